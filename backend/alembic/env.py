@@ -15,7 +15,13 @@ from app.models.UserModel import UserModel
 from app.models.CategoryModel import CategoryModel
 from app.models.BotModel import BotModel
 from app.models.Associations import bot_categories
+from app.models.CatalogVersion import catalog_version
+from app.models.SalesDaily import sales_daily
+from app.models.BotRecommendations import bot_recommendations
+from app.models.BotRatingHistogram import bot_rating_histograms
 from app.models.Bot_executionModel import BotExecutionModel
+from app.models.Bot_scheduleModel import BotScheduleModel
+from app.models.Bot_execution_statsModel import BotExecutionStatsModel
 from app.models.Bot_ReviewModel import BotReviewModel
 from app.models.ExecutionLogModel import ExecutionLogModel
 from app.models.OrderModel import OrderModel
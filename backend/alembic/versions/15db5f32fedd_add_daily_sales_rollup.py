@@ -0,0 +1,172 @@
+"""add daily sales rollup
+
+Revision ID: 15db5f32fedd
+Revises: ec911e0a2516
+Create Date: 2026-10-19 18:10:51.182185
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '15db5f32fedd'
+down_revision: Union[str, None] = 'ec911e0a2516'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# An order counts once it is paid
+PAID = "'completed'"
+
+# One order line as a rollup delta; `o` is the order, `i` the item
+LINE = (
+    "(o.created_at AT TIME ZONE 'UTC')::date AS day, i.bot_id, "
+    "coalesce(i.quantity, 1) AS units, coalesce(i.quantity, 1) * i.price_at_purchase AS revenue, 1 AS lines"
+)
+NEGATED_LINE = (
+    "(o.created_at AT TIME ZONE 'UTC')::date AS day, i.bot_id, "
+    "-coalesce(i.quantity, 1) AS units, -coalesce(i.quantity, 1) * i.price_at_purchase AS revenue, -1 AS lines"
+)
+
+
+def upsert(deltas: str, bots: str = "bot_id IS NOT NULL") -> str:
+    """
+    Add per-line deltas to sales_daily, one row per (day, bot), in key order
+    so concurrent checkouts touching the same rows cannot deadlock. Lines
+    are kept only if they match `bots`.
+    """
+    return f"""
+        INSERT INTO sales_daily (day, bot_id, units, revenue, order_count)
+        SELECT day, bot_id, sum(units), sum(revenue), sum(lines)
+        FROM ({deltas}) AS deltas
+        WHERE {bots}
+        GROUP BY day, bot_id
+        ORDER BY day, bot_id
+        ON CONFLICT (day, bot_id) DO UPDATE SET
+            units = sales_daily.units + EXCLUDED.units,
+            revenue = sales_daily.revenue + EXCLUDED.revenue,
+            order_count = sales_daily.order_count + EXCLUDED.order_count
+    """
+
+
+# Statement level with transition tables, so a multi-line checkout is one upsert
+FUNCTIONS = {
+    "sales_daily_items_insert": upsert(
+        f"SELECT {LINE} FROM new_items AS i JOIN orders AS o ON o.id = i.order_id WHERE o.payment_status = {PAID}"
+    ),
+    # Lines removed with their order were already subtracted by sales_daily_order_delete
+    "sales_daily_items_delete": upsert(
+        f"SELECT {NEGATED_LINE} FROM old_items AS i JOIN orders AS o ON o.id = i.order_id WHERE o.payment_status = {PAID}"
+    ),
+    # Deleting a bot sets its lines' bot_id to NULL (ON DELETE SET NULL) after
+    # its sales_daily rows were cascade-deleted, so skip bots that are gone
+    "sales_daily_items_update": upsert(
+        f"SELECT {LINE} FROM new_items AS i JOIN orders AS o ON o.id = i.order_id WHERE o.payment_status = {PAID} "
+        f"UNION ALL "
+        f"SELECT {NEGATED_LINE} FROM old_items AS i JOIN orders AS o ON o.id = i.order_id WHERE o.payment_status = {PAID}",
+        bots="bot_id IN (SELECT id FROM bots)",
+    ),
+    # Paid, refunded, or moved to another day
+    "sales_daily_orders_update": upsert(
+        f"SELECT {LINE} FROM new_orders AS o JOIN old_orders AS p ON p.id = o.id JOIN orderitems AS i ON i.order_id = o.id "
+        f"WHERE o.payment_status = {PAID} "
+        f"AND (p.payment_status IS DISTINCT FROM {PAID} OR p.created_at IS DISTINCT FROM o.created_at) "
+        f"UNION ALL "
+        f"SELECT {NEGATED_LINE} FROM old_orders AS o JOIN new_orders AS n ON n.id = o.id JOIN orderitems AS i ON i.order_id = o.id "
+        f"WHERE o.payment_status = {PAID} "
+        f"AND (n.payment_status IS DISTINCT FROM {PAID} OR n.created_at IS DISTINCT FROM o.created_at)"
+    ),
+}
+
+TRIGGERS = (
+    ("orderitems_sales_daily_insert", "AFTER INSERT ON orderitems REFERENCING NEW TABLE AS new_items",
+     "sales_daily_items_insert"),
+    ("orderitems_sales_daily_update", "AFTER UPDATE ON orderitems REFERENCING OLD TABLE AS old_items NEW TABLE AS new_items",
+     "sales_daily_items_update"),
+    ("orderitems_sales_daily_delete", "AFTER DELETE ON orderitems REFERENCING OLD TABLE AS old_items",
+     "sales_daily_items_delete"),
+    ("orders_sales_daily_update", "AFTER UPDATE ON orders REFERENCING OLD TABLE AS old_orders NEW TABLE AS new_orders",
+     "sales_daily_orders_update"),
+)
+
+BACKFILL = upsert(
+    f"SELECT {LINE} FROM orderitems AS i JOIN orders AS o ON o.id = i.order_id WHERE o.payment_status = {PAID}"
+)
+
+
+def upgrade() -> None:
+    op.create_table('sales_daily',
+    sa.Column('day', sa.Date(), nullable=False, comment='UTC date the orders were placed'),
+    sa.Column('bot_id', sa.UUID(), nullable=False, comment='Bot sold'),
+    sa.Column('units', sa.BigInteger(), nullable=False, comment='Units sold in paid orders'),
+    sa.Column('revenue', sa.DECIMAL(precision=14, scale=2), nullable=False, comment='Revenue in USD from paid orders'),
+    sa.Column('order_count', sa.BigInteger(), nullable=False, comment='Paid order lines'),
+    sa.ForeignKeyConstraint(['bot_id'], ['bots.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('day', 'bot_id')
+    )
+    op.create_index('ix_sales_daily_bot_id_day', 'sales_daily', ['bot_id', 'day'], unique=False)
+    op.create_index('ix_orderitems_order_id', 'orderitems', ['order_id'], unique=False)
+
+    # No order writes between the backfill and the triggers taking over
+    op.execute("LOCK TABLE orders, orderitems IN SHARE MODE")
+
+    for name, statement in FUNCTIONS.items():
+        op.execute(f"""
+            CREATE OR REPLACE FUNCTION {name}() RETURNS trigger AS $$
+            BEGIN
+                {statement};
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """)
+    for name, event, function in TRIGGERS:
+        op.execute(f"CREATE TRIGGER {name} {event} FOR EACH STATEMENT EXECUTE FUNCTION {function}()")
+
+    # Row level and BEFORE: the order's lines are gone by the time an AFTER
+    # trigger runs (ON DELETE CASCADE), so subtract them while they exist
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION sales_daily_order_delete() RETURNS trigger AS $$
+        BEGIN
+            IF OLD.payment_status = {PAID} THEN
+                {upsert(f"SELECT {NEGATED_LINE} FROM orderitems AS i CROSS JOIN (SELECT OLD.created_at AS created_at) AS o WHERE i.order_id = OLD.id")};
+            END IF;
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(
+        "CREATE TRIGGER orders_sales_daily_delete BEFORE DELETE ON orders "
+        "FOR EACH ROW EXECUTE FUNCTION sales_daily_order_delete()"
+    )
+
+    # TRUNCATE orders has to cascade to orderitems, so this covers both
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sales_daily_truncate() RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM sales_daily;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(
+        "CREATE TRIGGER orderitems_sales_daily_truncate AFTER TRUNCATE ON orderitems "
+        "FOR EACH STATEMENT EXECUTE FUNCTION sales_daily_truncate()"
+    )
+
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    for name, event, _ in TRIGGERS:
+        table = event.split(" ON ")[1].split()[0]
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON {table}")
+    op.execute("DROP TRIGGER IF EXISTS orders_sales_daily_delete ON orders")
+    op.execute("DROP TRIGGER IF EXISTS orderitems_sales_daily_truncate ON orderitems")
+    for name in (*FUNCTIONS, "sales_daily_order_delete", "sales_daily_truncate"):
+        op.execute(f"DROP FUNCTION IF EXISTS {name}()")
+    op.drop_index('ix_orderitems_order_id', table_name='orderitems')
+    op.drop_index('ix_sales_daily_bot_id_day', table_name='sales_daily')
+    op.drop_table('sales_daily')
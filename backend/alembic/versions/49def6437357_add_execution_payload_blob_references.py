@@ -0,0 +1,37 @@
+"""add execution payload blob references
+
+Revision ID: 49def6437357
+Revises: 85499f6d527a
+Create Date: 2026-10-19 17:15:18.195668
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '49def6437357'
+down_revision: Union[str, None] = '85499f6d527a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('bot_executions', sa.Column('input_blob_key', sa.String(length=64), nullable=True, comment='Blob store key of the input parameters when too large to inline'))
+    op.add_column('bot_executions', sa.Column('input_size', sa.BigInteger(), nullable=True, comment='Serialized size of the input parameters in bytes'))
+    op.add_column('bot_executions', sa.Column('output_blob_key', sa.String(length=64), nullable=True, comment='Blob store key of the output when too large to inline'))
+    op.add_column('bot_executions', sa.Column('output_size', sa.BigInteger(), nullable=True, comment='Serialized size of the output in bytes'))
+    # Lets a cleanup job find unreferenced blobs without scanning the JSONB columns
+    op.create_index('ix_bot_executions_output_blob_key', 'bot_executions', ['output_blob_key'], postgresql_where=sa.text('output_blob_key IS NOT NULL'))
+    op.create_index('ix_bot_executions_input_blob_key', 'bot_executions', ['input_blob_key'], postgresql_where=sa.text('input_blob_key IS NOT NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_bot_executions_input_blob_key', table_name='bot_executions')
+    op.drop_index('ix_bot_executions_output_blob_key', table_name='bot_executions')
+    op.drop_column('bot_executions', 'output_size')
+    op.drop_column('bot_executions', 'output_blob_key')
+    op.drop_column('bot_executions', 'input_size')
+    op.drop_column('bot_executions', 'input_blob_key')
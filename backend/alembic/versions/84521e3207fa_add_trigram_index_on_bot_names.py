@@ -0,0 +1,29 @@
+"""add trigram index on bot names
+
+Revision ID: 84521e3207fa
+Revises: 2a6ec56545e8
+Create Date: 2026-10-19 18:36:02.118842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '84521e3207fa'
+down_revision: Union[str, None] = '2a6ec56545e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # pg_trgm ships with PostgreSQL (contrib); the extension stays on downgrade
+    # since other objects may have come to depend on it
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_bots_name_trgm', 'bots', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_bots_name_trgm', table_name='bots', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
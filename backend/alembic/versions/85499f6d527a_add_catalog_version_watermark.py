@@ -0,0 +1,72 @@
+"""add catalog version watermark
+
+Revision ID: 85499f6d527a
+Revises: ffb28a7b696d
+Create Date: 2026-10-19 16:58:05.274103
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '85499f6d527a'
+down_revision: Union[str, None] = 'ffb28a7b696d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables whose writes change what the catalog endpoints return
+CATALOG_TABLES = ("bots", "bot_categories", "categories")
+
+# Updates only count when they touch a column the catalog shows or filters
+# on. Download and rating counters change on every download and review and
+# would invalidate every cached page; they refresh with the cache TTL instead.
+# updated_at is left out too, the ORM sets it on every update. Later
+# migrations that add catalog columns recreate the trigger with them.
+CATALOG_COLUMNS = {
+    "bots": (
+        "name", "description", "detailed_description", "price", "is_free", "difficulty_level",
+        "python_version", "execution_time_estimate", "docker_image", "github_repo_url",
+        "demo_video_url", "thumbnail_url", "is_active",
+    ),
+}
+
+
+def upgrade() -> None:
+    op.create_table('catalog_version',
+    sa.Column('id', sa.SmallInteger(), nullable=False, comment='Always 1, the table holds a single row'),
+    sa.Column('version', sa.BigInteger(), nullable=False, comment='Incremented on every catalog write'),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False, comment='Time of the last catalog write'),
+    sa.CheckConstraint('id = 1', name='catalog_version_single_row'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("INSERT INTO catalog_version (id, version, updated_at) VALUES (1, 1, now())")
+
+    # Statement level triggers: one bump per write statement, inside the writing
+    # transaction, so every worker sees the new version exactly when the data commits
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_catalog_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE catalog_version SET version = version + 1, updated_at = now() WHERE id = 1;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in CATALOG_TABLES:
+        columns = CATALOG_COLUMNS.get(table)
+        update = f"UPDATE OF {', '.join(columns)}" if columns else "UPDATE"
+        op.execute(f"""
+            CREATE TRIGGER {table}_bump_catalog_version
+            AFTER INSERT OR {update} OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version()
+        """)
+
+
+def downgrade() -> None:
+    for table in CATALOG_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_catalog_version ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS bump_catalog_version()")
+    op.drop_table('catalog_version')
@@ -0,0 +1,133 @@
+"""add rating histograms
+
+Revision ID: 972059a70ce4
+Revises: 6f0ebb268121
+Create Date: 2026-10-19 18:41:48.294804
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '972059a70ce4'
+down_revision: Union[str, None] = '6f0ebb268121'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+STARS = range(1, 6)
+
+
+def upsert(deltas: str) -> str:
+    """
+    Add (bot_id, rating, n) deltas to bot_rating_histograms, in key order so
+    concurrent review writes touching the same bots cannot deadlock. Bots
+    deleted in the same statement (ON DELETE CASCADE) are skipped.
+    """
+    sums = ", ".join(f"sum(CASE WHEN d.rating = {stars} THEN d.n ELSE 0 END)" for stars in STARS)
+    columns = ", ".join(f"rating_{stars}" for stars in STARS)
+    updates = ", ".join(f"rating_{stars} = bot_rating_histograms.rating_{stars} + EXCLUDED.rating_{stars}" for stars in STARS)
+    return f"""
+        INSERT INTO bot_rating_histograms (bot_id, {columns})
+        SELECT d.bot_id, {sums}
+        FROM ({deltas}) AS d JOIN bots AS b ON b.id = d.bot_id
+        WHERE d.rating IS NOT NULL
+        GROUP BY d.bot_id
+        ORDER BY d.bot_id
+        ON CONFLICT (bot_id) DO UPDATE SET {updates}
+    """
+
+
+# Statement level with transition tables, so a bulk import is one upsert
+FUNCTIONS = {
+    "rating_histograms_insert": upsert("SELECT bot_id, rating, 1 AS n FROM new_reviews"),
+    "rating_histograms_delete": upsert("SELECT bot_id, rating, -1 AS n FROM old_reviews"),
+    # Only reviews whose rating (or bot) changed
+    "rating_histograms_update": upsert(
+        "SELECT r.bot_id, r.rating, 1 AS n FROM new_reviews AS r JOIN old_reviews AS o ON o.id = r.id "
+        "WHERE r.rating IS DISTINCT FROM o.rating OR r.bot_id IS DISTINCT FROM o.bot_id "
+        "UNION ALL "
+        "SELECT o.bot_id, o.rating, -1 AS n FROM old_reviews AS o JOIN new_reviews AS r ON r.id = o.id "
+        "WHERE r.rating IS DISTINCT FROM o.rating OR r.bot_id IS DISTINCT FROM o.bot_id"
+    ),
+}
+
+TRIGGERS = (
+    ("botreviews_rating_histograms_insert", "AFTER INSERT ON botreviews REFERENCING NEW TABLE AS new_reviews",
+     "rating_histograms_insert"),
+    ("botreviews_rating_histograms_update", "AFTER UPDATE ON botreviews REFERENCING OLD TABLE AS old_reviews NEW TABLE AS new_reviews",
+     "rating_histograms_update"),
+    ("botreviews_rating_histograms_delete", "AFTER DELETE ON botreviews REFERENCING OLD TABLE AS old_reviews",
+     "rating_histograms_delete"),
+)
+
+BACKFILL = upsert("SELECT bot_id, rating, 1 AS n FROM botreviews")
+
+
+def upgrade() -> None:
+    # The review cursor is (created_at, id); a NULL would end paging at that review
+    op.execute("UPDATE botreviews SET created_at = coalesce(updated_at, now()) WHERE created_at IS NULL")
+    op.alter_column('botreviews', 'created_at',
+               existing_type=sa.DateTime(timezone=True),
+               nullable=False,
+               existing_server_default=sa.text('now()'),
+               existing_comment='Timestamp when the record was created')
+    op.create_table('bot_rating_histograms',
+    sa.Column('bot_id', sa.UUID(), nullable=False, comment='Bot reviewed'),
+    sa.Column('rating_1', sa.BigInteger(), nullable=False, comment='Reviews rating the bot 1 of 5'),
+    sa.Column('rating_2', sa.BigInteger(), nullable=False, comment='Reviews rating the bot 2 of 5'),
+    sa.Column('rating_3', sa.BigInteger(), nullable=False, comment='Reviews rating the bot 3 of 5'),
+    sa.Column('rating_4', sa.BigInteger(), nullable=False, comment='Reviews rating the bot 4 of 5'),
+    sa.Column('rating_5', sa.BigInteger(), nullable=False, comment='Reviews rating the bot 5 of 5'),
+    sa.ForeignKeyConstraint(['bot_id'], ['bots.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('bot_id')
+    )
+    op.create_index('ix_botreviews_bot_id_created_at', 'botreviews', ['bot_id', 'created_at', 'id'], unique=False)
+
+    # No review writes between the backfill and the triggers taking over
+    op.execute("LOCK TABLE botreviews IN SHARE MODE")
+
+    for name, statement in FUNCTIONS.items():
+        op.execute(f"""
+            CREATE OR REPLACE FUNCTION {name}() RETURNS trigger AS $$
+            BEGIN
+                {statement};
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """)
+    for name, event, function in TRIGGERS:
+        op.execute(f"CREATE TRIGGER {name} {event} FOR EACH STATEMENT EXECUTE FUNCTION {function}()")
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION rating_histograms_truncate() RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM bot_rating_histograms;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(
+        "CREATE TRIGGER botreviews_rating_histograms_truncate AFTER TRUNCATE ON botreviews "
+        "FOR EACH STATEMENT EXECUTE FUNCTION rating_histograms_truncate()"
+    )
+
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    for name, _, _ in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON botreviews")
+    op.execute("DROP TRIGGER IF EXISTS botreviews_rating_histograms_truncate ON botreviews")
+    for name in (*FUNCTIONS, "rating_histograms_truncate"):
+        op.execute(f"DROP FUNCTION IF EXISTS {name}()")
+    op.drop_index('ix_botreviews_bot_id_created_at', table_name='botreviews')
+    op.drop_table('bot_rating_histograms')
+    op.alter_column('botreviews', 'created_at',
+               existing_type=sa.DateTime(timezone=True),
+               nullable=True,
+               existing_server_default=sa.text('now()'),
+               existing_comment='Timestamp when the record was created')
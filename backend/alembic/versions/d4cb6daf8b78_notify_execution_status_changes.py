@@ -0,0 +1,56 @@
+"""notify execution status changes
+
+Revision ID: d4cb6daf8b78
+Revises: c101619de53a
+Create Date: 2026-10-19 17:50:33.816226
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4cb6daf8b78'
+down_revision: Union[str, None] = 'c101619de53a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match CHANNEL in app/services/execution_events.py
+CHANNEL = "execution_status"
+
+
+def upgrade() -> None:
+    # Row level: one notification per execution whose status changed, sent
+    # by PostgreSQL when (and only if) the writing transaction commits
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION notify_execution_status() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' AND OLD.execution_status IS NOT DISTINCT FROM NEW.execution_status THEN
+                RETURN NULL;
+            END IF;
+            PERFORM pg_notify('{CHANNEL}', json_build_object(
+                'id', NEW.id,
+                'user_id', NEW.user_id,
+                'bot_id', NEW.bot_id,
+                'execution_status', NEW.execution_status,
+                'cache_hit', NEW.cache_hit,
+                'started_at', NEW.started_at,
+                'completed_at', NEW.completed_at
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER bot_executions_notify_status
+        AFTER INSERT OR UPDATE OF execution_status ON bot_executions
+        FOR EACH ROW EXECUTE FUNCTION notify_execution_status()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS bot_executions_notify_status ON bot_executions")
+    op.execute("DROP FUNCTION IF EXISTS notify_execution_status()")
@@ -2,12 +2,12 @@
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 from app.core.config import settings
 from app.crud.user import user as user_crud
 from app.models.UserModel import UserModel
 from app.api.deps.database import get_db
+from app.utils.security import decode_access_token
 
 """
 Authentication dependencies for FastAPI.
@@ -18,6 +18,24 @@ These functions are used as dependencies in API endpoints that require authentic
 # Security scheme for JWT tokens
 security = HTTPBearer()
 
+def user_from_token(db: Session, token: str) -> Optional[UserModel]:
+    """
+        Resolve a JWT access token to its user.
+        
+        Used directly where there is no Authorization header (WebSockets).
+        
+        Args:
+            db: Database session
+            token: JWT access token
+            
+        Returns:
+            User model, or None if the token is invalid or the user is unknown
+    """
+    payload = decode_access_token(token)
+    if payload is None or payload.get("sub") is None:
+        return None
+    return user_crud.get(db, id=payload["sub"])
+
 def get_current_user(db: Session = Depends(get_db),credentials: HTTPAuthorizationCredentials = Depends(security)) -> UserModel:
     """
         Get the current authenticated user from JWT token.
@@ -38,24 +56,8 @@ def get_current_user(db: Session = Depends(get_db),credentials: HTTPAuthorizatio
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    try:
-        # Decode the JWT token
-        payload = jwt.decode(
-            credentials.credentials, 
-            settings.SECRET_KEY, 
-            algorithms=[settings.ALGORITHM]
-        )
-        
-        # Get user ID from token
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-            
-    except JWTError:
-        raise credentials_exception
-    
-    # Get user from database
-    user = user_crud.get(db, id=user_id)
+    # Decode the JWT token and get the user from the database
+    user = user_from_token(db, credentials.credentials)
     if user is None:
         raise credentials_exception
     
@@ -82,3 +84,24 @@ def get_current_active_user(current_user: UserModel = Depends(get_current_user),
     
     return current_user
 
+def get_current_admin_user(current_user: UserModel = Depends(get_current_active_user),) -> UserModel:
+    """
+        Get current user and ensure they are an admin (listed in ADMIN_EMAILS).
+        
+        Args:
+            current_user: Current active user
+            
+        Returns:
+            Admin user model
+            
+        Raises:
+            HTTPException: If user is not an admin
+    """
+    admins = {email.lower() for email in settings.ADMIN_EMAILS}
+    if current_user.email.lower() not in admins:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    
+    return current_user
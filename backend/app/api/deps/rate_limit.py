@@ -0,0 +1,79 @@
+# File: app/api/deps/rate_limit.py
+import math
+from functools import lru_cache
+from typing import Dict, Optional
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import OAuth2PasswordRequestForm
+from app.core.config import settings
+from app.services.rate_limit import RateLimit, rate_limiter
+from app.utils.security import decode_access_token
+
+"""
+Rate limiting dependencies.
+
+Add one of these to an endpoint's dependencies to enforce the limits
+configured in Settings. Over-limit requests get a 429 with Retry-After
+before the endpoint (and its bcrypt or ILIKE work) runs.
+"""
+
+@lru_cache(maxsize=None)
+def _limit(value: str) -> RateLimit:
+    return RateLimit.parse(value)
+
+def _client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+def _bearer_subject(request: Request) -> Optional[str]:
+    """
+    User id from a valid bearer token, if the request carries one.
+    """
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    payload = decode_access_token(token)
+    return payload.get("sub") if payload else None
+
+def enforce(route: str, buckets: Dict[str, str]) -> None:
+    """
+    Check the given buckets ({scope key: limit setting}) for `route`.
+
+    Raises:
+        HTTPException: 429 with Retry-After when any bucket is empty
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+    decision = rate_limiter.hit({f"{route}:{key}": _limit(value) for key, value in buckets.items()})
+    if not decision.allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please try again later.",
+            headers={"Retry-After": str(max(1, math.ceil(decision.retry_after)))},
+        )
+
+def login_rate_limit(request: Request, form_data: OAuth2PasswordRequestForm = Depends()) -> None:
+    """
+    Per IP and per username limits for /auth/login (protects bcrypt and accounts).
+    """
+    enforce("login", {
+        f"ip:{_client_ip(request)}": settings.RATE_LIMIT_LOGIN_PER_IP,
+        f"user:{form_data.username.lower()}": settings.RATE_LIMIT_LOGIN_PER_USER,
+    })
+
+def register_rate_limit(request: Request) -> None:
+    """
+    Per IP limit for /auth/register.
+    """
+    enforce("register", {f"ip:{_client_ip(request)}": settings.RATE_LIMIT_REGISTER_PER_IP})
+
+def search_rate_limit(request: Request) -> None:
+    """
+    Per IP and per user limits for catalog searches; plain listings are not limited.
+    """
+    if not request.query_params.get("search"):
+        return
+    buckets = {f"ip:{_client_ip(request)}": settings.RATE_LIMIT_SEARCH_PER_IP}
+    user_id = _bearer_subject(request)
+    if user_id is not None:
+        buckets[f"user:{user_id}"] = settings.RATE_LIMIT_SEARCH_PER_USER
+    enforce("search", buckets)
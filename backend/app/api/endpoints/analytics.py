@@ -0,0 +1,76 @@
+# File: app/api/endpoints/analytics.py
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from app.api.deps.database import get_db
+from app.api.deps.auth import get_current_admin_user
+from app.models.UserModel import UserModel
+from app.schemas.AnalyticsSchema import BotSalesResponse, DailySalesResponse
+from app.services.sales_analytics import daily_sales, top_bots
+
+"""
+Revenue analytics endpoints.
+
+Both read the daily sales rollup (app/models/SalesDaily.py), so a date
+range costs at most one row per bot per day, not a scan of the orders.
+Dates are UTC and ranges include both ends; without them the last 30
+days are used. Marketplace-wide revenue is for admins (ADMIN_EMAILS) only.
+"""
+
+router = APIRouter()
+
+def date_range(start: Optional[date], end: Optional[date]) -> Tuple[date, date]:
+    """
+    Fill in the default range and reject reversed ones with 400.
+    """
+    end = end or datetime.now(timezone.utc).date()
+    start = start or end - timedelta(days=29)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+    return start, end
+
+@router.get("/sales/daily", response_model=List[DailySalesResponse])
+def read_daily_sales(*,db: Session = Depends(get_db),current_user: UserModel = Depends(get_current_admin_user),
+    start: Optional[date] = Query(None, description="First day (UTC), default 29 days before end"),
+    end: Optional[date] = Query(None, description="Last day (UTC), default today"),
+    bot_id: Optional[UUID] = Query(None, description="Only this bot's sales"),
+) -> Any:
+    """
+    Units, revenue and orders per day.
+    
+    Args:
+        db: Database session
+        current_user: Current admin user
+        start: First day of the range
+        end: Last day of the range
+        bot_id: Optional bot filter
+        
+    Returns:
+        One entry per day with sales, oldest first
+    """
+    start, end = date_range(start, end)
+    return daily_sales(db, start=start, end=end, bot_id=bot_id)
+
+@router.get("/sales/top-bots", response_model=List[BotSalesResponse])
+def read_top_bots(*,db: Session = Depends(get_db),current_user: UserModel = Depends(get_current_admin_user),
+    start: Optional[date] = Query(None, description="First day (UTC), default 29 days before end"),
+    end: Optional[date] = Query(None, description="Last day (UTC), default today"),
+    limit: int = Query(10, ge=1, le=100, description="Number of bots to return"),
+) -> Any:
+    """
+    Best-selling bots by revenue.
+    
+    Args:
+        db: Database session
+        current_user: Current admin user
+        start: First day of the range
+        end: Last day of the range
+        limit: Number of bots to return
+        
+    Returns:
+        Bots with their units, revenue and orders in the range, highest revenue first
+    """
+    start, end = date_range(start, end)
+    return top_bots(db, start=start, end=end, limit=limit)
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from app.api.deps.database import get_db
+from app.api.deps.rate_limit import login_rate_limit, register_rate_limit
 from app.crud.user import user as user_crud
 from app.schemas.UserSchema import UserCreate, UserResponse, Token
 from app.utils.security import create_access_token
@@ -16,7 +17,7 @@ Authentication endpoints for user registration and login.
 
 router = APIRouter()
 
-@router.post("/register", response_model=UserResponse)
+@router.post("/register", response_model=UserResponse, dependencies=[Depends(register_rate_limit)])
 def register(*,db: Session = Depends(get_db),user_in: UserCreate,) -> Any:
     
     """
@@ -51,7 +52,7 @@ def register(*,db: Session = Depends(get_db),user_in: UserCreate,) -> Any:
     user = user_crud.create(db, obj_in=user_in)
     return user
 
-@router.post("/login", response_model=Token)
+@router.post("/login", response_model=Token, dependencies=[Depends(login_rate_limit)])
 def login(db: Session = Depends(get_db),form_data: OAuth2PasswordRequestForm = Depends()) -> Any:
     
     """
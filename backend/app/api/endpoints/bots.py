@@ -1,10 +1,27 @@
 # File: app/api/endpoints/bots.py
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, Query
+import json
+from datetime import datetime
+from typing import Any, List, Union
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from app.api.deps.database import get_db
+from app.api.deps.rate_limit import search_rate_limit
+from app.api.responses import cached_json_response, catalog_cache_headers, is_not_modified, not_modified_response
+from app.core.config import settings
+from app.core.startup import warmup
 from app.crud.bot import bot as bot_crud
-from app.schemas.BotSchema import BotResponse
+from app.db.session.database import SessionLocal
+from app.schemas.BotSchema import BotBatchResponse, BotExecutionStatsResponse, BotResponse, BotSearchResponse, SuggestionResponse
+from app.schemas.ReviewSchema import RatingSummary, ReviewPageResponse, ReviewResponse
+from app.services.catalog_cache import cached_details, detail_key, facets_key, get_or_build, list_key, lookup_details, serialize_bot, serialize_bots
+from app.services.catalog_facets import facet_counts
+from app.services.catalog_version import get_catalog_version
+from app.services.leaderboards import BOARDS, leaderboards
+from app.services.recommendations import recommendations
+from app.services.similarity_index import similarity_index
+from app.services.suggestions import MAX_SUGGESTIONS, suggestion_index
+from app.utils.pagination import decode_cursor, encode_cursor
 
 """
 Bot marketplace endpoints.
@@ -12,49 +29,354 @@ Bot marketplace endpoints.
 
 router = APIRouter()
 
-@router.get("/", response_model=List[BotResponse])
-def read_bots(db: Session = Depends(get_db),skip: int = Query(0, ge=0, description="Number of items to skip"),limit: int = Query(100, ge=1, le=100, description="Number of items to return"),
+# Most ids accepted by /batch
+MAX_BATCH_IDS = 100
+
+@warmup("catalog queries")
+def warm_catalog_queries() -> None:
+    """
+    Compile the hot catalog statements once per worker.
+    """
+    db = SessionLocal()
+    try:
+        bot_crud.get_active_bots(db, limit=1)
+        bot_crud.get(db, id="00000000-0000-0000-0000-000000000000")
+    finally:
+        db.close()
+
+@warmup("leaderboards")
+def warm_leaderboards() -> None:
+    """
+    Build the leaderboards (if nobody has yet) before the first read needs them.
+    """
+    leaderboards.top(BOARDS[0], 1)
+
+@warmup("recommendations")
+def warm_recommendations() -> None:
+    """
+    Load the recommendation lists into memory.
+    """
+    recommendations.reload()
+
+@warmup("similarity index")
+def warm_similarity_index() -> None:
+    """
+    Map the text similarity index (building it if there is none on disk).
+    """
+    similarity_index.refresh()
+
+@warmup("suggestions")
+def warm_suggestions() -> None:
+    """
+    Build the typeahead index.
+    """
+    suggestion_index.refresh()
+
+@router.get("/", response_model=Union[List[BotResponse], BotSearchResponse], dependencies=[Depends(search_rate_limit)])
+def read_bots(request: Request, db: Session = Depends(get_db),skip: int = Query(0, ge=0, description="Number of items to skip"),limit: int = Query(100, ge=1, le=100, description="Number of items to return"),
     category: str = Query(None, description="Filter by category ID"),
     search: str = Query(None, description="Search query"),
     free_only: bool = Query(False, description="Show only free bots"),
+    facets: bool = Query(False, description="Also count the matching bots per facet (returns {items, facets})"),
 ) -> Any:
     """
     Retrieve bots with filtering and pagination.
     
+    Responses are served from the catalog cache, including their
+    precompressed representations, and carry ETag/Last-Modified derived
+    from the catalog version. A matching conditional request gets a 304
+    without running the list query, concurrent identical misses share
+    a single query, and expired entries are served stale while they are
+    refreshed in the background.
+    
+    With `facets`, the list comes back as `items` next to the counts of
+    all matching bots per category, difficulty level, Python version,
+    price bucket and free/paid. The counts are cached per filter, so
+    paging through a result set computes them once.
+    
     Args:
+        request: Incoming request (for content negotiation and validators)
         db: Database session
         skip: Number of items to skip for pagination
         limit: Maximum number of items to return
         category: Optional category filter
         search: Optional search query
         free_only: Whether to show only free bots
+        facets: Whether to include facet counts
+        
+    Returns:
+        List of bot data, or the list and its facet counts
+    """
+    version = get_catalog_version(db)
+    if is_not_modified(request, version):
+        return not_modified_response(version)
+    
+    def build(db: Session) -> bytes:
+        if free_only:
+            bots = bot_crud.get_free_bots(db, skip=skip, limit=limit)
+        elif category:
+            bots = bot_crud.get_by_category(db, category_id=category, skip=skip, limit=limit)
+        elif search:
+            bots = bot_crud.search_bots(db, query=search, skip=skip, limit=limit)
+        else:
+            bots = bot_crud.get_active_bots(db, skip=skip, limit=limit)
+        return serialize_bots(bots)
+    
+    key = list_key(skip=skip, limit=limit, category=category, search=search, free_only=free_only)
+    payload = get_or_build(db, key, version.version, build)
+    
+    if facets:
+        def build_facets(db: Session) -> bytes:
+            return facet_counts(db, category=category, search=search, free_only=free_only).model_dump_json().encode()
+        
+        key = facets_key(category=category, search=search, free_only=free_only)
+        counts = get_or_build(db, key, version.version, build_facets)
+        return Response(
+            content=b'{"items":' + payload.body + b',"facets":' + counts.body + b"}",
+            media_type="application/json",
+            headers=catalog_cache_headers(version),
+        )
+    
+    return cached_json_response(request, payload, headers=catalog_cache_headers(version))
+
+@router.get("/leaderboards/{board}", response_model=List[BotResponse])
+def read_leaderboard(*,db: Session = Depends(get_db),board: str,limit: int = Query(10, ge=1, le=100, description="Number of bots to return"),) -> Any:
+    """
+    Top bots on a leaderboard, best first.
+    
+    Args:
+        db: Database session
+        board: "downloads" (most downloaded), "rating" (top rated) or
+            "trending" (recent purchases and reviews)
+        limit: Number of bots to return
+        
+    Returns:
+        Bot data of the top bots
+        
+    Raises:
+        HTTPException: If the leaderboard does not exist
+    """
+    if board not in BOARDS:
+        raise HTTPException(
+            status_code=404, 
+            detail="Leaderboard not found"
+        )
+    bodies = cached_details(db, leaderboards.top(board, limit))
+    return Response(content=b"[" + b",".join(bodies) + b"]", media_type="application/json")
+
+@router.get("/suggest", response_model=List[SuggestionResponse])
+def suggest(*,db: Session = Depends(get_db),q: str = Query(..., min_length=1, max_length=100, description="What the user typed so far"),limit: int = Query(8, ge=1, le=MAX_SUGGESTIONS, description="Number of suggestions to return"),) -> Any:
+    """
+    Typeahead suggestions: categories and bots whose name has a word
+    starting with `q`, most popular first.
+    
+    Prefix matches come from memory. When they do not fill the list and
+    `q` has 3+ characters, bots containing `q` anywhere in their name
+    are added from the database (trigram index).
+    
+    Args:
+        db: Database session
+        q: What the user typed so far
+        limit: Number of suggestions to return
         
     Returns:
-        List of bot data
+        Suggestions, categories first
+    """
+    suggestions = [
+        SuggestionResponse(kind=kind, id=entry.id, name=entry.name)
+        for kind, entry in suggestion_index.suggest(q, limit)
+    ]
+    if len(suggestions) < limit and len(q.strip()) >= 3:
+        rows = bot_crud.get_names_containing(
+            db, query=q.strip(), exclude=[s.id for s in suggestions if s.kind == "bot"], limit=limit - len(suggestions)
+        )
+        suggestions.extend(SuggestionResponse(kind="bot", id=bot_id, name=name) for bot_id, name in rows)
+    return suggestions
+
+@router.get("/similar", response_model=List[BotResponse])
+def search_similar_bots(*,db: Session = Depends(get_db),q: str = Query(..., min_length=1, max_length=500, description="Free text describing the bot wanted"),limit: int = Query(10, ge=1, le=100, description="Number of bots to return"),) -> Any:
     """
-    if free_only:
-        bots = bot_crud.get_free_bots(db, skip=skip, limit=limit)
-    elif category:
-        bots = bot_crud.get_by_category(db, category_id=category, skip=skip, limit=limit)
-    elif search:
-        bots = bot_crud.search_bots(db, query=search, skip=skip, limit=limit)
-    else:
-        bots = bot_crud.get_active_bots(db, skip=skip, limit=limit)
+    Bots whose name and description best match free text (TF-IDF cosine similarity).
     
-    return bots
+    Args:
+        db: Database session
+        q: Free text describing the bot wanted
+        limit: Number of bots to return
+        
+    Returns:
+        Bot data of the best matches, best first
+    """
+    bodies = cached_details(db, similarity_index.search(q, limit))
+    return Response(content=b"[" + b",".join(bodies) + b"]", media_type="application/json")
+
+@router.get("/batch", response_model=BotBatchResponse)
+def read_bots_batch(*,db: Session = Depends(get_db),ids: str = Query(..., description=f"Comma-separated bot UUIDs (at most {MAX_BATCH_IDS})"),) -> Any:
+    """
+    Get several bots by ID in one request.
+    
+    Cached bots come from the catalog cache, the rest are loaded with a
+    single query (categories included) and cached for the next request.
+    
+    Args:
+        db: Database session
+        ids: Comma-separated bot UUIDs
+        
+    Returns:
+        Bot data in request order, null for ids that match no bot, and
+        the list of those ids
+        
+    Raises:
+        HTTPException: If more than MAX_BATCH_IDS ids are requested
+    """
+    requested = [bot_id.strip() for bot_id in ids.split(",") if bot_id.strip()]
+    if len(requested) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"At most {MAX_BATCH_IDS} ids per request"
+        )
+    canonical = {}
+    for bot_id in requested:
+        try:
+            canonical[bot_id] = str(UUID(bot_id))
+        except ValueError:
+            pass
+    bodies = lookup_details(db, list(dict.fromkeys(canonical.values())))
+    items = [bodies.get(canonical.get(bot_id), b"null") for bot_id in requested]
+    not_found = [bot_id for bot_id in dict.fromkeys(requested) if canonical.get(bot_id) not in bodies]
+    return Response(
+        content=b'{"items":[' + b",".join(items) + b'],"not_found":' + json.dumps(not_found).encode() + b"}",
+        media_type="application/json",
+    )
 
 @router.get("/{bot_id}", response_model=BotResponse)
-def read_bot(*,db: Session = Depends(get_db),bot_id: str,) -> Any:
+def read_bot(*,request: Request,db: Session = Depends(get_db),bot_id: str,) -> Any:
     """
     Get bot by ID.
     
     Args:
+        request: Incoming request (for content negotiation and validators)
         db: Database session
         bot_id: Bot UUID
         
     Returns:
         Bot data
         
+    Raises:
+        HTTPException: If bot not found
+    """
+    version = get_catalog_version(db)
+    if is_not_modified(request, version):
+        return not_modified_response(version)
+    
+    def build(db: Session) -> bytes:
+        bot = bot_crud.get(db, id=bot_id)
+        if not bot:
+            raise HTTPException(
+                status_code=404, 
+                detail="Bot not found"
+            )
+        return serialize_bot(bot)
+    
+    payload = get_or_build(db, detail_key(bot_id), version.version, build)
+    return cached_json_response(request, payload, headers=catalog_cache_headers(version))
+
+@router.get("/{bot_id}/recommendations", response_model=List[BotResponse])
+def read_bot_recommendations(*,db: Session = Depends(get_db),bot_id: str,limit: int = Query(10, ge=1, le=settings.RECOMMENDATIONS_TOP_K, description="Number of bots to return"),) -> Any:
+    """
+    Bots often bought together with this one, most related first.
+    
+    Args:
+        db: Database session
+        bot_id: Bot UUID
+        limit: Number of bots to return
+        
+    Returns:
+        Bot data of the recommended bots; empty until enough users hold
+        access to this bot and others
+    """
+    # Lists are computed offline and may name bots deactivated since, which are skipped
+    bodies = cached_details(db, recommendations.get(bot_id, settings.RECOMMENDATIONS_TOP_K))[:limit]
+    return Response(content=b"[" + b",".join(bodies) + b"]", media_type="application/json")
+
+@router.get("/{bot_id}/similar", response_model=List[BotResponse])
+def read_similar_bots(*,db: Session = Depends(get_db),bot_id: str,limit: int = Query(10, ge=1, le=100, description="Number of bots to return"),) -> Any:
+    """
+    Bots whose name and description are most similar to this bot's.
+    
+    Args:
+        db: Database session
+        bot_id: Bot UUID
+        limit: Number of bots to return
+        
+    Returns:
+        Bot data of the most similar bots, best first; empty for unknown or
+        inactive bots
+    """
+    bodies = cached_details(db, similarity_index.similar_to_bot(bot_id, limit))
+    return Response(content=b"[" + b",".join(bodies) + b"]", media_type="application/json")
+
+@router.get("/{bot_id}/reviews", response_model=ReviewPageResponse)
+def read_bot_reviews(*,db: Session = Depends(get_db),bot_id: str,cursor: str = Query(None, description="next_cursor of the previous page"),limit: int = Query(20, ge=1, le=100, description="Number of reviews to return"),) -> Any:
+    """
+    Get a bot's reviews, newest first, with its star rating histogram.
+    
+    Pages use keyset pagination on (created_at, id), so each one costs
+    the same however many reviews the bot has. The histogram is kept per
+    bot by triggers on review writes rather than grouped on every view.
+    
+    Args:
+        db: Database session
+        bot_id: Bot UUID
+        cursor: Position after the previous page
+        limit: Maximum number of reviews to return
+        
+    Returns:
+        A page of reviews, the rating histogram and the cursor of the next page
+        
+    Raises:
+        HTTPException: If bot not found
+    """
+    bot = bot_crud.get(db, id=bot_id)
+    if not bot:
+        raise HTTPException(
+            status_code=404, 
+            detail="Bot not found"
+        )
+    after = decode_cursor(cursor, datetime, UUID)
+    reviews = bot_crud.get_reviews_page(db, bot_id=bot.id, after=after, limit=limit + 1)
+    next_cursor = None
+    if len(reviews) > limit:
+        next_cursor = encode_cursor(reviews[limit - 1].created_at, reviews[limit - 1].id)
+    
+    counts = bot_crud.get_rating_histogram(db, bot_id=bot.id)
+    count = sum(counts)
+    rating = RatingSummary(
+        count=count,
+        average=round(sum(stars * n for stars, n in enumerate(counts, start=1)) / count, 2) if count else None,
+        histogram=dict(enumerate(counts, start=1)),
+    )
+    return ReviewPageResponse(
+        items=[ReviewResponse.model_validate(review) for review in reviews[:limit]],
+        rating=rating,
+        next_cursor=next_cursor,
+    )
+
+@router.get("/{bot_id}/stats", response_model=BotExecutionStatsResponse)
+def read_bot_stats(*,db: Session = Depends(get_db),bot_id: str,) -> Any:
+    """
+    Get a bot's execution time statistics.
+    
+    Percentiles come from the bot's execution time sketch, which the
+    executors keep up to date (app/services/execution_stats.py), so this
+    reads one row rather than the bot's execution history.
+    
+    Args:
+        db: Database session
+        bot_id: Bot UUID
+        
+    Returns:
+        Execution count, mean and p50/p95/p99 in seconds
+        
     Raises:
         HTTPException: If bot not found
     """
@@ -64,4 +386,16 @@ def read_bot(*,db: Session = Depends(get_db),bot_id: str,) -> Any:
             status_code=404, 
             detail="Bot not found"
         )
-    return bot
\ No newline at end of file
+    stats = bot_crud.get_execution_stats(db, bot_id=bot.id)
+    if stats is None:
+        return BotExecutionStatsResponse(bot_id=bot.id, execution_time_estimate=bot.execution_time_estimate)
+    return BotExecutionStatsResponse(
+        bot_id=bot.id,
+        execution_count=stats.execution_count,
+        mean_seconds=stats.mean_seconds,
+        p50_seconds=stats.p50_seconds,
+        p95_seconds=stats.p95_seconds,
+        p99_seconds=stats.p99_seconds,
+        execution_time_estimate=bot.execution_time_estimate,
+        updated_at=stats.updated_at,
+    )
@@ -0,0 +1,283 @@
+# File: app/api/endpoints/executions.py
+import json
+from typing import Any, AsyncIterator, Dict, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.orm import Session
+from starlette.background import BackgroundTask
+from app.api.deps.database import get_db
+from app.api.deps.auth import get_current_active_user, get_current_user, security, user_from_token
+from app.api.responses import etag_matches
+from app.core.config import settings
+from app.core.startup import warmup
+from app.crud.bot import bot as bot_crud
+from app.crud.execution import execution as execution_crud
+from app.crud.user import user as user_crud
+from app.db.session.database import SessionLocal
+from app.models.UserModel import UserModel
+from app.schemas.ExecutionSchema import ExecutionCreate, ExecutionResponse
+from app.services.blob_store import BlobNotFound
+from app.services.execution_events import TERMINAL_STATUSES, execution_events
+
+"""
+Bot execution endpoints.
+
+Executions are queued here and run by the executor service
+(scripts/run_executor.py); executions of deterministic bots whose result
+is in the execution cache come back completed right away.
+
+Status changes are pushed rather than polled: GET /{id}/events is a
+Server-Sent Events stream for one execution, /ws a WebSocket carrying all
+of the user's executions. Both are fed by the worker's single LISTEN
+connection (app/services/execution_events.py).
+"""
+
+router = APIRouter()
+
+@warmup("execution events")
+def start_execution_events() -> None:
+    """
+    LISTEN before the first client subscribes.
+    """
+    execution_events.start()
+
+def status_event(execution) -> Dict[str, Any]:
+    """
+    An execution's current status, shaped like the NOTIFY payload.
+    """
+    return {
+        "id": str(execution.id),
+        "user_id": str(execution.user_id) if execution.user_id else None,
+        "bot_id": str(execution.bot_id) if execution.bot_id else None,
+        "execution_status": execution.execution_status,
+        "cache_hit": execution.cache_hit,
+        "started_at": execution.started_at.isoformat() if execution.started_at else None,
+        "completed_at": execution.completed_at.isoformat() if execution.completed_at else None,
+    }
+
+def current_status(execution_id: UUID, user_id: UUID) -> Optional[Dict[str, Any]]:
+    with SessionLocal() as db:
+        execution = execution_crud.get_for_user(db, id=execution_id, user_id=user_id)
+        return status_event(execution) if execution else None
+
+def sse(event: Dict[str, Any]) -> str:
+    return f"event: status\ndata: {json.dumps(event)}\n\n"
+
+def get_own_execution(execution_id: UUID, db: Session, current_user: UserModel):
+    execution = execution_crud.get_for_user(db, id=execution_id, user_id=current_user.id)
+    if not execution:
+        raise HTTPException(
+            status_code=404,
+            detail="Execution not found"
+        )
+    return execution
+
+def payload_response(request: Request, execution, field: str) -> Response:
+    """
+    Stream an execution payload. Blob payloads carry their content hash as
+    a strong ETag, so clients can revalidate multi-megabyte outputs cheaply;
+    a match is answered before the blob is opened.
+    """
+    blob_key = execution_crud.payload_key(execution, field)
+    etag = f'"{blob_key}"' if blob_key else None
+    if etag and etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    try:
+        chunks, size, _ = execution_crud.payload_stream(execution, field)
+    except BlobNotFound:
+        raise HTTPException(status_code=404, detail=f"Execution {field} is no longer available")
+    if chunks is None:
+        raise HTTPException(status_code=404, detail=f"Execution has no {field}")
+    
+    headers = {"Content-Length": str(size)}
+    if etag:
+        headers["ETag"] = etag
+    return StreamingResponse(chunks, media_type="application/json", headers=headers)
+
+@router.post("/", response_model=ExecutionResponse)
+def create_execution(*,db: Session = Depends(get_db),execution_in: ExecutionCreate,current_user: UserModel = Depends(get_current_active_user),) -> Any:
+    """
+    Start a bot execution.
+    
+    Args:
+        db: Database session
+        execution_in: Bot and input parameters
+        current_user: Current authenticated user
+        
+    Returns:
+        The queued execution, or a completed one (cache_hit) when a
+        deterministic bot already ran with the same input
+        
+    Raises:
+        HTTPException: If the bot does not exist, or is paid and the user has no access to it
+    """
+    bot = bot_crud.get(db, id=execution_in.bot_id)
+    if not bot or not bot.is_active:
+        raise HTTPException(
+            status_code=404,
+            detail="Bot not found"
+        )
+    if not bot.is_free and not user_crud.has_bot_access(db, user_id=current_user.id, bot_id=bot.id):
+        raise HTTPException(
+            status_code=403,
+            detail="You do not have access to this bot"
+        )
+    return execution_crud.create_for_user(db, obj_in=execution_in, user_id=current_user.id, bot=bot)
+
+@router.websocket("/ws")
+async def execution_events_socket(websocket: WebSocket, token: str = Query(..., description="Access token")) -> None:
+    """
+    Push status changes of all of the user's executions over a WebSocket.
+    
+    Browsers cannot set an Authorization header on WebSockets, so the
+    access token comes as a query parameter. Messages are JSON status
+    events; {"event": "resync"} means events may have been missed and
+    current state should be re-read.
+    
+    Args:
+        websocket: WebSocket connection
+        token: JWT access token
+    """
+    def authenticate() -> Optional[UserModel]:
+        with SessionLocal() as db:
+            user = user_from_token(db, token)
+            return user if user is not None and user_crud.is_active(user) else None
+    
+    user = await run_in_threadpool(authenticate)
+    if user is None:
+        await websocket.close(code=1008)
+        return
+    
+    await websocket.accept()
+    subscription = execution_events.subscribe(user_id=user.id)
+    try:
+        while True:
+            event = await subscription.get(timeout=settings.EXECUTION_EVENTS_KEEPALIVE)
+            # Sending is also how a vanished client is noticed
+            await websocket.send_json(event if event is not None else {"event": "keepalive"})
+    except WebSocketDisconnect:
+        pass
+    finally:
+        subscription.close()
+
+@router.get("/{execution_id}/events")
+async def stream_execution_events(*,execution_id: UUID,credentials: HTTPAuthorizationCredentials = Depends(security),) -> Any:
+    """
+    Stream an execution's status changes as Server-Sent Events.
+    
+    The first event is the current status; the stream ends after a final
+    status (completed, failed, cancelled). Authentication and the first
+    read share one short-lived session rather than the request-scoped one,
+    so an open stream holds no database connection, and opening many at
+    once cannot tie up the threadpool waiting for connections.
+    
+    Args:
+        execution_id: Execution UUID
+        credentials: JWT token from Authorization header
+        
+    Returns:
+        text/event-stream response
+        
+    Raises:
+        HTTPException: If the token is invalid or the execution does not exist or belongs to someone else
+    """
+    def load() -> Dict[str, Any]:
+        with SessionLocal() as db:
+            current_user = get_current_active_user(get_current_user(db, credentials))
+            return status_event(get_own_execution(execution_id, db, current_user))
+    
+    # Subscribe before reading, so no change between the two is missed
+    subscription = execution_events.subscribe(execution_id=execution_id)
+    try:
+        first = await run_in_threadpool(load)
+    except BaseException:
+        subscription.close()
+        raise
+    user_id = UUID(first["user_id"])
+    
+    async def events() -> AsyncIterator[str]:
+        try:
+            event = first
+            while True:
+                if event is None:
+                    yield ": keepalive\n\n"
+                else:
+                    if event.get("event") == "resync":
+                        event = await run_in_threadpool(current_status, execution_id, user_id)
+                        if event is None:
+                            return
+                    yield sse(event)
+                    if event["execution_status"] in TERMINAL_STATUSES:
+                        return
+                event = await subscription.get(timeout=settings.EXECUTION_EVENTS_KEEPALIVE)
+        finally:
+            subscription.close()
+    
+    # Also closed after the response: a stream that never started never runs its finally
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=BackgroundTask(subscription.close),
+    )
+
+@router.get("/{execution_id}", response_model=ExecutionResponse)
+def read_execution(*,db: Session = Depends(get_db),execution_id: UUID,current_user: UserModel = Depends(get_current_active_user),) -> Any:
+    """
+    Get one of the current user's executions.
+    
+    Args:
+        db: Database session
+        execution_id: Execution UUID
+        current_user: Current authenticated user
+        
+    Returns:
+        Execution data (without input and output payloads)
+        
+    Raises:
+        HTTPException: If the execution does not exist or belongs to someone else
+    """
+    return get_own_execution(execution_id, db, current_user)
+
+@router.get("/{execution_id}/output")
+def download_execution_output(*,request: Request,db: Session = Depends(get_db),execution_id: UUID,current_user: UserModel = Depends(get_current_active_user),) -> Any:
+    """
+    Download an execution's output as JSON, streamed from the blob store.
+    
+    Args:
+        request: Incoming request (for If-None-Match)
+        db: Database session
+        execution_id: Execution UUID
+        current_user: Current authenticated user
+        
+    Returns:
+        Streaming JSON response
+        
+    Raises:
+        HTTPException: If the execution or its output does not exist
+    """
+    execution = get_own_execution(execution_id, db, current_user)
+    return payload_response(request, execution, "output")
+
+@router.get("/{execution_id}/input")
+def download_execution_input(*,request: Request,db: Session = Depends(get_db),execution_id: UUID,current_user: UserModel = Depends(get_current_active_user),) -> Any:
+    """
+    Download an execution's input parameters as JSON.
+    
+    Args:
+        request: Incoming request (for If-None-Match)
+        db: Database session
+        execution_id: Execution UUID
+        current_user: Current authenticated user
+        
+    Returns:
+        Streaming JSON response
+        
+    Raises:
+        HTTPException: If the execution or its input does not exist
+    """
+    execution = get_own_execution(execution_id, db, current_user)
+    return payload_response(request, execution, "input")
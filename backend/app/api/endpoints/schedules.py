@@ -0,0 +1,144 @@
+# File: app/api/endpoints/schedules.py
+from typing import Any, List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from app.api.deps.database import get_db
+from app.api.deps.auth import get_current_active_user
+from app.core.config import settings
+from app.crud.bot import bot as bot_crud
+from app.crud.execution import serialize_payload
+from app.crud.schedule import schedule as schedule_crud
+from app.crud.user import user as user_crud
+from app.models.UserModel import UserModel
+from app.schemas.ScheduleSchema import ScheduleCreate, ScheduleResponse, ScheduleUpdate
+from app.services.scheduler import validate_schedule
+
+"""
+Scheduled bot execution endpoints.
+
+The schedules are run by the scheduler service (scripts/run_scheduler.py),
+which picks up changes made here within SCHEDULER_RELOAD_INTERVAL seconds.
+"""
+
+router = APIRouter()
+
+def check_schedule(cron_expression: str, timezone: str, input_parameters: Optional[dict]) -> None:
+    """
+    Validate a schedule definition, raising 400 with the reason.
+    """
+    try:
+        validate_schedule(cron_expression, timezone)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    # Scheduled runs copy the parameters inline, keep them below the blob threshold
+    if input_parameters is not None and len(serialize_payload(input_parameters)) > settings.EXECUTION_INLINE_PAYLOAD_MAX:
+        raise HTTPException(status_code=400, detail="Input parameters are too large for a schedule")
+
+def get_runnable_bot(bot_id: UUID, db: Session, current_user: UserModel):
+    """
+    The bot a schedule runs, if it exists and the user may run it: it is
+    free or the user has an active access grant for it.
+    """
+    bot = bot_crud.get(db, id=bot_id)
+    if not bot or not bot.is_active:
+        raise HTTPException(
+            status_code=404,
+            detail="Bot not found"
+        )
+    if not bot.is_free and not user_crud.has_bot_access(db, user_id=current_user.id, bot_id=bot.id):
+        raise HTTPException(
+            status_code=403,
+            detail="You do not have access to this bot"
+        )
+    return bot
+
+def get_own_schedule(schedule_id: UUID, db: Session, current_user: UserModel):
+    schedule = schedule_crud.get_for_user(db, id=schedule_id, user_id=current_user.id)
+    if not schedule:
+        raise HTTPException(
+            status_code=404,
+            detail="Schedule not found"
+        )
+    return schedule
+
+@router.post("/", response_model=ScheduleResponse)
+def create_schedule(*,db: Session = Depends(get_db),schedule_in: ScheduleCreate,current_user: UserModel = Depends(get_current_active_user),) -> Any:
+    """
+    Schedule recurring executions of a bot.
+    
+    Args:
+        db: Database session
+        schedule_in: Schedule definition
+        current_user: Current authenticated user
+        
+    Returns:
+        Created schedule, including its first run time
+        
+    Raises:
+        HTTPException: If the bot does not exist, the user has no access to it or the schedule is invalid
+    """
+    get_runnable_bot(schedule_in.bot_id, db, current_user)
+    check_schedule(schedule_in.cron_expression, schedule_in.timezone, schedule_in.input_parameters)
+    return schedule_crud.create_for_user(db, obj_in=schedule_in, user_id=current_user.id)
+
+@router.get("/", response_model=List[ScheduleResponse])
+def read_schedules(db: Session = Depends(get_db),current_user: UserModel = Depends(get_current_active_user),skip: int = Query(0, ge=0),limit: int = Query(100, ge=1, le=100),) -> Any:
+    """
+    List the current user's schedules.
+    
+    Args:
+        db: Database session
+        current_user: Current authenticated user
+        skip: Number of items to skip for pagination
+        limit: Maximum number of items to return
+        
+    Returns:
+        List of schedules
+    """
+    return schedule_crud.get_multi_for_user(db, user_id=current_user.id, skip=skip, limit=limit)
+
+@router.get("/{schedule_id}", response_model=ScheduleResponse)
+def read_schedule(*,db: Session = Depends(get_db),schedule_id: UUID,current_user: UserModel = Depends(get_current_active_user),) -> Any:
+    """
+    Get one of the current user's schedules.
+    """
+    return get_own_schedule(schedule_id, db, current_user)
+
+@router.put("/{schedule_id}", response_model=ScheduleResponse)
+def update_schedule(*,db: Session = Depends(get_db),schedule_id: UUID,schedule_in: ScheduleUpdate,current_user: UserModel = Depends(get_current_active_user),) -> Any:
+    """
+    Change, pause (is_active=false) or resume a schedule.
+    
+    Args:
+        db: Database session
+        schedule_id: Schedule UUID
+        schedule_in: Fields to change
+        current_user: Current authenticated user
+        
+    Returns:
+        Updated schedule
+        
+    Raises:
+        HTTPException: If the schedule does not exist, the change is invalid, or the
+            schedule stays active and the user no longer has access to its bot
+    """
+    schedule = get_own_schedule(schedule_id, db, current_user)
+    # Pausing needs no access, so runs of a bot whose access lapsed can be stopped
+    stays_active = schedule.is_active if schedule_in.is_active is None else schedule_in.is_active
+    if stays_active:
+        get_runnable_bot(schedule.bot_id, db, current_user)
+    check_schedule(
+        schedule_in.cron_expression or schedule.cron_expression,
+        schedule_in.timezone or schedule.timezone,
+        schedule_in.input_parameters,
+    )
+    return schedule_crud.update(db, db_obj=schedule, obj_in=schedule_in)
+
+@router.delete("/{schedule_id}", response_model=ScheduleResponse)
+def delete_schedule(*,db: Session = Depends(get_db),schedule_id: UUID,current_user: UserModel = Depends(get_current_active_user),) -> Any:
+    """
+    Stop a schedule. Executions it already created are kept.
+    """
+    schedule = get_own_schedule(schedule_id, db, current_user)
+    return schedule_crud.deactivate(db, db_obj=schedule)
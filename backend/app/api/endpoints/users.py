@@ -1,12 +1,18 @@
 # File: app/api/endpoints/users.py
+import json
+from datetime import datetime
 from typing import Any
-from fastapi import APIRouter, Depends
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 from app.api.deps.database import get_db
 from app.api.deps.auth import get_current_active_user
 from app.crud.user import user as user_crud
 from app.models.UserModel import UserModel
+from app.schemas.BotSchema import BotLibraryResponse
 from app.schemas.UserSchema import UserResponse, UserUpdate
+from app.services.catalog_cache import cached_details
+from app.utils.pagination import decode_cursor, encode_cursor
 
 """
 User management endpoints.
@@ -41,4 +47,34 @@ def update_user_me(*,db: Session = Depends(get_db),user_in: UserUpdate,current_u
             Updated user data
     """
     user = user_crud.update(db, db_obj=current_user, obj_in=user_in)
-    return user
\ No newline at end of file
+    return user
+
+@router.get("/me/bots", response_model=BotLibraryResponse)
+def read_user_bots(*,db: Session = Depends(get_db),current_user: UserModel = Depends(get_current_active_user),cursor: str = Query(None, description="next_cursor of the previous page"),limit: int = Query(50, ge=1, le=100, description="Number of bots to return"),) -> Any:
+    """
+        Get the bots the current user has access to, most recently granted first.
+        
+        Pages use keyset pagination, so each one costs the same however
+        many bots the user owns, and bot cards come from the catalog cache
+        (one query for any that are not cached).
+        
+        Args:
+            db: Database session
+            current_user: Current authenticated user
+            cursor: Position after the previous page
+            limit: Maximum number of bots to return
+            
+        Returns:
+            A page of bot data and the cursor of the next page
+    """
+    after = decode_cursor(cursor, datetime, UUID)
+    grants = user_crud.get_library_page(db, user_id=current_user.id, after=after, limit=limit + 1)
+    next_cursor = None
+    if len(grants) > limit:
+        access_id, granted_at, _ = grants[limit - 1]
+        next_cursor = encode_cursor(granted_at, access_id)
+    bodies = cached_details(db, [str(bot_id) for _, _, bot_id in grants[:limit]])
+    return Response(
+        content=b'{"items":[' + b",".join(bodies) + b'],"next_cursor":' + json.dumps(next_cursor).encode() + b"}",
+        media_type="application/json",
+    )
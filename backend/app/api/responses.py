@@ -0,0 +1,74 @@
+# File: app/api/responses.py
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from fastapi import Request, Response
+from app.core.config import settings
+from app.services.cache import CachedPayload
+from app.services.catalog_version import CatalogVersion
+from app.utils.compression import negotiate_encoding
+
+"""
+Helpers for building responses from cached payloads, and HTTP
+conditional GET handling for catalog resources.
+"""
+
+def catalog_cache_headers(version: CatalogVersion) -> Dict[str, str]:
+    """
+    Validators and caching policy for a catalog response at `version`.
+    """
+    return {
+        "ETag": version.etag,
+        "Last-Modified": version.last_modified,
+        "Cache-Control": f"public, max-age={settings.CATALOG_HTTP_MAX_AGE}",
+    }
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches `etag`: "*", or any listed tag
+    by weak comparison (W/ prefixes ignored on both sides).
+    """
+    current = etag.removeprefix("W/")
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or current in tags
+
+def is_not_modified(request: Request, version: CatalogVersion) -> bool:
+    """
+    Whether the client's cached copy is still current (RFC 9110 section 13).
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted
+    when no entity tag was sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, version.etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            return False
+        # HTTP dates have one second resolution
+        return version.updated_at.replace(microsecond=0) <= since
+    return False
+
+def not_modified_response(version: CatalogVersion) -> Response:
+    return Response(status_code=304, headers=catalog_cache_headers(version))
+
+def cached_json_response(request: Request, payload: CachedPayload, headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    Send a cached JSON payload in the best encoding the client accepts.
+
+    The compressed bytes come from the payload itself, so they are produced
+    once per cache entry instead of once per request.
+    """
+    encoding = None
+    if len(payload.body) >= settings.COMPRESSION_MIN_SIZE:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    response = Response(content=payload.encoded(encoding), media_type="application/json", headers=headers)
+    response.headers["Vary"] = "Accept-Encoding"
+    if encoding is not None:
+        response.headers["Content-Encoding"] = encoding
+    return response
@@ -1,9 +1,7 @@
 
 from typing import List, Optional 
 from pydantic_settings import BaseSettings
-from pydantic import Field 
-import os 
-from dotenv import load_dotenv 
+from pydantic import Field, field_validator
 
 class Settings(BaseSettings):
     
@@ -23,18 +21,92 @@ class Settings(BaseSettings):
             DATABASE_URL (str): The database connection URL.
             DB_POOL_SIZE (int): The size of the database connection pool.
             DB_MAX_OVERFLOW (int): The maximum overflow size for the database connection pool.
+            DB_POOL_PREWARM (int): Number of pool connections opened at startup, before the first request.
+            DB_DRIVER (str): PostgreSQL driver, "psycopg2" or "psycopg" (psycopg 3, with server-side prepared statements).
+            DB_PREPARE_THRESHOLD (Optional[int]): psycopg 3 only: executions after which a statement is prepared on the server; -1 (None) disables (e.g. behind PgBouncer in transaction mode), 0 prepares on first use.
+            DB_PREPARED_MAX (int): psycopg 3 only: prepared statements kept per connection.
+            DATABASE_REPLICA_URLS (List[str]): Read replica connection URLs; empty sends all traffic to DATABASE_URL.
+            DB_REPLICA_STRATEGY (str): How reads are spread over replicas, "round_robin" or "least_connections".
+            DB_REPLICA_MAX_LAG (float): Replication lag, in seconds, above which a replica gets no reads.
+            DB_REPLICA_LAG_CHECK_INTERVAL (float): Seconds between replication lag checks per replica.
+            DB_READ_YOUR_WRITES_WINDOW (int): Seconds a client's reads go to the primary after it wrote.
             SECRET_KEY (str): The secret key for security purposes.
             ALGORITHM (str): The algorithm used for token encoding.
             ACCESS_TOKEN_EXPIRE_MINUTES (int): The expiration time for access tokens in minutes.
+            ADMIN_EMAILS (List[str]): Email addresses of the users allowed to use admin endpoints (revenue analytics).
             ALLOWED_HOSTS (List[str]): A list of allowed hosts for CORS.
             ENVIRONMENT (str): The current environment (e.g., development, production).
             DEBUG (bool): A flag indicating whether debugging is enabled.
+            LOG_LEVEL (str): The log level for the application loggers.
+            SQL_QUERY_REPEAT_THRESHOLD (int): Times a statement shape may run in one request before it is flagged as a likely N+1.
+            COMPRESSION_MIN_SIZE (int): Smallest response body, in bytes, that gets compressed.
+            COMPRESSION_GZIP_LEVEL (int): gzip level used for dynamic responses.
+            COMPRESSION_BROTLI_QUALITY (int): brotli quality used for dynamic responses.
+            CATALOG_CACHE_TTL (int): Seconds a cached catalog response stays fresh.
+            CATALOG_CACHE_STALE_TTL (int): Seconds after that during which a stale response is served while it is refreshed in the background.
+            CATALOG_CACHE_TTL_JITTER (float): Random +/- fraction applied to each entry's TTL.
+            CATALOG_REFRESH_WORKERS (int): Threads per worker that refresh stale catalog entries.
+            CATALOG_CACHE_MAX_ENTRIES (int): Maximum number of cached catalog responses per worker.
+            CATALOG_HTTP_MAX_AGE (int): max-age, in seconds, sent to clients and CDNs for catalog responses.
+            CATALOG_COALESCE_TIMEOUT (float): Seconds a request waits for an identical in-flight catalog query before running its own.
+            BLOB_STORE_BACKEND (str): Blob store backend for large execution payloads ("local").
+            BLOB_STORE_PATH (str): Blob store location; a directory for the local backend.
+            EXECUTION_INLINE_PAYLOAD_MAX (int): Largest execution input/output, in bytes, kept inline in the database.
+            EXECUTION_CACHE_TTL (int): Seconds a deterministic bot's result may be reused for identical input; 0 disables reuse.
+            EXECUTION_CACHE_MAX_ENTRIES (int): Results kept in each process's execution cache.
+            EXECUTION_CACHE_MAX_BYTES (int): Inline output bytes kept in each process's execution cache.
+            EXECUTION_EVENTS_KEEPALIVE (float): Seconds between keepalives on idle execution event streams.
+            EXECUTION_EVENTS_QUEUE_SIZE (int): Events buffered per subscriber before the oldest are dropped.
+            EXECUTION_EVENTS_RECONNECT_INTERVAL (float): Seconds before the status listener reconnects after losing its connection.
+            EXECUTION_STATS_ACCURACY (float): Relative accuracy of the per-bot execution time sketches (0.01 = within 1%).
+            EXECUTION_STATS_MIN_SAMPLES (int): Executions a bot needs before its execution_time_estimate is maintained automatically.
+            EXECUTION_STATS_FLUSH_INTERVAL (float): Seconds between merges of an executor's execution times into the stored statistics.
+            LEADERBOARD_REBUILD_INTERVAL (float): Seconds after which the leaderboards are recomputed from the database (corrects drift).
+            LEADERBOARD_TRENDING_HALF_LIFE (float): Seconds after which a purchase or review counts half as much towards trending.
+            LEADERBOARD_RATING_PRIOR_WEIGHT (float): Virtual average ratings added to every bot when ranking by rating.
+            RECOMMENDATIONS_TOP_K (int): Recommendations stored per bot.
+            RECOMMENDATIONS_MIN_COOCCURRENCE (int): Users two bots must have in common before one is recommended for the other.
+            RECOMMENDATIONS_RELOAD_INTERVAL (float): Seconds between checks for newly built recommendations.
+            SIMILARITY_INDEX_PATH (str): Directory holding the text similarity index builds.
+            SIMILARITY_REFRESH_INTERVAL (float): Seconds between checks for changed bots and newer index builds.
+            SIMILARITY_MAX_DELTA (int): Bots changed since the last build before the index is rebuilt.
+            SUGGEST_REFRESH_INTERVAL (float): Seconds between checks for catalog writes to apply to the suggestion index.
+            SUGGEST_MAX_INCREMENTAL (int): Changed bots applied one by one; more than this rebuilds the suggestion index.
+            SCHEDULER_TICK_SECONDS (float): Resolution of the schedule timing wheel.
+            SCHEDULER_WHEEL_SLOTS (int): Ticks covered by the wheel; later fire times wait in an overflow heap.
+            SCHEDULER_BATCH_SIZE (int): Schedules fired per statement.
+            SCHEDULER_RELOAD_INTERVAL (float): Seconds between incremental reloads of changed schedules.
+            SCHEDULER_FULL_RELOAD_INTERVAL (float): Seconds between full reloads (catches hard deletes).
+            SCHEDULER_LEADER_RETRY_INTERVAL (float): Seconds a standby scheduler waits before retrying for leadership.
+            RUNNER_BACKEND (str): How bot runners are started, "subprocess" (local interpreter) or "docker".
+            RUNNER_BOT_PATH (str): Directory holding one subdirectory of code per bot (named by bot id).
+            RUNNER_ENTRY_POINT (str): "module:function" called with the input parameters in a bot's directory.
+            RUNNER_MAX_PER_RUNTIME (int): Most runners per (docker_image, python_version).
+            RUNNER_MAX_TOTAL (int): Most runners per executor process.
+            RUNNER_MIN_IDLE (int): Warm runners kept per runtime that had work within RUNNER_IDLE_TIMEOUT.
+            RUNNER_MAX_USES (int): Executions after which a runner is replaced.
+            RUNNER_MAX_MEMORY_MB (int): Peak memory after which a runner is replaced (hard container limit with docker).
+            RUNNER_IDLE_TIMEOUT (float): Seconds an unneeded idle runner is kept before it is closed.
+            RUNNER_START_TIMEOUT (float): Seconds a runner may take to start.
+            RUNNER_JOB_TIMEOUT (float): Seconds an execution may run before its runner is killed.
+            RUNNER_LEASE_TIMEOUT (float): Seconds an execution waits for a runner before going back to the queue.
+            EXECUTOR_POLL_INTERVAL (float): Seconds between executor polls of the execution queue.
+            EXECUTOR_REAP_INTERVAL (float): Seconds between checks for executions left running by an executor that died.
+            EXECUTOR_STALE_GRACE (float): Seconds past the longest legitimate run before a running execution counts as abandoned.
             REDIS_URL (str): The Redis connection URL.
+            REDIS_ENABLED (bool): Whether to use Redis for shared state (falls back to in-process state when off or down).
+            REDIS_SOCKET_TIMEOUT (float): Connect/read timeout for Redis calls, in seconds.
+            REDIS_RETRY_INTERVAL (float): Seconds to wait before reconnecting after a Redis failure.
+            RATE_LIMIT_ENABLED (bool): Whether rate limits are enforced.
+            RATE_LIMIT_LOGIN_PER_IP (str): Login attempts allowed per client IP, e.g. "20/minute".
+            RATE_LIMIT_LOGIN_PER_USER (str): Login attempts allowed per username.
+            RATE_LIMIT_REGISTER_PER_IP (str): Registrations allowed per client IP.
+            RATE_LIMIT_SEARCH_PER_IP (str): Catalog searches allowed per client IP.
+            RATE_LIMIT_SEARCH_PER_USER (str): Catalog searches allowed per authenticated user.
             STRIPE_SECRET_KEY (Optional[str]): The secret key for Stripe API.
             OPENAI_API_KEY (Optional[str]): The API key for OpenAI services.
     """
     
-    load_dotenv()
     # API Settings 
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME : str = "1.0.0"
@@ -46,11 +118,23 @@ class Settings(BaseSettings):
     # Database connection pool settings
     DB_POOL_SIZE: int = Field(default=5, env="DB_POOL_SIZE")
     DB_MAX_OVERFLOW: int = Field(default=10, env="DB_MAX_OVERFLOW")
+    DB_POOL_PREWARM: int = Field(default=2, env="DB_POOL_PREWARM")
+    DB_DRIVER: str = Field(default="psycopg2", env="DB_DRIVER")
+    DB_PREPARE_THRESHOLD: Optional[int] = Field(default=2, env="DB_PREPARE_THRESHOLD")
+    DB_PREPARED_MAX: int = Field(default=256, env="DB_PREPARED_MAX")
+    
+    # Read replica settings
+    DATABASE_REPLICA_URLS: List[str] = Field(default=[], env="DATABASE_REPLICA_URLS")
+    DB_REPLICA_STRATEGY: str = Field(default="round_robin", env="DB_REPLICA_STRATEGY")
+    DB_REPLICA_MAX_LAG: float = Field(default=5.0, env="DB_REPLICA_MAX_LAG")
+    DB_REPLICA_LAG_CHECK_INTERVAL: float = Field(default=1.0, env="DB_REPLICA_LAG_CHECK_INTERVAL")
+    DB_READ_YOUR_WRITES_WINDOW: int = Field(default=10, env="DB_READ_YOUR_WRITES_WINDOW")
     
     # Security Settings 
     SECRET_KEY: str = Field(..., env="SECRET_KEY")
     ALGORITHM: str = Field(default="HS256", env="ALGORITHM")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30, env="ACCESS_TOKEN_EXPIRE_MINUTES")
+    ADMIN_EMAILS: List[str] = Field(default=[], env="ADMIN_EMAILS")
     
     # CORS Settings (Cross-Origin Resource Sharing)
     ALLOWED_HOSTS: List[str] = Field(default=["http://localhost:3000", "http://localhost:8000"], env="ALLOWED_HOSTS")
@@ -58,16 +142,121 @@ class Settings(BaseSettings):
     # Environment
     ENVIRONMENT: str = Field(default="development", env="ENVIRONMENT")
     DEBUG: bool = Field(default=False, env="DEBUG")
+    LOG_LEVEL: str = Field(default="INFO", env="LOG_LEVEL")
+    
+    # Query instrumentation
+    SQL_QUERY_REPEAT_THRESHOLD: int = Field(default=5, env="SQL_QUERY_REPEAT_THRESHOLD")
+    
+    # Response compression
+    COMPRESSION_MIN_SIZE: int = Field(default=1024, env="COMPRESSION_MIN_SIZE")
+    COMPRESSION_GZIP_LEVEL: int = Field(default=6, env="COMPRESSION_GZIP_LEVEL")
+    COMPRESSION_BROTLI_QUALITY: int = Field(default=4, env="COMPRESSION_BROTLI_QUALITY")
+    
+    # Catalog response cache
+    CATALOG_CACHE_TTL: int = Field(default=60, env="CATALOG_CACHE_TTL")
+    CATALOG_CACHE_STALE_TTL: int = Field(default=300, env="CATALOG_CACHE_STALE_TTL")
+    CATALOG_CACHE_TTL_JITTER: float = Field(default=0.1, env="CATALOG_CACHE_TTL_JITTER")
+    CATALOG_REFRESH_WORKERS: int = Field(default=2, env="CATALOG_REFRESH_WORKERS")
+    CATALOG_CACHE_MAX_ENTRIES: int = Field(default=2048, env="CATALOG_CACHE_MAX_ENTRIES")
+    CATALOG_HTTP_MAX_AGE: int = Field(default=10, env="CATALOG_HTTP_MAX_AGE")
+    CATALOG_COALESCE_TIMEOUT: float = Field(default=10.0, env="CATALOG_COALESCE_TIMEOUT")
+    
+    # Execution payload storage
+    BLOB_STORE_BACKEND: str = Field(default="local", env="BLOB_STORE_BACKEND")
+    BLOB_STORE_PATH: str = Field(default="./data/blobs", env="BLOB_STORE_PATH")
+    EXECUTION_INLINE_PAYLOAD_MAX: int = Field(default=64 * 1024, env="EXECUTION_INLINE_PAYLOAD_MAX")
+    
+    # Result reuse for deterministic bots
+    EXECUTION_CACHE_TTL: int = Field(default=3600, env="EXECUTION_CACHE_TTL")
+    EXECUTION_CACHE_MAX_ENTRIES: int = Field(default=10000, env="EXECUTION_CACHE_MAX_ENTRIES")
+    EXECUTION_CACHE_MAX_BYTES: int = Field(default=64 * 1024 * 1024, env="EXECUTION_CACHE_MAX_BYTES")
+    
+    # Execution status push (LISTEN/NOTIFY -> SSE/WebSocket)
+    EXECUTION_EVENTS_KEEPALIVE: float = Field(default=15.0, env="EXECUTION_EVENTS_KEEPALIVE")
+    EXECUTION_EVENTS_QUEUE_SIZE: int = Field(default=100, env="EXECUTION_EVENTS_QUEUE_SIZE")
+    EXECUTION_EVENTS_RECONNECT_INTERVAL: float = Field(default=2.0, env="EXECUTION_EVENTS_RECONNECT_INTERVAL")
+    
+    # Execution time statistics
+    EXECUTION_STATS_ACCURACY: float = Field(default=0.01, env="EXECUTION_STATS_ACCURACY")
+    EXECUTION_STATS_MIN_SAMPLES: int = Field(default=20, env="EXECUTION_STATS_MIN_SAMPLES")
+    EXECUTION_STATS_FLUSH_INTERVAL: float = Field(default=60.0, env="EXECUTION_STATS_FLUSH_INTERVAL")
+    
+    # Leaderboards
+    LEADERBOARD_REBUILD_INTERVAL: float = Field(default=600.0, env="LEADERBOARD_REBUILD_INTERVAL")
+    LEADERBOARD_TRENDING_HALF_LIFE: float = Field(default=172800.0, env="LEADERBOARD_TRENDING_HALF_LIFE")
+    LEADERBOARD_RATING_PRIOR_WEIGHT: float = Field(default=5.0, env="LEADERBOARD_RATING_PRIOR_WEIGHT")
+    
+    # Recommendations
+    RECOMMENDATIONS_TOP_K: int = Field(default=20, env="RECOMMENDATIONS_TOP_K")
+    RECOMMENDATIONS_MIN_COOCCURRENCE: int = Field(default=2, env="RECOMMENDATIONS_MIN_COOCCURRENCE")
+    RECOMMENDATIONS_RELOAD_INTERVAL: float = Field(default=60.0, env="RECOMMENDATIONS_RELOAD_INTERVAL")
+    
+    # Text similarity ("similar bots")
+    SIMILARITY_INDEX_PATH: str = Field(default="./data/similarity", env="SIMILARITY_INDEX_PATH")
+    SIMILARITY_REFRESH_INTERVAL: float = Field(default=30.0, env="SIMILARITY_REFRESH_INTERVAL")
+    SIMILARITY_MAX_DELTA: int = Field(default=5000, env="SIMILARITY_MAX_DELTA")
+    
+    # Typeahead suggestions
+    SUGGEST_REFRESH_INTERVAL: float = Field(default=2.0, env="SUGGEST_REFRESH_INTERVAL")
+    SUGGEST_MAX_INCREMENTAL: int = Field(default=2000, env="SUGGEST_MAX_INCREMENTAL")
+    
+    # Scheduled executions
+    SCHEDULER_TICK_SECONDS: float = Field(default=1.0, env="SCHEDULER_TICK_SECONDS")
+    SCHEDULER_WHEEL_SLOTS: int = Field(default=3600, env="SCHEDULER_WHEEL_SLOTS")
+    SCHEDULER_BATCH_SIZE: int = Field(default=500, env="SCHEDULER_BATCH_SIZE")
+    SCHEDULER_RELOAD_INTERVAL: float = Field(default=5.0, env="SCHEDULER_RELOAD_INTERVAL")
+    SCHEDULER_FULL_RELOAD_INTERVAL: float = Field(default=600.0, env="SCHEDULER_FULL_RELOAD_INTERVAL")
+    SCHEDULER_LEADER_RETRY_INTERVAL: float = Field(default=5.0, env="SCHEDULER_LEADER_RETRY_INTERVAL")
+    
+    # Bot runners
+    RUNNER_BACKEND: str = Field(default="subprocess", env="RUNNER_BACKEND")
+    RUNNER_BOT_PATH: str = Field(default="./data/bots", env="RUNNER_BOT_PATH")
+    RUNNER_ENTRY_POINT: str = Field(default="main:run", env="RUNNER_ENTRY_POINT")
+    RUNNER_MAX_PER_RUNTIME: int = Field(default=4, env="RUNNER_MAX_PER_RUNTIME")
+    RUNNER_MAX_TOTAL: int = Field(default=16, env="RUNNER_MAX_TOTAL")
+    RUNNER_MIN_IDLE: int = Field(default=1, env="RUNNER_MIN_IDLE")
+    RUNNER_MAX_USES: int = Field(default=50, env="RUNNER_MAX_USES")
+    RUNNER_MAX_MEMORY_MB: int = Field(default=512, env="RUNNER_MAX_MEMORY_MB")
+    RUNNER_IDLE_TIMEOUT: float = Field(default=300.0, env="RUNNER_IDLE_TIMEOUT")
+    RUNNER_START_TIMEOUT: float = Field(default=30.0, env="RUNNER_START_TIMEOUT")
+    RUNNER_JOB_TIMEOUT: float = Field(default=600.0, env="RUNNER_JOB_TIMEOUT")
+    RUNNER_LEASE_TIMEOUT: float = Field(default=60.0, env="RUNNER_LEASE_TIMEOUT")
+    EXECUTOR_POLL_INTERVAL: float = Field(default=1.0, env="EXECUTOR_POLL_INTERVAL")
+    EXECUTOR_REAP_INTERVAL: float = Field(default=60.0, env="EXECUTOR_REAP_INTERVAL")
+    EXECUTOR_STALE_GRACE: float = Field(default=120.0, env="EXECUTOR_STALE_GRACE")
     
     # Redis Settings
     REDIS_URL: str = Field(default="redis://localhost:6379", env="REDIS_URL")
+    REDIS_ENABLED: bool = Field(default=True, env="REDIS_ENABLED")
+    REDIS_SOCKET_TIMEOUT: float = Field(default=0.25, env="REDIS_SOCKET_TIMEOUT")
+    REDIS_RETRY_INTERVAL: float = Field(default=30.0, env="REDIS_RETRY_INTERVAL")
+    
+    # Rate limiting ("<requests>/<second|minute|hour>", token bucket with burst = requests)
+    RATE_LIMIT_ENABLED: bool = Field(default=True, env="RATE_LIMIT_ENABLED")
+    RATE_LIMIT_LOGIN_PER_IP: str = Field(default="20/minute", env="RATE_LIMIT_LOGIN_PER_IP")
+    RATE_LIMIT_LOGIN_PER_USER: str = Field(default="5/minute", env="RATE_LIMIT_LOGIN_PER_USER")
+    RATE_LIMIT_REGISTER_PER_IP: str = Field(default="5/minute", env="RATE_LIMIT_REGISTER_PER_IP")
+    RATE_LIMIT_SEARCH_PER_IP: str = Field(default="60/minute", env="RATE_LIMIT_SEARCH_PER_IP")
+    RATE_LIMIT_SEARCH_PER_USER: str = Field(default="120/minute", env="RATE_LIMIT_SEARCH_PER_USER")
     
     # External API Keys
     STRIPE_SECRET_KEY: Optional[str] = Field(default=None, env="STRIPE_SECRET_KEY")
     OPENAI_API_KEY: Optional[str] = Field(default=None, env="OPENAI_API_KEY")
     
+    @field_validator("DB_PREPARE_THRESHOLD", mode="before")
+    @classmethod
+    def disable_prepare_threshold(cls, value):
+        """
+        Map a negative threshold (DB_PREPARE_THRESHOLD=-1) to None, which
+        turns server-side prepared statements off; the environment cannot
+        express None itself, and psycopg reads 0 as "prepare at once".
+        """
+        if value is not None and int(value) < 0:
+            return None
+        return value
+    
     class Config:
-        # This tells Pydantic to load values from .env file
+        # This tells Pydantic to load values from .env file (no load_dotenv() needed)
         env_file = ".env"
         case_sensitive = True
 
@@ -0,0 +1,67 @@
+# File: app/core/redis.py
+import logging
+import threading
+import time
+from typing import Optional
+from app.core.config import settings
+
+try:
+    import redis
+except ImportError:  # Redis support is optional, callers fall back to in-process state
+    redis = None
+
+"""
+Shared Redis connection.
+
+Redis is optional: when it is disabled, not installed or unreachable,
+get_redis() returns None and features fall back to per-process state.
+After a failure we stop trying for REDIS_RETRY_INTERVAL seconds, so an
+outage costs one connection timeout per interval instead of one per call.
+"""
+
+logger = logging.getLogger(__name__)
+
+class RedisConnection:
+
+    def __init__(self, url: str, retry_interval: float):
+        self.url = url
+        self.retry_interval = retry_interval
+        self._client = None
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+
+    def client(self) -> Optional["redis.Redis"]:
+        """
+        A connected client, or None if Redis is unavailable right now.
+        """
+        if self._client is not None:
+            return self._client
+        if redis is None or not settings.REDIS_ENABLED or time.monotonic() < self._retry_at:
+            return None
+        with self._lock:
+            if self._client is None and time.monotonic() >= self._retry_at:
+                try:
+                    client = redis.Redis.from_url(
+                        self.url,
+                        socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                    )
+                    client.ping()
+                    self._client = client
+                except redis.RedisError as exc:
+                    logger.warning("redis unavailable, using in-process fallback", extra={"error": str(exc)})
+                    self._retry_at = time.monotonic() + self.retry_interval
+        return self._client
+
+    def mark_failed(self) -> None:
+        """
+        Drop the client after an operation failed; reconnect after the retry interval.
+        """
+        with self._lock:
+            self._client = None
+            self._retry_at = time.monotonic() + self.retry_interval
+
+redis_connection = RedisConnection(settings.REDIS_URL, retry_interval=settings.REDIS_RETRY_INTERVAL)
+
+def get_redis() -> Optional["redis.Redis"]:
+    return redis_connection.client()
@@ -0,0 +1,116 @@
+# File: app/core/startup.py
+import logging
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple
+
+"""
+Startup work and the startup profiler.
+
+Everything a worker has to do before it can answer quickly (ORM mapper
+configuration, opening pool connections, loading hashing backends, warming
+caches) runs here, from the FastAPI lifespan, instead of on the first
+request. Each step is timed so slow boots can be diagnosed from the
+"startup complete" log line.
+
+Modules register cache warmers with the @warmup decorator; they run in
+registration order after the database pool is ready.
+
+This module is imported before anything heavy, keep its imports to the
+standard library.
+"""
+
+logger = logging.getLogger("app.startup")
+
+class StartupProfiler:
+    """
+    Records how long each import/startup phase takes.
+    """
+
+    def __init__(self):
+        self.created = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - started))
+
+    def report(self) -> Dict[str, float]:
+        """
+        Phase durations in milliseconds, plus the total since the profiler was created.
+        """
+        report = {name: round(seconds * 1000, 2) for name, seconds in self.phases}
+        report["total"] = round((time.perf_counter() - self.created) * 1000, 2)
+        return report
+
+# Created when app.main starts importing, so "total" includes import time
+profiler = StartupProfiler()
+
+_warmups: List[Tuple[str, Callable[[], None]]] = []
+
+def warmup(name: str) -> Callable:
+    """
+    Register a function to run once at startup, after the pool is warm.
+
+    Warmers must be idempotent and cheap enough to run on every worker boot.
+    Failures are logged and do not stop the worker from starting.
+    """
+    def decorator(func: Callable[[], None]) -> Callable[[], None]:
+        _warmups.append((name, func))
+        return func
+    return decorator
+
+def configure_orm() -> None:
+    """
+    Resolve all relationships now instead of on the first query.
+    """
+    from sqlalchemy.orm import configure_mappers
+    import app.models  # noqa: F401  (registers every mapper)
+    configure_mappers()
+
+def prewarm_pool(size: int) -> int:
+    """
+    Open `size` pool connections up front and hand them back to the pool.
+
+    Returns the number of connections that were opened.
+    """
+    from app.db.session.database import engine
+    size = min(size, engine.pool.size())
+    connections = []
+    try:
+        for _ in range(size):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+    return len(connections)
+
+def run_startup() -> Dict[str, float]:
+    """
+    Run all blocking startup steps and return the timing report.
+    """
+    from app.core.config import settings
+
+    with profiler.phase("startup.configure_mappers"):
+        configure_orm()
+
+    with profiler.phase("startup.db_pool"):
+        try:
+            prewarm_pool(settings.DB_POOL_PREWARM)
+        except Exception:
+            logger.warning("could not pre-open database connections", exc_info=True)
+
+    for name, func in _warmups:
+        with profiler.phase(f"warmup.{name}"):
+            try:
+                func()
+            except Exception:
+                logger.warning("cache warmup failed", extra={"warmup": name}, exc_info=True)
+
+    report = profiler.report()
+    logger.info("startup complete", extra={"timings_ms": report})
+    return report
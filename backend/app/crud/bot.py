@@ -1,9 +1,15 @@
 # File: app/crud/bot.py
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, any_, bindparam, or_, select, tuple_
 from app.crud.base import CRUDBase
 from app.models.BotModel import BotModel
+from app.models.Bot_execution_statsModel import BotExecutionStatsModel
+from app.models.Bot_ReviewModel import BotReviewModel
+from app.models.BotRatingHistogram import bot_rating_histograms
 from app.models.CategoryModel import CategoryModel
 from app.schemas.BotSchema import BotCreate, BotUpdate
 
@@ -114,6 +120,108 @@ class CRUDBot(CRUDBase[BotModel, BotCreate, BotUpdate]):
             .limit(limit)
             .all()
         )
+    
+    def get_many(self, db: Session, *, ids: List[UUID]) -> List[BotModel]:
+        """
+        Get bots by ID, with their categories.
+        
+        One `id = ANY(:ids)` query whatever the number of ids (a single
+        statement to prepare and plan), plus one for all the categories.
+        
+        Args:
+            db: Database session
+            ids: Bot UUIDs
+            
+        Returns:
+            Bot models found, in no particular order
+        """
+        return (
+            db.query(BotModel)
+            .options(selectinload(BotModel.categories))
+            .filter(BotModel.id == any_(bindparam("ids", ids, type_=ARRAY(PG_UUID(as_uuid=True)))))
+            .all()
+        )
+    
+    def get_execution_stats(self, db: Session, *, bot_id: str) -> Optional[BotExecutionStatsModel]:
+        """
+        Get a bot's execution time statistics.
+        
+        Args:
+            db: Database session
+            bot_id: Bot UUID
+            
+        Returns:
+            Statistics model, or None if none of the bot's executions ran yet
+        """
+        return db.query(BotExecutionStatsModel).filter(BotExecutionStatsModel.bot_id == bot_id).first()
+    
+    def get_reviews_page(self, db: Session, *, bot_id: str, after: Optional[Tuple[datetime, UUID]] = None, limit: int = 20) -> List[BotReviewModel]:
+        """
+        Get a page of a bot's reviews, newest first.
+        
+        Keyset pagination on (created_at, id): the query seeks straight to
+        `after` in ix_botreviews_bot_id_created_at, so every page costs the
+        same however many reviews the bot has.
+        
+        Args:
+            db: Database session
+            bot_id: Bot UUID
+            after: (created_at, review id) of the last review of the previous page
+            limit: Maximum number of reviews
+            
+        Returns:
+            List of review models
+        """
+        query = db.query(BotReviewModel).filter(BotReviewModel.bot_id == bot_id)
+        if after is not None:
+            query = query.filter(tuple_(BotReviewModel.created_at, BotReviewModel.id) < tuple_(*after))
+        return (
+            query
+            .order_by(BotReviewModel.created_at.desc(), BotReviewModel.id.desc())
+            .limit(limit)
+            .all()
+        )
+    
+    def get_rating_histogram(self, db: Session, *, bot_id: str) -> List[int]:
+        """
+        Get the number of reviews of each rating, kept current by triggers on botreviews.
+        
+        Args:
+            db: Database session
+            bot_id: Bot UUID
+            
+        Returns:
+            Review counts for 1 to 5 stars
+        """
+        columns = [bot_rating_histograms.c[f"rating_{stars}"] for stars in range(1, 6)]
+        row = db.execute(select(*columns).where(bot_rating_histograms.c.bot_id == bot_id)).first()
+        return list(row) if row is not None else [0] * 5
+    
+    def get_names_containing(self, db: Session, *, query: str, exclude: List[str], limit: int = 10) -> List[tuple]:
+        """
+        Most downloaded active bots whose name contains `query` anywhere.
+        
+        Served by the trigram index on bots.name for queries of 3+ characters.
+        
+        Args:
+            db: Database session
+            query: Text to find in the name (LIKE wildcards are matched literally)
+            exclude: Bot ids already suggested
+            limit: Maximum number of records
+            
+        Returns:
+            (id, name) rows
+        """
+        filters = [BotModel.name.icontains(query, autoescape=True), BotModel.is_active == True]
+        if exclude:
+            filters.append(BotModel.id.notin_(exclude))
+        return (
+            db.query(BotModel.id, BotModel.name)
+            .filter(and_(*filters))
+            .order_by(BotModel.download_count.desc().nulls_last(), BotModel.id)
+            .limit(limit)
+            .all()
+        )
 
 # Create instance to use in API endpoints
 bot = CRUDBot(BotModel)
\ No newline at end of file
@@ -0,0 +1,183 @@
+# File: app/crud/execution.py
+import json
+from datetime import datetime, timezone
+from typing import Any, Iterator, Optional, Tuple
+from uuid import UUID
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.crud.base import CRUDBase
+from app.models.BotModel import BotModel
+from app.models.Bot_executionModel import BotExecutionModel
+from app.schemas.ExecutionSchema import ExecutionCreate, ExecutionUpdate
+from app.services.blob_store import get_blob_store
+from app.services.execution_cache import CachedResult, execution_cache, input_hash
+
+"""
+Bot execution CRUD with blob-backed payloads.
+
+Inputs and outputs are serialized once; payloads up to
+EXECUTION_INLINE_PAYLOAD_MAX bytes stay in the JSONB columns, larger ones
+go to the blob store and the row keeps only the content hash and size.
+Serialization is canonical (sorted keys), so identical payloads share a blob
+and hash the same for the execution cache of deterministic bots.
+"""
+
+PAYLOAD_COLUMNS = {"input": "input_parameters", "output": "output_data"}
+
+def serialize_payload(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+class CRUDExecution(CRUDBase[BotExecutionModel, ExecutionCreate, ExecutionUpdate]):
+    """
+    CRUD operations for bot executions.
+    """
+    
+    def _store_payload(self, db_obj: BotExecutionModel, field: str, value: Any) -> Optional[bytes]:
+        """
+        Set a payload inline or as a blob reference, depending on its size.
+        Returns the serialized payload (None for no payload).
+        """
+        column = PAYLOAD_COLUMNS[field]
+        if value is None:
+            setattr(db_obj, column, None)
+            setattr(db_obj, f"{field}_blob_key", None)
+            setattr(db_obj, f"{field}_size", None)
+            return None
+        body = serialize_payload(value)
+        if len(body) > settings.EXECUTION_INLINE_PAYLOAD_MAX:
+            ref = get_blob_store().put(body)
+            setattr(db_obj, column, None)
+            setattr(db_obj, f"{field}_blob_key", ref.key)
+        else:
+            setattr(db_obj, column, value)
+            setattr(db_obj, f"{field}_blob_key", None)
+        setattr(db_obj, f"{field}_size", len(body))
+        return body
+    
+    def use_cache(self, db: Session, *, db_obj: BotExecutionModel, bot: BotModel, input_body: Optional[bytes]) -> bool:
+        """
+        Key a deterministic bot's execution for the execution cache and, on
+        a hit, complete it with the cached output (not committed).
+        
+        Args:
+            db: Database session
+            db_obj: Queued execution
+            bot: The execution's bot
+            input_body: Serialized input parameters (None for no input)
+            
+        Returns:
+            True if the execution was completed from the cache
+        """
+        if not bot.is_deterministic:
+            return False
+        db_obj.input_hash = input_hash(input_body if input_body is not None else serialize_payload(None))
+        db_obj.bot_version = bot.version
+        cached = execution_cache.lookup(db, (bot.id, bot.version, db_obj.input_hash))
+        if cached is None:
+            return False
+        self._complete_from_cache(db_obj, cached)
+        return True
+    
+    def _complete_from_cache(self, db_obj: BotExecutionModel, cached: CachedResult) -> None:
+        # Blob outputs are content-addressed, the reference can be shared as is
+        db_obj.output_data = cached.output
+        db_obj.output_blob_key = cached.output_blob_key
+        db_obj.output_size = cached.output_size
+        now = datetime.now(timezone.utc)
+        db_obj.execution_status = "completed"
+        db_obj.cache_hit = True
+        db_obj.started_at = now
+        db_obj.completed_at = now
+        db_obj.execution_time = 0
+        db_obj.error_message = None
+    
+    def create_for_user(self, db: Session, *, obj_in: ExecutionCreate, user_id: UUID, bot: Optional[BotModel] = None) -> BotExecutionModel:
+        """
+        Create a queued execution.
+        
+        Args:
+            db: Database session
+            obj_in: Execution creation schema
+            user_id: User starting the execution
+            bot: The bot being run; when given and deterministic, a cached
+                result completes the execution right away
+            
+        Returns:
+            Created execution model
+        """
+        db_obj = BotExecutionModel(user_id=user_id, bot_id=obj_in.bot_id, execution_status="queued")
+        body = self._store_payload(db_obj, "input", obj_in.input_parameters)
+        if bot is not None:
+            self.use_cache(db, db_obj=db_obj, bot=bot, input_body=body)
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+    
+    def get_for_user(self, db: Session, *, id: UUID, user_id: UUID) -> Optional[BotExecutionModel]:
+        """
+        Get an execution if it belongs to the user.
+        """
+        return (
+            db.query(BotExecutionModel)
+            .filter(BotExecutionModel.id == id, BotExecutionModel.user_id == user_id)
+            .first()
+        )
+    
+    def set_output(self, db: Session, *, db_obj: BotExecutionModel, output: Any) -> BotExecutionModel:
+        """
+        Store an execution's output.
+        
+        Args:
+            db: Database session
+            db_obj: Execution to update
+            output: JSON-serializable result
+            
+        Returns:
+            Updated execution model
+        """
+        self._store_payload(db_obj, "output", output)
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+    
+    def load_payload(self, db_obj: BotExecutionModel, field: str) -> Any:
+        """
+        Read a stored payload back as a Python value, from the row or the blob store.
+        """
+        blob_key = getattr(db_obj, f"{field}_blob_key")
+        if blob_key:
+            with get_blob_store().open(blob_key) as f:
+                return json.load(f)
+        return getattr(db_obj, PAYLOAD_COLUMNS[field])
+    
+    def payload_key(self, db_obj: BotExecutionModel, field: str) -> Optional[str]:
+        """
+        Content hash of a blob payload (None for inline or missing ones), known without opening it.
+        """
+        return getattr(db_obj, f"{field}_blob_key")
+    
+    def payload_stream(self, db_obj: BotExecutionModel, field: str) -> Tuple[Optional[Iterator[bytes]], Optional[int], Optional[str]]:
+        """
+        Stream a stored payload as JSON bytes.
+        
+        Args:
+            db_obj: Execution
+            field: "input" or "output"
+            
+        Returns:
+            (chunks, size, blob key); chunks is None when there is no payload.
+            Blob payloads are read from the store in chunks, inline ones
+            are small by construction.
+        """
+        blob_key = self.payload_key(db_obj, field)
+        if blob_key:
+            return get_blob_store().iter_chunks(blob_key), getattr(db_obj, f"{field}_size"), blob_key
+        value = getattr(db_obj, PAYLOAD_COLUMNS[field])
+        if value is None:
+            return None, None, None
+        body = serialize_payload(value)
+        return iter((body,)), len(body), None
+
+execution = CRUDExecution(BotExecutionModel)
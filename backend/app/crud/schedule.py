@@ -0,0 +1,88 @@
+# File: app/crud/schedule.py
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Union
+from uuid import UUID
+from sqlalchemy.orm import Session
+from app.crud.base import CRUDBase
+from app.models.Bot_scheduleModel import BotScheduleModel
+from app.schemas.ScheduleSchema import ScheduleCreate, ScheduleUpdate
+from app.services.scheduler import next_fire_time
+
+class CRUDSchedule(CRUDBase[BotScheduleModel, ScheduleCreate, ScheduleUpdate]):
+    """
+    CRUD operations for bot schedules.
+    
+    Every write bumps updated_at, which is how the scheduler service finds
+    changed schedules; deleting only deactivates the row for the same reason.
+    """
+    
+    def create_for_user(self, db: Session, *, obj_in: ScheduleCreate, user_id: UUID) -> BotScheduleModel:
+        """
+        Create a schedule and compute its first run.
+        
+        Args:
+            db: Database session
+            obj_in: Schedule creation schema (already validated)
+            user_id: Owner
+            
+        Returns:
+            Created schedule model
+        """
+        db_obj = BotScheduleModel(
+            user_id=user_id,
+            bot_id=obj_in.bot_id,
+            cron_expression=obj_in.cron_expression,
+            timezone=obj_in.timezone,
+            input_parameters=obj_in.input_parameters,
+            is_active=True,
+            next_run_at=next_fire_time(obj_in.cron_expression, obj_in.timezone, datetime.now(timezone.utc)),
+        )
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+    
+    def get_for_user(self, db: Session, *, id: UUID, user_id: UUID) -> Optional[BotScheduleModel]:
+        """
+        Get a schedule if it belongs to the user.
+        """
+        return (
+            db.query(BotScheduleModel)
+            .filter(BotScheduleModel.id == id, BotScheduleModel.user_id == user_id)
+            .first()
+        )
+    
+    def get_multi_for_user(self, db: Session, *, user_id: UUID, skip: int = 0, limit: int = 100) -> List[BotScheduleModel]:
+        """
+        Get a user's schedules, newest first.
+        """
+        return (
+            db.query(BotScheduleModel)
+            .filter(BotScheduleModel.user_id == user_id)
+            .order_by(BotScheduleModel.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+    
+    def update(self, db: Session, *, db_obj: BotScheduleModel, obj_in: Union[ScheduleUpdate, Dict[str, Any]]) -> BotScheduleModel:
+        """
+        Update a schedule; the next run is recomputed from now.
+        """
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(db_obj, field, value)
+        if db_obj.is_active:
+            db_obj.next_run_at = next_fire_time(db_obj.cron_expression, db_obj.timezone, datetime.now(timezone.utc))
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+    
+    def deactivate(self, db: Session, *, db_obj: BotScheduleModel) -> BotScheduleModel:
+        """
+        Soft delete: the scheduler drops inactive schedules on its next reload.
+        """
+        return self.update(db, db_obj=db_obj, obj_in={"is_active": False})
+
+schedule = CRUDSchedule(BotScheduleModel)
@@ -1,11 +1,24 @@
 # File: app/crud/user.py
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import func, or_, tuple_
 from sqlalchemy.orm import Session
 from app.crud.base import CRUDBase
 from app.models.UserModel import UserModel
+from app.models.User_Bot_AccessModel import UserBotAccessModel
 from app.schemas.UserSchema import UserCreate, UserUpdate
 from app.utils.security import get_password_hash, verify_password
 
+def active_grant() -> tuple:
+    """
+    Filter conditions for access grants that are active and not expired.
+    """
+    return (
+        UserBotAccessModel.is_active == True,
+        or_(UserBotAccessModel.expires_at.is_(None), UserBotAccessModel.expires_at > func.now()),
+    )
+
 class CRUDUser(CRUDBase[UserModel, UserCreate, UserUpdate]):
     """
     CRUD operations for User model with additional authentication methods.
@@ -94,6 +107,54 @@ class CRUDUser(CRUDBase[UserModel, UserCreate, UserUpdate]):
         
         return user
     
+    def get_library_page(self, db: Session, *, user_id: UUID, after: Optional[Tuple[datetime, UUID]] = None, limit: int = 50) -> List[Tuple[UUID, datetime, UUID]]:
+        """
+        Get a page of the bots a user currently has access to, newest grant first.
+        
+        Keyset pagination on (granted_at, id): the query seeks straight to
+        `after` in ix_userbotaccesss_library and reads only the index, so
+        every page costs the same however many grants the user has.
+        
+        Args:
+            db: Database session
+            user_id: User UUID
+            after: (granted_at, access id) of the last grant of the previous page
+            limit: Maximum number of grants
+            
+        Returns:
+            (access id, granted_at, bot id) of each grant
+        """
+        query = (
+            db.query(UserBotAccessModel.id, UserBotAccessModel.granted_at, UserBotAccessModel.bot_id)
+            .filter(UserBotAccessModel.user_id == user_id, *active_grant())
+        )
+        if after is not None:
+            query = query.filter(tuple_(UserBotAccessModel.granted_at, UserBotAccessModel.id) < tuple_(*after))
+        return (
+            query
+            .order_by(UserBotAccessModel.granted_at.desc(), UserBotAccessModel.id.desc())
+            .limit(limit)
+            .all()
+        )
+    
+    def has_bot_access(self, db: Session, *, user_id: UUID, bot_id: UUID) -> bool:
+        """
+        Check if a user holds an active, unexpired access grant for a bot.
+        
+        Args:
+            db: Database session
+            user_id: User UUID
+            bot_id: Bot UUID
+            
+        Returns:
+            True if the user has access, False otherwise
+        """
+        return db.query(
+            db.query(UserBotAccessModel.id)
+            .filter(UserBotAccessModel.user_id == user_id, UserBotAccessModel.bot_id == bot_id, *active_grant())
+            .exists()
+        ).scalar()
+    
     def is_active(self, user: UserModel) -> bool:
         """
         Check if user account is active.
@@ -1,8 +1,12 @@
 
-from sqlalchemy import create_engine
+from typing import Any, Dict
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base 
 from sqlalchemy.orm import sessionmaker 
 from app.core.config import settings
+from app.db.session.instrumentation import instrument_engine
+from app.db.session.routing import ReplicaSet, RoutingSession
 
 """
 Database session setup explained
@@ -11,21 +15,67 @@ Database session setup explained
 2. SessionLocal: A factory for creating database sessions 
 3. Base: The base class for all our database models
 4. get_db: A dependency that provides database sessions to API endpoints
+
+DB_DRIVER selects psycopg2 (default) or psycopg 3. With psycopg 3 every
+connection prepares a statement on the server once it has run
+DB_PREPARE_THRESHOLD times, so the hot CRUD queries skip parsing and
+planning, and executemany() batches are sent in pipeline mode.
+DB_PREPARE_THRESHOLD=-1 turns preparing off (PgBouncer in transaction mode).
 """
 
+DRIVERS = {"psycopg2": "postgresql+psycopg2", "psycopg": "postgresql+psycopg"}
+
+def driver_url(url: str) -> str:
+    """
+    Rewrite a postgresql:// URL to use the driver chosen by DB_DRIVER.
+    """
+    if settings.DB_DRIVER not in DRIVERS:
+        raise ValueError(f"Unknown DB_DRIVER {settings.DB_DRIVER!r}, expected one of {list(DRIVERS)}")
+    return make_url(url).set(drivername=DRIVERS[settings.DB_DRIVER]).render_as_string(hide_password=False)
+
+def make_engine(url: str, **kwargs: Any) -> Engine:
+    """
+    Create an engine with the pool and driver settings shared by primary and replicas.
+    """
+    connect_args: Dict[str, Any] = {}
+    if settings.DB_DRIVER == "psycopg":
+        connect_args["prepare_threshold"] = settings.DB_PREPARE_THRESHOLD
+    new_engine = create_engine(
+        driver_url(url),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        echo=settings.DEBUG,
+        connect_args=connect_args,
+        **kwargs,
+    )
+    if settings.DB_DRIVER == "psycopg":
+        @event.listens_for(new_engine, "connect")
+        def _set_prepared_max(dbapi_connection, connection_record):
+            dbapi_connection.prepared_max = settings.DB_PREPARED_MAX
+    return new_engine
+
 # Create the sqlalchemy engine from create_engine method 
+engine = make_engine(settings.DATABASE_URL)
+
+# Optional read replicas, used for GET traffic (see routing.py)
+replica_engines = [make_engine(url, pool_pre_ping=True) for url in settings.DATABASE_REPLICA_URLS]
+
+# Count queries and database time per request (Server-Timing header)
+for _engine in (engine, *replica_engines):
+    instrument_engine(_engine)
 
-engine = create_engine(
-    settings.DATABASE_URL, 
-    pool_size=settings.DB_POOL_SIZE, 
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    echo=settings.DEBUG,
+RoutingSession.replicas = ReplicaSet(
+    replica_engines,
+    strategy=settings.DB_REPLICA_STRATEGY,
+    max_lag=settings.DB_REPLICA_MAX_LAG,
+    check_interval=settings.DB_REPLICA_LAG_CHECK_INTERVAL,
 )
 
 SessionLocal = sessionmaker(
 autocommit=False,    # Don't auto-commit transactions
 autoflush=False,     # Don't auto-flush changes
-bind=engine          # Bind to our engine
+bind=engine,         # Bind to our engine (the primary)
+class_=RoutingSession,  # Reads may go to a replica
     )
 
 # Create a Base class for our models to inherit from
@@ -0,0 +1,91 @@
+# File: app/db/session/instrumentation.py
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+"""
+Per-request SQL accounting.
+
+Cursor execution hooks on the engine add every statement to the QueryStats
+object of the request that is currently running (see QueryTimingMiddleware).
+Statements that run outside of a request (scripts, startup) are not counted.
+
+The stats object is shared by reference, so queries issued from the sync
+endpoint threadpool still land on the request that started them.
+"""
+
+# Stats for the request currently being handled, if any
+request_query_stats: ContextVar[Optional["QueryStats"]] = ContextVar("request_query_stats", default=None)
+
+_WHITESPACE = re.compile(r"\s+")
+# Expanded IN lists and multi-row VALUES differ only in the number of placeholders
+_PLACEHOLDER = re.compile(r"%\([^)]+\)s|%s|\$\d+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+
+def statement_shape(statement: str) -> str:
+    """
+    Normalize a SQL statement so that executions differing only in bound
+    parameters (including the length of IN lists) compare equal.
+    """
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _PLACEHOLDER.sub("?", shape)
+    return _PLACEHOLDER_LIST.sub("?", shape)
+
+class QueryStats:
+    """
+    Query counters for a single request.
+
+    Attributes:
+        count: Number of statements executed
+        duration: Total time spent in the database, in seconds
+        shapes: Execution count per statement shape (only when track_shapes is set)
+    """
+
+    __slots__ = ("count", "duration", "shapes", "track_shapes")
+
+    def __init__(self, track_shapes: bool = False):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: Counter = Counter()
+        self.track_shapes = track_shapes
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.duration += elapsed
+        if self.track_shapes:
+            self.shapes[statement_shape(statement)] += 1
+
+    def repeated_shapes(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        Statement shapes executed more than `threshold` times, most frequent first.
+        """
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start_time"].pop()
+    stats = request_query_stats.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+def _handle_error(exception_context):
+    # after_cursor_execute is skipped on errors, keep the timer stack balanced
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Register the query accounting hooks on an engine.
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
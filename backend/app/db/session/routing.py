@@ -0,0 +1,226 @@
+# File: app/db/session/routing.py
+import itertools
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import TextClause
+from app.core.redis import get_redis, redis, redis_connection
+
+"""
+Read replica routing.
+
+RoutingSession picks an engine per statement: reads go to a replica when
+the request allows it, everything else goes to the primary. A request is
+replica-eligible when it is a safe method (GET/HEAD), the client has not
+written recently (see ReadYourWritesMiddleware: a pin per authenticated
+user in recent_writers, or a cookie for anonymous clients) and the
+session itself has not written yet.
+
+Replicas are picked round-robin or by fewest checked-out connections, and
+skipped while their replication lag is above DB_REPLICA_MAX_LAG; when no
+replica qualifies the primary serves the read. Without replicas configured
+every statement goes to the primary, exactly as before.
+
+Sessions created outside a request (scripts, background jobs) use the
+primary unless they are created with info={"read_only": True}.
+"""
+
+logger = logging.getLogger(__name__)
+
+class RecentWriters:
+    """
+    Users who wrote within the read-your-writes window, so their reads go to
+    the primary whichever worker serves them and whatever client they use.
+    Pins live in Redis (shared by all workers) or, when Redis is
+    unavailable, in process.
+    """
+
+    prefix = "db_primary:"
+
+    def __init__(self, max_users: int = 100_000):
+        self.max_users = max_users
+        self._local: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def pin(self, user_id: str, window: int) -> None:
+        """
+        Send `user_id`'s reads to the primary for the next `window` seconds.
+        """
+        client = get_redis()
+        if client is not None:
+            try:
+                client.set(self.prefix + user_id, "1", ex=window)
+                return
+            except redis.RedisError:
+                logger.warning("read-your-writes pin failed in redis, pinning in process", exc_info=True)
+                redis_connection.mark_failed()
+        now = time.time()
+        with self._lock:
+            if len(self._local) >= self.max_users:
+                self._local = {user: until for user, until in self._local.items() if until > now}
+            self._local[user_id] = now + window
+
+    def pinned(self, user_id: str) -> bool:
+        client = get_redis()
+        if client is not None:
+            try:
+                return bool(client.exists(self.prefix + user_id))
+            except redis.RedisError:
+                logger.warning("read-your-writes lookup failed in redis, using in-process pins", exc_info=True)
+                redis_connection.mark_failed()
+        return self._local.get(user_id, 0.0) > time.time()
+
+recent_writers = RecentWriters()
+
+class RoutingState:
+    """
+    Routing flags for the request currently being handled.
+
+    Attributes:
+        read_only: Request method allows reading from replicas
+        user_id: Authenticated user making the request, if any
+        wrote: A write went to the primary during this request
+    """
+
+    __slots__ = ("read_only", "user_id", "wrote", "_sticky")
+
+    def __init__(self, read_only: bool = False, sticky: bool = False, user_id: Optional[str] = None):
+        self.read_only = read_only
+        self.user_id = user_id
+        self.wrote = False
+        # A user's pin is looked up on first use, from the (threadpool) session
+        self._sticky: Optional[bool] = True if sticky else None
+
+    @property
+    def sticky(self) -> bool:
+        """
+        Client wrote recently, read from the primary.
+        """
+        if self._sticky is None:
+            self._sticky = self.user_id is not None and recent_writers.pinned(self.user_id)
+        return self._sticky
+
+# Shared by reference like request_query_stats, so threadpool handlers can flag writes
+request_routing: ContextVar[Optional[RoutingState]] = ContextVar("request_routing", default=None)
+
+# Zero when the replica has replayed everything it received (an idle primary
+# would otherwise look like growing lag), else time since the last replayed commit
+LAG_QUERY = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
+WRITE_KEYWORDS = ("insert", "update", "delete", "merge", "create", "alter", "drop", "truncate", "grant", "copy", "call")
+
+class Replica:
+    """
+    A replica engine plus its last measured replication lag.
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.lag = 0.0
+        self.checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def current_lag(self, interval: float) -> float:
+        """
+        Replication lag in seconds, re-measured at most every `interval`
+        seconds; an unreachable replica reports infinite lag.
+        """
+        if time.monotonic() - self.checked_at < interval or not self._lock.acquire(blocking=False):
+            return self.lag
+        try:
+            with self.engine.connect() as conn:
+                self.lag = float(conn.execute(LAG_QUERY).scalar() or 0)
+        except Exception:
+            logger.warning("replica %s unreachable, routing reads elsewhere", self.engine.url.host, exc_info=True)
+            self.lag = float("inf")
+        finally:
+            self.checked_at = time.monotonic()
+            self._lock.release()
+        return self.lag
+
+class ReplicaSet:
+    """
+    Picks a replica for reads.
+    """
+
+    STRATEGIES = ("round_robin", "least_connections")
+
+    def __init__(self, engines: List[Engine], strategy: str, max_lag: float, check_interval: float):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown replica strategy {strategy!r}, expected one of {self.STRATEGIES}")
+        self.replicas = [Replica(engine) for engine in engines]
+        self.strategy = strategy
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._counter = itertools.count()
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def choose(self) -> Optional[Engine]:
+        """
+        An eligible replica engine, or None to use the primary.
+        """
+        healthy = [r for r in self.replicas if r.current_lag(self.check_interval) <= self.max_lag]
+        if not healthy:
+            return None
+        if self.strategy == "least_connections":
+            return min(healthy, key=lambda r: r.engine.pool.checkedout()).engine
+        return healthy[next(self._counter) % len(healthy)].engine
+
+def is_write(clause) -> bool:
+    """
+    Whether a statement must run on the primary.
+    """
+    if clause is None:
+        return False
+    if getattr(clause, "is_dml", False) or getattr(clause, "is_ddl", False):
+        return True
+    if getattr(clause, "_for_update_arg", None) is not None:
+        return True
+    if isinstance(clause, TextClause):
+        words = clause.text.split(None, 1)
+        return bool(words) and words[0].lower() in WRITE_KEYWORDS
+    return False
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to replicas and writes to the primary.
+    """
+
+    replicas: ReplicaSet = ReplicaSet([], "round_robin", 0, 0)
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if not self.replicas:
+            return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+        state = request_routing.get()
+        if self._flushing or is_write(clause):
+            self.info["wrote"] = True
+            if state is not None:
+                state.wrote = True
+            return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+        read_only = self.info.get("read_only", state is not None and state.read_only)
+        if not read_only or self.info.get("wrote") or (state is not None and state.sticky):
+            return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+        # Stay on one replica for the whole session so reads are mutually consistent
+        replica = self.info.get("replica")
+        if replica is None:
+            replica = self.replicas.choose()
+            if replica is None:
+                return super().get_bind(mapper=mapper, clause=clause, **kw)
+            self.info["replica"] = replica
+        return replica
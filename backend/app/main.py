@@ -1,15 +1,48 @@
 # File: app/main.py
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from app.core.config import settings
-from app.api.endpoints import auth, users, bots
+from contextlib import asynccontextmanager
+from app.core.startup import profiler, run_startup, warmup
+
+# Imports are grouped into profiler phases for the startup report
+with profiler.phase("import.framework"):
+    from fastapi import FastAPI
+    from fastapi.concurrency import run_in_threadpool
+    from fastapi.middleware.cors import CORSMiddleware
+with profiler.phase("import.settings"):
+    from app.core.config import settings
+    from app.core.logging import configure_logging
+with profiler.phase("import.database"):
+    from app.db.session.database import SessionLocal
+    from app.middleware.compression import CompressionMiddleware
+    from app.middleware.routing import ReadYourWritesMiddleware
+    from app.middleware.timing import QueryTimingMiddleware
+with profiler.phase("import.routers"):
+    from app.api.endpoints import auth, users, bots, executions, schedules, analytics
+    from app.services.catalog_cache import catalog_cache
+    from app.services.execution_cache import execution_cache
+    from app.services.execution_events import execution_events
+    from app.services.leaderboards import leaderboards, track_leaderboard_events
+    from app.services.recommendations import recommendations
+    from app.services.similarity_index import similarity_index
+    from app.services.suggestions import suggestion_index
 
 """
 Main FastAPI application setup.
 
 This file creates and configures the FastAPI application instance.
+Worker startup work (mappers, pool, cache warmers) runs in the lifespan
+handler, see app/core/startup.py.
 """
 
+configure_logging()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Do all initialization before the worker accepts traffic.
+    """
+    app.state.startup_timings = await run_in_threadpool(run_startup)
+    yield
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -18,6 +51,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url="/docs",  # Swagger UI
     redoc_url="/redoc",  # ReDoc documentation
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -29,6 +63,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Route GET reads to replicas, keep recent writers on the primary
+app.add_middleware(ReadYourWritesMiddleware)
+
+# Compress dynamic responses (cached catalog payloads arrive precompressed)
+app.add_middleware(CompressionMiddleware)
+
+# Per-request query count and database time (Server-Timing header + request log)
+app.add_middleware(QueryTimingMiddleware)
+
+# Keep the leaderboards current with committed downloads, reviews and purchases
+track_leaderboard_events(SessionLocal)
+
 # Include API routers
 app.include_router(
     auth.router, 
@@ -45,6 +91,28 @@ app.include_router(
     prefix=f"{settings.API_V1_STR}/bots", 
     tags=["bots"]
 )
+app.include_router(
+    executions.router, 
+    prefix=f"{settings.API_V1_STR}/executions", 
+    tags=["executions"]
+)
+app.include_router(
+    schedules.router, 
+    prefix=f"{settings.API_V1_STR}/schedules", 
+    tags=["schedules"]
+)
+app.include_router(
+    analytics.router, 
+    prefix=f"{settings.API_V1_STR}/analytics", 
+    tags=["analytics"]
+)
+
+@warmup("openapi")
+def warm_openapi() -> None:
+    """
+    Build the OpenAPI schema now rather than on the first /docs hit.
+    """
+    app.openapi()
 
 @app.get("/")
 async def root():
@@ -60,6 +128,16 @@ async def root():
 @app.get("/health")
 async def health_check():
     """
-    Health check endpoint.
+    Health check endpoint, with this worker's cache and event stream counters.
     """
-    return {"status": "healthy", "version": settings.VERSION}
\ No newline at end of file
+    return {
+        "status": "healthy",
+        "version": settings.VERSION,
+        "catalog_cache": catalog_cache.stats(),
+        "execution_cache": execution_cache.stats(),
+        "execution_events": execution_events.stats(),
+        "leaderboards": leaderboards.stats(),
+        "recommendations": recommendations.stats(),
+        "similarity_index": similarity_index.stats(),
+        "suggestions": suggestion_index.stats(),
+    }
\ No newline at end of file
@@ -0,0 +1,82 @@
+# File: app/middleware/routing.py
+import time
+from http.cookies import SimpleCookie
+from typing import Optional
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+from app.db.session.routing import RoutingSession, RoutingState, recent_writers, request_routing
+from app.utils.security import decode_access_token
+
+"""
+Read-your-writes middleware for replica routing.
+
+Marks GET/HEAD requests as replica-eligible for RoutingSession. When a
+request writes to the primary, that client's reads go to the primary for
+the next DB_READ_YOUR_WRITES_WINDOW seconds, so it never reads a replica
+that has not caught up with its own write.
+
+API clients send a bearer token and usually keep no cookies, so the
+authenticated user is pinned (see RecentWriters) before the response goes
+out. Every client also gets a short-lived cookie, which covers anonymous
+browser sessions.
+"""
+
+COOKIE_NAME = "db_primary_until"
+SAFE_METHODS = ("GET", "HEAD")
+
+class ReadYourWritesMiddleware:
+
+    def __init__(self, app: ASGIApp, window: int = None):
+        self.app = app
+        self.window = settings.DB_READ_YOUR_WRITES_WINDOW if window is None else window
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        state = RoutingState(
+            read_only=scope["method"] in SAFE_METHODS,
+            sticky=self._sticky(headers),
+            # Only routing needs the user, and only when there are replicas to route to
+            user_id=self._user_id(headers) if RoutingSession.replicas else None,
+        )
+        token = request_routing.set(state)
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and state.wrote and self.window > 0:
+                if state.user_id is not None:
+                    await run_in_threadpool(recent_writers.pin, state.user_id, self.window)
+                until = int(time.time()) + self.window
+                MutableHeaders(scope=message).append(
+                    "Set-Cookie",
+                    f"{COOKIE_NAME}={until}; Max-Age={self.window}; Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_cookie)
+        finally:
+            request_routing.reset(token)
+
+    @staticmethod
+    def _user_id(headers: Headers) -> Optional[str]:
+        scheme, _, credentials = headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not credentials:
+            return None
+        payload = decode_access_token(credentials)
+        return str(payload["sub"]) if payload and payload.get("sub") else None
+
+    @staticmethod
+    def _sticky(headers: Headers) -> bool:
+        cookie_header = headers.get("cookie")
+        if not cookie_header:
+            return False
+        morsel = SimpleCookie(cookie_header).get(COOKIE_NAME)
+        try:
+            return morsel is not None and int(morsel.value) > time.time()
+        except ValueError:
+            return False
@@ -0,0 +1,82 @@
+# File: app/middleware/timing.py
+import logging
+import time
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+from app.db.session.instrumentation import QueryStats, request_query_stats
+
+"""
+Request timing middleware.
+
+Every HTTP response gets a Server-Timing header with the number of SQL
+statements, the time spent in the database and the total handler time, and
+one structured log line with the same numbers.
+
+In debug or test mode the middleware also looks for statement shapes that
+repeat more than SQL_QUERY_REPEAT_THRESHOLD times in one request, which is
+the usual signature of lazy relationship loads (N+1 queries).
+"""
+
+logger = logging.getLogger("app.request")
+
+class QueryTimingMiddleware:
+    """
+    Pure ASGI middleware, so the header can be added without buffering the body.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.detect_repeats = settings.DEBUG or settings.ENVIRONMENT == "test"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(track_shapes=self.detect_repeats)
+        token = request_query_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries", app;dur={elapsed_ms:.2f}',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_query_stats.reset(token)
+            self._report(scope, stats, status_code, time.perf_counter() - started)
+
+    def _report(self, scope: Scope, stats: QueryStats, status_code: int, elapsed: float) -> None:
+        """
+        Emit the structured request log and any repeated statement warnings.
+        """
+        route = scope.get("route")
+        path = getattr(route, "path", scope["path"])
+        logger.info(
+            "request completed",
+            extra={
+                "method": scope["method"],
+                "path": path,
+                "status_code": status_code,
+                "duration_ms": round(elapsed * 1000, 2),
+                "db_queries": stats.count,
+                "db_time_ms": round(stats.duration * 1000, 2),
+            },
+        )
+        if self.detect_repeats:
+            for shape, count in stats.repeated_shapes(settings.SQL_QUERY_REPEAT_THRESHOLD):
+                logger.warning(
+                    "repeated statement detected, possible N+1 query",
+                    extra={"method": scope["method"], "path": path, "repeat_count": count, "statement": shape},
+                )
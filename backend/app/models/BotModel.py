@@ -1,6 +1,6 @@
 
 # File: app/models/bot.py
-from sqlalchemy import Column, String, Text, DECIMAL, Boolean, Integer
+from sqlalchemy import Column, String, Text, DECIMAL, Boolean, Integer, Index
 from sqlalchemy.orm import relationship
 from app.models.BaseModel import BaseModel
 
@@ -38,6 +38,10 @@ class BotModel(BaseModel):
     
     github_repo_url = Column(String(255),comment="GitHub repository URL")
     
+    version = Column(Integer, nullable=False, default=1, server_default="1",comment="Bot code version; bump it when the code changes so cached results are not reused")
+    
+    is_deterministic = Column(Boolean, nullable=False, default=False, server_default="false",comment="Opt-in: same input gives the same output, so execution results may be reused")
+    
     # Media
     demo_video_url = Column(String(255),comment="URL to demo video" )
     
@@ -59,9 +63,17 @@ class BotModel(BaseModel):
     
     executions = relationship("BotExecutionModel",  back_populates="bot" )
     
+    schedules = relationship("BotScheduleModel", back_populates="bot", cascade="all, delete-orphan")
+    
     reviews = relationship("BotReviewModel", back_populates="bot",cascade="all, delete-orphan")
     
     user_access = relationship("UserBotAccessModel", back_populates="bot")
     
+    # Table constraints
+    __table_args__ = (
+        # Substring matches on names (ILIKE '%...%'), e.g. typeahead suggestions; needs pg_trgm
+        Index('ix_bots_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+    )
+    
     def __repr__(self):
         return f"<Bot(name='{self.name}', price={self.price})>"
\ No newline at end of file
@@ -0,0 +1,21 @@
+# File: app/models/BotRatingHistogram.py
+from sqlalchemy import Table, Column, BigInteger, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.session.database import Base
+
+"""
+Star rating histogram per bot.
+
+One row per reviewed bot with the number of reviews of each rating.
+Triggers on botreviews keep it current in the same transaction as the
+review writes (see the "add rating histograms" migration), so a review
+page reads five counters instead of grouping the bot's reviews.
+"""
+
+bot_rating_histograms = Table('bot_rating_histograms', Base.metadata,
+    Column('bot_id', UUID(as_uuid=True), ForeignKey('bots.id', ondelete='CASCADE'), primary_key=True, comment="Bot reviewed"),
+    *(
+        Column(f'rating_{stars}', BigInteger, nullable=False, default=0, comment=f"Reviews rating the bot {stars} of 5")
+        for stars in range(1, 6)
+    ),
+)
@@ -0,0 +1,20 @@
+# File: app/models/BotRecommendations.py
+from sqlalchemy import Table, Column, DateTime, REAL, ForeignKey
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from app.db.session.database import Base
+
+"""
+Precomputed "users who bought this also bought" lists.
+
+One row per bot with its most similar bots (cosine similarity of the
+sets of users holding access to each), best first. Written by
+scripts/build_recommendations.py, read whole into memory by the API
+(app/services/recommendations.py).
+"""
+
+bot_recommendations = Table('bot_recommendations', Base.metadata,
+    Column('bot_id', UUID(as_uuid=True), ForeignKey('bots.id', ondelete='CASCADE'), primary_key=True, comment="Bot the recommendations are for"),
+    Column('recommended_ids', ARRAY(UUID(as_uuid=True)), nullable=False, comment="Recommended bots, most similar first"),
+    Column('scores', ARRAY(REAL), nullable=False, comment="Similarity of each recommended bot (0 to 1)"),
+    Column('computed_at', DateTime(timezone=True), nullable=False, comment="Access grants up to this time were taken into account"),
+)
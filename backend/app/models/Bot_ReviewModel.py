@@ -1,8 +1,9 @@
 # File: app/models/bot_review.py
-from sqlalchemy import Column, String, Text, Boolean, Integer, CheckConstraint
+from sqlalchemy import Column, String, Text, Boolean, Integer, CheckConstraint, DateTime
+from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
 from app.models.BaseModel import BaseModel
 
 class BotReviewModel(BaseModel):
@@ -47,6 +48,14 @@ class BotReviewModel(BaseModel):
         comment="Whether this user actually purchased the bot"
     )
     
+    # Review pages seek on (created_at, id); a NULL would end paging at that review
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="Timestamp when the record was created"
+    )
+    
     # Relationships
     user = relationship(
         "UserModel",
@@ -63,6 +72,8 @@ class BotReviewModel(BaseModel):
     # Table constraints
     __table_args__ = (
         UniqueConstraint('user_id', 'bot_id', name='unique_user_bot_review'),
+        # Review pages, newest first, seek on (created_at, id) within a bot
+        Index('ix_botreviews_bot_id_created_at', 'bot_id', 'created_at', 'id'),
     )
     
     def __repr__(self):
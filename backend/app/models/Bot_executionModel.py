@@ -1,8 +1,8 @@
 # File: app/models/bot_execution.py
-from sqlalchemy import Column, String, Integer, Text, DateTime
+from sqlalchemy import Column, String, Integer, BigInteger, Boolean, Text, DateTime
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
-from sqlalchemy import ForeignKey
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy import ForeignKey, Index, text
 from app.models.BaseModel import BaseModel
 
 class BotExecutionModel(BaseModel):
@@ -12,6 +12,11 @@ class BotExecutionModel(BaseModel):
     New SQLAlchemy concepts:
     - JSONB: PostgreSQL's JSON with indexing support
     - Flexible data storage for bot parameters and results
+    - deferred(): large JSONB columns are only loaded when accessed
+    
+    Payloads larger than EXECUTION_INLINE_PAYLOAD_MAX are not stored inline:
+    the JSONB column stays NULL and *_blob_key points into the blob store
+    (see app/crud/execution.py).
     """
     
     __tablename__ = "bot_executions"
@@ -28,6 +33,12 @@ class BotExecutionModel(BaseModel):
         comment="Bot that was executed"
     )
     
+    schedule_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey('bot_schedules.id', ondelete='SET NULL'),
+        comment="Schedule that started this execution, if any"
+    )
+    
     # Execution status
     execution_status = Column(
         String(50),
@@ -36,14 +47,54 @@ class BotExecutionModel(BaseModel):
     )
     
     # Flexible data storage using JSONB
-    input_parameters = Column(
+    input_parameters = deferred(Column(
         JSONB,
         comment="Bot input parameters as JSON"
-    )
+    ))
     
-    output_data = Column(
+    output_data = deferred(Column(
         JSONB,
         comment="Bot execution results as JSON"
+    ))
+    
+    # Large payloads live in the blob store, the row keeps the content hash
+    input_blob_key = Column(
+        String(64),
+        comment="Blob store key of the input parameters when too large to inline"
+    )
+    
+    input_size = Column(
+        BigInteger,
+        comment="Serialized size of the input parameters in bytes"
+    )
+    
+    output_blob_key = Column(
+        String(64),
+        comment="Blob store key of the output when too large to inline"
+    )
+    
+    output_size = Column(
+        BigInteger,
+        comment="Serialized size of the output in bytes"
+    )
+    
+    # Result reuse for deterministic bots (see app/services/execution_cache.py)
+    input_hash = Column(
+        String(64),
+        comment="SHA-256 of the canonical input parameters, set for deterministic bots"
+    )
+    
+    bot_version = Column(
+        Integer,
+        comment="Bot version the execution ran (or was cached) for, set for deterministic bots"
+    )
+    
+    cache_hit = Column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default="false",
+        comment="Whether the output was reused from an earlier execution instead of running the bot"
     )
     
     # Execution metrics
@@ -86,11 +137,33 @@ class BotExecutionModel(BaseModel):
         back_populates="executions",
     )
     
+    schedule = relationship(
+        "BotScheduleModel",
+        back_populates="executions",
+    )
+    
     execution_logs = relationship(
         "ExecutionLogModel",
         back_populates="execution",
         cascade="all, delete-orphan",
     )
     
+    # Table constraints
+    __table_args__ = (
+        Index('ix_bot_executions_output_blob_key', 'output_blob_key', postgresql_where=text('output_blob_key IS NOT NULL')),
+        Index('ix_bot_executions_input_blob_key', 'input_blob_key', postgresql_where=text('input_blob_key IS NOT NULL')),
+        # Executor queue scans only touch queued rows
+        Index('ix_bot_executions_queued', 'created_at', postgresql_where=text("execution_status = 'queued'")),
+        # The executor's stale execution reaper looks only at running rows
+        Index('ix_bot_executions_running', 'started_at', postgresql_where=text("execution_status = 'running'")),
+        # ON DELETE SET NULL from bot_schedules looks executions up by schedule_id
+        Index('ix_bot_executions_schedule_id', 'schedule_id', postgresql_where=text('schedule_id IS NOT NULL')),
+        # Execution cache lookups: latest real run for (bot, version, input)
+        Index(
+            'ix_bot_executions_cache_lookup', 'bot_id', 'bot_version', 'input_hash', 'completed_at',
+            postgresql_where=text("input_hash IS NOT NULL AND execution_status = 'completed' AND NOT cache_hit"),
+        ),
+    )
+    
     def __repr__(self):
         return f"<BotExecution(bot_id='{self.bot_id}', status='{self.execution_status}')>"
\ No newline at end of file
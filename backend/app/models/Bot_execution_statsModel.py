@@ -0,0 +1,61 @@
+# File: app/models/Bot_execution_statsModel.py
+from sqlalchemy import Column, BigInteger, Float
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import ForeignKey
+from app.models.BaseModel import BaseModel
+
+class BotExecutionStatsModel(BaseModel):
+    """
+    Execution time distribution of a bot, as a mergeable quantile sketch.
+
+    Executors add the durations of the executions they run to in-memory
+    sketches and merge them into this row periodically (see
+    app/services/execution_stats.py); the percentiles are kept next to the
+    sketch so reading them needs no execution history.
+    """
+
+    __tablename__ = "bot_execution_stats"
+
+    bot_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey('bots.id', ondelete='CASCADE'),
+        nullable=False,
+        unique=True,
+        comment="Bot the statistics describe"
+    )
+
+    sketch = Column(
+        JSONB,
+        nullable=False,
+        comment="DDSketch of execution durations in seconds"
+    )
+
+    execution_count = Column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        comment="Executions in the sketch"
+    )
+
+    mean_seconds = Column(
+        Float,
+        comment="Mean execution time in seconds"
+    )
+
+    p50_seconds = Column(
+        Float,
+        comment="Median execution time in seconds"
+    )
+
+    p95_seconds = Column(
+        Float,
+        comment="95th percentile execution time in seconds"
+    )
+
+    p99_seconds = Column(
+        Float,
+        comment="99th percentile execution time in seconds"
+    )
+
+    def __repr__(self):
+        return f"<BotExecutionStats(bot_id='{self.bot_id}', p50={self.p50_seconds}, p95={self.p95_seconds})>"
@@ -0,0 +1,96 @@
+# File: app/models/Bot_scheduleModel.py
+from sqlalchemy import Column, String, Boolean, DateTime, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import relationship
+from sqlalchemy import ForeignKey
+from app.models.BaseModel import BaseModel
+
+class BotScheduleModel(BaseModel):
+    """
+    Recurring bot execution defined by a cron expression.
+    
+    The scheduler service (app/services/scheduler.py) keeps next_run_at of
+    every active schedule in memory and creates a BotExecutionModel row
+    each time one fires. next_run_at in the database is the source of truth
+    when a scheduler instance takes over from another.
+    """
+    
+    __tablename__ = "bot_schedules"
+    
+    # Foreign keys
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey('users.id', ondelete='CASCADE'),
+        nullable=False,
+        comment="User who owns the schedule"
+    )
+    
+    bot_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey('bots.id', ondelete='CASCADE'),
+        nullable=False,
+        comment="Bot to execute"
+    )
+    
+    # Schedule definition
+    cron_expression = Column(
+        String(100),
+        nullable=False,
+        comment="Five-field cron expression, e.g. '0 9 * * 1-5'"
+    )
+    
+    timezone = Column(
+        String(64),
+        nullable=False,
+        default="UTC",
+        comment="IANA time zone the cron expression is evaluated in"
+    )
+    
+    input_parameters = Column(
+        JSONB,
+        comment="Input parameters for every execution"
+    )
+    
+    is_active = Column(
+        Boolean,
+        nullable=False,
+        default=True,
+        comment="Paused or deleted schedules are inactive"
+    )
+    
+    # Timing
+    next_run_at = Column(
+        DateTime(timezone=True),
+        comment="Next time the schedule fires"
+    )
+    
+    last_run_at = Column(
+        DateTime(timezone=True),
+        comment="Last time the schedule fired"
+    )
+    
+    # Relationships
+    user = relationship(
+        "UserModel",
+        back_populates="bot_schedules",
+    )
+    
+    bot = relationship(
+        "BotModel",
+        back_populates="schedules",
+    )
+    
+    executions = relationship(
+        "BotExecutionModel",
+        back_populates="schedule",
+    )
+    
+    # Table constraints
+    __table_args__ = (
+        # Incremental scheduler reloads read rows changed since the last one
+        Index('ix_bot_schedules_updated_at', 'updated_at'),
+        Index('ix_bot_schedules_user_id', 'user_id'),
+    )
+    
+    def __repr__(self):
+        return f"<BotSchedule(bot_id='{self.bot_id}', cron='{self.cron_expression}')>"
@@ -0,0 +1,23 @@
+# File: app/models/CatalogVersion.py
+from sqlalchemy import Table, Column, SmallInteger, BigInteger, DateTime, CheckConstraint, func
+from app.db.session.database import Base
+
+"""
+Catalog version watermark.
+
+A single row whose counter is bumped by statement level triggers on
+bots, bot_categories and categories (see the "add catalog version watermark"
+migration). Any write to the catalog, from any worker or even from psql,
+moves the version forward in the same transaction as the data.
+
+Updates of bots that only touch download_count, rating_average,
+rating_count or updated_at do not bump it, so cached catalog pages show
+those counters up to CATALOG_CACHE_TTL late.
+"""
+
+catalog_version = Table('catalog_version', Base.metadata,
+    Column('id', SmallInteger, primary_key=True, comment="Always 1, the table holds a single row"),
+    Column('version', BigInteger, nullable=False, comment="Incremented on every catalog write"),
+    Column('updated_at', DateTime(timezone=True), server_default=func.now(), nullable=False, comment="Time of the last catalog write"),
+    CheckConstraint('id = 1', name='catalog_version_single_row'),
+)
@@ -1,5 +1,5 @@
 # File: app/models/order_item.py
-from sqlalchemy import Column, Integer, DECIMAL
+from sqlalchemy import Column, Integer, DECIMAL, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy import ForeignKey
@@ -54,5 +54,11 @@ class OrderItemModel(BaseModel):
         
     )
     
+    # Table constraints
+    __table_args__ = (
+        # An order's lines, read by the sales rollup triggers on every payment status change
+        Index('ix_orderitems_order_id', 'order_id'),
+    )
+    
     def __repr__(self):
         return f"<OrderItem(bot_id='{self.bot_id}', quantity={self.quantity}, price={self.price_at_purchase})>"
\ No newline at end of file
@@ -0,0 +1,25 @@
+# File: app/models/SalesDaily.py
+from sqlalchemy import Table, Column, Date, BigInteger, DECIMAL, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.session.database import Base
+
+"""
+Daily sales rollup.
+
+One row per (day, bot) with the units, revenue and order lines of paid
+orders (payment_status 'completed'), day being the order's UTC date.
+Triggers on orders and orderitems keep it current in the same transaction
+as the order data (see the "add daily sales rollup" migration), including
+refunds, deleted orders and edited line items, so revenue queries read
+this table instead of aggregating orders.
+"""
+
+sales_daily = Table('sales_daily', Base.metadata,
+    Column('day', Date, primary_key=True, comment="UTC date the orders were placed"),
+    Column('bot_id', UUID(as_uuid=True), ForeignKey('bots.id', ondelete='CASCADE'), primary_key=True, comment="Bot sold"),
+    Column('units', BigInteger, nullable=False, default=0, comment="Units sold in paid orders"),
+    Column('revenue', DECIMAL(14, 2), nullable=False, default=0, comment="Revenue in USD from paid orders"),
+    Column('order_count', BigInteger, nullable=False, default=0, comment="Paid order lines"),
+    # Per-bot history; date ranges over all bots use the primary key
+    Index('ix_sales_daily_bot_id_day', 'bot_id', 'day'),
+)
@@ -31,6 +31,7 @@ class UserModel(BaseModel):
     # relationships with other model entities 
     orders = relationship("OrderModel", back_populates="user", cascade="all, delete-orphan")
     bot_executions = relationship("BotExecutionModel", back_populates="user",cascade="all, delete-orphan")
+    bot_schedules = relationship("BotScheduleModel", back_populates="user",cascade="all, delete-orphan")
     reviews = relationship("BotReviewModel", back_populates="user",cascade="all, delete-orphan")
     
     
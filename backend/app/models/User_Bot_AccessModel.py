@@ -3,7 +3,7 @@ from sqlalchemy import Column, String, Boolean, DateTime
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
 from app.models.BaseModel import BaseModel
 
 class UserBotAccessModel(BaseModel):
@@ -41,6 +41,7 @@ class UserBotAccessModel(BaseModel):
     
     granted_at = Column(
         DateTime(timezone=True),
+        nullable=False,
         server_default=func.now(),
         comment="When access was granted"
     )
@@ -72,6 +73,11 @@ class UserBotAccessModel(BaseModel):
     # Table constraints
     __table_args__ = (
         UniqueConstraint('user_id', 'bot_id', name='unique_user_bot_access'),
+        # "My library" pages, newest grant first, answered from the index alone
+        Index(
+            'ix_userbotaccesss_library', 'user_id', 'is_active', 'granted_at', 'id',
+            postgresql_include=['bot_id', 'expires_at'],
+        ),
     )
     
     def __repr__(self):
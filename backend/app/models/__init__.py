@@ -5,10 +5,16 @@ from app.models.CategoryModel import CategoryModel
 from app.models.BotModel import BotModel 
 
 from app.models.Associations import bot_categories
+from app.models.CatalogVersion import catalog_version
+from app.models.SalesDaily import sales_daily
+from app.models.BotRecommendations import bot_recommendations
+from app.models.BotRatingHistogram import bot_rating_histograms
 
 from app.models.OrderModel import OrderModel
 from app.models.OrderItemModel import OrderItemModel
 from app.models.Bot_executionModel import BotExecutionModel
+from app.models.Bot_scheduleModel import BotScheduleModel
+from app.models.Bot_execution_statsModel import BotExecutionStatsModel
 from app.models.ExecutionLogModel import ExecutionLogModel
 from app.models.Bot_ReviewModel import BotReviewModel
 from app.models.User_Bot_AccessModel import UserBotAccessModel
@@ -21,8 +27,14 @@ __all__ = [
     "OrderModel",
     "OrderItemModel", 
     "BotExecutionModel",
+    "BotScheduleModel",
+    "BotExecutionStatsModel",
     "ExecutionLogModel",
     "BotReviewModel",
     "UserBotAccessModel",
-    "bot_categories"
+    "bot_categories",
+    "catalog_version",
+    "sales_daily",
+    "bot_recommendations",
+    "bot_rating_histograms"
 ]
\ No newline at end of file
@@ -0,0 +1,29 @@
+# File: app/schemas/AnalyticsSchema.py
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict
+
+class DailySalesResponse(BaseModel):
+    """
+    Sales of one day (paid orders, UTC dates).
+    """
+    day: date
+    units: int
+    revenue: Decimal
+    order_count: int
+    
+    model_config = ConfigDict(from_attributes=True)
+
+class BotSalesResponse(BaseModel):
+    """
+    A bot's sales over a date range.
+    """
+    bot_id: UUID
+    name: Optional[str]
+    units: int
+    revenue: Decimal
+    order_count: int
+    
+    model_config = ConfigDict(from_attributes=True)
@@ -1,6 +1,8 @@
 # File: app/schemas/bot.py
 from typing import List, Optional
+from datetime import datetime
 from decimal import Decimal
+from uuid import UUID
 from pydantic import BaseModel, Field, ConfigDict
 from app.schemas.BaseSchema import TimestampSchema
 
@@ -14,6 +16,7 @@ class BotBase(BaseModel):
     price: Decimal = Field(..., ge=0, decimal_places=2)  # ge = greater or equal to 0
     difficulty_level: str = Field(default="beginner")
     python_version: str = Field(default="3.9+")
+    is_deterministic: bool = Field(default=False, description="Same input always gives the same output, so results may be reused")
 
 class BotCreate(BotBase):
     """
@@ -44,6 +47,8 @@ class BotUpdate(BaseModel):
     detailed_description: Optional[str] = None
     price: Optional[Decimal] = Field(None, ge=0, decimal_places=2)
     is_active: Optional[bool] = None
+    is_deterministic: Optional[bool] = None
+    version: Optional[int] = Field(None, ge=1, description="Bump when the bot's code changes; cached results of older versions are not reused")
     category_ids: Optional[List[str]] = None
 
 class BotResponse(BotBase, TimestampSchema):
@@ -51,6 +56,7 @@ class BotResponse(BotBase, TimestampSchema):
     Schema for bot data in API responses.
     """
     is_free: bool
+    version: int
     execution_time_estimate: Optional[int]
     docker_image: Optional[str]
     github_repo_url: Optional[str]
@@ -78,4 +84,65 @@ class CategoryResponse(CategoryBase, TimestampSchema):
     model_config = ConfigDict(from_attributes=True)
 
 # Update BotResponse to resolve forward reference
-BotResponse.model_rebuild()
\ No newline at end of file
+BotResponse.model_rebuild()
+
+class BotExecutionStatsResponse(BaseModel):
+    """
+    Schema for a bot's execution time statistics (seconds).
+    """
+    bot_id: UUID
+    execution_count: int = 0
+    mean_seconds: Optional[float] = None
+    p50_seconds: Optional[float] = None
+    p95_seconds: Optional[float] = None
+    p99_seconds: Optional[float] = None
+    execution_time_estimate: Optional[int] = None
+    updated_at: Optional[datetime] = None
+
+class SuggestionResponse(BaseModel):
+    """
+    Schema for a typeahead suggestion.
+    """
+    kind: str = Field(..., description="bot or category")
+    id: UUID
+    name: str
+
+class FacetValue(BaseModel):
+    """
+    Schema for the number of bots with one facet value.
+    """
+    value: Optional[str] = None
+    label: Optional[str] = Field(None, description="Display name, where the value is an id")
+    count: int
+
+class CatalogFacets(BaseModel):
+    """
+    Schema for the facet counts of a catalog listing.
+    """
+    total: int = 0
+    categories: List[FacetValue] = []
+    difficulty_level: List[FacetValue] = []
+    python_version: List[FacetValue] = []
+    price: List[FacetValue] = Field([], description="Price buckets in USD, e.g. \"5-10\" or \"50+\"")
+    is_free: List[FacetValue] = Field([], description="\"free\" or \"paid\"")
+
+class BotSearchResponse(BaseModel):
+    """
+    Schema for a catalog listing returned with its facet counts.
+    """
+    items: List[BotResponse]
+    facets: CatalogFacets
+
+class BotLibraryResponse(BaseModel):
+    """
+    Schema for a page of the bots a user has access to.
+    """
+    items: List[BotResponse]
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` for the next page; null on the last page")
+
+class BotBatchResponse(BaseModel):
+    """
+    Schema for bots fetched by ID in one request.
+    """
+    items: List[Optional[BotResponse]] = Field(..., description="One entry per requested id, in request order; null if not found")
+    not_found: List[str] = Field([], description="Requested ids that match no bot")
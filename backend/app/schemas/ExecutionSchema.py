@@ -0,0 +1,41 @@
+# File: app/schemas/ExecutionSchema.py
+from typing import Any, Dict, Optional
+from datetime import datetime
+from uuid import UUID
+from pydantic import BaseModel, Field
+from app.schemas.BaseSchema import TimestampSchema
+
+class ExecutionCreate(BaseModel):
+    """
+    Schema for starting a bot execution.
+    """
+    bot_id: UUID
+    input_parameters: Optional[Dict[str, Any]] = Field(default=None, description="Bot input parameters")
+
+class ExecutionUpdate(BaseModel):
+    """
+    Schema for execution status updates.
+    """
+    execution_status: Optional[str] = None
+    execution_time: Optional[int] = None
+    error_message: Optional[str] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+class ExecutionResponse(TimestampSchema):
+    """
+    Schema for execution data in API responses.
+    
+    Inputs and outputs are not embedded, they can be megabytes; download
+    them from /executions/{id}/input and /executions/{id}/output.
+    """
+    user_id: Optional[UUID]
+    bot_id: Optional[UUID]
+    execution_status: Optional[str]
+    cache_hit: bool
+    execution_time: Optional[int]
+    error_message: Optional[str]
+    started_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    input_size: Optional[int]
+    output_size: Optional[int]
@@ -0,0 +1,34 @@
+# File: app/schemas/ReviewSchema.py
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict, Field
+
+class ReviewResponse(BaseModel):
+    """
+    Schema for a bot review.
+    """
+    id: UUID
+    user_id: Optional[UUID] = None
+    rating: Optional[int] = None
+    review_text: Optional[str] = None
+    is_verified_purchase: Optional[bool] = False
+    created_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
+
+class RatingSummary(BaseModel):
+    """
+    Schema for a bot's star rating histogram.
+    """
+    count: int = 0
+    average: Optional[float] = Field(None, description="Mean rating, null without reviews")
+    histogram: Dict[int, int] = Field(..., description="Number of reviews per rating, 1 to 5")
+
+class ReviewPageResponse(BaseModel):
+    """
+    Schema for a page of a bot's reviews with its rating histogram.
+    """
+    items: List[ReviewResponse]
+    rating: RatingSummary
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` for the next page; null on the last page")
@@ -0,0 +1,58 @@
+# File: app/schemas/ScheduleSchema.py
+from typing import Any, Dict, Optional
+from datetime import datetime
+from uuid import UUID
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+from app.schemas.BaseSchema import TimestampSchema
+
+class ScheduleBase(BaseModel):
+    """
+    Base schedule schema with common fields.
+    """
+    cron_expression: str = Field(..., max_length=100, description="Five-field cron expression")
+    timezone: str = Field(default="UTC", max_length=64, description="IANA time zone, e.g. Europe/Berlin")
+    input_parameters: Optional[Dict[str, Any]] = Field(default=None, description="Input parameters for every run")
+
+class ScheduleCreate(ScheduleBase):
+    """
+    Schema for creating a schedule.
+    """
+    bot_id: UUID
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "bot_id": "123e4567-e89b-12d3-a456-426614174000",
+                "cron_expression": "0 9 * * 1-5",
+                "timezone": "Europe/Berlin",
+                "input_parameters": {"source_dir": "~/Downloads"}
+            }
+        }
+    )
+
+class ScheduleUpdate(BaseModel):
+    """
+    Schema for updating a schedule. All fields are optional, but only
+    input_parameters may be set to null.
+    """
+    cron_expression: Optional[str] = Field(None, max_length=100)
+    timezone: Optional[str] = Field(None, max_length=64)
+    input_parameters: Optional[Dict[str, Any]] = None
+    is_active: Optional[bool] = None
+    
+    @field_validator("cron_expression", "timezone", "is_active")
+    @classmethod
+    def not_null(cls, value):
+        # Runs only for fields sent in the request; omitted ones keep their value
+        if value is None:
+            raise ValueError("may be omitted but not null")
+        return value
+
+class ScheduleResponse(ScheduleBase, TimestampSchema):
+    """
+    Schema for schedule data in API responses.
+    """
+    bot_id: UUID
+    is_active: bool
+    next_run_at: Optional[datetime]
+    last_run_at: Optional[datetime]
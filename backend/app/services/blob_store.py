@@ -0,0 +1,138 @@
+# File: app/services/blob_store.py
+import hashlib
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import BinaryIO, Dict, Iterator, Type
+from app.core.config import settings
+
+"""
+Content-addressed blob storage.
+
+Blobs are stored under the SHA-256 of their content, so storing the same
+bytes twice keeps a single copy and a key always names the same content
+(it doubles as a strong ETag). Backends implement BlobStore; the local
+filesystem backend is the default and others can be registered in
+BLOB_BACKENDS and selected with BLOB_STORE_BACKEND.
+"""
+
+CHUNK_SIZE = 64 * 1024
+
+@dataclass(frozen=True)
+class BlobRef:
+    key: str
+    size: int
+
+class BlobNotFound(KeyError):
+    pass
+
+class BlobStore(ABC):
+    """
+    Interface for blob storage backends.
+    """
+
+    @abstractmethod
+    def put(self, data: bytes) -> BlobRef:
+        """
+        Store `data` (no-op if the same content is already stored).
+        """
+
+    @abstractmethod
+    def open(self, key: str) -> BinaryIO:
+        """
+        Open a blob for reading; raises BlobNotFound.
+        """
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    def iter_chunks(self, key: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Stream a blob without loading it into memory.
+        
+        The blob is opened right away, so BlobNotFound is raised here rather
+        than halfway through a response.
+        """
+        return _read_chunks(self.open(key), chunk_size)
+
+    @staticmethod
+    def key_for(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+def _read_chunks(f: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    with f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+class LocalBlobStore(BlobStore):
+    """
+    Blobs as files under `root`, sharded by the first two bytes of the hash
+    (root/ab/cd/abcd...) to keep directories small.
+    """
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+
+    def _path(self, key: str) -> str:
+        if len(key) != 64 or not all(c in "0123456789abcdef" for c in key):
+            raise BlobNotFound(key)
+        return os.path.join(self.root, key[:2], key[2:4], key)
+
+    def put(self, data: bytes) -> BlobRef:
+        key = self.key_for(data)
+        path = self._path(key)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temp file and rename, so readers never see a partial blob
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        return BlobRef(key=key, size=len(data))
+
+    def open(self, key: str) -> BinaryIO:
+        try:
+            return open(self._path(key), "rb")
+        except FileNotFoundError:
+            raise BlobNotFound(key)
+
+    def exists(self, key: str) -> bool:
+        try:
+            return os.path.exists(self._path(key))
+        except BlobNotFound:
+            return False
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+BLOB_BACKENDS: Dict[str, Type[BlobStore]] = {
+    "local": LocalBlobStore,
+}
+
+@lru_cache
+def get_blob_store() -> BlobStore:
+    """
+    The blob store configured by BLOB_STORE_BACKEND / BLOB_STORE_PATH.
+    """
+    try:
+        backend = BLOB_BACKENDS[settings.BLOB_STORE_BACKEND]
+    except KeyError:
+        raise ValueError(f"Unknown BLOB_STORE_BACKEND {settings.BLOB_STORE_BACKEND!r}, expected one of {list(BLOB_BACKENDS)}")
+    return backend(settings.BLOB_STORE_PATH)
@@ -0,0 +1,176 @@
+# File: app/services/cache.py
+import json
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Set
+from app.utils.compression import compress
+
+"""
+In-process response cache.
+
+Entries hold the serialized JSON body of a response together with every
+compressed representation that has been requested so far, so a cached
+payload is serialized once and compressed at most once per encoding no
+matter how many requests it serves.
+
+The cache is per worker process, bounded by entry count (LRU) and TTL.
+Entries can also carry the data version they were built from, so callers
+can reject them as soon as the underlying data changes.
+
+Stale-while-revalidate: after its (jittered) TTL an entry turns stale but
+is still returned for `stale_ttl` more seconds, so the caller can serve it
+immediately and refresh it in the background. begin_refresh/end_refresh
+make sure only one refresh per entry runs at a time.
+"""
+
+class CachedPayload:
+    """
+    A serialized response body plus its lazily built compressed variants.
+    """
+
+    __slots__ = ("body", "version", "created_at", "fresh_until", "expires_at", "_data", "_encoded", "_lock")
+
+    def __init__(self, body: bytes, ttl: float, version: Optional[int] = None, stale_ttl: float = 0.0):
+        self.body = body
+        self.version = version
+        self.created_at = time.time()
+        self.fresh_until = time.monotonic() + ttl
+        self.expires_at = self.fresh_until + stale_ttl
+        self._data = None
+        self._encoded: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def data(self) -> Any:
+        """
+        The decoded JSON document (parsed on first access).
+        """
+        if self._data is None:
+            self._data = json.loads(self.body)
+        return self._data
+
+    @property
+    def is_stale(self) -> bool:
+        """
+        Past its TTL but still inside the grace window.
+        """
+        return time.monotonic() >= self.fresh_until
+
+    def encoded(self, encoding: Optional[str]) -> bytes:
+        """
+        Body in the given content coding; None means identity.
+        """
+        if encoding is None:
+            return self.body
+        cached = self._encoded.get(encoding)
+        if cached is None:
+            with self._lock:
+                cached = self._encoded.get(encoding)
+                if cached is None:
+                    cached = compress(self.body, encoding, precompressed=True)
+                    self._encoded[encoding] = cached
+        return cached
+
+class ResponseCache:
+    """
+    Thread-safe LRU + TTL map of cache keys to CachedPayload.
+    """
+
+    def __init__(self, max_entries: int, ttl: float, stale_ttl: float = 0.0, jitter: float = 0.0):
+        """
+        Args:
+            max_entries: LRU bound
+            ttl: Seconds an entry is fresh
+            stale_ttl: Seconds a stale entry is still served after `ttl`
+            jitter: Fraction by which each entry's TTL is randomly shortened
+                or lengthened, so entries written together do not expire together
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.jitter = jitter
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, CachedPayload]" = OrderedDict()
+        self._refreshing: Set[Hashable] = set()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, version: Optional[int] = None, record: bool = True) -> Optional[CachedPayload]:
+        """
+        Look up an entry, fresh or stale (check `payload.is_stale`).
+
+        When `version` is given, an entry built from another version is a miss.
+        `record=False` leaves the hit/miss counters alone (re-checks).
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None and payload.expires_at <= time.monotonic():
+                del self._entries[key]
+                payload = None
+            if payload is None or (version is not None and payload.version != version):
+                self.misses += record
+                return None
+            self._entries.move_to_end(key)
+            if record:
+                if payload.is_stale:
+                    self.stale_hits += 1
+                else:
+                    self.hits += 1
+            return payload
+
+    def set(self, key: Hashable, body: bytes, version: Optional[int] = None) -> CachedPayload:
+        """
+        Store a body; `version` records the data version it was built from.
+        """
+        ttl = self.ttl
+        if self.jitter:
+            ttl *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        payload = CachedPayload(body, ttl, version, self.stale_ttl)
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return payload
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def begin_refresh(self, key: Hashable) -> bool:
+        """
+        Claim the refresh of `key`; False if another refresh is already running.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: Hashable) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/stale-hit/miss counters since startup.
+        """
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshing": len(self._refreshing),
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 4) if lookups else None,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
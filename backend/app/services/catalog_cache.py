@@ -0,0 +1,158 @@
+# File: app/services/catalog_cache.py
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, List, Optional
+from uuid import UUID
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.crud.bot import bot as bot_crud
+from app.db.session.database import SessionLocal
+from app.models.BotModel import BotModel
+from app.schemas.BotSchema import BotResponse
+from app.services.cache import CachedPayload, ResponseCache
+from app.services.catalog_version import get_catalog_version
+from app.services.singleflight import SingleFlight
+
+"""
+Cache of serialized catalog responses (bot lists and bot details).
+
+Keys are built from the normalized request parameters, values are the
+JSON bodies exactly as they go out on the wire (see CachedPayload).
+
+Misses go through a single-flight group keyed by (cache key, catalog
+version): when an entry expires under load, one request runs the query
+and every identical concurrent request gets its payload.
+
+Entries past their TTL are served stale (stale-while-revalidate) while a
+background thread rebuilds them with its own session. A change of catalog
+version is never served stale: the payload must match the ETag sent with it.
+"""
+
+logger = logging.getLogger(__name__)
+
+catalog_cache = ResponseCache(
+    max_entries=settings.CATALOG_CACHE_MAX_ENTRIES,
+    ttl=settings.CATALOG_CACHE_TTL,
+    stale_ttl=settings.CATALOG_CACHE_STALE_TTL,
+    jitter=settings.CATALOG_CACHE_TTL_JITTER,
+)
+
+refresh_executor = ThreadPoolExecutor(
+    max_workers=settings.CATALOG_REFRESH_WORKERS,
+    thread_name_prefix="catalog-refresh",
+)
+
+catalog_flight = SingleFlight(timeout=settings.CATALOG_COALESCE_TIMEOUT)
+
+bot_list_adapter = TypeAdapter(List[BotResponse])
+
+def list_key(*, skip: int, limit: int, category: Optional[str], search: Optional[str], free_only: bool) -> Hashable:
+    """
+    Cache key for a catalog listing. Search is matched with ILIKE, so case does not matter.
+    """
+    return ("bots", skip, limit, category or None, search.lower() if search else None, free_only)
+
+def facets_key(*, category: Optional[str], search: Optional[str], free_only: bool) -> Hashable:
+    """
+    Cache key for a listing's facet counts: only the filter read_bots applies
+    (free_only, else category, else search) matters, pagination does not.
+    """
+    if free_only:
+        return ("facets", None, None, True)
+    if category:
+        return ("facets", category, None, False)
+    return ("facets", None, search.lower() if search else None, False)
+
+def detail_key(bot_id: str) -> Hashable:
+    return ("bot", str(bot_id).lower())
+
+def serialize_bots(bots: List[BotModel]) -> bytes:
+    return bot_list_adapter.dump_json(bot_list_adapter.validate_python(bots, from_attributes=True))
+
+def serialize_bot(bot: BotModel) -> bytes:
+    return BotResponse.model_validate(bot).model_dump_json().encode()
+
+def lookup_details(db: Session, bot_ids: List[str], *, active_only: bool = False) -> Dict[str, bytes]:
+    """
+    Detail payloads of `bot_ids` (canonical UUID strings) by id, from the cache where possible.
+
+    Misses are loaded with one query and cached; bots that do not exist,
+    and inactive bots if `active_only` is set, are left out.
+    """
+    version = get_catalog_version(db).version
+    bodies = {}
+    cached = set()
+    for bot_id in bot_ids:
+        payload = catalog_cache.get(detail_key(bot_id), version)
+        if payload is not None:
+            cached.add(bot_id)
+            if not active_only or payload.data["is_active"]:
+                bodies[bot_id] = payload.body
+    missing = [UUID(bot_id) for bot_id in dict.fromkeys(bot_ids) if bot_id not in cached]
+    if missing:
+        for bot in bot_crud.get_many(db, ids=missing):
+            body = catalog_cache.set(detail_key(bot.id), serialize_bot(bot), version=version).body
+            if not active_only or bot.is_active:
+                bodies[str(bot.id)] = body
+    return bodies
+
+def cached_details(db: Session, bot_ids: List[str]) -> List[bytes]:
+    """
+    Detail payloads for `bot_ids`, in order, from the cache where possible.
+
+    Misses are loaded with one query and cached; ids of bots that no
+    longer exist or were deactivated are skipped, so lists computed
+    offline (recommendations, similar bots) never show them.
+    """
+    bodies = lookup_details(db, bot_ids, active_only=True)
+    return [bodies[bot_id] for bot_id in bot_ids if bot_id in bodies]
+
+def refresh(key: Hashable, build: Callable[[Session], bytes]) -> None:
+    """
+    Rebuild a stale entry at the current catalog version (background thread).
+    """
+    db = SessionLocal(info={"read_only": True})
+    try:
+        version = get_catalog_version(db).version
+        catalog_cache.set(key, build(db), version=version)
+    except Exception:
+        logger.warning("background refresh of %r failed", key, exc_info=True)
+    finally:
+        db.close()
+        catalog_cache.end_refresh(key)
+
+def get_or_build(db: Session, key: Hashable, version: int, build: Callable[[Session], bytes]) -> CachedPayload:
+    """
+    Cached payload for `key` at `version`.
+
+    A stale entry is returned as is and refreshed in the background (one
+    refresh per entry at a time). On a miss the payload is built at most
+    once across concurrent identical requests.
+
+    Args:
+        db: Request session, used when the payload is built inline
+        key: Cache key from list_key/detail_key
+        version: Current catalog version; entries from other versions are misses
+        build: Runs the query on the given session and returns the serialized
+            body; it must not capture request-scoped state since it is also
+            used for background refreshes. Exceptions (e.g. a 404) are raised
+            to every waiting request.
+
+    Returns:
+        The cached payload
+    """
+    payload = catalog_cache.get(key, version)
+    if payload is not None:
+        if payload.is_stale and catalog_cache.begin_refresh(key):
+            refresh_executor.submit(refresh, key, build)
+        return payload
+
+    def produce() -> CachedPayload:
+        # A flight that finished just before this one started may have filled it
+        payload = catalog_cache.get(key, version, record=False)
+        if payload is not None:
+            return payload
+        return catalog_cache.set(key, build(db), version=version)
+
+    return catalog_flight.do((key, version), produce)
@@ -0,0 +1,124 @@
+# File: app/services/catalog_facets.py
+from typing import Any, Dict, List, Optional
+from sqlalchemy import and_, distinct, func, literal_column, or_, select, text, tuple_
+from sqlalchemy.orm import Session
+from app.models.Associations import bot_categories
+from app.models.BotModel import BotModel
+from app.models.CategoryModel import CategoryModel
+from app.schemas.BotSchema import CatalogFacets
+
+"""
+Facet counts for catalog listings.
+
+Every facet of a listing (category, difficulty level, Python version,
+price bucket, free/paid) comes from one GROUPING SETS query: Postgres
+reads the matching bots once and aggregates each grouping from the same
+pass, instead of one query per facet. A bot in several categories is
+joined once per category, so every count is of distinct bots.
+
+The filter mirrors read_bots, precedence included (free_only, then
+category, then search), so the counts describe exactly the listing they
+are returned with.
+"""
+
+# Upper bounds (USD) of the price buckets; prices from the last one up share an open bucket
+PRICE_BUCKET_EDGES = (5, 10, 25, 50)
+
+def price_bucket_label(bucket: int) -> str:
+    """
+    Label of a width_bucket() result: 0 is below the first edge.
+    """
+    if bucket >= len(PRICE_BUCKET_EDGES):
+        return f"{PRICE_BUCKET_EDGES[-1]}+"
+    low = PRICE_BUCKET_EDGES[bucket - 1] if bucket else 0
+    return f"{low}-{PRICE_BUCKET_EDGES[bucket]}"
+
+def matching_bots(*, category: Optional[str], search: Optional[str], free_only: bool):
+    """
+    Active bots matching a listing's filter, as a CTE.
+    """
+    query = select(
+        BotModel.id, BotModel.difficulty_level, BotModel.python_version, BotModel.price, BotModel.is_free
+    ).where(BotModel.is_active == True)
+    if free_only:
+        query = query.where(BotModel.is_free == True)
+    elif category:
+        query = query.where(
+            BotModel.id.in_(select(bot_categories.c.bot_id).where(bot_categories.c.category_id == category))
+        )
+    elif search:
+        query = query.where(or_(BotModel.name.ilike(f"%{search}%"), BotModel.description.ilike(f"%{search}%")))
+    return query.cte("matched")
+
+def facet_counts(db: Session, *, category: Optional[str], search: Optional[str], free_only: bool) -> CatalogFacets:
+    """
+    Count the bots of a listing per facet value.
+
+    Args:
+        db: Database session
+        category: Optional category filter
+        search: Optional search query
+        free_only: Whether the listing shows only free bots
+
+    Returns:
+        Total and per-value counts, most common first (price buckets in price order)
+    """
+    matched = matching_bots(category=category, search=search, free_only=free_only)
+    edges = ", ".join(str(edge) for edge in PRICE_BUCKET_EDGES)
+    bucket = func.width_bucket(matched.c.price, literal_column(f"ARRAY[{edges}]::numeric[]"))
+    groupings = {
+        "categories": CategoryModel.id,
+        "difficulty_level": matched.c.difficulty_level,
+        "python_version": matched.c.python_version,
+        "price": bucket,
+        "is_free": matched.c.is_free,
+    }
+    query = (
+        select(
+            CategoryModel.id,
+            CategoryModel.name,
+            matched.c.difficulty_level,
+            matched.c.python_version,
+            bucket,
+            matched.c.is_free,
+            *(func.grouping(column) for column in groupings.values()),
+            func.count(distinct(matched.c.id)),
+        )
+        .select_from(
+            matched
+            .outerjoin(bot_categories, bot_categories.c.bot_id == matched.c.id)
+            .outerjoin(CategoryModel, and_(CategoryModel.id == bot_categories.c.category_id, CategoryModel.is_active))
+        )
+        .group_by(func.grouping_sets(
+            tuple_(CategoryModel.id, CategoryModel.name),
+            *list(groupings.values())[1:],
+            text("()"),
+        ))
+    )
+
+    total = 0
+    facets: Dict[str, List[Dict[str, Any]]] = {name: [] for name in groupings}
+    for category_id, category_name, difficulty, python_version, price, is_free, *flags, count in db.execute(query):
+        grouped = [name for name, flag in zip(groupings, flags) if flag == 0]
+        if not grouped:
+            total = count
+        elif grouped == ["categories"]:
+            if category_id is not None:
+                facets["categories"].append({"value": str(category_id), "label": category_name, "count": count})
+        elif grouped == ["difficulty_level"]:
+            facets["difficulty_level"].append({"value": difficulty, "count": count})
+        elif grouped == ["python_version"]:
+            facets["python_version"].append({"value": python_version, "count": count})
+        elif grouped == ["price"]:
+            facets["price"].append({"value": price_bucket_label(price), "bucket": price, "count": count})
+        elif grouped == ["is_free"]:
+            facets["is_free"].append({"value": "free" if is_free else "paid", "count": count})
+
+    for name, values in facets.items():
+        if name == "price":
+            values.sort(key=lambda value: value["bucket"])
+            for value in values:
+                del value["bucket"]
+        else:
+            values.sort(key=lambda value: (-value["count"], str(value["value"])))
+    return CatalogFacets(total=total, **facets)
@@ -0,0 +1,40 @@
+# File: app/services/catalog_version.py
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.models.CatalogVersion import catalog_version
+
+"""
+Reads the catalog version watermark.
+
+The watermark is maintained by database triggers, so it is strongly
+consistent across workers: a request sees a new version exactly when the
+write that caused it is visible. Reading it is a primary key lookup on a
+one-row table, far cheaper than any catalog query it lets us skip.
+"""
+
+@dataclass(frozen=True)
+class CatalogVersion:
+    version: int
+    updated_at: datetime
+
+    @property
+    def etag(self) -> str:
+        # Weak: the same version is served in several content encodings
+        return f'W/"catalog-{self.version}"'
+
+    @property
+    def last_modified(self) -> str:
+        # psycopg 3 returns timestamptz in the session time zone
+        return format_datetime(self.updated_at.astimezone(timezone.utc), usegmt=True)
+
+def get_catalog_version(db: Session) -> CatalogVersion:
+    """
+    Current catalog version as seen by this session.
+    """
+    row = db.execute(
+        select(catalog_version.c.version, catalog_version.c.updated_at).where(catalog_version.c.id == 1)
+    ).one()
+    return CatalogVersion(version=row.version, updated_at=row.updated_at)
@@ -0,0 +1,119 @@
+# File: app/services/duration_sketch.py
+import math
+from typing import Any, Dict, Optional
+
+"""
+DDSketch: a mergeable quantile sketch with relative-error guarantees.
+
+Values are counted in logarithmic buckets, bucket i covering
+(gamma^(i-1), gamma^i] with gamma = (1 + alpha) / (1 - alpha), so any
+quantile it returns is within a fraction alpha of the true value. Two
+sketches with the same alpha merge by adding bucket counts, exactly, which
+is what lets every executor keep its own and fold them into the stored one.
+
+At alpha = 1% durations from a millisecond to a day need about 900
+buckets; values at or below min_value are counted as zero, and if a sketch
+ever exceeds max_buckets the lowest buckets are collapsed (long durations
+are the ones that matter for estimates).
+"""
+
+class DDSketch:
+    """
+    Quantile sketch for positive values (execution durations in seconds).
+    """
+
+    def __init__(self, alpha: float = 0.01, min_value: float = 1e-3, max_buckets: int = 2048):
+        self.alpha = alpha
+        self.min_value = min_value
+        self.max_buckets = max_buckets
+        self.gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        # Midpoint (in relative terms) of the bucket's range
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def add(self, value: float, count: int = 1) -> None:
+        if count <= 0:
+            return
+        if value <= self.min_value:
+            self.zero_count += count
+        else:
+            key = self._key(value)
+            self.buckets[key] = self.buckets.get(key, 0) + count
+            if len(self.buckets) > self.max_buckets:
+                self._collapse()
+        self.count += count
+        self.sum += value * count
+
+    def _collapse(self) -> None:
+        keys = sorted(self.buckets)
+        excess = keys[:len(keys) - self.max_buckets + 1]
+        folded = sum(self.buckets.pop(key) for key in excess)
+        self.buckets[excess[-1]] = folded
+
+    def merge(self, other: "DDSketch") -> None:
+        """
+        Add another sketch's counts to this one (same alpha required).
+        """
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Value at quantile q (0..1), or None for an empty sketch.
+        """
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                return self._value(key)
+        return self._value(max(self.buckets))
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "alpha": self.alpha,
+            "min_value": self.min_value,
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            # JSON object keys are strings
+            "buckets": {str(key): count for key, count in self.buckets.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]], alpha: float = 0.01) -> "DDSketch":
+        """
+        Rebuild a sketch stored with to_dict (an empty one for None or {}).
+        """
+        if not data:
+            return cls(alpha)
+        sketch = cls(data.get("alpha", alpha), data.get("min_value", 1e-3))
+        sketch.buckets = {int(key): count for key, count in data.get("buckets", {}).items()}
+        sketch.zero_count = data.get("zero_count", 0)
+        sketch.count = data.get("count", 0)
+        sketch.sum = data.get("sum", 0.0)
+        return sketch
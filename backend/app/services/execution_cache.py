@@ -0,0 +1,159 @@
+# File: app/services/execution_cache.py
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+from sqlalchemy.orm import Session, undefer
+from app.core.config import settings
+from app.models.Bot_executionModel import BotExecutionModel
+
+"""
+Result cache for deterministic bots.
+
+Bots flagged is_deterministic promise that the same input gives the same
+output, so an execution whose (bot_id, bot version, input hash) matches a
+successful run completed within EXECUTION_CACHE_TTL reuses that run's
+output instead of going to a runner.
+
+Two levels: a per-process LRU, bounded by entry count and output bytes,
+in front of the bot_executions table itself (the latest real run for the
+key, via a partial index), which is what lets the API and the executor
+service share results. Cached outputs are never copied byte for byte:
+inline outputs are small by construction, and large ones are blob store
+references, which are content-addressed and can simply be shared.
+"""
+
+CacheKey = Tuple[UUID, int, str]
+
+@dataclass(frozen=True)
+class CachedResult:
+    execution_id: UUID
+    output: Any
+    output_blob_key: Optional[str]
+    output_size: Optional[int]
+    completed_at: datetime
+
+    @property
+    def weight(self) -> int:
+        # Blob outputs only cost their reference in memory
+        return 64 if self.output_blob_key else (self.output_size or 0)
+
+def input_hash(body: bytes) -> str:
+    """
+    Hash of canonically serialized input parameters (see serialize_payload).
+    """
+    return hashlib.sha256(body).hexdigest()
+
+class ExecutionCache:
+    """
+    LRU of recent results, expiring EXECUTION_CACHE_TTL after the source run completed.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[CacheKey, CachedResult]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def _expired(self, result: CachedResult) -> bool:
+        return result.completed_at + timedelta(seconds=self.ttl) <= datetime.now(timezone.utc)
+
+    def get(self, key: CacheKey) -> Optional[CachedResult]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                return None
+            if self._expired(result):
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: CacheKey, result: CachedResult) -> None:
+        if not self.enabled or result.weight > self.max_bytes or self._expired(result):
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = result
+            self._bytes += result.weight
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: CacheKey) -> None:
+        self._bytes -= self._entries.pop(key).weight
+
+    def lookup(self, db: Session, key: CacheKey) -> Optional[CachedResult]:
+        """
+        Result for `key` from memory, else from the latest matching real run.
+        """
+        if not self.enabled:
+            return None
+        result = self.get(key)
+        if result is not None:
+            self.hits += 1
+            return result
+        bot_id, bot_version, digest = key
+        source = (
+            db.query(BotExecutionModel)
+            .options(undefer(BotExecutionModel.output_data))
+            .filter(
+                BotExecutionModel.bot_id == bot_id,
+                BotExecutionModel.bot_version == bot_version,
+                BotExecutionModel.input_hash == digest,
+                BotExecutionModel.execution_status == "completed",
+                BotExecutionModel.cache_hit == False,
+                BotExecutionModel.completed_at > datetime.now(timezone.utc) - timedelta(seconds=self.ttl),
+            )
+            .order_by(BotExecutionModel.completed_at.desc())
+            .first()
+        )
+        if source is None:
+            self.misses += 1
+            return None
+        self.db_hits += 1
+        return self.record(source)
+
+    def record(self, db_obj: BotExecutionModel) -> Optional[CachedResult]:
+        """
+        Remember a completed real run of a deterministic bot.
+        """
+        if db_obj.input_hash is None or db_obj.completed_at is None:
+            return None
+        result = CachedResult(
+            execution_id=db_obj.id,
+            output=None if db_obj.output_blob_key else db_obj.output_data,
+            output_blob_key=db_obj.output_blob_key,
+            output_size=db_obj.output_size,
+            completed_at=db_obj.completed_at,
+        )
+        self.put((db_obj.bot_id, db_obj.bot_version, db_obj.input_hash), result)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "db_hits": self.db_hits,
+                "misses": self.misses,
+            }
+
+execution_cache = ExecutionCache(
+    max_entries=settings.EXECUTION_CACHE_MAX_ENTRIES,
+    max_bytes=settings.EXECUTION_CACHE_MAX_BYTES,
+    ttl=settings.EXECUTION_CACHE_TTL,
+)
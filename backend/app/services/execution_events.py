@@ -0,0 +1,217 @@
+# File: app/services/execution_events.py
+import asyncio
+import json
+import logging
+import select
+import threading
+from typing import Any, Dict, Hashable, Optional, Set
+from uuid import UUID
+import psycopg2
+from sqlalchemy.engine import make_url
+from app.core.config import settings
+
+"""
+Execution status push.
+
+A trigger on bot_executions sends a NOTIFY on CHANNEL whenever an
+execution's status changes (see migration d4cb6daf8b78). Each worker
+process runs one listener thread on one dedicated connection and fans the
+notifications out to its subscribers (SSE streams and WebSockets), so the
+number of watchers costs no database work at all.
+
+The listener is started when the worker starts (a @warmup in the
+executions endpoints), so LISTEN is active before any client subscribes.
+Subscriptions belong to the event loop that created them; the listener
+hands events over with call_soon_threadsafe. If the listener connection
+drops, notifications sent in the meantime are lost, so after reconnecting
+every subscriber gets a {"event": "resync"} to re-read current state.
+"""
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "execution_status"
+
+TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+RESYNC = {"event": "resync"}
+
+class Subscription:
+    """
+    A subscriber's queue of events for a set of topics.
+    """
+
+    def __init__(self, hub: "ExecutionEventHub", topics: Set[Hashable], loop: asyncio.AbstractEventLoop, maxsize: int):
+        self.hub = hub
+        self.topics = topics
+        self.loop = loop
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize)
+        self.dropped = 0
+
+    def _deliver(self, event: Dict[str, Any]) -> None:
+        # Slow consumer: drop the oldest event rather than grow without bound
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Next event, or None if none arrived within `timeout`.
+        """
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.hub.unsubscribe(self)
+
+class ExecutionEventHub:
+    """
+    One LISTEN connection per process, shared by all subscribers.
+    """
+
+    def __init__(self, database_url: str, reconnect_interval: float = 2.0, queue_size: int = 100):
+        self.database_url = database_url
+        self.reconnect_interval = reconnect_interval
+        self.queue_size = queue_size
+        self._topics: Dict[Hashable, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._listening = threading.Event()
+        self.connected = False
+        self.events = 0
+        self.reconnects = 0
+
+    def subscribe(self, execution_id: Optional[UUID] = None, user_id: Optional[UUID] = None) -> Subscription:
+        """
+        Subscribe to one execution's events, or all of a user's. Must be called
+        from the event loop that will consume the subscription.
+        """
+        topics: Set[Hashable] = set()
+        if execution_id is not None:
+            topics.add(("execution", str(execution_id)))
+        if user_id is not None:
+            topics.add(("user", str(user_id)))
+        subscription = Subscription(self, topics, asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            for topic in topics:
+                self._topics.setdefault(topic, set()).add(subscription)
+            self._ensure_listener()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            for topic in subscription.topics:
+                subscribers = self._topics.get(topic)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._topics[topic]
+
+    def start(self, timeout: float = 5.0) -> bool:
+        """
+        Start the listener and wait up to `timeout` for LISTEN to be active.
+        """
+        with self._lock:
+            self._ensure_listener()
+        return self._listening.wait(timeout)
+
+    def _ensure_listener(self) -> None:
+        # Normally started at worker startup; started here too in case it was not
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._listen, name="execution-events", daemon=True)
+            self._thread.start()
+
+    def dispatch(self, event: Dict[str, Any]) -> None:
+        """
+        Hand an event to the subscribers of its execution and its user.
+        """
+        self.events += 1
+        with self._lock:
+            targets = set()
+            for topic in (("execution", event.get("id")), ("user", event.get("user_id"))):
+                targets.update(self._topics.get(topic, ()))
+        self._deliver(targets, event)
+
+    def _broadcast(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            targets = {s for subscribers in self._topics.values() for s in subscribers}
+        self._deliver(targets, event)
+
+    @staticmethod
+    def _deliver(targets: Set[Subscription], event: Dict[str, Any]) -> None:
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._deliver, event)
+            except RuntimeError:
+                # Its event loop is closed; it is unsubscribed when its stream unwinds
+                pass
+
+    def _connect(self):
+        url = make_url(self.database_url).set(drivername="postgresql")
+        conn = psycopg2.connect(url.render_as_string(hide_password=False))
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {CHANNEL}")
+        return conn
+
+    def _listen(self) -> None:
+        first = True
+        while not self._stop.is_set():
+            try:
+                conn = self._connect()
+            except Exception:
+                logger.warning("execution event listener could not connect", exc_info=True)
+                self._stop.wait(self.reconnect_interval)
+                continue
+            self.connected = True
+            self._listening.set()
+            if not first:
+                self.reconnects += 1
+                self._broadcast(RESYNC)
+            first = False
+            try:
+                while not self._stop.is_set():
+                    if select.select([conn], [], [], 1.0)[0]:
+                        conn.poll()
+                        while conn.notifies:
+                            notify = conn.notifies.pop(0)
+                            try:
+                                self.dispatch(json.loads(notify.payload))
+                            except ValueError:
+                                logger.warning("invalid execution event payload", extra={"payload": notify.payload[:200]})
+            except Exception:
+                logger.warning("execution event listener lost its connection", exc_info=True)
+            finally:
+                self.connected = False
+                self._listening.clear()
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            if not self._stop.is_set():
+                self._stop.wait(self.reconnect_interval)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            subscribers = len({s for subscribers in self._topics.values() for s in subscribers})
+        return {
+            "connected": self.connected,
+            "subscribers": subscribers,
+            "events": self.events,
+            "reconnects": self.reconnects,
+        }
+
+execution_events = ExecutionEventHub(
+    settings.DATABASE_URL,
+    reconnect_interval=settings.EXECUTION_EVENTS_RECONNECT_INTERVAL,
+    queue_size=settings.EXECUTION_EVENTS_QUEUE_SIZE,
+)
@@ -0,0 +1,187 @@
+# File: app/services/execution_stats.py
+import json
+import logging
+import math
+import threading
+from typing import Dict
+from uuid import UUID
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from app.core.config import settings
+from app.services.duration_sketch import DDSketch
+
+"""
+Self-updating execution time estimates.
+
+The executor adds the duration of every execution it actually runs
+(cache hits cost nothing and are left out) to a per-bot DDSketch in
+memory. flush() merges those into bot_execution_stats under a row lock,
+so any number of executors can feed the same bot, recomputes p50, p95 and
+p99 there, and writes the median back to bots.execution_time_estimate
+once a bot has EXECUTION_STATS_MIN_SAMPLES executions.
+
+execution_time_estimate is only updated when its value changes: writes
+to bots move the catalog version and so invalidate the catalog cache.
+
+Sketches of different accuracies cannot be merged: a stored sketch built
+with another EXECUTION_STATS_ACCURACY is discarded and the bot's
+statistics start over at the current one.
+"""
+
+logger = logging.getLogger(__name__)
+
+ENSURE_ROWS_STATEMENT = text("""
+INSERT INTO bot_execution_stats (id, bot_id, sketch, execution_count, created_at, updated_at)
+SELECT gen_random_uuid(), b.id, '{}'::jsonb, 0, now(), now()
+FROM unnest(CAST(:ids AS uuid[])) AS pending(id) JOIN bots AS b ON b.id = pending.id
+ON CONFLICT (bot_id) DO NOTHING
+""")
+
+LOCK_ROWS_STATEMENT = text("""
+SELECT bot_id, sketch FROM bot_execution_stats
+WHERE bot_id = ANY(CAST(:ids AS uuid[]))
+ORDER BY bot_id
+FOR UPDATE
+""")
+
+UPDATE_ROWS_STATEMENT = text("""
+UPDATE bot_execution_stats AS s
+SET sketch = CAST(v.sketch AS jsonb), execution_count = v.execution_count, mean_seconds = v.mean,
+    p50_seconds = v.p50, p95_seconds = v.p95, p99_seconds = v.p99, updated_at = now()
+FROM unnest(CAST(:ids AS uuid[]), CAST(:sketches AS text[]), CAST(:counts AS bigint[]),
+            CAST(:means AS float8[]), CAST(:p50s AS float8[]), CAST(:p95s AS float8[]), CAST(:p99s AS float8[]))
+    AS v(bot_id, sketch, execution_count, mean, p50, p95, p99)
+WHERE s.bot_id = v.bot_id
+""")
+
+CURRENT_ESTIMATES_STATEMENT = text("""
+SELECT id, execution_time_estimate FROM bots WHERE id = ANY(CAST(:ids AS uuid[]))
+""")
+
+WRITE_ESTIMATES_STATEMENT = text("""
+UPDATE bots AS b SET execution_time_estimate = v.estimate
+FROM unnest(CAST(:ids AS uuid[]), CAST(:estimates AS integer[])) AS v(id, estimate)
+WHERE b.id = v.id
+""")
+
+def estimate_seconds(p50: float) -> int:
+    """
+    execution_time_estimate for a median duration: whole seconds, rounded up.
+    """
+    return max(1, math.ceil(p50))
+
+class ExecutionStats:
+    """
+    Per-bot duration sketches not yet merged into the database.
+    """
+
+    def __init__(self, alpha: float = 0.01, min_samples: int = 20):
+        self.alpha = alpha
+        self.min_samples = min_samples
+        self._pending: Dict[UUID, DDSketch] = {}
+        self._lock = threading.Lock()
+        self.flushes = 0
+        self.estimates_updated = 0
+
+    def observe(self, bot_id: UUID, seconds: float) -> None:
+        """
+        Record the duration of one execution that ran.
+        """
+        with self._lock:
+            sketch = self._pending.get(bot_id)
+            if sketch is None:
+                sketch = self._pending[bot_id] = DDSketch(self.alpha)
+            sketch.add(seconds)
+
+    def _restore(self, pending: Dict[UUID, DDSketch]) -> None:
+        with self._lock:
+            for bot_id, sketch in pending.items():
+                current = self._pending.get(bot_id)
+                if current is None:
+                    self._pending[bot_id] = sketch
+                else:
+                    current.merge(sketch)
+
+    def flush(self, engine: Engine) -> int:
+        """
+        Merge pending sketches into bot_execution_stats and update estimates.
+
+        Returns:
+            Number of bots whose statistics were updated
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        try:
+            with engine.begin() as conn:
+                updated = self.merge(conn, pending)
+        except Exception:
+            # Keep the observations for the next flush
+            self._restore(pending)
+            raise
+        self.flushes += 1
+        return updated
+
+    def merge(self, conn: Connection, pending: Dict[UUID, DDSketch]) -> int:
+        """
+        Merge sketches into the stored ones within the caller's transaction.
+
+        Returns:
+            Number of bots whose statistics were updated
+        """
+        by_id = {str(bot_id): sketch for bot_id, sketch in pending.items()}
+        # Sorted, so concurrent flushes lock rows in the same order
+        ids = sorted(by_id)
+        conn.execute(ENSURE_ROWS_STATEMENT, {"ids": ids})
+        merged: Dict[str, DDSketch] = {}
+        for bot_id, stored in conn.execute(LOCK_ROWS_STATEMENT, {"ids": ids}):
+            sketch = DDSketch.from_dict(stored, self.alpha)
+            if sketch.alpha != self.alpha:
+                logger.warning(
+                    "discarding execution stats built at another accuracy",
+                    extra={"bot_id": str(bot_id), "stored_alpha": sketch.alpha, "alpha": self.alpha},
+                )
+                sketch = DDSketch(self.alpha)
+            sketch.merge(by_id[str(bot_id)])
+            merged[str(bot_id)] = sketch
+        if not merged:
+            # Bots deleted since they ran
+            return 0
+        rows = list(merged.items())
+        conn.execute(UPDATE_ROWS_STATEMENT, {
+            "ids": [bot_id for bot_id, _ in rows],
+            "sketches": [json.dumps(sketch.to_dict()) for _, sketch in rows],
+            "counts": [sketch.count for _, sketch in rows],
+            "means": [sketch.mean for _, sketch in rows],
+            "p50s": [sketch.quantile(0.5) for _, sketch in rows],
+            "p95s": [sketch.quantile(0.95) for _, sketch in rows],
+            "p99s": [sketch.quantile(0.99) for _, sketch in rows],
+        })
+        self._write_estimates(conn, merged)
+        return len(merged)
+
+    def _write_estimates(self, conn: Connection, merged: Dict[str, DDSketch]) -> None:
+        wanted = {
+            bot_id: estimate_seconds(sketch.quantile(0.5))
+            for bot_id, sketch in merged.items()
+            if sketch.count >= self.min_samples
+        }
+        if not wanted:
+            return
+        current = {str(bot_id): estimate for bot_id, estimate in conn.execute(CURRENT_ESTIMATES_STATEMENT, {"ids": list(wanted)})}
+        changed = {bot_id: estimate for bot_id, estimate in wanted.items() if current.get(bot_id) != estimate}
+        if not changed:
+            return
+        conn.execute(WRITE_ESTIMATES_STATEMENT, {"ids": list(changed), "estimates": list(changed.values())})
+        self.estimates_updated += len(changed)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            pending = sum(sketch.count for sketch in self._pending.values())
+        return {"pending": pending, "flushes": self.flushes, "estimates_updated": self.estimates_updated}
+
+execution_stats = ExecutionStats(
+    alpha=settings.EXECUTION_STATS_ACCURACY,
+    min_samples=settings.EXECUTION_STATS_MIN_SAMPLES,
+)
@@ -0,0 +1,313 @@
+# File: app/services/executor.py
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import undefer
+from app.core.config import settings
+from app.crud.execution import execution as crud_execution, serialize_payload
+from app.db.session.database import SessionLocal
+from app.models.Bot_executionModel import BotExecutionModel
+from app.services.execution_cache import execution_cache
+from app.services.execution_stats import execution_stats
+from app.services.runner_pool import JobResult, PoolExhausted, RunnerError, RunnerPool, RuntimeKey
+from app.services.singleflight import SingleFlight
+
+"""
+Executor service: runs queued bot executions on the warm runner pool.
+
+Every poll it reads the queue depth per runtime, hands it to the pool so
+runners are started (or retired) ahead of the work, then claims at most as
+many queued executions per runtime as that runtime has free runner slots.
+Claiming uses FOR UPDATE SKIP LOCKED, so several executor instances can
+share the queue without running anything twice.
+
+Executions of deterministic bots are checked against the execution cache
+before they take a runner, and identical ones claimed together run once.
+
+How long each execution ran is added to the bot's execution time sketch,
+merged into the stored statistics every EXECUTION_STATS_FLUSH_INTERVAL.
+
+An executor that dies leaves its claimed executions running. Every
+EXECUTOR_REAP_INTERVAL the loop releases those running for longer than
+any live executor could take (see stale_after): ones that never got a
+runner go back to the queue, ones that did are failed, since the bot may
+have had side effects before the executor died.
+"""
+
+logger = logging.getLogger(__name__)
+
+# A leader may wait for a runner before its job starts, so waiters allow for both
+execution_flight = SingleFlight(timeout=settings.RUNNER_LEASE_TIMEOUT + settings.RUNNER_JOB_TIMEOUT)
+
+QUEUE_DEPTH_STATEMENT = text("""
+SELECT b.docker_image, b.python_version, count(*)
+FROM bot_executions AS e JOIN bots AS b ON b.id = e.bot_id
+WHERE e.execution_status = 'queued'
+GROUP BY b.docker_image, b.python_version
+""")
+
+CLAIM_STATEMENT = text("""
+UPDATE bot_executions AS e
+SET execution_status = 'running', started_at = now(), updated_at = now()
+FROM (
+    SELECT e.id FROM bot_executions AS e JOIN bots AS b ON b.id = e.bot_id
+    WHERE e.execution_status = 'queued'
+      AND b.docker_image IS NOT DISTINCT FROM :docker_image
+      AND b.python_version IS NOT DISTINCT FROM :python_version
+    ORDER BY e.created_at
+    LIMIT :limit
+    FOR UPDATE OF e SKIP LOCKED
+) AS claimed
+WHERE e.id = claimed.id
+RETURNING e.id
+""")
+
+# Abandoned executions: back to the queue if no runner was leased, failed otherwise
+REAP_STATEMENT = text("""
+UPDATE bot_executions
+SET execution_status = CASE WHEN container_id IS NULL THEN 'queued' ELSE 'failed' END,
+    started_at = CASE WHEN container_id IS NULL THEN NULL ELSE started_at END,
+    completed_at = CASE WHEN container_id IS NULL THEN NULL ELSE now() END,
+    error_message = CASE WHEN container_id IS NULL THEN error_message ELSE :error END,
+    updated_at = now()
+WHERE execution_status = 'running' AND started_at < now() - make_interval(secs => :max_age)
+RETURNING execution_status
+""")
+
+REAPED_ERROR = "Executor stopped while the execution was running"
+
+BOT_UNAVAILABLE_ERROR = "Bot is no longer available"
+
+def queue_depth(engine: Engine) -> Dict[RuntimeKey, int]:
+    with engine.connect() as conn:
+        return {RuntimeKey(image, version): count for image, version, count in conn.execute(QUEUE_DEPTH_STATEMENT)}
+
+def claim(engine: Engine, key: RuntimeKey, limit: int) -> List[UUID]:
+    """
+    Mark up to `limit` queued executions of a runtime as running, oldest first.
+    """
+    with engine.begin() as conn:
+        rows = conn.execute(CLAIM_STATEMENT, {
+            "docker_image": key.docker_image,
+            "python_version": key.python_version,
+            "limit": limit,
+        })
+        return [row[0] for row in rows]
+
+def stale_after() -> float:
+    """
+    Seconds after which a running execution has certainly been abandoned:
+    a waiter on an identical execution may wait out the flight, then lease
+    a runner and run itself, plus EXECUTOR_STALE_GRACE.
+    """
+    run = settings.RUNNER_LEASE_TIMEOUT + settings.RUNNER_JOB_TIMEOUT
+    return execution_flight.timeout + run + settings.EXECUTOR_STALE_GRACE
+
+def reap_stale(conn: Connection, max_age: float) -> Tuple[int, int]:
+    """
+    Release executions that have been running for more than `max_age` seconds.
+
+    Returns:
+        Number of executions requeued and number failed
+    """
+    statuses = [row[0] for row in conn.execute(REAP_STATEMENT, {"max_age": max_age, "error": REAPED_ERROR})]
+    return statuses.count("queued"), statuses.count("failed")
+
+def run_deduplicated(key: Optional[Hashable], job: Callable[[], JobResult]) -> Tuple[JobResult, bool]:
+    """
+    Run `job`, or share the result of an identical job in flight under `key`
+    (None runs it unshared).
+
+    Returns:
+        The result, and whether this call ran the job itself (a leader, or a
+        waiter that gave up on the leader) rather than sharing it
+    """
+    ran = False
+
+    def run() -> JobResult:
+        nonlocal ran
+        ran = True
+        return job()
+
+    result = run() if key is None else execution_flight.do(key, run)
+    return result, ran
+
+def record_result(db_obj: BotExecutionModel, result: JobResult, *, ran: bool, elapsed: float) -> None:
+    """
+    Mark an execution finished; a successful result it did not run itself is a cache hit.
+    """
+    db_obj.execution_status = "completed" if result.ok else "failed"
+    db_obj.cache_hit = result.ok and not ran
+    db_obj.error_message = None if result.ok else result.error
+    db_obj.execution_time = round(elapsed)
+    db_obj.completed_at = datetime.now(timezone.utc)
+
+def run_execution(pool: RunnerPool, execution_id: UUID, key: RuntimeKey) -> bool:
+    """
+    Run one claimed execution on a leased runner and store its result.
+
+    Returns:
+        True if it ran (successfully or not), False if it went back to the
+        queue or was deleted after it was claimed
+    """
+    with SessionLocal() as db:
+        db_obj = db.get(BotExecutionModel, execution_id, options=[undefer(BotExecutionModel.input_parameters)])
+        if db_obj is None:
+            return False
+        if db_obj.bot is None or not db_obj.bot.is_active:
+            # Deleted or deactivated since it was queued
+            record_result(db_obj, JobResult(ok=False, error=BOT_UNAVAILABLE_ERROR), ran=True, elapsed=0)
+            db.commit()
+            return True
+        job = {
+            "bot": str(db_obj.bot_id),
+            "entry_point": settings.RUNNER_ENTRY_POINT,
+            "input": crud_execution.load_payload(db_obj, "input"),
+        }
+        # Scheduled executions reach the cache here, API ones were checked on create
+        if db_obj.input_hash is None:
+            body = serialize_payload(job["input"]) if job["input"] is not None else None
+            if crud_execution.use_cache(db, db_obj=db_obj, bot=db_obj.bot, input_body=body):
+                db.commit()
+                return True
+        # No transaction (or pooled connection) is held while the bot runs
+        db.commit()
+        started = time.monotonic()
+        duration = None
+
+        def run_job() -> JobResult:
+            nonlocal duration
+            try:
+                with pool.lease(key, timeout=settings.RUNNER_LEASE_TIMEOUT) as runner:
+                    db_obj.container_id = runner.id
+                    db.commit()
+                    # Time on the runner only, not waiting for one
+                    job_started = time.monotonic()
+                    result = runner.run(job, settings.RUNNER_JOB_TIMEOUT)
+                    duration = time.monotonic() - job_started
+                    return result
+            except RunnerError as exc:
+                return JobResult(ok=False, error=str(exc))
+
+        try:
+            # Identical deterministic executions in flight share one run
+            flight_key = None if db_obj.input_hash is None else (db_obj.bot_id, db_obj.bot_version, db_obj.input_hash)
+            result, ran = run_deduplicated(flight_key, run_job)
+        except PoolExhausted:
+            # Not started: let this or another executor pick it up again
+            db_obj.execution_status = "queued"
+            db_obj.started_at = None
+            db_obj.container_id = None
+            db.commit()
+            return False
+
+        record_result(db_obj, result, ran=ran, elapsed=time.monotonic() - started)
+        crud_execution.set_output(db, db_obj=db_obj, output=result.output if result.ok else None)
+        if result.ok and ran:
+            execution_cache.record(db_obj)
+            execution_stats.observe(db_obj.bot_id, duration)
+        return True
+
+class Executor:
+    """
+    Poll loop state: executions in flight per pooled runtime and the worker threads.
+    """
+
+    def __init__(self, engine: Engine, pool: RunnerPool):
+        self.engine = engine
+        self.pool = pool
+        self.threads = ThreadPoolExecutor(max_workers=pool.max_total, thread_name_prefix="executor")
+        self.in_flight: Dict[RuntimeKey, int] = {}
+        self._lock = threading.Lock()
+
+    def poll(self) -> int:
+        """
+        Scale the pool to the queue and start as many executions as fit.
+
+        Returns:
+            Number of executions claimed
+        """
+        depths = queue_depth(self.engine)
+        self.pool.set_demand(depths)
+        self.pool.maintain()
+        claimed = 0
+        for key in depths:
+            runtime = self.pool.runtime(key)
+            with self._lock:
+                running = sum(self.in_flight.values())
+                free = min(self.pool.max_per_runtime - self.in_flight.get(runtime, 0), self.pool.max_total - running)
+            if free <= 0:
+                continue
+            for execution_id in claim(self.engine, key, free):
+                with self._lock:
+                    self.in_flight[runtime] = self.in_flight.get(runtime, 0) + 1
+                self.threads.submit(self._run, execution_id, key)
+                claimed += 1
+        return claimed
+
+    def _run(self, execution_id: UUID, key: RuntimeKey) -> None:
+        try:
+            run_execution(self.pool, execution_id, key)
+        except Exception:
+            logger.exception("execution failed to run", extra={"execution_id": str(execution_id)})
+        finally:
+            with self._lock:
+                self.in_flight[self.pool.runtime(key)] -= 1
+
+    def idle(self) -> bool:
+        with self._lock:
+            return not any(self.in_flight.values())
+
+    def shutdown(self) -> None:
+        """
+        Wait for running executions, then close the runners.
+        """
+        self.threads.shutdown(wait=True)
+        self.pool.close()
+
+def flush_execution_stats(engine: Engine) -> None:
+    try:
+        execution_stats.flush(engine)
+    except Exception:
+        logger.exception("execution stats flush failed")
+
+def reap_stale_executions(engine: Engine) -> None:
+    try:
+        with engine.begin() as conn:
+            requeued, failed = reap_stale(conn, stale_after())
+        if requeued or failed:
+            logger.warning("abandoned executions released", extra={"requeued": requeued, "failed": failed})
+    except Exception:
+        logger.exception("stale execution reap failed")
+
+def run_executor(engine: Engine, stop: threading.Event) -> None:
+    """
+    Executor main loop: poll every EXECUTOR_POLL_INTERVAL until `stop` is set.
+    """
+    executor = Executor(engine, RunnerPool())
+    next_flush = time.monotonic() + settings.EXECUTION_STATS_FLUSH_INTERVAL
+    next_reap = time.monotonic()
+    try:
+        while not stop.is_set():
+            try:
+                claimed = executor.poll()
+                if claimed:
+                    logger.info("executions started", extra={"executions": claimed})
+            except Exception:
+                logger.exception("executor poll failed")
+            if time.monotonic() >= next_flush:
+                flush_execution_stats(engine)
+                next_flush = time.monotonic() + settings.EXECUTION_STATS_FLUSH_INTERVAL
+            if time.monotonic() >= next_reap:
+                reap_stale_executions(engine)
+                next_reap = time.monotonic() + settings.EXECUTOR_REAP_INTERVAL
+            stop.wait(settings.EXECUTOR_POLL_INTERVAL)
+    finally:
+        executor.shutdown()
+        flush_execution_stats(engine)
@@ -0,0 +1,437 @@
+# File: app/services/leaderboards.py
+import logging
+import threading
+import time
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import event, inspect, text
+from sqlalchemy.orm import Session, sessionmaker
+from app.core.config import settings
+from app.core.redis import get_redis, redis, redis_connection
+from app.db.session.database import SessionLocal
+from app.models.BotModel import BotModel
+from app.models.Bot_ReviewModel import BotReviewModel
+from app.models.OrderItemModel import OrderItemModel
+from app.models.OrderModel import OrderModel
+from app.services.singleflight import SingleFlight
+
+"""
+Bot leaderboards: most downloaded, top rated and trending.
+
+Each board is a sorted set of bot ids, in Redis (shared by all workers)
+or, when Redis is unavailable, in process. Reading the top N is
+O(log M + N) either way, instead of an ORDER BY over bots.
+
+Boards are updated incrementally from committed ORM writes (see
+track_leaderboard_events): download_count changes, rating changes, new
+reviews and paid order lines. Writes that bypass the ORM, and refunds,
+are picked up by the rebuild, which recomputes every board from the
+database once the boards are LEADERBOARD_REBUILD_INTERVAL old (started by
+the read that notices, one rebuild at a time across workers).
+
+- downloads: bots.download_count
+- rating: rating_average shrunk towards PRIOR_RATING by
+  LEADERBOARD_RATING_PRIOR_WEIGHT virtual ratings, so one 5-star review
+  does not top the board
+- trending: purchases (per unit) and reviews, each worth
+  2^((t - landmark) / half-life). Scores are relative to the landmark,
+  the time of the last rebuild, which keeps them small; decay is applied
+  implicitly because newer events are worth more.
+"""
+
+logger = logging.getLogger(__name__)
+
+BOARDS = ("downloads", "rating", "trending")
+
+PRIOR_RATING = 3.0
+
+TRENDING_WEIGHTS = {"purchase": 1.0, "review": 0.5}
+
+# (board, op, bot id, value); op is "incr", "set", "decay" (trending weight
+# at the current time) or "remove" (from every board)
+Event = Tuple[str, str, str, float]
+
+DOWNLOADS_STATEMENT = text("""
+SELECT id, download_count FROM bots WHERE is_active AND download_count > 0
+""")
+
+RATINGS_STATEMENT = text("""
+SELECT id, rating_average, rating_count FROM bots WHERE is_active AND rating_count > 0
+""")
+
+# Purchases count from noon of their (UTC) day; older than the window they weigh < 0.4%
+TRENDING_STATEMENT = text("""
+SELECT e.bot_id, sum(e.score)
+FROM (
+    SELECT s.bot_id, s.units * power(2.0, (extract(epoch FROM least(CAST(s.day AS timestamp) AT TIME ZONE 'UTC' + interval '12 hours', now())) - :landmark) / :half_life) AS score
+    FROM sales_daily AS s
+    WHERE s.day >= CAST(to_timestamp(:since) AT TIME ZONE 'UTC' AS date)
+    UNION ALL
+    SELECT r.bot_id, :review_weight * power(2.0, (extract(epoch FROM r.created_at) - :landmark) / :half_life)
+    FROM botreviews AS r
+    WHERE r.created_at >= to_timestamp(:since)
+) AS e JOIN bots AS b ON b.id = e.bot_id AND b.is_active
+GROUP BY e.bot_id
+HAVING sum(e.score) > 0
+""")
+
+# KEYS: meta hash, then one key per board in BOARDS order
+# ARGV: half-life, then (board index, op, member, value) per event
+# Events before the first rebuild are dropped, the rebuild will count them.
+APPLY_SCRIPT = """
+local landmark = tonumber(redis.call('HGET', KEYS[1], 'landmark'))
+if not landmark then
+    return 0
+end
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local half_life = tonumber(ARGV[1])
+for i = 2, #ARGV, 4 do
+    local key = KEYS[tonumber(ARGV[i]) + 2]
+    local op = ARGV[i + 1]
+    local member = ARGV[i + 2]
+    local value = tonumber(ARGV[i + 3])
+    if op == 'incr' then
+        redis.call('ZINCRBY', key, value, member)
+    elseif op == 'set' then
+        redis.call('ZADD', key, value, member)
+    elseif op == 'decay' then
+        redis.call('ZINCRBY', key, value * 2 ^ ((now - landmark) / half_life), member)
+    elseif op == 'remove' then
+        for k = 2, #KEYS do
+            redis.call('ZREM', KEYS[k], member)
+        end
+    end
+end
+return 1
+"""
+
+def rating_score(rating_average, rating_count) -> float:
+    """
+    Bayesian average: the mean rating after adding prior-weight ratings of PRIOR_RATING.
+    """
+    count = rating_count or 0
+    prior = settings.LEADERBOARD_RATING_PRIOR_WEIGHT
+    return (prior * PRIOR_RATING + float(rating_average or 0) * count) / (prior + count)
+
+def decay_factor(at: float, landmark: float) -> float:
+    return 2 ** ((at - landmark) / settings.LEADERBOARD_TRENDING_HALF_LIFE)
+
+class LocalSortedSet:
+    """
+    Sorted set for the in-process store: scores by member plus a list kept
+    in (-score, member) order, so the top N is a slice.
+    """
+
+    def __init__(self, scores: Optional[Dict[str, float]] = None):
+        self.scores: Dict[str, float] = dict(scores or {})
+        self.order: List[Tuple[float, str]] = sorted((-score, member) for member, score in self.scores.items())
+
+    def set(self, member: str, score: float) -> None:
+        self.remove(member)
+        self.scores[member] = score
+        insort(self.order, (-score, member))
+
+    def incr(self, member: str, delta: float) -> None:
+        self.set(member, self.scores.get(member, 0.0) + delta)
+
+    def remove(self, member: str) -> None:
+        old = self.scores.pop(member, None)
+        if old is not None:
+            del self.order[bisect_left(self.order, (-old, member))]
+
+    def top(self, n: int) -> List[str]:
+        return [member for _, member in self.order[:n]]
+
+class LocalLeaderboards:
+    """
+    In-process store: used when Redis is unavailable, and in tests.
+    """
+
+    def __init__(self):
+        self.boards: Dict[str, LocalSortedSet] = {board: LocalSortedSet() for board in BOARDS}
+        self.landmark: Optional[float] = None
+        self.built_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def apply(self, events: Sequence[Event]) -> None:
+        with self._lock:
+            if self.landmark is None:
+                return
+            now = time.time()
+            for board, op, member, value in events:
+                if op == "incr":
+                    self.boards[board].incr(member, value)
+                elif op == "set":
+                    self.boards[board].set(member, value)
+                elif op == "decay":
+                    self.boards[board].incr(member, value * decay_factor(now, self.landmark))
+                elif op == "remove":
+                    for sorted_set in self.boards.values():
+                        sorted_set.remove(member)
+
+    def top(self, board: str, n: int) -> Tuple[List[str], Optional[float]]:
+        with self._lock:
+            return self.boards[board].top(n), self.built_at
+
+    def replace(self, boards: Dict[str, Dict[str, float]], landmark: float) -> None:
+        built = {board: LocalSortedSet(boards.get(board)) for board in BOARDS}
+        with self._lock:
+            self.boards = built
+            self.landmark = landmark
+            self.built_at = time.time()
+
+class RedisLeaderboards:
+    """
+    Shared store: one sorted set per board plus a meta hash (landmark, built_at).
+    """
+
+    prefix = "leaderboard:"
+
+    def __init__(self):
+        self._script = None
+        self._script_client = None
+
+    @property
+    def meta_key(self) -> str:
+        return self.prefix + "meta"
+
+    def key(self, board: str) -> str:
+        return self.prefix + board
+
+    def apply(self, client, events: Sequence[Event]) -> None:
+        if self._script is None or self._script_client is not client:
+            self._script = client.register_script(APPLY_SCRIPT)
+            self._script_client = client
+        args: List = [settings.LEADERBOARD_TRENDING_HALF_LIFE]
+        for board, op, member, value in events:
+            args.extend((BOARDS.index(board) if board in BOARDS else 0, op, member, value))
+        self._script(keys=[self.meta_key, *map(self.key, BOARDS)], args=args)
+
+    def top(self, client, board: str, n: int) -> Tuple[List[str], Optional[float]]:
+        pipe = client.pipeline(transaction=False)
+        pipe.zrevrange(self.key(board), 0, n - 1)
+        pipe.hget(self.meta_key, "built_at")
+        members, built_at = pipe.execute()
+        return [member.decode() for member in members], float(built_at) if built_at is not None else None
+
+    def replace(self, client, boards: Dict[str, Dict[str, float]], landmark: float) -> None:
+        # Fill temporary keys, then swap them all in at once
+        pipe = client.pipeline(transaction=False)
+        for board in BOARDS:
+            scores = boards.get(board) or {}
+            pipe.delete(self.key(board) + ":next")
+            items = list(scores.items())
+            for start in range(0, len(items), 5000):
+                pipe.zadd(self.key(board) + ":next", dict(items[start:start + 5000]))
+        pipe.execute()
+        swap = client.pipeline(transaction=True)
+        for board in BOARDS:
+            if boards.get(board):
+                swap.rename(self.key(board) + ":next", self.key(board))
+            else:
+                swap.delete(self.key(board))
+        swap.hset(self.meta_key, mapping={"landmark": landmark, "built_at": time.time()})
+        swap.execute()
+
+    def try_lock_rebuild(self, client) -> bool:
+        return bool(client.set(self.prefix + "rebuilding", "1", nx=True, ex=300))
+
+    def unlock_rebuild(self, client) -> None:
+        client.delete(self.prefix + "rebuilding")
+
+def compute_boards(db: Session, landmark: float) -> Dict[str, Dict[str, float]]:
+    """
+    Every board's scores from the database, trending relative to `landmark`.
+    """
+    half_life = settings.LEADERBOARD_TRENDING_HALF_LIFE
+    trending = db.execute(TRENDING_STATEMENT, {
+        "landmark": landmark,
+        "half_life": half_life,
+        "since": landmark - 8 * half_life,
+        "review_weight": TRENDING_WEIGHTS["review"],
+    })
+    return {
+        "downloads": {str(bot_id): float(count) for bot_id, count in db.execute(DOWNLOADS_STATEMENT)},
+        "rating": {str(bot_id): rating_score(average, count) for bot_id, average, count in db.execute(RATINGS_STATEMENT)},
+        "trending": {str(bot_id): float(score) for bot_id, score in trending},
+    }
+
+class Leaderboards:
+    """
+    Leaderboards in Redis, or in process when Redis is down.
+    """
+
+    def __init__(self, session_factory: sessionmaker):
+        self.session_factory = session_factory
+        self.local = LocalLeaderboards()
+        self.redis = RedisLeaderboards()
+        self._flight = SingleFlight(timeout=60.0)
+        self._rebuilding = threading.Lock()
+        self.rebuilds = 0
+        self.events = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "local" if get_redis() is None else "redis",
+            "events": self.events,
+            "rebuilds": self.rebuilds,
+        }
+
+    def _fall_back(self, action: str) -> None:
+        logger.warning(f"leaderboard {action} failed in redis, using in-process boards", exc_info=True)
+        redis_connection.mark_failed()
+
+    def record(self, events: Sequence[Event]) -> None:
+        """
+        Apply committed events to the boards.
+        """
+        if not events:
+            return
+        self.events += len(events)
+        client = get_redis()
+        if client is not None:
+            try:
+                self.redis.apply(client, events)
+                return
+            except redis.RedisError:
+                self._fall_back("update")
+        self.local.apply(events)
+
+    def top(self, board: str, n: int) -> List[str]:
+        """
+        Ids of the top `n` bots on a board, best first.
+
+        Boards that were never built are built first; boards older than
+        LEADERBOARD_REBUILD_INTERVAL are served and rebuilt in the background.
+        """
+        client = get_redis()
+        if client is not None:
+            try:
+                ids, built_at = self.redis.top(client, board, n)
+            except redis.RedisError:
+                self._fall_back("read")
+                client = None
+        if client is None:
+            ids, built_at = self.local.top(board, n)
+        if built_at is None:
+            self._flight.do("rebuild", self.rebuild)
+            return self.top(board, n) if self._built() else []
+        if time.time() - built_at > settings.LEADERBOARD_REBUILD_INTERVAL and self._rebuilding.acquire(blocking=False):
+            threading.Thread(target=self._rebuild_in_background, name="leaderboard-rebuild", daemon=True).start()
+        return ids
+
+    def _built(self) -> bool:
+        client = get_redis()
+        if client is not None:
+            try:
+                return client.hexists(self.redis.meta_key, "built_at")
+            except redis.RedisError:
+                self._fall_back("read")
+        return self.local.built_at is not None
+
+    def _rebuild_in_background(self) -> None:
+        try:
+            self.rebuild()
+        except Exception:
+            logger.warning("leaderboard rebuild failed", exc_info=True)
+        finally:
+            self._rebuilding.release()
+
+    def rebuild(self) -> bool:
+        """
+        Recompute every board from the database.
+
+        Returns:
+            False if another worker was already rebuilding the shared boards
+        """
+        client = get_redis()
+        if client is not None:
+            try:
+                if not self.redis.try_lock_rebuild(client):
+                    return False
+            except redis.RedisError:
+                self._fall_back("rebuild")
+                client = None
+        try:
+            landmark = time.time()
+            db = self.session_factory(info={"read_only": True})
+            try:
+                boards = compute_boards(db, landmark)
+            finally:
+                db.close()
+            if client is not None:
+                try:
+                    self.redis.replace(client, boards, landmark)
+                except redis.RedisError:
+                    self._fall_back("rebuild")
+                    self.local.replace(boards, landmark)
+            else:
+                self.local.replace(boards, landmark)
+            self.rebuilds += 1
+            return True
+        finally:
+            if client is not None:
+                try:
+                    self.redis.unlock_rebuild(client)
+                except redis.RedisError:
+                    pass
+
+leaderboards = Leaderboards(SessionLocal)
+
+def _changed(obj, attribute: str) -> bool:
+    return inspect(obj).attrs[attribute].history.has_changes()
+
+def _collect_events(session: Session) -> Iterable[Event]:
+    for obj in session.new:
+        if isinstance(obj, BotReviewModel) and obj.bot_id is not None:
+            yield ("trending", "decay", str(obj.bot_id), TRENDING_WEIGHTS["review"])
+        elif isinstance(obj, OrderItemModel) and obj.bot_id is not None:
+            order = obj.order or session.get(OrderModel, obj.order_id)
+            if order is not None and order.payment_status == "completed":
+                yield ("trending", "decay", str(obj.bot_id), TRENDING_WEIGHTS["purchase"] * (obj.quantity or 1))
+    for obj in session.dirty:
+        if isinstance(obj, BotModel):
+            bot_id = str(obj.id)
+            if _changed(obj, "is_active") and not obj.is_active:
+                yield ("", "remove", bot_id, 0.0)
+                continue
+            history = inspect(obj).attrs.download_count.history
+            if history.has_changes():
+                before = (history.deleted or [0])[0] or 0
+                yield ("downloads", "incr", bot_id, float((obj.download_count or 0) - before))
+            if _changed(obj, "rating_average") or _changed(obj, "rating_count"):
+                yield ("rating", "set", bot_id, rating_score(obj.rating_average, obj.rating_count))
+        elif isinstance(obj, OrderModel) and _changed(obj, "payment_status") and obj.payment_status == "completed":
+            for item in obj.order_items:
+                if item.bot_id is not None and item not in session.new:
+                    yield ("trending", "decay", str(item.bot_id), TRENDING_WEIGHTS["purchase"] * (item.quantity or 1))
+    for obj in session.deleted:
+        if isinstance(obj, BotModel):
+            yield ("", "remove", str(obj.id), 0.0)
+
+def track_leaderboard_events(session_factory: sessionmaker) -> None:
+    """
+    Feed the leaderboards from sessions of `session_factory`.
+
+    Events are collected at flush time (while attribute history is still
+    there) and applied only after the transaction commits.
+    """
+    @event.listens_for(session_factory, "after_flush")
+    def collect(session, flush_context):
+        events = list(_collect_events(session))
+        if events:
+            session.info.setdefault("leaderboard_events", []).extend(events)
+
+    @event.listens_for(session_factory, "after_commit")
+    def apply(session):
+        events = session.info.pop("leaderboard_events", None)
+        if events:
+            try:
+                leaderboards.record(events)
+            except Exception:
+                logger.warning("leaderboard update failed", exc_info=True)
+
+    @event.listens_for(session_factory, "after_rollback")
+    def discard(session):
+        session.info.pop("leaderboard_events", None)
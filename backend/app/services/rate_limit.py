@@ -0,0 +1,159 @@
+# File: app/services/rate_limit.py
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+from app.core.redis import get_redis, redis, redis_connection
+
+"""
+Token bucket rate limiting.
+
+A limit like "20/minute" is a bucket holding at most 20 tokens that refills
+at 20 tokens per minute; each request takes one token. A request can be
+subject to several buckets at once (per IP, per user); it is allowed only
+if every bucket has a token, and then takes one from each.
+
+Bucket state lives in Redis and is updated atomically by a Lua script
+(one round trip for all buckets, Redis clock, so workers agree). When
+Redis is unavailable, buckets are kept in process instead: limits are then
+enforced per worker rather than globally.
+"""
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Bucket capacity and refill rate (tokens per second).
+    """
+    capacity: int
+    rate: float
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimit":
+        """
+        Parse "<count>/<second|minute|hour|day>", e.g. "20/minute".
+        """
+        count, _, period = value.partition("/")
+        try:
+            seconds = PERIODS[period.strip().lower().rstrip("s") or "second"]
+            capacity = int(count)
+        except (KeyError, ValueError):
+            raise ValueError(f"Invalid rate limit {value!r}, expected e.g. '20/minute'")
+        return cls(capacity=capacity, rate=capacity / seconds)
+
+@dataclass(frozen=True)
+class Decision:
+    allowed: bool
+    retry_after: float = 0.0
+
+# KEYS: bucket keys; ARGV: rate_1, capacity_1, rate_2, capacity_2, ...
+# Tokens are only taken if every bucket can pay, so a denied request costs nothing.
+TOKEN_BUCKET_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local tokens = {}
+local retry_after = 0
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[i * 2 - 1])
+    local capacity = tonumber(ARGV[i * 2])
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local available = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    available = math.min(capacity, available + math.max(0, now - ts) * rate)
+    tokens[i] = available
+    if available < 1 then
+        retry_after = math.max(retry_after, (1 - available) / rate)
+    end
+end
+if retry_after > 0 then
+    return {0, tostring(retry_after)}
+end
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[i * 2 - 1])
+    local capacity = tonumber(ARGV[i * 2])
+    redis.call('HSET', key, 'tokens', tostring(tokens[i] - 1), 'ts', tostring(now))
+    redis.call('PEXPIRE', key, math.ceil(capacity / rate * 1000) + 1000)
+end
+return {1, '0'}
+"""
+
+class LocalTokenBuckets:
+    """
+    In-process fallback: same algorithm, state in a bounded LRU dict.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, buckets: Sequence[Tuple[str, RateLimit]]) -> Decision:
+        now = time.monotonic()
+        with self._lock:
+            refilled: List[float] = []
+            retry_after = 0.0
+            for key, limit in buckets:
+                available, ts = self._buckets.get(key, (limit.capacity, now))
+                available = min(limit.capacity, available + (now - ts) * limit.rate)
+                refilled.append(available)
+                if available < 1:
+                    retry_after = max(retry_after, (1 - available) / limit.rate)
+            if retry_after > 0:
+                return Decision(allowed=False, retry_after=retry_after)
+            for (key, _), available in zip(buckets, refilled):
+                self._buckets[key] = (available - 1, now)
+                self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return Decision(allowed=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+class RateLimiter:
+    """
+    Checks a set of buckets in Redis, or in process when Redis is down.
+    """
+
+    key_prefix = "ratelimit:"
+
+    def __init__(self):
+        self.local = LocalTokenBuckets()
+        self._script = None
+        self._script_client = None
+
+    def hit(self, buckets: Dict[str, RateLimit]) -> Decision:
+        """
+        Take one token from each bucket if all of them have one.
+
+        Args:
+            buckets: Bucket key -> limit, e.g. {"login:ip:10.0.0.1": RateLimit(20, 0.33)}
+        """
+        items = list(buckets.items())
+        client = get_redis()
+        if client is not None:
+            try:
+                return self._hit_redis(client, items)
+            except redis.RedisError:
+                logger.warning("rate limit check failed in redis, using in-process buckets", exc_info=True)
+                redis_connection.mark_failed()
+        return self.local.hit(items)
+
+    def _hit_redis(self, client, items: List[Tuple[str, RateLimit]]) -> Decision:
+        if self._script is None or self._script_client is not client:
+            # register_script uses EVALSHA and reloads the script if Redis lost it
+            self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+            self._script_client = client
+        args: List[float] = []
+        for _, limit in items:
+            args.extend((limit.rate, limit.capacity))
+        allowed, retry_after = self._script(keys=[self.key_prefix + key for key, _ in items], args=args)
+        return Decision(allowed=bool(int(allowed)), retry_after=float(retry_after))
+
+rate_limiter = RateLimiter()
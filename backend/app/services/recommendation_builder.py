@@ -0,0 +1,141 @@
+# File: app/services/recommendation_builder.py
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+import numpy as np
+from scipy import sparse
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.engine import Connection
+from app.models.BotRecommendations import bot_recommendations
+
+"""
+Offline builder of "users who bought this also bought" lists.
+
+Access grants form a sparse user x bot matrix X. X^T X counts the users
+every pair of bots has in common; dividing by the square roots of both
+bots' user counts gives their cosine similarity. Rows of X^T X are computed
+a chunk of bots at a time, so memory stays bounded by the chunk, and the
+best RECOMMENDATIONS_TOP_K bots per row are stored in bot_recommendations.
+
+Incremental runs only rewrite the lists of bots held by users whose grants
+changed since the previous run: only their co-occurrence counts moved.
+Other bots' similarities drift slightly as user counts change, which the
+next full run (--full) corrects.
+"""
+
+# pg_advisory_xact_lock key, any constant unique to this application
+RECOMMENDATIONS_LOCK_ID = 0x426F745265636F6D  # "BotRecom"
+
+# Grants committed by transactions that started before the previous run read
+CHANGE_OVERLAP = timedelta(seconds=60)
+
+# Bots per X^T X slice; a row can have as many entries as there are bots
+CHUNK_SIZE = 256
+
+GRANTS_STATEMENT = text("""
+SELECT a.user_id, a.bot_id
+FROM userbotaccesss AS a JOIN bots AS b ON b.id = a.bot_id AND b.is_active
+WHERE a.is_active AND (a.expires_at IS NULL OR a.expires_at > now())
+""")
+
+# Every bot held, or once held, by a user whose grants changed
+AFFECTED_STATEMENT = text("""
+SELECT DISTINCT bot_id FROM userbotaccesss
+WHERE user_id IN (
+    SELECT user_id FROM userbotaccesss WHERE granted_at > :since OR updated_at > :since
+)
+""")
+
+@dataclass
+class BuildResult:
+    full: bool
+    users: int
+    bots: int
+    grants: int
+    rewritten: int
+
+def grant_matrix(conn: Connection) -> Tuple[List[UUID], sparse.csr_matrix]:
+    """
+    Current access grants of active bots as a binary users x bots matrix.
+
+    Returns:
+        Bot id of each column, and the matrix
+    """
+    users: Dict[UUID, int] = {}
+    bots: Dict[UUID, int] = {}
+    rows, columns = [], []
+    for user_id, bot_id in conn.execute(GRANTS_STATEMENT):
+        rows.append(users.setdefault(user_id, len(users)))
+        columns.append(bots.setdefault(bot_id, len(bots)))
+    matrix = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float32), (np.array(rows, dtype=np.int32), np.array(columns, dtype=np.int32))),
+        shape=(len(users), len(bots)),
+    )
+    return list(bots), matrix
+
+def top_neighbours(matrix: sparse.csr_matrix, columns: np.ndarray, *, top_k: int, min_cooccurrence: int) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+    """
+    Most similar bots for each of `columns`.
+
+    Yields:
+        (column, neighbour columns best first, their cosine similarities)
+    """
+    item_users = matrix.T.tocsr()
+    inverse_norms = 1.0 / np.sqrt(np.maximum(matrix.getnnz(axis=0), 1))
+    for start in range(0, len(columns), CHUNK_SIZE):
+        chunk = columns[start:start + CHUNK_SIZE]
+        together = (item_users[chunk] @ matrix).tocsr()
+        for row, column in enumerate(chunk):
+            lo, hi = together.indptr[row], together.indptr[row + 1]
+            others, counts = together.indices[lo:hi], together.data[lo:hi]
+            keep = (others != column) & (counts >= min_cooccurrence)
+            others = others[keep]
+            scores = counts[keep] * inverse_norms[others] * inverse_norms[column]
+            if len(others) > top_k:
+                best = np.argpartition(-scores, top_k)[:top_k]
+                others, scores = others[best], scores[best]
+            order = np.lexsort((others, -scores))
+            yield column, others[order], scores[order]
+
+def build(conn: Connection, *, top_k: int, min_cooccurrence: int, full: bool = False) -> Optional[BuildResult]:
+    """
+    Recompute recommendation lists within the caller's transaction.
+
+    Runs incrementally when there are lists from a previous run, unless
+    `full` is set. The latest computed_at is where the next incremental run
+    starts looking for changed grants.
+
+    Returns:
+        What was done, or None if another build holds the lock
+    """
+    if not conn.execute(select(func.pg_try_advisory_xact_lock(RECOMMENDATIONS_LOCK_ID))).scalar():
+        return None
+    computed_at = conn.execute(select(func.now())).scalar()
+    previous = None if full else conn.execute(select(func.max(bot_recommendations.c.computed_at))).scalar()
+    full = previous is None
+
+    bot_ids, matrix = grant_matrix(conn)
+    column_of = {bot_id: column for column, bot_id in enumerate(bot_ids)}
+    if full:
+        affected = list(bot_ids)
+        conn.execute(delete(bot_recommendations))
+    else:
+        affected = list(conn.execute(AFFECTED_STATEMENT, {"since": previous - CHANGE_OVERLAP}).scalars())
+        if affected:
+            conn.execute(delete(bot_recommendations).where(bot_recommendations.c.bot_id.in_(affected)))
+
+    columns = np.array(sorted(column_of[bot_id] for bot_id in affected if bot_id in column_of), dtype=np.int32)
+    rows = [
+        {
+            "bot_id": bot_ids[column],
+            "recommended_ids": [bot_ids[other] for other in others],
+            "scores": [round(float(score), 6) for score in scores],
+            "computed_at": computed_at,
+        }
+        for column, others, scores in top_neighbours(matrix, columns, top_k=top_k, min_cooccurrence=min_cooccurrence)
+        if len(others)
+    ]
+    for start in range(0, len(rows), 5000):
+        conn.execute(insert(bot_recommendations), rows[start:start + 5000])
+    return BuildResult(full=full, users=matrix.shape[0], bots=matrix.shape[1], grants=matrix.nnz, rewritten=len(rows))
@@ -0,0 +1,97 @@
+# File: app/services/recommendations.py
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import String, cast, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.db.session.database import SessionLocal
+from app.models.BotRecommendations import bot_recommendations
+from app.services.singleflight import SingleFlight
+
+"""
+In-memory "users who bought this also bought" lists.
+
+scripts/build_recommendations.py precomputes them into
+bot_recommendations; every worker holds the whole table in a dict, so a
+lookup never touches the database. Every RECOMMENDATIONS_RELOAD_INTERVAL
+the first reader checks in the background whether a build has changed the
+table since it was loaded, and swaps in the new lists if so.
+"""
+
+logger = logging.getLogger(__name__)
+
+MARKER_STATEMENT = select(func.count(), func.max(bot_recommendations.c.computed_at))
+
+# Ids as text: converting to UUID objects only to print them again is most of the load time
+LISTS_STATEMENT = select(
+    cast(bot_recommendations.c.bot_id, String),
+    cast(bot_recommendations.c.recommended_ids, ARRAY(String)),
+)
+
+class RecommendationStore:
+
+    def __init__(self, session_factory: sessionmaker, reload_interval: float):
+        self.session_factory = session_factory
+        self.reload_interval = reload_interval
+        self._lists: Dict[str, Tuple[str, ...]] = {}
+        self._marker: Optional[tuple] = None
+        self._checked_at: Optional[float] = None
+        self._flight = SingleFlight(timeout=60.0)
+        self._reloading = threading.Lock()
+        self.reloads = 0
+
+    def get(self, bot_id: str, limit: int) -> List[str]:
+        """
+        Ids of the bots most often bought together with `bot_id`, best first.
+        """
+        if self._checked_at is None:
+            self._flight.do("reload", self.reload)
+        elif time.monotonic() - self._checked_at > self.reload_interval and self._reloading.acquire(blocking=False):
+            threading.Thread(target=self._reload_in_background, name="recommendations-reload", daemon=True).start()
+        return list(self._lists.get(str(bot_id).lower(), ())[:limit])
+
+    def _reload_in_background(self) -> None:
+        try:
+            self.reload()
+        except Exception:
+            logger.warning("reloading recommendations failed", exc_info=True)
+        finally:
+            self._reloading.release()
+
+    def reload(self) -> bool:
+        """
+        Load the lists if the table changed since the last load.
+
+        Returns:
+            Whether new lists were loaded
+        """
+        db = self.session_factory(info={"read_only": True})
+        try:
+            marker = tuple(db.execute(MARKER_STATEMENT).one())
+            if marker == self._marker:
+                self._checked_at = time.monotonic()
+                return False
+            # One string per bot, shared by every list it appears in
+            ids: Dict[str, str] = {}
+            lists = {}
+            for bot_id, recommended_ids in db.execute(LISTS_STATEMENT):
+                lists[ids.setdefault(bot_id, bot_id)] = tuple(ids.setdefault(other, other) for other in recommended_ids)
+        finally:
+            db.close()
+        self._lists = lists
+        self._marker = marker
+        self._checked_at = time.monotonic()
+        self.reloads += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "bots": len(self._lists),
+            "computed_at": self._marker[1].isoformat() if self._marker and self._marker[1] else None,
+            "reloads": self.reloads,
+        }
+
+recommendations = RecommendationStore(SessionLocal, reload_interval=settings.RECOMMENDATIONS_RELOAD_INTERVAL)
@@ -0,0 +1,505 @@
+# File: app/services/runner_pool.py
+import itertools
+import json
+import logging
+import os
+import re
+import select
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterator, List, Optional, Type
+from app.core.config import settings
+
+"""
+Warm runner pool for bot executions.
+
+Starting an interpreter (or a container) per execution makes cold start
+dominate short jobs, so the pool keeps runner processes alive per runtime,
+i.e. per (docker_image, python_version), and leases one to each execution.
+A runner serves one job at a time and is recycled after RUNNER_MAX_USES
+jobs, when its peak memory passes RUNNER_MAX_MEMORY_MB, or when a job
+fails at the process level (crash, timeout, broken protocol).
+
+Scaling follows queue depth: maintain() pre-starts idle runners for the
+queued executions of each runtime (up to the per-runtime and total caps)
+and closes idle runners beyond that once they have been idle for
+RUNNER_IDLE_TIMEOUT.
+
+Backends implement Runner and are selected with RUNNER_BACKEND: the
+"subprocess" backend runs a local interpreter and needs no Docker, the
+"docker" backend runs the bot's image.
+"""
+
+logger = logging.getLogger(__name__)
+
+WORKER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "runner_worker.py")
+
+@dataclass(frozen=True)
+class RuntimeKey:
+    docker_image: Optional[str]
+    python_version: Optional[str]
+
+class RunnerError(RuntimeError):
+    """
+    The runner process failed; the runner is discarded.
+    """
+
+class RunnerTimeout(RunnerError):
+    pass
+
+class PoolExhausted(RuntimeError):
+    """
+    No runner became available within the lease timeout.
+    """
+
+@dataclass
+class JobResult:
+    ok: bool
+    output: Any = None
+    error: Optional[str] = None
+    traceback: Optional[str] = None
+
+_runner_ids = itertools.count(1)
+
+class Runner(ABC):
+    """
+    A long-lived process that runs jobs for one runtime.
+    """
+
+    def __init__(self, key: RuntimeKey):
+        self.key = key
+        self.id = f"runner-{os.getpid()}-{next(_runner_ids)}"
+        self.uses = 0
+        self.max_rss_kb: Optional[int] = None
+        self.started_at = time.monotonic()
+        self.last_used = self.started_at
+
+    @classmethod
+    def runtime(cls, key: RuntimeKey) -> RuntimeKey:
+        """
+        The key runners are pooled under; backends that ignore part of the
+        runtime drop it so equivalent runners are shared.
+        """
+        return key
+
+    @abstractmethod
+    def start(self, timeout: float) -> None:
+        """
+        Start the process and wait until it is ready; raises RunnerError.
+        """
+
+    @abstractmethod
+    def run(self, job: Dict[str, Any], timeout: float) -> JobResult:
+        """
+        Run one job; raises RunnerError if the process itself failed.
+        """
+
+    @abstractmethod
+    def alive(self) -> bool:
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        ...
+
+class ProcessRunner(Runner):
+    """
+    Runner speaking the runner_worker JSON-lines protocol over a child's stdin/stdout.
+    """
+
+    @abstractmethod
+    def command(self) -> List[str]:
+        """
+        Argument list that starts runner_worker for this runtime.
+        """
+
+    def start(self, timeout: float) -> None:
+        try:
+            self.process = subprocess.Popen(
+                self.command(),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=None,
+                bufsize=0,
+                start_new_session=True,
+            )
+        except OSError as exc:
+            raise RunnerError(f"Could not start runner for {self.key}: {exc}") from exc
+        self._buffer = b""
+        ready = self._read_message(timeout)
+        if not ready.get("ready"):
+            self.close()
+            raise RunnerError(f"Runner for {self.key} did not start: {ready}")
+        self.pid = ready.get("pid")
+
+    def run(self, job: Dict[str, Any], timeout: float) -> JobResult:
+        try:
+            self.process.stdin.write(json.dumps(job, default=str).encode() + b"\n")
+        except (BrokenPipeError, OSError) as exc:
+            raise RunnerError(f"Runner {self.id} is gone: {exc}") from exc
+        message = self._read_message(timeout)
+        self.max_rss_kb = message.get("max_rss_kb")
+        return JobResult(
+            ok=bool(message.get("ok")),
+            output=message.get("output"),
+            error=message.get("error"),
+            traceback=message.get("traceback"),
+        )
+
+    def _read_message(self, timeout: float) -> Dict[str, Any]:
+        deadline = time.monotonic() + timeout
+        stdout = self.process.stdout
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # A runner stuck in a job is of no further use
+                self.process.kill()
+                raise RunnerTimeout(f"Runner {self.id} gave no answer within {timeout:.0f}s")
+            readable, _, _ = select.select([stdout], [], [], remaining)
+            if not readable:
+                continue
+            chunk = os.read(stdout.fileno(), 65536)
+            if not chunk:
+                raise RunnerError(f"Runner {self.id} exited with code {self.process.wait()}")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        try:
+            return json.loads(line)
+        except ValueError as exc:
+            raise RunnerError(f"Runner {self.id} sent an invalid message: {line[:200]!r}") from exc
+
+    def alive(self) -> bool:
+        return getattr(self, "process", None) is not None and self.process.poll() is None
+
+    def close(self) -> None:
+        process = getattr(self, "process", None)
+        if process is None or process.poll() is not None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+
+def resolve_python(python_version: Optional[str]) -> str:
+    """
+    Local interpreter for a bot's python_version ("3.11", "3.9+").
+
+    The current interpreter is used when it satisfies the requirement,
+    otherwise a `pythonX.Y` on PATH; raises RunnerError if there is none.
+    """
+    match = re.match(r"\s*(\d+)\.(\d+)\s*(\+)?", python_version or "")
+    if not match:
+        return sys.executable
+    wanted = (int(match.group(1)), int(match.group(2)))
+    current = sys.version_info[:2]
+    if current == wanted or (match.group(3) and current > wanted):
+        return sys.executable
+    found = shutil.which(f"python{wanted[0]}.{wanted[1]}")
+    if not found:
+        raise RunnerError(f"No local interpreter for Python {python_version}")
+    return found
+
+class SubprocessRunner(ProcessRunner):
+    """
+    Local interpreter; ignores docker_image. Bots are read from RUNNER_BOT_PATH.
+    """
+
+    @classmethod
+    def runtime(cls, key: RuntimeKey) -> RuntimeKey:
+        return RuntimeKey(None, key.python_version)
+
+    def command(self) -> List[str]:
+        return [resolve_python(self.key.python_version), "-u", WORKER_PATH, os.path.abspath(settings.RUNNER_BOT_PATH)]
+
+class DockerRunner(ProcessRunner):
+    """
+    `docker run -i` of the bot's image, with RUNNER_BOT_PATH mounted read-only
+    at /bots and the container memory capped at RUNNER_MAX_MEMORY_MB.
+    """
+
+    def command(self) -> List[str]:
+        image = self.key.docker_image
+        if not image:
+            version = re.match(r"\s*(\d+\.\d+)", self.key.python_version or "")
+            image = f"python:{version.group(1) if version else '3'}-slim"
+        with open(WORKER_PATH) as f:
+            source = f.read()
+        return [
+            "docker", "run", "--rm", "-i",
+            "--name", self.id,
+            "--network", "none",
+            "--memory", f"{settings.RUNNER_MAX_MEMORY_MB}m",
+            "-v", f"{os.path.abspath(settings.RUNNER_BOT_PATH)}:/bots:ro",
+            image, "python", "-u", "-c", source, "/bots",
+        ]
+
+    def close(self) -> None:
+        super().close()
+        if getattr(self, "process", None) is not None:
+            subprocess.run(["docker", "rm", "-f", self.id], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+RUNNER_BACKENDS: Dict[str, Type[Runner]] = {
+    "subprocess": SubprocessRunner,
+    "docker": DockerRunner,
+}
+
+class _RuntimePool:
+    def __init__(self):
+        self.idle: Deque[Runner] = deque()
+        self.busy = 0
+        self.starting = 0
+        self.waiting = 0
+        self.demand = 0
+        self.last_demand = 0.0
+
+    @property
+    def total(self) -> int:
+        return len(self.idle) + self.busy + self.starting
+
+class RunnerPool:
+    """
+    Warm runners per runtime, leased one job at a time.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[Type[Runner]] = None,
+        max_per_runtime: Optional[int] = None,
+        max_total: Optional[int] = None,
+        min_idle: Optional[int] = None,
+        max_uses: Optional[int] = None,
+        max_memory_mb: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        start_timeout: Optional[float] = None,
+    ):
+        if backend is None:
+            try:
+                backend = RUNNER_BACKENDS[settings.RUNNER_BACKEND]
+            except KeyError:
+                raise ValueError(f"Unknown RUNNER_BACKEND {settings.RUNNER_BACKEND!r}, expected one of {list(RUNNER_BACKENDS)}")
+        self.backend = backend
+        self.max_per_runtime = settings.RUNNER_MAX_PER_RUNTIME if max_per_runtime is None else max_per_runtime
+        self.max_total = settings.RUNNER_MAX_TOTAL if max_total is None else max_total
+        self.min_idle = settings.RUNNER_MIN_IDLE if min_idle is None else min_idle
+        self.max_uses = settings.RUNNER_MAX_USES if max_uses is None else max_uses
+        self.max_memory_kb = (settings.RUNNER_MAX_MEMORY_MB if max_memory_mb is None else max_memory_mb) * 1024
+        self.idle_timeout = settings.RUNNER_IDLE_TIMEOUT if idle_timeout is None else idle_timeout
+        self.start_timeout = settings.RUNNER_START_TIMEOUT if start_timeout is None else start_timeout
+        self._lock = threading.Condition()
+        self._runtimes: Dict[RuntimeKey, _RuntimePool] = {}
+        self._closed = False
+        self.started = 0
+        self.recycled = 0
+        self.leases = 0
+        self.warm_leases = 0
+
+    def runtime(self, key: RuntimeKey) -> RuntimeKey:
+        """
+        The runtime `key` shares runners with under this pool's backend.
+        """
+        return self.backend.runtime(key)
+
+    def _runtime(self, key: RuntimeKey) -> _RuntimePool:
+        runtime = self._runtimes.get(key)
+        if runtime is None:
+            runtime = self._runtimes[key] = _RuntimePool()
+        return runtime
+
+    def _total(self) -> int:
+        return sum(runtime.total for runtime in self._runtimes.values())
+
+    def _evict_idle(self) -> bool:
+        """
+        Close the longest-idle runner of any runtime to make room (lock held).
+        """
+        candidates = [r for r in self._runtimes.values() if r.idle]
+        if not candidates:
+            return False
+        runtime = min(candidates, key=lambda r: r.idle[0].last_used)
+        self._discard(runtime.idle.popleft())
+        return True
+
+    def _discard(self, runner: Runner) -> None:
+        self.recycled += 1
+        threading.Thread(target=runner.close, daemon=True).start()
+
+    def _spawn(self, key: RuntimeKey) -> Runner:
+        """
+        Start a runner for a slot already reserved in `starting`.
+        """
+        runner = self.backend(key)
+        try:
+            runner.start(self.start_timeout)
+        except BaseException:
+            with self._lock:
+                self._runtime(key).starting -= 1
+                self._lock.notify_all()
+            runner.close()
+            raise
+        self.started += 1
+        return runner
+
+    @contextmanager
+    def lease(self, key: RuntimeKey, timeout: Optional[float] = None) -> Iterator[Runner]:
+        """
+        Lease a runner for `key`, starting one if none is idle.
+
+        Raises:
+            PoolExhausted: No runner became free within `timeout`
+            RunnerError: A new runner could not be started
+        """
+        runner = self._acquire(self.runtime(key), timeout)
+        healthy = False
+        try:
+            yield runner
+            healthy = True
+        finally:
+            self._release(runner, healthy)
+
+    def _acquire(self, key: RuntimeKey, timeout: Optional[float]) -> Runner:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            runtime = self._runtime(key)
+            runtime.waiting += 1
+            try:
+                while True:
+                    if self._closed:
+                        raise PoolExhausted("Runner pool is closed")
+                    while runtime.idle:
+                        runner = runtime.idle.pop()
+                        if runner.alive():
+                            runtime.busy += 1
+                            self.leases += 1
+                            self.warm_leases += 1
+                            return runner
+                        self._discard(runner)
+                    if runtime.total < self.max_per_runtime and (self._total() < self.max_total or self._evict_idle()):
+                        runtime.starting += 1
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise PoolExhausted(f"No runner for {key} within {timeout}s")
+                    self._lock.wait(remaining)
+            finally:
+                runtime.waiting -= 1
+        runner = self._spawn(key)
+        with self._lock:
+            runtime.starting -= 1
+            runtime.busy += 1
+            self.leases += 1
+        return runner
+
+    def _release(self, runner: Runner, healthy: bool) -> None:
+        runner.uses += 1
+        runner.last_used = time.monotonic()
+        recycle = (
+            not healthy
+            or not runner.alive()
+            or runner.uses >= self.max_uses
+            or (runner.max_rss_kb is not None and runner.max_rss_kb > self.max_memory_kb)
+        )
+        with self._lock:
+            runtime = self._runtime(runner.key)
+            runtime.busy -= 1
+            if recycle or self._closed:
+                self._discard(runner)
+            else:
+                runtime.idle.append(runner)
+            self._lock.notify_all()
+
+    def set_demand(self, depths: Dict[RuntimeKey, int]) -> None:
+        """
+        Record the queued executions per runtime (runtimes not listed have none).
+        """
+        now = time.monotonic()
+        pooled: Dict[RuntimeKey, int] = {}
+        for key, depth in depths.items():
+            pooled[self.runtime(key)] = pooled.get(self.runtime(key), 0) + depth
+        with self._lock:
+            for key in set(self._runtimes) | set(pooled):
+                runtime = self._runtime(key)
+                runtime.demand = pooled.get(key, 0)
+                if runtime.demand:
+                    runtime.last_demand = now
+
+    def maintain(self) -> int:
+        """
+        Scale every runtime towards its demand: start idle runners for queued
+        executions, close idle runners that are not needed and have been idle
+        for idle_timeout.
+
+        Returns:
+            Number of runners started
+        """
+        now = time.monotonic()
+        to_start: List[RuntimeKey] = []
+        with self._lock:
+            for key, runtime in list(self._runtimes.items()):
+                recently_used = now - max(runtime.last_demand, max((r.last_used for r in runtime.idle), default=0.0)) < self.idle_timeout
+                wanted = max(runtime.demand, self.min_idle if recently_used else 0)
+                target = min(wanted, self.max_per_runtime - runtime.busy - runtime.starting)
+                # Oldest idle runners first, the warmest stay at the right end of the deque
+                while len(runtime.idle) > max(target, 0) and now - runtime.idle[0].last_used >= self.idle_timeout:
+                    self._discard(runtime.idle.popleft())
+                for _ in range(target - len(runtime.idle)):
+                    if self._total() >= self.max_total:
+                        break
+                    runtime.starting += 1
+                    to_start.append(key)
+                if runtime.total == 0 and not runtime.waiting and not runtime.demand:
+                    del self._runtimes[key]
+        started = 0
+        for key in to_start:
+            try:
+                runner = self._spawn(key)
+            except RunnerError:
+                logger.warning("could not pre-start runner", extra={"runtime": str(key)}, exc_info=True)
+                continue
+            with self._lock:
+                runtime = self._runtime(key)
+                runtime.starting -= 1
+                if self._closed:
+                    self._discard(runner)
+                else:
+                    runtime.idle.append(runner)
+                self._lock.notify_all()
+            started += 1
+        return started
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "runners": self._total(),
+                "started": self.started,
+                "recycled": self.recycled,
+                "leases": self.leases,
+                "warm_leases": self.warm_leases,
+                "runtimes": {
+                    f"{key.docker_image or '-'}/{key.python_version or '-'}": {
+                        "idle": len(r.idle), "busy": r.busy, "starting": r.starting, "queued": r.demand,
+                    }
+                    for key, r in self._runtimes.items()
+                },
+            }
+
+    def close(self) -> None:
+        """
+        Close idle runners; busy ones are closed when their lease ends.
+        """
+        with self._lock:
+            self._closed = True
+            idle = [runner for runtime in self._runtimes.values() for runner in runtime.idle]
+            for runtime in self._runtimes.values():
+                runtime.idle.clear()
+            self._lock.notify_all()
+        for runner in idle:
+            runner.close()
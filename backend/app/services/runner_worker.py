@@ -0,0 +1,98 @@
+# File: app/services/runner_worker.py
+import importlib
+import json
+import os
+import sys
+import traceback
+
+"""
+Runner process for bot executions (the child side of app.services.runner_pool).
+
+Started once per warm runner, then serves one job at a time over JSON
+lines: a job on stdin, its result on stdout. Standard library only and
+no imports from `app`, because it also runs inside bot images with other
+Python versions (the pool passes this file to the interpreter directly).
+
+A job names a bot directory under the bots root and an entry point
+("module:function"); the function is called with the input parameters and
+must return something JSON-serializable. Modules imported from a bot's
+directory are dropped before another bot runs in the same process.
+
+Usage (normally done by the pool):
+    python app/services/runner_worker.py /path/to/bots
+"""
+
+def _max_rss_kb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes elsewhere
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+class BotImporter:
+    """
+    Puts one bot directory on sys.path at a time.
+    """
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self.current = None
+
+    def activate(self, bot):
+        path = os.path.abspath(os.path.join(self.root, bot))
+        if os.path.dirname(path) != self.root:
+            raise ValueError("Invalid bot directory %r" % bot)
+        if path == self.current:
+            return
+        if self.current is not None:
+            self._unload(self.current)
+        sys.path.insert(0, path)
+        importlib.invalidate_caches()
+        self.current = path
+
+    @staticmethod
+    def _unload(path):
+        while path in sys.path:
+            sys.path.remove(path)
+        prefix = path + os.sep
+        for name, module in list(sys.modules.items()):
+            module_file = getattr(module, "__file__", None) or ""
+            if module_file.startswith(prefix):
+                del sys.modules[name]
+
+def run_job(importer, job):
+    importer.activate(job["bot"])
+    module_name, _, function_name = job["entry_point"].partition(":")
+    function = getattr(importlib.import_module(module_name), function_name or "run")
+    return function(job.get("input") or {})
+
+def main():
+    root = sys.argv[1] if len(sys.argv) > 1 else "."
+    # Keep the protocol on a private copy of stdout; anything the bot prints goes to stderr
+    protocol = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    importer = BotImporter(root)
+
+    def reply(message):
+        protocol.write(json.dumps(message, default=str) + "\n")
+        protocol.flush()
+
+    reply({"ready": True, "pid": os.getpid(), "python": "%d.%d.%d" % sys.version_info[:3]})
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            output = run_job(importer, json.loads(line))
+            message = {"ok": True, "output": output}
+        except BaseException as exc:
+            if isinstance(exc, KeyboardInterrupt):
+                raise
+            message = {"ok": False, "error": "".join(traceback.format_exception_only(type(exc), exc)).strip(),
+                       "traceback": traceback.format_exc()}
+        message["max_rss_kb"] = _max_rss_kb()
+        reply(message)
+
+if __name__ == "__main__":
+    main()
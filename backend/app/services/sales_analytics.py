@@ -0,0 +1,127 @@
+# File: app/services/sales_analytics.py
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from app.models.BotModel import BotModel
+from app.models.SalesDaily import sales_daily
+
+"""
+Revenue analytics over the daily sales rollup.
+
+sales_daily is maintained by triggers on orders and orderitems, so these
+queries read at most one row per bot per day in the requested range
+instead of aggregating orders. LIVE_TOTALS is the same aggregation done
+the slow way, used to rebuild or verify the rollup
+(scripts/rebuild_sales_daily.py).
+"""
+
+LIVE_TOTALS = """
+SELECT (o.created_at AT TIME ZONE 'UTC')::date AS day, i.bot_id,
+       sum(coalesce(i.quantity, 1)) AS units,
+       sum(coalesce(i.quantity, 1) * i.price_at_purchase) AS revenue,
+       count(*) AS order_count
+FROM orderitems AS i JOIN orders AS o ON o.id = i.order_id
+WHERE o.payment_status = 'completed' AND i.bot_id IS NOT NULL
+GROUP BY 1, 2
+"""
+
+# Rows whose net sales went back to zero (refunds) are not differences
+MISMATCH_STATEMENT = text(f"""
+SELECT coalesce(r.day, l.day) AS day, coalesce(r.bot_id, l.bot_id) AS bot_id,
+       r.units AS rollup_units, l.units AS live_units, r.revenue AS rollup_revenue, l.revenue AS live_revenue
+FROM sales_daily AS r FULL JOIN ({LIVE_TOTALS}) AS l ON l.day = r.day AND l.bot_id = r.bot_id
+WHERE (coalesce(r.units, 0), coalesce(r.revenue, 0), coalesce(r.order_count, 0))
+      IS DISTINCT FROM (coalesce(l.units, 0), coalesce(l.revenue, 0), coalesce(l.order_count, 0))
+ORDER BY 1, 2
+""")
+
+@dataclass(frozen=True)
+class DailySales:
+    day: date
+    units: int
+    revenue: Decimal
+    order_count: int
+
+@dataclass(frozen=True)
+class BotSales:
+    bot_id: UUID
+    name: Optional[str]
+    units: int
+    revenue: Decimal
+    order_count: int
+
+def daily_sales(db: Session, *, start: date, end: date, bot_id: Optional[UUID] = None) -> List[DailySales]:
+    """
+    Sales per day from `start` to `end` (inclusive), for one bot or all.
+
+    Days without sales are omitted.
+    """
+    query = (
+        select(
+            sales_daily.c.day,
+            func.sum(sales_daily.c.units).label("units"),
+            func.sum(sales_daily.c.revenue).label("revenue"),
+            func.sum(sales_daily.c.order_count).label("order_count"),
+        )
+        .where(sales_daily.c.day.between(start, end))
+        .group_by(sales_daily.c.day)
+        .having(func.sum(sales_daily.c.order_count) != 0)
+        .order_by(sales_daily.c.day)
+    )
+    if bot_id is not None:
+        query = query.where(sales_daily.c.bot_id == bot_id)
+    return [DailySales(row.day, int(row.units), row.revenue, int(row.order_count)) for row in db.execute(query)]
+
+def top_bots(db: Session, *, start: date, end: date, limit: int = 10) -> List[BotSales]:
+    """
+    Best-selling bots by revenue from `start` to `end` (inclusive).
+    """
+    totals = (
+        select(
+            sales_daily.c.bot_id,
+            func.sum(sales_daily.c.units).label("units"),
+            func.sum(sales_daily.c.revenue).label("revenue"),
+            func.sum(sales_daily.c.order_count).label("order_count"),
+        )
+        .where(sales_daily.c.day.between(start, end))
+        .group_by(sales_daily.c.bot_id)
+        .having(func.sum(sales_daily.c.order_count) > 0)
+        .order_by(func.sum(sales_daily.c.revenue).desc(), sales_daily.c.bot_id)
+        .limit(limit)
+        .subquery()
+    )
+    # Names only for the bots that made the cut
+    query = (
+        select(totals, BotModel.name)
+        .join(BotModel, BotModel.id == totals.c.bot_id)
+        .order_by(totals.c.revenue.desc(), totals.c.bot_id)
+    )
+    return [
+        BotSales(row.bot_id, row.name, int(row.units), row.revenue, int(row.order_count))
+        for row in db.execute(query)
+    ]
+
+def rebuild(conn: Connection) -> int:
+    """
+    Recompute sales_daily from orders within the caller's transaction.
+
+    Returns:
+        Number of rollup rows written
+    """
+    conn.execute(text("LOCK TABLE orders, orderitems IN SHARE MODE"))
+    conn.execute(text("DELETE FROM sales_daily"))
+    result = conn.execute(text(
+        f"INSERT INTO sales_daily (day, bot_id, units, revenue, order_count) {LIVE_TOTALS}"
+    ))
+    return result.rowcount
+
+def mismatches(conn: Connection) -> list:
+    """
+    (day, bot) rows where the rollup differs from aggregating orders.
+    """
+    return conn.execute(MISMATCH_STATEMENT).all()
@@ -0,0 +1,323 @@
+# File: app/services/scheduler.py
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Sequence, Tuple
+from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from croniter import croniter
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import Connection, Engine
+from app.core.config import settings
+from app.models.Bot_scheduleModel import BotScheduleModel
+from app.services.timing_wheel import TimingWheel
+
+"""
+Scheduler for recurring bot executions.
+
+One instance at a time is the leader (a PostgreSQL advisory lock held on a
+dedicated connection). The leader keeps the next fire time of every active
+schedule in a TimingWheel, so a tick costs only the schedules that are due,
+not a query over the schedules table.
+
+Changes are picked up incrementally: every SCHEDULER_RELOAD_INTERVAL the
+leader reads schedules whose updated_at moved since the last reload (with
+a small overlap for transactions that committed late), plus a full reload
+every SCHEDULER_FULL_RELOAD_INTERVAL to catch hard deletes.
+
+Due schedules are fired in batches with a single statement per batch that
+advances next_run_at only where it still has the value the leader fired
+for, and inserts one queued execution per schedule it advanced. A schedule
+that was changed concurrently, or already fired by a previous leader, is
+skipped rather than run twice. Missed runs (e.g. no leader for a while)
+fire once, not once per missed occurrence.
+
+A run is only queued if its bot is active and the owner may still run it
+(the bot is free or the owner holds an active access grant); otherwise the
+schedule advances without an execution. Input parameters are copied inline,
+the API keeps them under EXECUTION_INLINE_PAYLOAD_MAX; a run whose input is
+over the limit (stored before it was lowered) is recorded as failed.
+"""
+
+logger = logging.getLogger(__name__)
+
+# pg_advisory_lock key, any constant unique to this application
+SCHEDULER_LOCK_ID = 0x426F745363686564  # "BotSched"
+
+# Reload window overlap for rows whose transaction committed after a later-started one
+RELOAD_OVERLAP = timedelta(seconds=5)
+
+FIRE_STATEMENT = text("""
+WITH due AS (
+    SELECT * FROM unnest(CAST(:ids AS uuid[]), CAST(:expected AS timestamptz[]), CAST(:next AS timestamptz[]))
+        AS due(id, expected, next_run_at)
+), fired AS (
+    UPDATE bot_schedules AS s
+    SET next_run_at = due.next_run_at, last_run_at = now()
+    FROM due
+    WHERE s.id = due.id AND s.next_run_at = due.expected AND s.is_active
+    RETURNING s.id, s.user_id, s.bot_id, s.input_parameters, octet_length(s.input_parameters::text) AS input_size
+), runnable AS (
+    SELECT fired.* FROM fired JOIN bots AS b ON b.id = fired.bot_id
+    WHERE b.is_active AND (b.is_free OR EXISTS (
+        SELECT 1 FROM userbotaccesss AS a
+        WHERE a.user_id = fired.user_id AND a.bot_id = fired.bot_id AND a.is_active
+          AND (a.expires_at IS NULL OR a.expires_at > now())
+    ))
+), queued AS (
+    INSERT INTO bot_executions (id, user_id, bot_id, schedule_id, execution_status, input_parameters, input_size, error_message, completed_at, created_at, updated_at)
+    SELECT gen_random_uuid(), user_id, bot_id, id,
+        CASE WHEN input_size > :inline_max THEN 'failed' ELSE 'queued' END,
+        CASE WHEN input_size > :inline_max THEN NULL ELSE input_parameters END,
+        input_size,
+        CASE WHEN input_size > :inline_max THEN :too_large END,
+        CASE WHEN input_size > :inline_max THEN now() END,
+        now(), now()
+    FROM runnable
+    RETURNING schedule_id
+)
+SELECT fired.id, queued.schedule_id IS NOT NULL FROM fired LEFT JOIN queued ON queued.schedule_id = fired.id
+""")
+
+# Error of scheduled runs whose input is over EXECUTION_INLINE_PAYLOAD_MAX (stored before a lower limit)
+INPUT_TOO_LARGE_ERROR = "Input parameters are too large for a scheduled run"
+
+def validate_schedule(cron_expression: str, tz: str) -> None:
+    """
+    Raise ValueError if the cron expression or time zone is invalid.
+    """
+    if not croniter.is_valid(cron_expression) or len(cron_expression.split()) != 5:
+        raise ValueError(f"Invalid cron expression {cron_expression!r}, expected five fields like '0 9 * * 1-5'")
+    try:
+        ZoneInfo(tz)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValueError(f"Unknown time zone {tz!r}")
+
+def next_fire_time(cron_expression: str, tz: str, after: datetime) -> datetime:
+    """
+    First time strictly after `after` that matches the expression in `tz`, in UTC.
+    """
+    local_after = after.astimezone(ZoneInfo(tz))
+    return croniter(cron_expression, local_after).get_next(datetime).astimezone(timezone.utc)
+
+class AdvisoryLockLeader:
+    """
+    Leader election with a session-level advisory lock.
+
+    The lock lives as long as its connection: if this process dies or loses
+    the connection, PostgreSQL releases it and another instance takes over.
+    """
+
+    def __init__(self, engine: Engine, lock_id: int = SCHEDULER_LOCK_ID):
+        self.engine = engine
+        self.lock_id = lock_id
+        self._conn: Optional[Connection] = None
+
+    def acquire(self) -> bool:
+        """
+        Try to become leader; True if this instance holds the lock.
+        """
+        if self._conn is not None:
+            return self.is_leader()
+        conn = self.engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+        try:
+            acquired = conn.execute(select(func.pg_try_advisory_lock(self.lock_id))).scalar()
+        except Exception:
+            conn.close()
+            raise
+        if not acquired:
+            conn.close()
+            return False
+        self._conn = conn
+        return True
+
+    def is_leader(self) -> bool:
+        """
+        Check that the lock connection is still alive.
+        """
+        if self._conn is None:
+            return False
+        try:
+            self._conn.execute(text("SELECT 1"))
+            return True
+        except Exception:
+            logger.warning("lost scheduler leader connection", exc_info=True)
+            self._drop()
+            return False
+
+    def release(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(select(func.pg_advisory_unlock(self.lock_id)))
+        except Exception:
+            pass
+        self._drop()
+
+    def _drop(self) -> None:
+        try:
+            self._conn.invalidate()
+            self._conn.close()
+        except Exception:
+            pass
+        self._conn = None
+
+class Scheduler:
+    """
+    In-memory schedule state plus the load/reload/fire steps (leader only).
+
+    Attributes:
+        wheel: Pending fire times keyed by schedule id
+        specs: Schedule id -> (cron expression, time zone, next_run_at as stored)
+        fired: Executions created
+        skipped: Due schedules changed concurrently or fired elsewhere
+        denied: Runs not queued because the bot is inactive or the owner lost access
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.wheel: Optional[TimingWheel] = None
+        self.specs: Dict[UUID, Tuple[str, str, datetime]] = {}
+        self.watermark: Optional[datetime] = None
+        self.fired = 0
+        self.skipped = 0
+        self.denied = 0
+
+    def _apply(self, rows) -> None:
+        for schedule_id, cron_expression, tz, next_run_at, is_active, updated_at in rows:
+            if is_active and next_run_at is not None:
+                self.specs[schedule_id] = (cron_expression, tz, next_run_at)
+                self.wheel.schedule(schedule_id, next_run_at.timestamp())
+            else:
+                self.specs.pop(schedule_id, None)
+                self.wheel.cancel(schedule_id)
+            if updated_at is not None and (self.watermark is None or updated_at > self.watermark):
+                self.watermark = updated_at
+
+    def _columns(self):
+        s = BotScheduleModel
+        return select(s.id, s.cron_expression, s.timezone, s.next_run_at, s.is_active, s.updated_at)
+
+    def load(self) -> int:
+        """
+        Rebuild the wheel from every active schedule.
+        """
+        self.wheel = TimingWheel(
+            now=time.time(),
+            tick=settings.SCHEDULER_TICK_SECONDS,
+            slots=settings.SCHEDULER_WHEEL_SLOTS,
+        )
+        self.specs = {}
+        with self.engine.connect() as conn:
+            # Anything changed after this point is picked up by reload_changed
+            self.watermark = conn.execute(select(func.now())).scalar()
+            result = conn.execution_options(yield_per=5000).execute(
+                self._columns().where(BotScheduleModel.is_active == True)
+            )
+            for rows in result.partitions():
+                self._apply(rows)
+        logger.info("scheduler loaded schedules", extra={"schedules": len(self.wheel)})
+        return len(self.wheel)
+
+    def reload_changed(self) -> int:
+        """
+        Apply schedules created, changed, paused or deleted since the last reload.
+        """
+        query = self._columns()
+        if self.watermark is not None:
+            query = query.where(BotScheduleModel.updated_at > self.watermark - RELOAD_OVERLAP)
+        with self.engine.connect() as conn:
+            rows = conn.execute(query).all()
+        self._apply(rows)
+        return len(rows)
+
+    def _refresh(self, conn: Connection, ids: Sequence[UUID]) -> None:
+        rows = conn.execute(self._columns().where(BotScheduleModel.id.in_(ids))).all()
+        found = {row[0] for row in rows}
+        self._apply(rows)
+        for schedule_id in ids:
+            if schedule_id not in found:
+                self.specs.pop(schedule_id, None)
+                self.wheel.cancel(schedule_id)
+
+    def fire_due(self, now: Optional[float] = None) -> int:
+        """
+        Fire every schedule that came due and queue its execution.
+
+        Returns:
+            Number of executions created
+        """
+        now = time.time() if now is None else now
+        due = [schedule_id for schedule_id, _ in self.wheel.advance(now) if schedule_id in self.specs]
+        created = 0
+        now_dt = datetime.fromtimestamp(now, timezone.utc)
+        batch_size = settings.SCHEDULER_BATCH_SIZE
+        for start in range(0, len(due), batch_size):
+            batch = due[start:start + batch_size]
+            expected, upcoming = [], []
+            for schedule_id in batch:
+                cron_expression, tz, next_run_at = self.specs[schedule_id]
+                expected.append(next_run_at)
+                # Missed occurrences are skipped: the next run is after now
+                upcoming.append(next_fire_time(cron_expression, tz, max(next_run_at, now_dt)))
+            with self.engine.begin() as conn:
+                fired = dict(conn.execute(FIRE_STATEMENT, {
+                    "ids": [str(i) for i in batch],
+                    "expected": expected,
+                    "next": upcoming,
+                    "inline_max": settings.EXECUTION_INLINE_PAYLOAD_MAX,
+                    "too_large": INPUT_TOO_LARGE_ERROR,
+                }).all())
+                stale = [schedule_id for schedule_id in batch if schedule_id not in fired]
+                if stale:
+                    # Changed under us or fired elsewhere: take the stored state as truth
+                    self._refresh(conn, stale)
+            for schedule_id, next_run_at in zip(batch, upcoming):
+                if schedule_id in fired:
+                    cron_expression, tz, _ = self.specs[schedule_id]
+                    self.specs[schedule_id] = (cron_expression, tz, next_run_at)
+                    self.wheel.schedule(schedule_id, next_run_at.timestamp())
+            created += sum(fired.values())
+            self.skipped += len(batch) - len(fired)
+            self.denied += len(fired) - sum(fired.values())
+        self.fired += created
+        return created
+
+def run_scheduler(engine: Engine, stop: threading.Event) -> None:
+    """
+    Scheduler main loop: wait for leadership, then load, reload and fire
+    once per tick until `stop` is set.
+    """
+    leader = AdvisoryLockLeader(engine)
+    scheduler = Scheduler(engine)
+    tick = settings.SCHEDULER_TICK_SECONDS
+    try:
+        while not stop.is_set():
+            if not leader.acquire():
+                stop.wait(settings.SCHEDULER_LEADER_RETRY_INTERVAL)
+                continue
+
+            logger.info("scheduler became leader")
+            scheduler.load()
+            last_reload = last_full_reload = time.monotonic()
+            while not stop.is_set() and leader.is_leader():
+                try:
+                    if time.monotonic() - last_full_reload >= settings.SCHEDULER_FULL_RELOAD_INTERVAL:
+                        scheduler.load()
+                        last_reload = last_full_reload = time.monotonic()
+                    elif time.monotonic() - last_reload >= settings.SCHEDULER_RELOAD_INTERVAL:
+                        scheduler.reload_changed()
+                        last_reload = time.monotonic()
+                    created = scheduler.fire_due()
+                    if created:
+                        logger.info("scheduled executions queued", extra={"executions": created})
+                except Exception:
+                    logger.exception("scheduler tick failed")
+                    # Timers taken off the wheel may not have fired, rebuild from the table
+                    last_full_reload = float("-inf")
+                # Sleep to the next tick boundary
+                stop.wait(tick - (time.time() % tick))
+            logger.info("scheduler stepped down")
+    finally:
+        leader.release()
@@ -0,0 +1,408 @@
+# File: app/services/similarity_index.py
+import fcntl
+import json
+import logging
+import math
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+from scipy import sparse
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, sessionmaker
+from app.core.config import settings
+from app.db.session.database import SessionLocal
+from app.models.BotModel import BotModel
+from app.services.singleflight import SingleFlight
+
+"""
+Content similarity index over bot names and descriptions.
+
+Each active bot is an L2-normalized TF-IDF vector, so cosine similarity
+is a dot product. A segment stores the vectors twice as sparse matrices:
+forward (bots x terms, to look up a bot's vector) and inverted (terms x
+bots, the postings). Scoring a query multiplies its vector with the
+inverted matrix, which touches only the postings of the query's terms,
+whatever the catalog size. Rows are sorted by bot id, so finding a bot
+is a binary search.
+
+Full builds are written to SIMILARITY_INDEX_PATH as .npy files and
+loaded memory-mapped: workers share one copy through the page cache and
+start without rebuilding. Bots changed since the build (by updated_at)
+are kept in a small in-memory delta segment, using the build's
+vocabulary and IDF; their rows in the build are masked out. Once more than
+SIMILARITY_MAX_DELTA bots changed, the next refresh does a full build.
+Terms that first appear after a build are ignored until the next one.
+
+Workers coordinate through a file lock in the index directory: builds
+(and pruning) hold it exclusively, so only one runs at a time, while
+reading CURRENT and mapping a build holds it shared, so a build cannot be
+pruned between being named and being mapped.
+"""
+
+logger = logging.getLogger(__name__)
+
+# Words; bare numbers (e.g. in generated names) say nothing about the bot
+TOKEN = re.compile(r"[a-z][a-z0-9+#]*")
+
+STOP_WORDS = frozenset(
+    "a an and are as at be by can for from has have in is it its of on or that the this to with you your".split()
+)
+
+# A name term counts as this many occurrences in the text
+NAME_WEIGHT = 3
+
+# Changes committed by transactions that started before the build read
+CHANGE_OVERLAP = timedelta(seconds=5)
+
+# Builds kept on disk: the current one plus the previous, which workers may still have mapped
+KEEP_BUILDS = 2
+
+TEXT_STATEMENT = select(
+    BotModel.id, BotModel.name, BotModel.description, BotModel.detailed_description, BotModel.is_active,
+)
+
+def tokens(text: Optional[str]) -> List[str]:
+    if not text:
+        return []
+    return [token for token in TOKEN.findall(text.lower()) if token not in STOP_WORDS]
+
+def bot_terms(name: Optional[str], description: Optional[str], detailed_description: Optional[str]) -> Counter:
+    counts = Counter(tokens(description))
+    counts.update(tokens(detailed_description))
+    for token in tokens(name):
+        counts[token] += NAME_WEIGHT
+    return counts
+
+def normalize(matrix: sparse.csr_matrix) -> sparse.csr_matrix:
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.csr_matrix(sparse.diags(1.0 / norms) @ matrix, dtype=np.float32)
+
+@dataclass(frozen=True)
+class Vocabulary:
+    terms: Dict[str, int]
+    idf: np.ndarray
+
+    def weigh(self, documents: Sequence[Counter]) -> sparse.csr_matrix:
+        """
+        Normalized TF-IDF rows (sublinear term frequency) of `documents`.
+        """
+        indptr, indices, frequencies = [0], [], []
+        for counts in documents:
+            for term, count in counts.items():
+                column = self.terms.get(term)
+                if column is not None:
+                    indices.append(column)
+                    frequencies.append(1.0 + math.log(count))
+            indptr.append(len(indices))
+        matrix = sparse.csr_matrix(
+            (np.array(frequencies, dtype=np.float32), np.array(indices, dtype=np.int32), np.array(indptr, dtype=np.int32)),
+            shape=(len(documents), len(self.idf)),
+        )
+        matrix.sort_indices()
+        matrix.data *= self.idf[matrix.indices]
+        return normalize(matrix)
+
+    @classmethod
+    def fit(cls, documents: Sequence[Counter]) -> "Vocabulary":
+        document_frequency = Counter(term for counts in documents for term in counts)
+        terms = {term: column for column, term in enumerate(sorted(document_frequency))}
+        df = np.array([document_frequency[term] for term in terms], dtype=np.float32)
+        # Smoothed, as if one extra document contained every term
+        idf = np.log((1 + len(documents)) / (1 + df)).astype(np.float32) + 1
+        return cls(terms=terms, idf=idf)
+
+class Segment:
+    """
+    Vectors of a set of bots, rows sorted by bot id.
+    """
+
+    def __init__(self, bot_ids: np.ndarray, forward: sparse.csr_matrix, inverted: Optional[sparse.csr_matrix] = None):
+        self.bot_ids = bot_ids
+        self.forward = forward
+        self.inverted = inverted if inverted is not None else sparse.csr_matrix(forward.T, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.bot_ids)
+
+    def row(self, bot_id: str) -> Optional[int]:
+        row = int(np.searchsorted(self.bot_ids, bot_id))
+        return row if row < len(self.bot_ids) and self.bot_ids[row] == bot_id else None
+
+    def vector(self, row: int) -> sparse.csr_matrix:
+        return self.forward[row]
+
+    def top(self, vector: sparse.csr_matrix, k: int, dropped: Optional[np.ndarray] = None) -> List[Tuple[float, str]]:
+        """
+        The `k` best (score, bot id) in this segment for a normalized vector.
+        """
+        if not len(self.bot_ids) or not vector.nnz:
+            return []
+        product = vector @ self.inverted
+        rows, scores = product.indices, product.data
+        if dropped is not None:
+            live = ~dropped[rows]
+            rows, scores = rows[live], scores[live]
+        if len(rows) > k:
+            best = np.argpartition(-scores, k)[:k]
+            rows, scores = rows[best], scores[best]
+        return [(float(score), str(self.bot_ids[row])) for row, score in zip(rows, scores)]
+
+    @classmethod
+    def build(cls, vocabulary: Vocabulary, bots: Sequence[Tuple[str, Counter]]) -> "Segment":
+        bots = sorted(bots, key=lambda bot: bot[0])
+        bot_ids = np.array([bot_id for bot_id, _ in bots], dtype="U36")
+        return cls(bot_ids, vocabulary.weigh([counts for _, counts in bots]))
+
+@dataclass(frozen=True)
+class IndexState:
+    build_id: str
+    watermark: datetime
+    vocabulary: Vocabulary
+    base: Segment
+    delta: Segment
+    # Base rows superseded by the delta or no longer active
+    dropped: np.ndarray
+
+    @property
+    def delta_size(self) -> int:
+        return len(self.delta) + int(self.dropped.sum())
+
+def read_bots(db: Session, since: Optional[datetime] = None) -> List[Tuple[str, bool, Counter]]:
+    query = TEXT_STATEMENT
+    if since is not None:
+        query = query.where(BotModel.updated_at > since)
+    return [
+        (str(bot_id), bool(is_active), bot_terms(name, description, detailed_description))
+        for bot_id, name, description, detailed_description, is_active in db.execute(query)
+    ]
+
+@contextmanager
+def locked(path: str, exclusive: bool) -> Iterator[None]:
+    """
+    Hold the index directory's lock, shared or exclusive, across processes and threads.
+    """
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, "LOCK"), "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+def save(path: str, build_id: str, vocabulary: Vocabulary, base: Segment, watermark: datetime) -> None:
+    """
+    Write a build, then point CURRENT at it (atomically) and prune old builds.
+    Call with the exclusive lock held.
+    """
+    directory = os.path.join(path, build_id)
+    os.makedirs(directory)
+    arrays = {
+        "bot_ids": base.bot_ids,
+        "idf": vocabulary.idf,
+        "forward_data": base.forward.data, "forward_indices": base.forward.indices, "forward_indptr": base.forward.indptr,
+        "inverted_data": base.inverted.data, "inverted_indices": base.inverted.indices, "inverted_indptr": base.inverted.indptr,
+    }
+    for name, array in arrays.items():
+        np.save(os.path.join(directory, f"{name}.npy"), array)
+    with open(os.path.join(directory, "vocabulary.json"), "w") as f:
+        json.dump(sorted(vocabulary.terms, key=vocabulary.terms.get), f)
+    with open(os.path.join(directory, "manifest.json"), "w") as f:
+        json.dump({"watermark": watermark.isoformat(), "bots": len(base), "terms": len(vocabulary.terms)}, f)
+
+    with open(os.path.join(path, "CURRENT.tmp"), "w") as f:
+        f.write(build_id)
+    os.replace(os.path.join(path, "CURRENT.tmp"), os.path.join(path, "CURRENT"))
+
+    # The build CURRENT names is never pruned, whatever its id sorts like
+    builds = sorted(
+        entry for entry in os.listdir(path) if os.path.isdir(os.path.join(path, entry)) and entry != build_id
+    )
+    for old in builds[:max(len(builds) - (KEEP_BUILDS - 1), 0)]:
+        # Unlinking is safe even if another worker still has the files mapped
+        shutil.rmtree(os.path.join(path, old), ignore_errors=True)
+
+def current_build(path: str) -> Optional[str]:
+    try:
+        with open(os.path.join(path, "CURRENT")) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+def load(path: str, build_id: str) -> Tuple[Vocabulary, Segment, datetime]:
+    """
+    Map a build from disk.
+
+    Returns:
+        Vocabulary, base segment, and the time up to which the build saw changes
+    """
+    directory = os.path.join(path, build_id)
+    array = lambda name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+    with open(os.path.join(directory, "vocabulary.json")) as f:
+        terms = {term: column for column, term in enumerate(json.load(f))}
+    with open(os.path.join(directory, "manifest.json")) as f:
+        manifest = json.load(f)
+    bot_ids = array("bot_ids")
+    forward = sparse.csr_matrix(
+        (array("forward_data"), array("forward_indices"), array("forward_indptr")), shape=(len(bot_ids), len(terms)), copy=False
+    )
+    inverted = sparse.csr_matrix(
+        (array("inverted_data"), array("inverted_indices"), array("inverted_indptr")), shape=(len(terms), len(bot_ids)), copy=False
+    )
+    return Vocabulary(terms=terms, idf=array("idf")), Segment(bot_ids, forward, inverted), datetime.fromisoformat(manifest["watermark"])
+
+class SimilarityIndex:
+
+    def __init__(self, session_factory: sessionmaker, path: str, refresh_interval: float, max_delta: int):
+        self.session_factory = session_factory
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.max_delta = max_delta
+        self._state: Optional[IndexState] = None
+        self._checked_at: Optional[float] = None
+        self._flight = SingleFlight(timeout=300.0)
+        self._refreshing = threading.Lock()
+        self.builds = 0
+
+    def similar_to_bot(self, bot_id: str, limit: int) -> List[str]:
+        """
+        Ids of the bots whose text is most similar to this bot's, best first.
+        """
+        state = self._current()
+        bot_id = str(bot_id).lower()
+        row = state.delta.row(bot_id)
+        if row is not None:
+            vector = state.delta.vector(row)
+        else:
+            row = state.base.row(bot_id)
+            if row is None or state.dropped[row]:
+                return []
+            vector = state.base.vector(row)
+        return [other for other in self._top(state, vector, limit + 1) if other != bot_id][:limit]
+
+    def search(self, query: str, limit: int) -> List[str]:
+        """
+        Ids of the bots whose text is most similar to a free-text query, best first.
+        """
+        state = self._current()
+        return self._top(state, state.vocabulary.weigh([bot_terms(None, query, None)]), limit)
+
+    def _top(self, state: IndexState, vector: sparse.csr_matrix, k: int) -> List[str]:
+        candidates = state.base.top(vector, k, state.dropped) + state.delta.top(vector, k)
+        candidates.sort(key=lambda candidate: (-candidate[0], candidate[1]))
+        return [bot_id for score, bot_id in candidates[:k] if score > 0]
+
+    def _current(self) -> IndexState:
+        if self._state is None:
+            self._flight.do("refresh", self.refresh)
+        elif time.monotonic() - self._checked_at > self.refresh_interval and self._refreshing.acquire(blocking=False):
+            threading.Thread(target=self._refresh_in_background, name="similarity-refresh", daemon=True).start()
+        return self._state
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            logger.warning("refreshing the similarity index failed", exc_info=True)
+        finally:
+            self._refreshing.release()
+
+    def refresh(self, rebuild: bool = False) -> IndexState:
+        """
+        Pick up a newer build from disk, or make one, and re-read changed bots.
+
+        Args:
+            rebuild: Make a new full build even if the current one is usable
+        """
+        state = self._state
+        db = self.session_factory(info={"read_only": True})
+        try:
+            build_id = None
+            if not rebuild:
+                with locked(self.path, exclusive=False):
+                    build_id = current_build(self.path)
+                    if build_id is not None:
+                        vocabulary, base, watermark = self._load(build_id)
+            if build_id is None:
+                # Another worker may have built while this one waited for the lock
+                build_id, (vocabulary, base, watermark) = self._build_and_load(db, reuse=not rebuild)
+            changed = read_bots(db, since=watermark - CHANGE_OVERLAP)
+            if len(changed) > self.max_delta:
+                build_id, (vocabulary, base, watermark) = self._build_and_load(db, reuse=False)
+                changed = []
+        finally:
+            db.close()
+
+        dropped = np.zeros(len(base), dtype=bool)
+        for bot_id, _, _ in changed:
+            row = base.row(bot_id)
+            if row is not None:
+                dropped[row] = True
+        delta = Segment.build(vocabulary, [(bot_id, counts) for bot_id, is_active, counts in changed if is_active])
+        self._state = IndexState(build_id, watermark, vocabulary, base, delta, dropped)
+        self._checked_at = time.monotonic()
+        return self._state
+
+    def _load(self, build_id: str) -> Tuple[Vocabulary, Segment, datetime]:
+        """
+        Map a build, reusing the one already in memory. Call with the lock held.
+        """
+        state = self._state
+        if state is not None and state.build_id == build_id:
+            return state.vocabulary, state.base, state.watermark
+        return load(self.path, build_id)
+
+    def _build_and_load(self, db: Session, reuse: bool) -> Tuple[str, Tuple[Vocabulary, Segment, datetime]]:
+        """
+        Make a full build under the exclusive lock and map it.
+
+        Args:
+            db: Database session
+            reuse: Map the current build instead if there is one by now
+        """
+        with locked(self.path, exclusive=True):
+            build_id = current_build(self.path) if reuse else None
+            if build_id is None:
+                build_id = self.build(db)
+            return build_id, self._load(build_id)
+
+    def build(self, db: Session) -> str:
+        """
+        Full build of every active bot, saved to disk. Call with the exclusive lock held.
+
+        Returns:
+            Build id
+        """
+        watermark = db.execute(select(func.now())).scalar()
+        bots = [(bot_id, counts) for bot_id, is_active, counts in read_bots(db) if is_active]
+        vocabulary = Vocabulary.fit([counts for _, counts in bots])
+        base = Segment.build(vocabulary, bots)
+        build_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        save(self.path, build_id, vocabulary, base, watermark)
+        self.builds += 1
+        return build_id
+
+    def stats(self) -> Dict[str, Any]:
+        state = self._state
+        return {
+            "build": state.build_id if state else None,
+            "bots": len(state.base) - int(state.dropped.sum()) + len(state.delta) if state else 0,
+            "delta": state.delta_size if state else 0,
+            "builds": self.builds,
+        }
+
+similarity_index = SimilarityIndex(
+    SessionLocal,
+    path=settings.SIMILARITY_INDEX_PATH,
+    refresh_interval=settings.SIMILARITY_REFRESH_INTERVAL,
+    max_delta=settings.SIMILARITY_MAX_DELTA,
+)
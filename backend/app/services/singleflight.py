@@ -0,0 +1,76 @@
+# File: app/services/singleflight.py
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+"""
+Single-flight request coalescing.
+
+When several callers ask for the same key at the same time, only the first
+(the leader) runs the work; the others wait and receive the leader's result,
+or its exception. Once the call finishes the key is forgotten, so this
+collapses concurrent duplicates only and never caches anything by itself.
+"""
+
+T = TypeVar("T")
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+class SingleFlight:
+    """
+    Collapse concurrent calls with the same key into one execution.
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Args:
+            timeout: How long a waiter waits for the leader before running
+                the work itself; None waits indefinitely
+        """
+        self.timeout = timeout
+        self.executions = 0
+        self.shared = 0
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Run `fn` unless an identical call is in flight, in which case wait for it.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+                self.executions += 1
+            else:
+                call.waiters += 1
+                leader = False
+                self.shared += 1
+
+        if not leader:
+            if not call.done.wait(self.timeout):
+                return fn()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def in_flight(self) -> int:
+        return len(self._calls)
@@ -0,0 +1,281 @@
+# File: app/services/suggestions.py
+import heapq
+import logging
+import threading
+import time
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, sessionmaker
+from app.core.config import settings
+from app.db.session.database import SessionLocal
+from app.models.Associations import bot_categories
+from app.models.BotModel import BotModel
+from app.models.CategoryModel import CategoryModel
+from app.services.catalog_version import get_catalog_version
+
+"""
+Typeahead suggestions for bot and category names.
+
+Names are indexed by every word start ("Sales CSV Export" is found by
+"sa", "csv" and "exp") in a sorted list searched with bisect. A prefix
+that matches more than SCAN_LIMIT keys has its most popular entries
+precomputed, so even one-letter queries cost a dict lookup; all other
+prefixes scan at most SCAN_LIMIT keys. Popularity is download_count for
+bots and the number of active bots for categories; download counts do not
+move the catalog version, so they are picked up with the next catalog change.
+
+The index follows catalog writes incrementally: every
+SUGGEST_REFRESH_INTERVAL the first request checks in the background
+whether the catalog version moved, and re-reads only bots updated since
+the last check. Precomputed lists a change may have invalidated are
+recomputed right after, still in the background. Hard deletes and large
+batches of changes trigger a full rebuild.
+
+Matches inside words ("port" in "Import") are not in the index; the
+endpoint asks Postgres for those (ILIKE, backed by a pg_trgm index).
+"""
+
+logger = logging.getLogger(__name__)
+
+# Prefixes matching more keys than this get precomputed top lists
+SCAN_LIMIT = 256
+
+# Longest suggestion list served (and precomputed)
+MAX_SUGGESTIONS = 20
+
+# Categories listed ahead of the bots
+MAX_CATEGORY_SUGGESTIONS = 3
+
+# Separates the name from the entry id in index keys; sorts before any text
+SEPARATOR = "\x00"
+
+# Changes committed by transactions that started before the previous check read
+CHANGE_OVERLAP = timedelta(seconds=5)
+
+def normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+def word_starts(name: str) -> List[str]:
+    """
+    The normalized name from each word on: "sales csv", "csv".
+    """
+    name = normalize(name)
+    return [name[i:] for i in range(len(name)) if i == 0 or name[i - 1] == " "]
+
+@dataclass(frozen=True)
+class Entry:
+    id: str
+    name: str
+    popularity: int
+
+class PrefixIndex:
+    """
+    Entries of one kind (bots or categories) by word-start prefix.
+    """
+
+    def __init__(self, entries: Iterable[Entry] = ()):
+        self.entries: Dict[str, Entry] = {entry.id: entry for entry in entries}
+        self.keys: List[str] = sorted(
+            f"{key}{SEPARATOR}{entry.id}" for entry in self.entries.values() for key in word_starts(entry.name)
+        )
+        self.hot: Dict[str, List[str]] = {}
+        self.stale: set = set()
+        self._precompute(0, len(self.keys), 0)
+
+    def _range(self, prefix: str) -> Tuple[int, int]:
+        return bisect_left(self.keys, prefix), bisect_left(self.keys, prefix + "\uffff")
+
+    def _best(self, lo: int, hi: int, n: int = MAX_SUGGESTIONS) -> List[str]:
+        ids = {key[key.index(SEPARATOR) + 1:] for key in self.keys[lo:hi]}
+        return heapq.nlargest(n, ids, key=lambda entry_id: (self.entries[entry_id].popularity, entry_id))
+
+    def _precompute(self, lo: int, hi: int, depth: int) -> None:
+        # keys[lo:hi] share their first `depth` characters; split them by the next one
+        while lo < hi:
+            key = self.keys[lo]
+            if key[depth] == SEPARATOR:
+                lo += 1
+                continue
+            prefix = key[:depth + 1]
+            end = bisect_left(self.keys, prefix + "\uffff", lo, hi)
+            if end - lo > SCAN_LIMIT:
+                self.hot[prefix] = self._best(lo, end)
+                self._precompute(lo, end, depth + 1)
+            lo = end
+
+    def search(self, prefix: str, n: int) -> List[Entry]:
+        """
+        The `n` most popular entries with a word starting with `prefix`.
+        """
+        if prefix in self.hot:
+            if prefix in self.stale:
+                self.hot[prefix] = self._best(*self._range(prefix))
+                self.stale.discard(prefix)
+            ids = self.hot[prefix][:n]
+        else:
+            ids = self._best(*self._range(prefix), n)
+        return [self.entries[entry_id] for entry_id in ids]
+
+    def refresh_stale(self) -> None:
+        """
+        Recompute the precomputed lists changes may have invalidated.
+        """
+        for prefix in list(self.stale):
+            self.hot[prefix] = self._best(*self._range(prefix))
+            self.stale.discard(prefix)
+
+    def remove(self, entry_id: str) -> None:
+        entry = self.entries.pop(entry_id, None)
+        if entry is None:
+            return
+        for key in word_starts(entry.name):
+            position = bisect_left(self.keys, f"{key}{SEPARATOR}{entry_id}")
+            if position < len(self.keys) and self.keys[position] == f"{key}{SEPARATOR}{entry_id}":
+                del self.keys[position]
+            for length in range(1, len(key) + 1):
+                if entry_id in self.hot.get(key[:length], ()):
+                    self.stale.add(key[:length])
+
+    def add(self, entry: Entry) -> None:
+        self.remove(entry.id)
+        self.entries[entry.id] = entry
+        for key in word_starts(entry.name):
+            insort(self.keys, f"{key}{SEPARATOR}{entry.id}")
+            for length in range(1, len(key) + 1):
+                # A new or more popular entry may displace the least popular one listed
+                best = self.hot.get(key[:length])
+                if best is not None and key[:length] not in self.stale:
+                    if len(best) < MAX_SUGGESTIONS or self.entries[best[-1]].popularity <= entry.popularity:
+                        self.stale.add(key[:length])
+
+def read_bots(db: Session, since: Optional[datetime] = None) -> List[Tuple[str, Optional[Entry]]]:
+    """
+    (bot id, entry or None if inactive) of all bots, or of those updated since `since`.
+    """
+    query = select(BotModel.id, BotModel.name, BotModel.download_count, BotModel.is_active)
+    if since is not None:
+        query = query.where(BotModel.updated_at > since)
+    return [
+        (str(bot_id), Entry(str(bot_id), name, downloads or 0) if is_active else None)
+        for bot_id, name, downloads, is_active in db.execute(query)
+    ]
+
+def read_categories(db: Session) -> List[Entry]:
+    active_bots = (
+        select(func.count(BotModel.id))
+        .select_from(bot_categories.join(BotModel, BotModel.id == bot_categories.c.bot_id))
+        .where(bot_categories.c.category_id == CategoryModel.id, BotModel.is_active)
+        .scalar_subquery()
+    )
+    return [
+        Entry(str(category_id), name, count)
+        for category_id, name, count in db.execute(
+            select(CategoryModel.id, CategoryModel.name, active_bots).where(CategoryModel.is_active)
+        )
+    ]
+
+class SuggestionIndex:
+
+    def __init__(self, session_factory: sessionmaker, refresh_interval: float, max_incremental: int):
+        self.session_factory = session_factory
+        self.refresh_interval = refresh_interval
+        self.max_incremental = max_incremental
+        self.bots: Optional[PrefixIndex] = None
+        self.categories: Optional[PrefixIndex] = None
+        self._version: Optional[int] = None
+        self._watermark: Optional[datetime] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = threading.Lock()
+        self.rebuilds = 0
+        self.updates = 0
+
+    def suggest(self, query: str, limit: int) -> List[Tuple[str, Entry]]:
+        """
+        Up to `limit` (kind, entry): categories, then bots, with a name word
+        starting with `query`, most popular first.
+        """
+        if self.bots is None:
+            with self._refreshing:
+                if self.bots is None:
+                    self.refresh()
+        elif time.monotonic() - self._checked_at > self.refresh_interval and self._refreshing.acquire(blocking=False):
+            threading.Thread(target=self._refresh_in_background, name="suggestions-refresh", daemon=True).start()
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        with self._lock:
+            categories = self.categories.search(prefix, min(limit, MAX_CATEGORY_SUGGESTIONS))
+            bots = self.bots.search(prefix, limit - len(categories))
+        return [("category", entry) for entry in categories] + [("bot", entry) for entry in bots]
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            logger.warning("refreshing suggestions failed", exc_info=True)
+        finally:
+            self._refreshing.release()
+
+    def refresh(self) -> None:
+        """
+        Apply catalog writes since the last refresh, or build the index.
+        """
+        db = self.session_factory(info={"read_only": True})
+        try:
+            version = get_catalog_version(db).version
+            if version == self._version:
+                self._checked_at = time.monotonic()
+                return
+            now = db.execute(select(func.now())).scalar()
+            categories = PrefixIndex(read_categories(db))
+            changed = None
+            if self.bots is not None:
+                changed = read_bots(db, since=self._watermark - CHANGE_OVERLAP)
+                if len(changed) > self.max_incremental:
+                    changed = None
+            if changed is not None:
+                with self._lock:
+                    for bot_id, entry in changed:
+                        if entry is None:
+                            self.bots.remove(bot_id)
+                        else:
+                            self.bots.add(entry)
+                    self.categories = categories
+                    # Here rather than on the next request for each prefix; under
+                    # the lock, since search() also recomputes stale lists
+                    self.bots.refresh_stale()
+                self.updates += 1
+                active = db.execute(select(func.count()).select_from(BotModel).where(BotModel.is_active)).scalar()
+                # Hard deletes leave no updated_at behind
+                rebuild = active != len(self.bots.entries)
+            else:
+                rebuild = True
+            if rebuild:
+                bots = PrefixIndex(entry for _, entry in read_bots(db) if entry is not None)
+                with self._lock:
+                    self.bots, self.categories = bots, categories
+                self.rebuilds += 1
+        finally:
+            db.close()
+        self._version = version
+        self._watermark = now
+        self._checked_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "bots": len(self.bots.entries) if self.bots else 0,
+            "keys": len(self.bots.keys) if self.bots else 0,
+            "precomputed": len(self.bots.hot) if self.bots else 0,
+            "rebuilds": self.rebuilds,
+            "updates": self.updates,
+        }
+
+suggestion_index = SuggestionIndex(
+    SessionLocal,
+    refresh_interval=settings.SUGGEST_REFRESH_INTERVAL,
+    max_incremental=settings.SUGGEST_MAX_INCREMENTAL,
+)
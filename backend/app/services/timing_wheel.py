@@ -0,0 +1,106 @@
+# File: app/services/timing_wheel.py
+import heapq
+import itertools
+from typing import Dict, Hashable, List, Optional, Tuple
+
+"""
+Hashed timing wheel.
+
+Time is divided into ticks; the wheel has one slot per tick for the next
+`slots` ticks (the horizon). Timers inside the horizon sit in the slot of
+their tick, so advancing one tick touches only the timers that are due.
+Timers beyond the horizon wait in a heap and move into the wheel as the
+horizon reaches them, once per timer.
+
+Costs: schedule/cancel O(1) inside the horizon (O(log n) beyond it),
+advance O(ticks elapsed + timers due + timers entering the horizon),
+independent of how many timers are pending in total.
+"""
+
+class TimingWheel:
+    """
+    Timers keyed by an arbitrary hashable; scheduling a key again replaces it.
+    """
+
+    def __init__(self, now: float, tick: float = 1.0, slots: int = 3600):
+        """
+        Args:
+            now: Current time (epoch seconds); timers at or before it fire on the next advance, even to `now` itself
+            tick: Resolution in seconds
+            slots: Number of ticks covered by the wheel itself
+        """
+        self.tick = tick
+        self.size = slots
+        self.current = int(now // tick)
+        self._slots: List[Dict[Hashable, float]] = [{} for _ in range(slots)]
+        self._overflow: List[Tuple[int, int, Hashable]] = []
+        self._timers: Dict[Hashable, Tuple[int, float]] = {}
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._timers
+
+    def fire_at(self, key: Hashable) -> Optional[float]:
+        timer = self._timers.get(key)
+        return timer[1] if timer else None
+
+    def schedule(self, key: Hashable, fire_at: float) -> None:
+        """
+        Fire `key` at `fire_at` (epoch seconds), replacing any existing timer.
+        """
+        self.cancel(key)
+        tick = max(int(fire_at // self.tick), self.current + 1)
+        self._timers[key] = (tick, fire_at)
+        if tick - self.current < self.size:
+            self._slots[tick % self.size][key] = fire_at
+        else:
+            heapq.heappush(self._overflow, (tick, next(self._seq), key))
+
+    def cancel(self, key: Hashable) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            # Overflow heap entries are dropped lazily when they surface
+            self._slots[timer[0] % self.size].pop(key, None)
+
+    def advance(self, now: float) -> List[Tuple[Hashable, float]]:
+        """
+        Move the wheel to `now` and return the timers that came due, as
+        (key, fire_at) in firing order. Fired timers are removed.
+
+        Timers scheduled at or before the current tick wait in the next
+        tick's slot; those whose time has passed fire here too, so a timer
+        that is already overdue fires without waiting for the next tick.
+        """
+        target = int(now // self.tick)
+        due: List[Tuple[Hashable, float]] = []
+        while self.current < target:
+            self.current += 1
+            self._refill()
+            slot = self._slots[self.current % self.size]
+            if slot:
+                for key, fire_at in slot.items():
+                    del self._timers[key]
+                    due.append((key, fire_at))
+                slot.clear()
+        pending = self._slots[(self.current + 1) % self.size]
+        overdue = [(key, fire_at) for key, fire_at in pending.items() if fire_at <= now]
+        for key, fire_at in sorted(overdue, key=lambda timer: timer[1]):
+            del pending[key]
+            del self._timers[key]
+            due.append((key, fire_at))
+        return due
+
+    def _refill(self) -> None:
+        """
+        Move overflow timers that are now inside the horizon into their slots.
+        """
+        horizon = self.current + self.size
+        overflow = self._overflow
+        while overflow and overflow[0][0] < horizon:
+            tick, _, key = heapq.heappop(overflow)
+            timer = self._timers.get(key)
+            if timer is not None and timer[0] == tick:
+                self._slots[tick % self.size][key] = timer[1]
@@ -0,0 +1,68 @@
+# File: app/utils/compression.py
+import gzip
+from typing import Dict, Optional
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+"""
+Content-Encoding negotiation and compression helpers.
+
+Used by CompressionMiddleware for dynamic responses and by the catalog
+cache, which compresses each cached payload once per encoding. Precompressed
+payloads are compressed harder since the cost is paid once, not per request.
+"""
+
+# Server preference when the client accepts several encodings equally
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """
+    Parse an Accept-Encoding header into {encoding: q-value}.
+    """
+    accepted = {}
+    for part in header.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip()] = q
+    return accepted
+
+def negotiate_encoding(header: Optional[str]) -> Optional[str]:
+    """
+    Pick the best supported encoding for an Accept-Encoding header.
+
+    Returns None when the response should be sent uncompressed.
+    """
+    if not header:
+        return None
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        q = accepted.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+def compress(body: bytes, encoding: str, *, precompressed: bool = False) -> bytes:
+    """
+    Compress `body` with the given content coding ("br" or "gzip").
+    """
+    if encoding == "br":
+        quality = 9 if precompressed else settings.COMPRESSION_BROTLI_QUALITY
+        return brotli.compress(body, quality=quality)
+    if encoding == "gzip":
+        level = 9 if precompressed else settings.COMPRESSION_GZIP_LEVEL
+        return gzip.compress(body, compresslevel=level, mtime=0)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
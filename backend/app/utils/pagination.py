@@ -0,0 +1,42 @@
+# File: app/utils/pagination.py
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional
+from fastapi import HTTPException, status
+
+"""
+Opaque cursors for keyset pagination.
+
+A cursor is the sort key of the last row of a page, base64 encoded. The
+next page starts right after it (WHERE (a, b) < (:a, :b)), so the
+database seeks into the index instead of counting past OFFSET rows, and
+pages stay stable while rows are added in front of them.
+"""
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Cursor for the row with sort key `values` (datetimes, UUIDs and numbers).
+    """
+    data = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(data, default=str, separators=(",", ":")).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: Optional[str], *types: type) -> Optional[List[Any]]:
+    """
+    Sort key of a cursor, converted to `types`.
+
+    Raises:
+        HTTPException: If the cursor was not produced by encode_cursor
+    """
+    if not cursor:
+        return None
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if len(data) != len(types):
+            raise ValueError(cursor)
+        return [
+            value if value is None else datetime.fromisoformat(value) if kind is datetime else kind(value)
+            for kind, value in zip(types, data)
+        ]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
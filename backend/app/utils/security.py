@@ -1,9 +1,9 @@
 # File: app/utils/security.py
 from datetime import datetime, timedelta
-from typing import Any, Union
-from passlib.context import CryptContext
-from jose import jwt
+from functools import lru_cache
+from typing import Any, Dict, Optional, Union
 from app.core.config import settings
+from app.core.startup import warmup
 
 """
 Security utilities for password hashing and JWT tokens.
@@ -11,10 +11,27 @@ Security utilities for password hashing and JWT tokens.
 Libraries used:
 - passlib: For password hashing (bcrypt algorithm)
 - python-jose: For JWT token creation and verification
+
+Both libraries are imported on first use rather than at module import, so
+importing the routers stays cheap; the startup warmup below loads them
+before the first request.
 """
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    """
+        Password hashing context, created on first use.
+    """
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+@warmup("security")
+def warm_security() -> None:
+    """
+        Import jose and load the bcrypt backend ahead of the first login.
+    """
+    import jose.jwt  # noqa: F401
+    get_pwd_context().handler("bcrypt").get_backend()
 
 def create_access_token(subject: Union[str, Any], expires_delta: timedelta = None) -> str:
     
@@ -39,6 +56,7 @@ def create_access_token(subject: Union[str, Any], expires_delta: timedelta = Non
     to_encode = {"exp": expire, "sub": str(subject)}
     
     # Encode the token
+    from jose import jwt
     encoded_jwt = jwt.encode(
         to_encode, 
         settings.SECRET_KEY, 
@@ -47,6 +65,23 @@ def create_access_token(subject: Union[str, Any], expires_delta: timedelta = Non
     
     return encoded_jwt
 
+def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
+    
+    """
+        Decode and verify a JWT access token.
+        
+        Args:
+            token: Encoded JWT token string
+            
+        Returns:
+            Token payload, or None if the token is invalid or expired
+    """
+    from jose import JWTError, jwt
+    try:
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     
     """
@@ -59,7 +94,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         Returns:
             True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """
@@ -71,4 +106,4 @@ def get_password_hash(password: str) -> str:
         Returns:
             Hashed password string
     """
-    return pwd_context.hash(password)
\ No newline at end of file
+    return get_pwd_context().hash(password)
\ No newline at end of file
@@ -0,0 +1,218 @@
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+# Add app directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import httpx
+from sqlalchemy import func
+from app.main import app
+from app.core.config import settings
+from app.db.session.database import SessionLocal
+from app.models import BotModel
+
+"""
+In-process benchmark harness.
+
+Drives the ASGI app directly through httpx.AsyncClient (no network, no
+uvicorn), so numbers reflect the application and the database only.
+Load a realistic dataset first with scripts/generate_catalog.py.
+
+Usage:
+    python scripts/benchmark.py --requests 500 --concurrency 16 --output bench.json
+    python scripts/benchmark.py --compare bench.json      # diff against a previous run
+
+Scenarios: catalog_list, search, detail, login, users_me, update_me
+
+Rate limits are switched off for the run unless --rate-limits is given.
+"""
+
+API = settings.API_V1_STR
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+def summarize(latencies: List[float], elapsed: float, statuses: Dict[int, int]) -> dict:
+    ordered = sorted(latencies)
+    errors = sum(count for status, count in statuses.items() if status >= 400)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "status_codes": {str(k): v for k, v in sorted(statuses.items())},
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+    }
+
+async def run_scenario(client: httpx.AsyncClient, make_request: Callable, total: int, concurrency: int) -> dict:
+    """
+    Fire `total` requests with at most `concurrency` in flight.
+    """
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            response = await make_request(client, i)
+            latencies.append(time.perf_counter() - started)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return summarize(latencies, time.perf_counter() - started, statuses)
+
+def load_fixtures(sample_size: int, seed: int) -> dict:
+    """
+    Pick bot ids and search terms from the database once, before timing starts.
+    """
+    rng = random.Random(seed)
+    db = SessionLocal()
+    try:
+        bot_ids = [str(row.id) for row in db.query(BotModel.id).filter(BotModel.is_active == True).order_by(func.random()).limit(sample_size)]
+        names = [row.name for row in db.query(BotModel.name).order_by(func.random()).limit(sample_size)]
+        active_count = db.query(func.count(BotModel.id)).filter(BotModel.is_active == True).scalar()
+    finally:
+        db.close()
+    terms = [rng.choice(name.split()).lower() for name in names if name] or ["bot"]
+    return {"bot_ids": bot_ids, "terms": terms, "active_count": active_count}
+
+def build_scenarios(fixtures: dict, username: str, password: str, token: str, seed: int) -> Dict[str, Callable]:
+    rng = random.Random(seed)
+    bot_ids = fixtures["bot_ids"]
+    terms = fixtures["terms"]
+    max_skip = max(0, min(fixtures["active_count"], 10_000) - 20)
+
+    async def catalog_list(client, i):
+        return await client.get(f"{API}/bots/", params={"skip": rng.randint(0, max_skip), "limit": 20})
+
+    async def search(client, i):
+        return await client.get(f"{API}/bots/", params={"search": rng.choice(terms), "limit": 20})
+
+    async def detail(client, i):
+        return await client.get(f"{API}/bots/{rng.choice(bot_ids)}")
+
+    async def login(client, i):
+        return await client.post(f"{API}/auth/login", data={"username": username, "password": password})
+
+    async def users_me(client, i):
+        return await client.get(f"{API}/users/me", headers={"Authorization": f"Bearer {token}"})
+
+    async def update_me(client, i):
+        return await client.put(f"{API}/users/me", json={"first_name": f"Bench {i}"}, headers={"Authorization": f"Bearer {token}"})
+
+    scenarios = {"catalog_list": catalog_list, "search": search, "login": login, "users_me": users_me, "update_me": update_me}
+    if bot_ids:
+        scenarios["detail"] = detail
+    return scenarios
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def print_comparison(current: dict, baseline: dict) -> None:
+    print(f"\n📈 Compared with {baseline.get('git_revision', '?')} ({baseline.get('started_at', '?')})")
+    for name, result in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        parts = []
+        for metric in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms"):
+            old, new = before[metric], result[metric]
+            change = (new - old) / old * 100 if old else 0.0
+            parts.append(f"{metric}={new} ({change:+.1f}%)")
+        print(f"   {name:<13} " + "  ".join(parts))
+
+async def main_async(args) -> dict:
+    fixtures = load_fixtures(args.sample_size, args.seed)
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            response = await client.post(f"{API}/auth/login", data={"username": args.username, "password": args.password})
+            token = response.json().get("access_token", "") if response.status_code == 200 else ""
+            if not token:
+                print(f"⚠️  Login as {args.username} failed ({response.status_code}); login/users_me will report errors")
+
+            scenarios = build_scenarios(fixtures, args.username, args.password, token, args.seed)
+            selected = args.scenarios or list(scenarios)
+            results = {}
+            for name in selected:
+                if name not in scenarios:
+                    print(f"⚠️  Skipping unknown or unavailable scenario {name}")
+                    continue
+                total = args.login_requests if name == "login" else args.requests
+                await run_scenario(client, scenarios[name], min(args.warmup, total), args.concurrency)
+                results[name] = await run_scenario(client, scenarios[name], total, args.concurrency)
+                r = results[name]
+                print(f"   {name:<13} {r['throughput_rps']:>9} req/s  p50={r['p50_ms']}ms  p95={r['p95_ms']}ms  p99={r['p99_ms']}ms  errors={r['errors']}")
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the API in process through httpx.AsyncClient")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario")
+    parser.add_argument("--login-requests", type=int, default=100, help="Requests for the login scenario (bcrypt bound)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed requests before each scenario")
+    parser.add_argument("--scenarios", nargs="*", help="Subset of scenarios to run")
+    parser.add_argument("--username", default="bench_user_0")
+    parser.add_argument("--password", default="benchmark123")
+    parser.add_argument("--sample-size", type=int, default=1000, help="Bot ids / search terms to sample")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Previous JSON result to compare against")
+    parser.add_argument("--verbose", action="store_true", help="Keep the per-request log lines")
+    parser.add_argument("--rate-limits", action="store_true", help="Keep rate limiting enabled")
+    args = parser.parse_args()
+
+    if not args.rate_limits:
+        settings.RATE_LIMIT_ENABLED = False
+
+    if not args.verbose:
+        logging.getLogger("app.request").setLevel(logging.WARNING)
+
+    started_at = datetime.now(timezone.utc).isoformat()
+    print(f"🏁 Benchmarking {settings.PROJECT_NAME} at {git_revision()} (concurrency={args.concurrency})")
+    results = asyncio.run(main_async(args))
+
+    report = {
+        "git_revision": git_revision(),
+        "started_at": started_at,
+        "python": platform.python_version(),
+        "database_driver": settings.DB_DRIVER,
+        "config": {"requests": args.requests, "login_requests": args.login_requests, "concurrency": args.concurrency, "warmup": args.warmup, "seed": args.seed},
+        "scenarios": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Results written to {args.output}")
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(report, json.load(f))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+"""
+psycopg2 vs psycopg 3 comparison.
+
+Runs scripts/benchmark.py once per driver (DB_DRIVER) in a fresh process
+and prints both side by side. The catalog response cache is disabled for
+these runs so every catalog request reaches the database; otherwise the
+comparison would mostly measure cache hits.
+
+Usage:
+    python scripts/benchmark_drivers.py --requests 1000 --output drivers.json
+    python scripts/benchmark_drivers.py --scenarios detail users_me update_me
+"""
+
+DRIVERS = ("psycopg2", "psycopg")
+BENCHMARK = os.path.join(os.path.dirname(__file__), "benchmark.py")
+
+def run(driver: str, passthrough: list) -> dict:
+    env = dict(os.environ, DB_DRIVER=driver, CATALOG_CACHE_TTL="0", CATALOG_CACHE_STALE_TTL="0")
+    with tempfile.NamedTemporaryFile(suffix=".json") as out:
+        print(f"🚗 {driver}")
+        subprocess.run([sys.executable, BENCHMARK, "--output", out.name, *passthrough], env=env, check=True)
+        return json.load(open(out.name))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare database drivers with the benchmark harness")
+    parser.add_argument("--output", help="Write both results as JSON to this file")
+    args, passthrough = parser.parse_known_args()
+
+    results = {driver: run(driver, passthrough) for driver in DRIVERS}
+
+    baseline, candidate = (results[d]["scenarios"] for d in DRIVERS)
+    print(f"\n📊 {DRIVERS[1]} relative to {DRIVERS[0]}")
+    for name, after in candidate.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        parts = []
+        for metric in ("throughput_rps", "p50_ms", "p99_ms"):
+            old, new = before[metric], after[metric]
+            change = (new - old) / old * 100 if old else 0.0
+            parts.append(f"{metric}={old}->{new} ({change:+.1f}%)")
+        print(f"   {name:<13} " + "  ".join(parts))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add app directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.redis import get_redis
+from app.services.rate_limit import LocalTokenBuckets, RateLimit, RateLimiter
+
+"""
+Rate limiter decision overhead benchmark.
+
+Times single decisions (two buckets per request, like login) against the
+in-process buckets and, when reachable, against Redis via the Lua script.
+The budget is 1 ms per decision at p99.
+
+Usage:
+    python scripts/benchmark_rate_limit.py --decisions 20000 --output ratelimit.json
+"""
+
+BUDGET_MS = 1.0
+
+def measure(hit, decisions: int, keys: int) -> dict:
+    limits = (RateLimit.parse("1000000/second"), RateLimit.parse("1000000/second"))
+    timings = []
+    for i in range(decisions):
+        buckets = {f"bench:ip:{i % keys}": limits[0], f"bench:user:{i % keys}": limits[1]}
+        started = time.perf_counter()
+        hit(buckets)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    pick = lambda pct: round(timings[min(len(timings) - 1, int(len(timings) * pct / 100))] * 1000, 4)
+    return {"decisions": decisions, "p50_ms": pick(50), "p95_ms": pick(95), "p99_ms": pick(99), "max_ms": round(timings[-1] * 1000, 4)}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure rate limit decision latency")
+    parser.add_argument("--decisions", type=int, default=20_000)
+    parser.add_argument("--keys", type=int, default=1_000, help="Distinct clients to spread decisions over")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    local = LocalTokenBuckets()
+    results = {"in_process": measure(lambda b: local.hit(list(b.items())), args.decisions, args.keys)}
+
+    client = get_redis()
+    if client is not None:
+        limiter = RateLimiter()
+        results["redis"] = measure(lambda b: limiter._hit_redis(client, list(b.items())), args.decisions, args.keys)
+    else:
+        print("⚠️  Redis unavailable, only the in-process backend was measured")
+
+    for backend, r in results.items():
+        verdict = "✅" if r["p99_ms"] < BUDGET_MS else "❌"
+        print(f"{verdict} {backend:<11} p50={r['p50_ms']}ms  p95={r['p95_ms']}ms  p99={r['p99_ms']}ms  (budget {BUDGET_MS}ms)")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
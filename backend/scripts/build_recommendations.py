@@ -0,0 +1,48 @@
+
+import argparse
+import os
+import sys
+import time
+
+# Add app directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.config import settings
+from app.db.session.database import engine
+from app.services.recommendation_builder import build
+
+"""
+Build the "users who bought this also bought" lists from access grants.
+
+Run it periodically (e.g. every few minutes from cron): each run only
+recomputes the bots held by users whose grants changed since the last
+run. Schedule an occasional --full run as well; it recomputes every bot,
+which also picks up small score shifts the incremental runs skip.
+API workers pick up the new lists within RECOMMENDATIONS_RELOAD_INTERVAL.
+
+Usage:
+    python scripts/build_recommendations.py
+    python scripts/build_recommendations.py --full
+"""
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build bot recommendations from access grants")
+    parser.add_argument("--full", action="store_true", help="Recompute every bot, not just the ones with new grants")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        result = build(
+            conn,
+            top_k=settings.RECOMMENDATIONS_TOP_K,
+            min_cooccurrence=settings.RECOMMENDATIONS_MIN_COOCCURRENCE,
+            full=args.full,
+        )
+    if result is None:
+        print("⚠️  Another build is running")
+        sys.exit(1)
+    print(f"📊 {result.grants} grants of {result.users} users to {result.bots} bots")
+    print(f"✅ {'Full' if result.full else 'Incremental'} build: {result.rewritten} bots' recommendations written in {time.perf_counter() - started:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+
+import argparse
+import os
+import sys
+import time
+
+# Add app directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.config import settings
+from app.services.similarity_index import similarity_index
+
+"""
+Make a full build of the text similarity index.
+
+API workers build the index themselves when there is none on disk, and
+rebuild it once SIMILARITY_MAX_DELTA bots changed; this forces a build
+now, e.g. after a bulk import. Running workers map the new build at their
+next refresh (within SIMILARITY_REFRESH_INTERVAL).
+
+Usage:
+    python scripts/build_similarity_index.py
+    python scripts/build_similarity_index.py --query "csv to database pipeline"
+"""
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the text similarity index")
+    parser.add_argument("--query", help="Print the best matches for this text afterwards")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    similarity_index.refresh(rebuild=True)
+    stats = similarity_index.stats()
+    print(f"✅ Built {stats['build']} with {stats['bots']} bots in {settings.SIMILARITY_INDEX_PATH} ({time.perf_counter() - started:.2f}s)")
+
+    if args.query:
+        for rank, bot_id in enumerate(similarity_index.search(args.query, 10), start=1):
+            print(f"   {rank}. {bot_id}")
+
+if __name__ == "__main__":
+    main()
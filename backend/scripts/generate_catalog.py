@@ -0,0 +1,241 @@
+
+import argparse
+import csv
+import io
+import json
+import random
+import sys
+import os
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+# Add app directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.config import settings
+from app.db.session.database import engine
+from app.models import (
+    UserModel,
+    CategoryModel,
+    BotModel,
+    BotReviewModel,
+    BotExecutionModel,
+    ExecutionLogModel,
+    bot_categories,
+)
+from app.utils.security import get_password_hash
+
+"""
+Synthetic catalog generator.
+
+Loads a reproducible, production sized dataset into a local Postgres with
+COPY, so that query plans, caches and benchmarks behave like they would
+with a real catalog instead of the five seed bots.
+
+Usage:
+    python scripts/generate_catalog.py --bots 100000 --users 20000 --truncate
+
+Every generated user can log in with --password (default "benchmark123"),
+usernames are bench_user_0 ... bench_user_N.
+"""
+
+CHUNK_ROWS = 50_000
+
+WORDS = (
+    "file organizer email newsletter scraper data pipeline report invoice pdf "
+    "image resize backup sync calendar reminder slack discord twitter social "
+    "content generator summary translate csv excel database cleanup duplicate "
+    "monitor alert price tracker stock crypto weather news feed rss seo keyword "
+    "analytics dashboard chart export import convert archive compress schedule "
+    "task automation workflow notification sms lead crm sales marketing github "
+    "issue release deploy docker log parser audit security scan password vault"
+).split()
+
+DIFFICULTY_LEVELS = ["beginner", "intermediate", "advanced"]
+PYTHON_VERSIONS = ["3.9+", "3.10+", "3.11+", "3.12+"]
+EXECUTION_STATUSES = ["completed"] * 8 + ["failed", "cancelled", "running", "queued"]
+LOG_LEVELS = ["DEBUG", "INFO", "INFO", "INFO", "WARNING", "ERROR"]
+
+class Generator:
+    """
+    Deterministic row factory; the same seed always produces the same dataset.
+    """
+
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+        self.now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def uuid(self) -> str:
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def timestamp(self, max_days_ago: int = 730) -> str:
+        delta = timedelta(seconds=self.rng.randrange(max_days_ago * 86400))
+        return (self.now - delta).isoformat()
+
+    def sentence(self, min_words: int, max_words: int) -> str:
+        words = self.rng.choices(WORDS, k=self.rng.randint(min_words, max_words))
+        return " ".join(words).capitalize() + "."
+
+def copy_chunk(cursor, statement: str, buffer: io.StringIO) -> None:
+    """
+    Send one CSV chunk through COPY with the configured driver's API.
+    """
+    if settings.DB_DRIVER == "psycopg":
+        with cursor.copy(statement) as copy:
+            copy.write(buffer.getvalue())
+    else:
+        buffer.seek(0)
+        cursor.copy_expert(statement, buffer)
+
+def copy_rows(cursor, table, columns, rows) -> int:
+    """
+    Stream rows into `table` with COPY ... FROM STDIN in CSV chunks.
+    """
+    statement = f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    total = 0
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(["\\N" if value is None else value for value in row])
+        total += 1
+        if total % CHUNK_ROWS == 0:
+            copy_chunk(cursor, statement, buffer)
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        copy_chunk(cursor, statement, buffer)
+    return total
+
+def generate(args) -> None:
+    gen = Generator(args.seed)
+    password_hash = get_password_hash(args.password)
+
+    category_ids = [gen.uuid() for _ in range(args.categories)]
+    bot_ids = [gen.uuid() for _ in range(args.bots)]
+    user_ids = [gen.uuid() for _ in range(args.users)]
+    execution_ids = [gen.uuid() for _ in range(args.executions)]
+
+    def categories():
+        for i, category_id in enumerate(category_ids):
+            created = gen.timestamp()
+            yield (category_id, f"Category {i:04d} {gen.rng.choice(WORDS).title()}", gen.sentence(6, 14), f"/icons/category-{i}.svg", True, created, created)
+
+    def bots():
+        for i, bot_id in enumerate(bot_ids):
+            is_free = gen.rng.random() < 0.15
+            price = "0.00" if is_free else f"{gen.rng.choice([4.99, 9.99, 14.99, 19.99, 29.99, 39.99, 49.99, 99.99]):.2f}"
+            created = gen.timestamp()
+            name = " ".join(w.title() for w in gen.rng.sample(WORDS, 3)) + f" {i}"
+            yield (
+                bot_id, name, gen.sentence(8, 20), gen.sentence(40, 120), price, is_free,
+                gen.rng.choice(DIFFICULTY_LEVELS), gen.rng.choice(PYTHON_VERSIONS), gen.rng.randint(10, 600),
+                f"botmarketplace/bot-{i % 50}:latest", f"https://github.com/botmarketplace/bot-{i}",
+                None, f"/thumbnails/bot-{i}.jpg", gen.rng.random() > 0.03,
+                int(gen.rng.paretovariate(1.2) * 10), 0, 0, created, created,
+            )
+
+    def bot_category_links():
+        for bot_id in bot_ids:
+            for category_id in gen.rng.sample(category_ids, min(len(category_ids), gen.rng.randint(1, 3))):
+                yield (bot_id, category_id)
+
+    def users():
+        for i, user_id in enumerate(user_ids):
+            created = gen.timestamp()
+            yield (user_id, f"bench_user_{i}@example.com", f"bench_user_{i}", password_hash, "Bench", f"User{i}", True, True, gen.rng.choice(["free", "free", "premium", "enterprise"]), created, created)
+
+    def reviews():
+        # (bot, user) pairs must be unique: walk bots first, then shift the user per round
+        for i in range(min(args.reviews, args.bots * args.users)):
+            bot_index = i % args.bots
+            user_index = (i // args.bots + bot_index * 7919) % args.users
+            created = gen.timestamp()
+            yield (gen.uuid(), user_ids[user_index], bot_ids[bot_index], gen.rng.choices([1, 2, 3, 4, 5], weights=[1, 1, 3, 6, 8])[0], gen.sentence(5, 30), gen.rng.random() < 0.7, created, created)
+
+    def executions():
+        for execution_id in execution_ids:
+            status = gen.rng.choice(EXECUTION_STATUSES)
+            created = gen.timestamp(365)
+            duration = gen.rng.randint(1, 900)
+            finished = status in ("completed", "failed", "cancelled")
+            output = json.dumps({"items": gen.rng.randint(0, 5000), "summary": gen.sentence(5, 15)}) if status == "completed" else None
+            yield (
+                execution_id, gen.rng.choice(user_ids), gen.rng.choice(bot_ids), status,
+                json.dumps({"target": gen.rng.choice(WORDS), "limit": gen.rng.randint(1, 1000)}), output,
+                duration if finished else None, "Synthetic failure" if status == "failed" else None,
+                None, created, created if finished else None, created, created,
+            )
+
+    def execution_logs():
+        for execution_id in execution_ids:
+            for _ in range(gen.rng.randint(0, args.logs_per_execution * 2)):
+                created = gen.timestamp(365)
+                yield (gen.uuid(), execution_id, gen.rng.choice(LOG_LEVELS), gen.sentence(4, 16), created, created, created)
+
+    plan = [
+        (CategoryModel.__table__, ["id", "name", "description", "icon_url", "is_active", "created_at", "updated_at"], categories),
+        (BotModel.__table__, [
+            "id", "name", "description", "detailed_description", "price", "is_free", "difficulty_level", "python_version",
+            "execution_time_estimate", "docker_image", "github_repo_url", "demo_video_url", "thumbnail_url", "is_active",
+            "download_count", "rating_average", "rating_count", "created_at", "updated_at",
+        ], bots),
+        (bot_categories, ["bot_id", "category_id"], bot_category_links),
+        (UserModel.__table__, ["id", "email", "username", "password_hash", "first_name", "last_name", "is_active", "is_verified", "subscription_tier", "created_at", "updated_at"], users),
+        (BotReviewModel.__table__, ["id", "user_id", "bot_id", "rating", "review_text", "is_verified_purchase", "created_at", "updated_at"], reviews),
+        (BotExecutionModel.__table__, [
+            "id", "user_id", "bot_id", "execution_status", "input_parameters", "output_data", "execution_time",
+            "error_message", "container_id", "started_at", "completed_at", "created_at", "updated_at",
+        ], executions),
+        (ExecutionLogModel.__table__, ["id", "execution_id", "log_level", "message", "timestamp", "created_at", "updated_at"], execution_logs),
+    ]
+
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        if args.truncate:
+            tables = ", ".join(table.name for table, _, _ in reversed(plan))
+            print(f"🧹 Truncating {tables}")
+            cursor.execute(f"TRUNCATE {tables} CASCADE")
+
+        for table, columns, rows in plan:
+            started = time.perf_counter()
+            count = copy_rows(cursor, table, columns, rows())
+            print(f"   {table.name}: {count} rows in {time.perf_counter() - started:.1f}s")
+
+        # Keep the denormalized rating columns consistent with the generated reviews
+        reviews_table = BotReviewModel.__table__.name
+        cursor.execute(
+            f"""
+            UPDATE bots SET rating_average = r.avg_rating, rating_count = r.cnt
+            FROM (SELECT bot_id, ROUND(AVG(rating), 2) AS avg_rating, COUNT(*) AS cnt FROM {reviews_table} GROUP BY bot_id) r
+            WHERE bots.id = r.bot_id
+            """
+        )
+
+        print("📊 Running ANALYZE")
+        cursor.execute("ANALYZE")
+        raw.commit()
+    finally:
+        raw.close()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load a synthetic bot catalog into Postgres with COPY")
+    parser.add_argument("--bots", type=int, default=100_000)
+    parser.add_argument("--categories", type=int, default=60)
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--reviews", type=int, default=300_000)
+    parser.add_argument("--executions", type=int, default=200_000)
+    parser.add_argument("--logs-per-execution", type=int, default=3)
+    parser.add_argument("--password", default="benchmark123", help="Password for every generated user")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--truncate", action="store_true", help="Empty the catalog tables before loading")
+    args = parser.parse_args()
+
+    print(f"🏗️  Generating synthetic catalog (seed={args.seed})...")
+    started = time.perf_counter()
+    generate(args)
+    print(f"✅ Done in {time.perf_counter() - started:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+"""
+Cold start profiler.
+
+Starts a fresh interpreter per run (like a new worker), imports the app,
+runs the lifespan and times the first request. Reports the median of each
+phase so boots can be compared across commits.
+
+Usage:
+    python scripts/profile_startup.py --runs 5 --path /api/v1/bots/?limit=20 --output startup.json
+"""
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r"""
+import asyncio, json, sys, time
+started = time.perf_counter()
+import httpx
+from app.main import app
+imported = time.perf_counter()
+
+async def main():
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        ready = time.perf_counter()
+        async with httpx.AsyncClient(transport=transport, base_url="http://startup") as client:
+            response = await client.get(sys.argv[1])
+        first_byte = time.perf_counter()
+        second = time.perf_counter()
+        async with httpx.AsyncClient(transport=transport, base_url="http://startup") as client:
+            await client.get(sys.argv[1])
+        warm = time.perf_counter() - second
+    print(json.dumps({
+        "import_ms": (imported - started) * 1000,
+        "lifespan_ms": (ready - imported) * 1000,
+        "first_request_ms": (first_byte - ready) * 1000,
+        "warm_request_ms": warm * 1000,
+        "time_to_first_byte_ms": (first_byte - started) * 1000,
+        "status_code": response.status_code,
+        "startup_timings_ms": getattr(app.state, "startup_timings", {}),
+    }))
+
+asyncio.run(main())
+"""
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure worker cold start and time to first byte")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--path", default="/api/v1/bots/?limit=20", help="Request issued right after startup")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    env = dict(os.environ, LOG_LEVEL=os.environ.get("LOG_LEVEL", "WARNING"))
+    runs = []
+    for i in range(args.runs):
+        out = subprocess.run([sys.executable, "-c", CHILD, args.path], cwd=BACKEND_DIR, env=env, capture_output=True, text=True)
+        if out.returncode != 0:
+            print(out.stderr, file=sys.stderr)
+            sys.exit(out.returncode)
+        runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+        print(f"   run {i + 1}: ttfb={runs[-1]['time_to_first_byte_ms']:.1f}ms first_request={runs[-1]['first_request_ms']:.1f}ms")
+
+    metrics = ("import_ms", "lifespan_ms", "first_request_ms", "warm_request_ms", "time_to_first_byte_ms")
+    summary = {metric: round(statistics.median(run[metric] for run in runs), 2) for metric in metrics}
+    print("⏱️  Median over {} runs: ".format(len(runs)) + "  ".join(f"{k}={v}" for k, v in summary.items()))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"path": args.path, "median": summary, "runs": runs}, f, indent=2)
+        print(f"💾 Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict
+from uuid import UUID
+
+# Add app directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import text
+from app.core.config import settings
+from app.db.session.database import engine
+from app.services.duration_sketch import DDSketch
+from app.services.execution_stats import ExecutionStats
+
+"""
+Rebuild every bot's execution time statistics from execution history.
+
+The executors keep the statistics current on their own; this is for
+seeding them on an existing database, or starting over after changing
+EXECUTION_STATS_ACCURACY. Durations come from started_at/completed_at
+(execution_time is rounded to whole seconds); cache hits are skipped.
+
+Usage:
+    python scripts/rebuild_execution_stats.py
+    python scripts/rebuild_execution_stats.py --dry-run
+"""
+
+HISTORY_STATEMENT = text("""
+SELECT bot_id, EXTRACT(EPOCH FROM completed_at - started_at) AS seconds, execution_time
+FROM bot_executions
+WHERE execution_status = 'completed' AND NOT coalesce(cache_hit, false) AND bot_id IS NOT NULL
+""")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild execution time statistics from execution history")
+    parser.add_argument("--dry-run", action="store_true", help="Build the sketches but do not write them")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    sketches: Dict[UUID, DDSketch] = {}
+    executions = 0
+    with engine.connect() as conn:
+        rows = conn.execution_options(stream_results=True, yield_per=10000).execute(HISTORY_STATEMENT)
+        for bot_id, seconds, execution_time in rows:
+            seconds = float(seconds) if seconds is not None else execution_time
+            if seconds is None:
+                continue
+            sketch = sketches.get(bot_id)
+            if sketch is None:
+                sketch = sketches[bot_id] = DDSketch(settings.EXECUTION_STATS_ACCURACY)
+            sketch.add(max(seconds, 0.0))
+            executions += 1
+    print(f"📊 Read {executions} executions of {len(sketches)} bots in {time.perf_counter() - started:.2f}s")
+
+    if args.dry_run:
+        return
+
+    stats = ExecutionStats(alpha=settings.EXECUTION_STATS_ACCURACY, min_samples=settings.EXECUTION_STATS_MIN_SAMPLES)
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM bot_execution_stats"))
+        updated = stats.merge(conn, sketches) if sketches else 0
+    print(f"✅ Statistics written for {updated} bots, {stats.estimates_updated} execution time estimates updated")
+
+if __name__ == "__main__":
+    main()
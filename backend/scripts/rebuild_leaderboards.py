@@ -0,0 +1,44 @@
+
+import argparse
+import os
+import sys
+import time
+
+# Add app directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.redis import get_redis
+from app.services.leaderboards import BOARDS, leaderboards
+
+"""
+Rebuild the bot leaderboards in Redis from the database.
+
+The API rebuilds them on its own every LEADERBOARD_REBUILD_INTERVAL; this
+is for correcting them right away, e.g. after a bulk import or after
+changing the trending half-life or rating prior.
+
+Usage:
+    python scripts/rebuild_leaderboards.py
+    python scripts/rebuild_leaderboards.py --show 10
+"""
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the bot leaderboards")
+    parser.add_argument("--show", type=int, default=0, help="Print the top N of each board afterwards")
+    args = parser.parse_args()
+
+    if get_redis() is None:
+        print("❌ Redis is unavailable; API workers keep their own leaderboards and rebuild them themselves")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    if not leaderboards.rebuild():
+        print("⚠️  Another process is rebuilding the leaderboards")
+        sys.exit(1)
+    print(f"✅ Rebuilt leaderboards in {time.perf_counter() - started:.2f}s")
+
+    for board in BOARDS if args.show else ():
+        print(f"🏆 {board}: {', '.join(leaderboards.top(board, args.show))}")
+
+if __name__ == "__main__":
+    main()
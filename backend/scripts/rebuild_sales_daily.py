@@ -0,0 +1,48 @@
+
+import argparse
+import os
+import sys
+import time
+
+# Add app directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.db.session.database import engine
+from app.services.sales_analytics import mismatches, rebuild
+
+"""
+Verify or rebuild the daily sales rollup.
+
+Triggers keep sales_daily current and the migration that added it
+backfilled existing orders, so this is for checking the rollup against
+the orders (--check) or recomputing it after data was loaded with the
+triggers disabled. Rebuilding blocks order writes while it runs.
+
+Usage:
+    python scripts/rebuild_sales_daily.py --check
+    python scripts/rebuild_sales_daily.py
+"""
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Verify or rebuild the daily sales rollup")
+    parser.add_argument("--check", action="store_true", help="Only compare the rollup with the orders")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.check:
+        with engine.connect() as conn:
+            rows = mismatches(conn)
+        for row in rows[:20]:
+            print(f"   {row.day} {row.bot_id}: rollup {row.rollup_units} units / {row.rollup_revenue}, orders {row.live_units} units / {row.live_revenue}")
+        if rows:
+            print(f"❌ {len(rows)} rollup rows differ from the orders ({time.perf_counter() - started:.2f}s)")
+            sys.exit(1)
+        print(f"✅ Rollup matches the orders ({time.perf_counter() - started:.2f}s)")
+        return
+
+    with engine.begin() as conn:
+        written = rebuild(conn)
+    print(f"✅ Rebuilt sales_daily: {written} rows in {time.perf_counter() - started:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+
+import argparse
+import os
+import signal
+import sys
+import threading
+import time
+
+# Add app directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.logging import configure_logging
+from app.db.session.database import engine
+from app.services.executor import Executor, flush_execution_stats, run_executor
+from app.services.runner_pool import RunnerPool
+
+"""
+Executor service: runs queued bot executions on warm runners.
+
+Bot code is read from RUNNER_BOT_PATH/<bot id>/ and RUNNER_ENTRY_POINT
+(default main:run) is called with the execution's input parameters.
+Several instances can run side by side.
+
+Usage:
+    python scripts/run_executor.py
+    python scripts/run_executor.py --once       # run everything queued now, then exit
+    RUNNER_BACKEND=docker python scripts/run_executor.py
+"""
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the bot execution service")
+    parser.add_argument("--once", action="store_true", help="Drain the current queue and exit")
+    args = parser.parse_args()
+
+    configure_logging()
+
+    if args.once:
+        executor = Executor(engine, RunnerPool())
+        started = time.perf_counter()
+        claimed = 0
+        while True:
+            batch = executor.poll()
+            claimed += batch
+            if not batch and executor.idle():
+                break
+            time.sleep(0.05)
+        executor.shutdown()
+        flush_execution_stats(engine)
+        stats = executor.pool.stats()
+        print(f"🚀 Ran {claimed} executions in {time.perf_counter() - started:.2f}s")
+        print(f"🔥 Runners started: {stats['started']}, leases: {stats['leases']} ({stats['warm_leases']} warm), recycled: {stats['recycled']}")
+        return
+
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop.set())
+    print("⚙️  Executor running, Ctrl+C to stop")
+    run_executor(engine, stop)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+
+import argparse
+import os
+import signal
+import sys
+import threading
+
+# Add app directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.logging import configure_logging
+from app.db.session.database import engine
+from app.services.scheduler import Scheduler, run_scheduler
+
+"""
+Scheduler service for recurring bot executions.
+
+Run one or more instances next to the API; only the instance holding the
+scheduler advisory lock fires schedules, the others wait as hot standbys.
+
+Usage:
+    python scripts/run_scheduler.py
+    python scripts/run_scheduler.py --once      # load, fire what is due, exit
+"""
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the bot schedule service")
+    parser.add_argument("--once", action="store_true", help="Fire due schedules once and exit (no leader election)")
+    args = parser.parse_args()
+
+    configure_logging()
+
+    if args.once:
+        scheduler = Scheduler(engine)
+        print(f"📅 Loaded {scheduler.load()} active schedules")
+        print(f"🚀 Queued {scheduler.fire_due()} executions")
+        return
+
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop.set())
+    print("📅 Scheduler running, Ctrl+C to stop")
+    run_scheduler(engine, stop)
+
+if __name__ == "__main__":
+    main()
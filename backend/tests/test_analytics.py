@@ -0,0 +1,38 @@
+# File: tests/test_analytics.py
+import pytest
+from fastapi.testclient import TestClient
+from app.api.deps.auth import get_current_active_user
+from app.api.deps.database import get_db
+from app.core.config import settings
+from app.main import app
+from app.models import UserModel
+
+"""
+Revenue analytics are restricted to admins.
+"""
+
+@pytest.fixture
+def client_as(db, monkeypatch):
+    """
+    Test client signed in as a user with the given email.
+    """
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", ["Admin@Example.com"])
+
+    def sign_in(email):
+        app.dependency_overrides[get_current_active_user] = lambda: UserModel(email=email, username="u", is_active=True)
+        app.dependency_overrides[get_db] = lambda: db
+        return TestClient(app)
+
+    yield sign_in
+    app.dependency_overrides.clear()
+
+@pytest.mark.parametrize("path", ["/sales/daily", "/sales/top-bots"])
+def test_non_admins_are_forbidden(client_as, path):
+    response = client_as("user@example.com").get(f"{settings.API_V1_STR}/analytics{path}")
+    assert response.status_code == 403
+
+@pytest.mark.parametrize("path", ["/sales/daily", "/sales/top-bots"])
+def test_admins_see_sales(client_as, path):
+    response = client_as("admin@example.com").get(f"{settings.API_V1_STR}/analytics{path}")
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
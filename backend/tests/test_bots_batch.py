@@ -0,0 +1,67 @@
+# File: tests/test_bots_batch.py
+import json
+import uuid
+from decimal import Decimal
+import pytest
+from fastapi import HTTPException
+from app.api.endpoints.bots import MAX_BATCH_IDS, read_bots_batch
+from app.crud.bot import bot as bot_crud
+from app.models import BotModel
+
+"""
+GET /bots/batch.
+"""
+
+@pytest.fixture
+def bots(db):
+    bots = [BotModel(name=f"Bot {uuid.uuid4().hex[:12]}", price=Decimal("4.99")) for _ in range(3)]
+    db.add_all(bots)
+    db.flush()
+    return [str(bot.id) for bot in bots]
+
+@pytest.fixture
+def get_many_calls(monkeypatch):
+    calls = []
+    get_many = bot_crud.get_many
+
+    def counting(db, *, ids):
+        calls.append(sorted(str(bot_id) for bot_id in ids))
+        return get_many(db, ids=ids)
+
+    monkeypatch.setattr(bot_crud, "get_many", counting)
+    return calls
+
+def batch(db, *ids):
+    return json.loads(read_bots_batch(db=db, ids=",".join(ids)).body)
+
+def item_ids(result):
+    return [item["id"] if item else None for item in result["items"]]
+
+def test_items_come_in_request_order(db, bots):
+    result = batch(db, bots[2], bots[0], bots[1])
+    assert item_ids(result) == [bots[2], bots[0], bots[1]]
+    assert result["not_found"] == []
+
+def test_duplicates_and_spellings_of_one_id(db, bots):
+    result = batch(db, bots[0], bots[0].upper(), " " + bots[1], bots[0])
+    assert item_ids(result) == [bots[0], bots[0], bots[1], bots[0]]
+    assert result["not_found"] == []
+
+def test_unknown_and_malformed_ids_are_not_found(db, bots):
+    unknown = str(uuid.uuid4())
+    result = batch(db, "not-a-uuid", bots[0], unknown, "not-a-uuid")
+    assert item_ids(result) == [None, bots[0], None, None]
+    assert result["not_found"] == ["not-a-uuid", unknown]
+
+def test_too_many_ids_is_a_bad_request(db):
+    with pytest.raises(HTTPException) as exc_info:
+        batch(db, *(str(uuid.uuid4()) for _ in range(MAX_BATCH_IDS + 1)))
+    assert exc_info.value.status_code == 400
+
+def test_cache_misses_are_loaded_with_one_query(db, bots, get_many_calls):
+    batch(db, bots[0])
+    assert get_many_calls == [[bots[0]]]
+    result = batch(db, bots[2], bots[0], bots[1], bots[2])
+    assert item_ids(result) == [bots[2], bots[0], bots[1], bots[2]]
+    # bots[0] came from the cache, the others from a single query
+    assert get_many_calls[1:] == [sorted([bots[1], bots[2]])]
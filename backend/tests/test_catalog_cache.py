@@ -0,0 +1,100 @@
+# File: tests/test_catalog_cache.py
+from types import SimpleNamespace
+import pytest
+from app.services import catalog_cache as catalog_cache_module
+from app.services.cache import ResponseCache
+from app.services.catalog_cache import get_or_build, refresh
+
+"""
+Stale-while-revalidate in the catalog cache, without a database: the
+session factory, the catalog version and the refresh executor are fakes.
+"""
+
+KEY = ("bots", 0, 10, None, None, False)
+
+class FakeSession:
+    def __init__(self, info=None):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+class RecordingExecutor:
+    """
+    Collects submitted refreshes, to be run when the test decides.
+    """
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn, *args):
+        self.submitted.append((fn, args))
+
+    def run_all(self):
+        submitted, self.submitted = self.submitted, []
+        for fn, args in submitted:
+            fn(*args)
+
+@pytest.fixture
+def cache(monkeypatch):
+    # Entries turn stale as soon as they are written
+    cache = ResponseCache(max_entries=10, ttl=0, stale_ttl=60)
+    monkeypatch.setattr(catalog_cache_module, "catalog_cache", cache)
+    monkeypatch.setattr(catalog_cache_module, "SessionLocal", FakeSession)
+    monkeypatch.setattr(catalog_cache_module, "get_catalog_version", lambda db: SimpleNamespace(version=1))
+    return cache
+
+@pytest.fixture
+def executor(monkeypatch):
+    executor = RecordingExecutor()
+    monkeypatch.setattr(catalog_cache_module, "refresh_executor", executor)
+    return executor
+
+def never_inline(db):
+    raise AssertionError("a stale entry must not be rebuilt inline")
+
+def test_stale_entry_is_served_and_refreshed_in_the_background(cache, executor):
+    stale = cache.set(KEY, b"[1]", version=1)
+    builds = []
+
+    def build(db):
+        builds.append(db)
+        return b"[2]"
+
+    assert get_or_build(FakeSession(), KEY, 1, build) is stale
+    assert builds == []
+    executor.run_all()
+    # Rebuilt on its own session, which is closed afterwards
+    assert len(builds) == 1 and builds[0].closed
+    assert cache.get(KEY, 1).body == b"[2]"
+
+def test_one_background_refresh_per_key(cache, executor):
+    cache.set(KEY, b"[1]", version=1)
+    other = ("bots", 10, 10, None, None, False)
+    cache.set(other, b"[3]", version=1)
+    for _ in range(3):
+        get_or_build(FakeSession(), KEY, 1, never_inline)
+    get_or_build(FakeSession(), other, 1, never_inline)
+    assert [args[0] for _, args in executor.submitted] == [KEY, other]
+
+    executor.run_all()
+    # Finished refreshes release their keys
+    get_or_build(FakeSession(), KEY, 1, never_inline)
+    assert len(executor.submitted) == 1
+
+def test_failed_refresh_releases_the_key(cache, executor):
+    cache.set(KEY, b"[1]", version=1)
+
+    def failing_build(db):
+        raise RuntimeError("database went away")
+
+    assert cache.begin_refresh(KEY)
+    refresh(KEY, failing_build)
+    # The stale entry is still served, and the next request may refresh again
+    assert get_or_build(FakeSession(), KEY, 1, never_inline).body == b"[1]"
+    assert len(executor.submitted) == 1
+
+def test_other_catalog_version_is_a_miss_not_stale(cache, executor):
+    cache.set(KEY, b"[1]", version=1)
+    assert get_or_build(FakeSession(), KEY, 2, lambda db: b"[2]").body == b"[2]"
+    assert executor.submitted == []
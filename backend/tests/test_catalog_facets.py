@@ -0,0 +1,89 @@
+# File: tests/test_catalog_facets.py
+import uuid
+from collections import Counter
+from decimal import Decimal
+import pytest
+from app.models import BotModel, CategoryModel
+from app.services.catalog_facets import facet_counts, price_bucket_label
+
+"""
+Facet counts of catalog listings.
+"""
+
+def counts(facets):
+    """
+    {facet: {value: count}}, plus the total, from a CatalogFacets.
+    """
+    result = {
+        name: Counter({value.value: value.count for value in getattr(facets, name)})
+        for name in ("categories", "difficulty_level", "python_version", "price", "is_free")
+    }
+    result["total"] = facets.total
+    return result
+
+def add_catalog(db):
+    """
+    A tagged set of bots in two new categories:
+      one:      paid, 5.00 (a bucket edge), in both categories
+      two:      free, in the first category
+      three:    paid, 50.00 (the open bucket's edge), no category
+      inactive: in the first category, never counted
+    """
+    tag = uuid.uuid4().hex[:12]
+    first, second = CategoryModel(name=f"First {tag}"), CategoryModel(name=f"Second {tag}")
+    db.add_all([first, second])
+
+    def bot(name, price, *categories, **kwargs):
+        bot = BotModel(name=f"{tag} {name}", price=Decimal(price), categories=list(categories), **kwargs)
+        db.add(bot)
+        return bot
+
+    bot("one", "5.00", first, second, difficulty_level="beginner", python_version="3.11")
+    bot("two", "0.00", first, is_free=True, difficulty_level="advanced", python_version="3.11")
+    bot("three", "50.00", difficulty_level="beginner", python_version="3.12")
+    bot("inactive", "7.00", first, is_active=False)
+    db.flush()
+    return tag, str(first.id), str(second.id)
+
+@pytest.fixture
+def catalog(db):
+    return add_catalog(db)
+
+def test_price_bucket_labels():
+    assert [price_bucket_label(bucket) for bucket in range(5)] == ["0-5", "5-10", "10-25", "25-50", "50+"]
+
+def test_search_counts_each_bot_once_per_facet(db, catalog):
+    tag, first, second = catalog
+    result = counts(facet_counts(db, category=None, search=tag, free_only=False))
+    assert result["total"] == 3
+    # "one" is in both categories: counted in each, and once in every other facet
+    assert result["categories"] == {first: 2, second: 1}
+    assert result["difficulty_level"] == {"beginner": 2, "advanced": 1}
+    assert result["python_version"] == {"3.11": 2, "3.12": 1}
+    # Bucket edges belong to the bucket above them
+    assert result["price"] == {"0-5": 1, "5-10": 1, "50+": 1}
+    assert result["is_free"] == {"paid": 2, "free": 1}
+
+def test_category_filter(db, catalog):
+    tag, first, second = catalog
+    result = counts(facet_counts(db, category=first, search=None, free_only=False))
+    assert result["total"] == 2
+    assert result["categories"] == {first: 2, second: 1}
+    assert result["price"] == {"0-5": 1, "5-10": 1}
+
+def test_free_only_filter(db):
+    # Other free bots may exist: count what the tagged ones add
+    before = counts(facet_counts(db, category=None, search=None, free_only=True))
+    tag, first, second = add_catalog(db)
+    after = counts(facet_counts(db, category=None, search=None, free_only=True))
+    assert after["total"] - before["total"] == 1
+    assert after["categories"] - before["categories"] == {first: 1}
+    assert after["is_free"] - before["is_free"] == {"free": 1}
+    assert after["price"] - before["price"] == {"0-5": 1}
+
+def test_filters_take_precedence_like_read_bots(db, catalog):
+    tag, first, second = catalog
+    # Category wins over search, free_only over both
+    assert facet_counts(db, category=second, search="no bot is called this", free_only=False).total == 1
+    by_free_only = facet_counts(db, category=second, search=tag, free_only=True)
+    assert by_free_only.total == facet_counts(db, category=None, search=None, free_only=True).total
@@ -0,0 +1,35 @@
+# File: tests/test_catalog_version.py
+import uuid
+from decimal import Decimal
+from app.models import BotModel
+from app.services.catalog_version import get_catalog_version
+
+"""
+Catalog version watermark triggers.
+"""
+
+def make_bot(db):
+    bot = BotModel(name=f"Bot {uuid.uuid4().hex[:12]}", price=Decimal("4.99"))
+    db.add(bot)
+    db.flush()
+    return bot
+
+def test_catalog_writes_bump_the_version(db):
+    before = get_catalog_version(db).version
+    bot = make_bot(db)
+    created = get_catalog_version(db).version
+    assert created > before
+
+    bot.price = Decimal("5.99")
+    db.flush()
+    assert get_catalog_version(db).version > created
+
+def test_counter_updates_keep_the_version(db):
+    bot = make_bot(db)
+    before = get_catalog_version(db).version
+
+    bot.download_count = (bot.download_count or 0) + 1
+    bot.rating_average = Decimal("4.50")
+    bot.rating_count = 3
+    db.flush()
+    assert get_catalog_version(db).version == before
@@ -0,0 +1,55 @@
+# File: tests/test_conditional_requests.py
+from types import SimpleNamespace
+import pytest
+from starlette.requests import Request
+from app.api.endpoints import executions
+from app.api.responses import etag_matches
+
+"""
+ETag revalidation of catalog responses and execution payloads.
+"""
+
+@pytest.mark.parametrize("header, matches", [
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"xyz", "abc"', True),
+    ("*", True),
+    ('"xyz"', False),
+    ("", False),
+])
+def test_etag_matches(header, matches):
+    assert etag_matches(header, '"abc"') is matches
+    assert etag_matches(header, 'W/"abc"') is matches
+
+def request_with(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match is not None else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+@pytest.fixture
+def streams(monkeypatch):
+    """
+    Blob payload streams opened by payload_response.
+    """
+    opened = []
+
+    def payload_stream(execution, field):
+        opened.append(field)
+        return iter((b'{"ok": true}',)), 12, execution.output_blob_key
+
+    monkeypatch.setattr(executions.execution_crud, "payload_stream", payload_stream)
+    return opened
+
+EXECUTION = SimpleNamespace(output_blob_key="abc", output_size=12)
+
+@pytest.mark.parametrize("header", ['"abc"', 'W/"abc"', "*"])
+def test_revalidation_does_not_open_the_blob(streams, header):
+    response = executions.payload_response(request_with(header), EXECUTION, "output")
+    assert response.status_code == 304
+    assert response.headers["etag"] == '"abc"'
+    assert streams == []
+
+def test_changed_payload_is_streamed(streams):
+    response = executions.payload_response(request_with('"old"'), EXECUTION, "output")
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"abc"'
+    assert streams == ["output"]
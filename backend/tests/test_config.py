@@ -0,0 +1,18 @@
+# File: tests/test_config.py
+from app.core.config import Settings
+
+"""
+Settings parsing from the environment.
+"""
+
+def test_prepare_threshold_defaults_to_two(monkeypatch):
+    monkeypatch.delenv("DB_PREPARE_THRESHOLD", raising=False)
+    assert Settings().DB_PREPARE_THRESHOLD == 2
+
+def test_negative_prepare_threshold_disables_preparing(monkeypatch):
+    monkeypatch.setenv("DB_PREPARE_THRESHOLD", "-1")
+    assert Settings().DB_PREPARE_THRESHOLD is None
+
+def test_zero_prepare_threshold_prepares_at_once(monkeypatch):
+    monkeypatch.setenv("DB_PREPARE_THRESHOLD", "0")
+    assert Settings().DB_PREPARE_THRESHOLD == 0
@@ -0,0 +1,88 @@
+# File: tests/test_execution_events.py
+import asyncio
+import pytest
+from app.services.execution_events import RESYNC, ExecutionEventHub
+
+"""
+Fan-out of execution status events to subscribers. The LISTEN thread is
+not started; events are handed to the hub directly.
+"""
+
+EXECUTION = "0b7a4c52-8a3e-4c55-9d43-1d6a4f3b2e10"
+OTHER_EXECUTION = "5d0c8f6e-2b1a-4f0e-8c7d-3e9a1b2c4d5f"
+USER = "9f1e2d3c-4b5a-4697-8877-665544332211"
+
+@pytest.fixture
+def hub(monkeypatch):
+    hub = ExecutionEventHub("postgresql://unused", queue_size=3)
+    monkeypatch.setattr(hub, "_ensure_listener", lambda: None)
+    return hub
+
+def event(execution_id=EXECUTION, user_id=USER, status="running"):
+    return {"id": execution_id, "user_id": user_id, "execution_status": status}
+
+async def drain(subscription):
+    # Deliveries are scheduled with call_soon_threadsafe; let them run
+    await asyncio.sleep(0)
+    events = []
+    while not subscription.queue.empty():
+        events.append(subscription.queue.get_nowait())
+    return events
+
+def test_dispatch_reaches_execution_and_user_subscribers(hub):
+    async def scenario():
+        watcher = hub.subscribe(execution_id=EXECUTION)
+        owner = hub.subscribe(user_id=USER)
+        other = hub.subscribe(execution_id=OTHER_EXECUTION)
+        hub.dispatch(event())
+        hub.dispatch(event(OTHER_EXECUTION, user_id=None, status="queued"))
+        return await drain(watcher), await drain(owner), await drain(other)
+
+    watcher, owner, other = asyncio.run(scenario())
+    assert watcher == owner == [event()]
+    assert other == [event(OTHER_EXECUTION, user_id=None, status="queued")]
+
+def test_subscriber_matching_two_topics_gets_the_event_once(hub):
+    async def scenario():
+        subscription = hub.subscribe(execution_id=EXECUTION, user_id=USER)
+        hub.dispatch(event())
+        return await drain(subscription)
+
+    assert asyncio.run(scenario()) == [event()]
+
+def test_slow_subscriber_drops_the_oldest_events(hub):
+    async def scenario():
+        subscription = hub.subscribe(execution_id=EXECUTION)
+        for status in ("queued", "running", "running", "running", "completed"):
+            hub.dispatch(event(status=status))
+        return await drain(subscription), subscription.dropped
+
+    events, dropped = asyncio.run(scenario())
+    assert [e["execution_status"] for e in events] == ["running", "running", "completed"]
+    assert dropped == 2
+
+def test_resync_goes_to_every_subscriber(hub):
+    async def scenario():
+        subscriptions = [hub.subscribe(execution_id=EXECUTION), hub.subscribe(user_id=USER)]
+        hub._broadcast(RESYNC)
+        return [await drain(s) for s in subscriptions]
+
+    assert asyncio.run(scenario()) == [[RESYNC], [RESYNC]]
+
+def test_closed_subscriptions_get_nothing(hub):
+    async def scenario():
+        subscription = hub.subscribe(execution_id=EXECUTION, user_id=USER)
+        subscription.close()
+        # Closing twice (stream finally and background task) is harmless
+        subscription.close()
+        hub.dispatch(event())
+        return await drain(subscription)
+
+    assert asyncio.run(scenario()) == []
+    assert hub.stats()["subscribers"] == 0
+
+def test_get_times_out_with_none(hub):
+    async def scenario():
+        return await hub.subscribe(execution_id=EXECUTION).get(timeout=0.01)
+
+    assert asyncio.run(scenario()) is None
@@ -0,0 +1,46 @@
+# File: tests/test_execution_stats.py
+import uuid
+from decimal import Decimal
+from sqlalchemy import select
+from app.models import BotExecutionStatsModel, BotModel
+from app.services.duration_sketch import DDSketch
+from app.services.execution_stats import ExecutionStats
+
+"""
+Merging execution durations into bot_execution_stats.
+"""
+
+def make_bot(db):
+    bot = BotModel(name=f"Bot {uuid.uuid4().hex[:12]}", price=Decimal("4.99"))
+    db.add(bot)
+    db.flush()
+    return bot
+
+def sketch_of(alpha, *durations):
+    sketch = DDSketch(alpha)
+    for seconds in durations:
+        sketch.add(seconds)
+    return sketch
+
+def stored(db, bot):
+    return db.scalars(select(BotExecutionStatsModel).where(BotExecutionStatsModel.bot_id == bot.id)).one()
+
+def test_merges_into_the_stored_sketch(db):
+    bot = make_bot(db)
+    stats = ExecutionStats(alpha=0.01, min_samples=3)
+    stats.merge(db.connection(), {bot.id: sketch_of(0.01, 1.0, 2.0)})
+    stats.merge(db.connection(), {bot.id: sketch_of(0.01, 3.0)})
+    row = stored(db, bot)
+    assert row.execution_count == 3
+    db.refresh(bot)
+    assert bot.execution_time_estimate == 2
+
+def test_sketch_stored_at_another_accuracy_starts_over(db):
+    bot = make_bot(db)
+    ExecutionStats(alpha=0.02).merge(db.connection(), {bot.id: sketch_of(0.02, 1.0, 2.0)})
+    # EXECUTION_STATS_ACCURACY changed between deployments
+    ExecutionStats(alpha=0.01).merge(db.connection(), {bot.id: sketch_of(0.01, 3.0)})
+    row = stored(db, bot)
+    db.refresh(row)
+    assert row.execution_count == 1
+    assert row.sketch["alpha"] == 0.01
@@ -0,0 +1,56 @@
+# File: tests/test_executions.py
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+import pytest
+from fastapi import HTTPException
+from app.api.endpoints.executions import create_execution
+from app.models import BotModel, UserBotAccessModel, UserModel
+from app.schemas.ExecutionSchema import ExecutionCreate
+
+"""
+Who may start an execution.
+"""
+
+@pytest.fixture
+def user(db):
+    name = uuid.uuid4().hex[:12]
+    user = UserModel(email=f"{name}@example.com", username=name, password_hash="x")
+    db.add(user)
+    db.flush()
+    return user
+
+def make_bot(db, *, is_free):
+    bot = BotModel(name=f"Bot {uuid.uuid4().hex[:12]}", price=Decimal("0" if is_free else "4.99"), is_free=is_free)
+    db.add(bot)
+    db.flush()
+    return bot
+
+def grant(db, user, bot, **kwargs):
+    db.add(UserBotAccessModel(user_id=user.id, bot_id=bot.id, **kwargs))
+    db.flush()
+
+def start(db, user, bot):
+    return create_execution(db=db, execution_in=ExecutionCreate(bot_id=bot.id), current_user=user)
+
+def test_anyone_can_run_a_free_bot(db, user):
+    execution = start(db, user, make_bot(db, is_free=True))
+    assert execution.execution_status == "queued"
+
+def test_a_grant_unlocks_a_paid_bot(db, user):
+    bot = make_bot(db, is_free=False)
+    grant(db, user, bot)
+    assert start(db, user, bot).user_id == user.id
+
+@pytest.mark.parametrize("grant_kwargs", [
+    None,
+    {"is_active": False},
+    {"expires_at": datetime.now(timezone.utc) - timedelta(days=1)},
+], ids=["no grant", "revoked", "expired"])
+def test_paid_bot_without_access_is_forbidden(db, user, grant_kwargs):
+    bot = make_bot(db, is_free=False)
+    if grant_kwargs is not None:
+        grant(db, user, bot, **grant_kwargs)
+    with pytest.raises(HTTPException) as exc_info:
+        start(db, user, bot)
+    assert exc_info.value.status_code == 403
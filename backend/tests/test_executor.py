@@ -0,0 +1,121 @@
+# File: tests/test_executor.py
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from app.core.config import settings
+from app.models import BotExecutionModel
+from app.services.executor import (
+    REAPED_ERROR,
+    execution_flight,
+    reap_stale,
+    record_result,
+    run_deduplicated,
+    stale_after,
+)
+from app.services.runner_pool import JobResult
+
+"""
+Executor bookkeeping around claimed executions.
+"""
+
+def make_execution(db, *, status="running", age=0.0, container_id=None):
+    execution = BotExecutionModel(
+        execution_status=status,
+        started_at=datetime.now(timezone.utc) - timedelta(seconds=age),
+        container_id=container_id,
+    )
+    db.add(execution)
+    db.flush()
+    return execution
+
+def test_stale_after_covers_a_waiter_running_after_the_flight():
+    run = settings.RUNNER_LEASE_TIMEOUT + settings.RUNNER_JOB_TIMEOUT
+    assert stale_after() >= 2 * run
+
+def test_reap_stale_requeues_unleased_and_fails_leased(db):
+    unleased = make_execution(db, age=3600)
+    leased = make_execution(db, age=3600, container_id="runner-1")
+    recent = make_execution(db, age=10, container_id="runner-2")
+    done = make_execution(db, status="completed", age=3600, container_id="runner-3")
+
+    # Abandoned rows already in the database are released along with these
+    requeued, failed = reap_stale(db.connection(), 600)
+    assert requeued >= 1 and failed >= 1
+    for execution in (unleased, leased, recent, done):
+        db.refresh(execution)
+
+    assert unleased.execution_status == "queued"
+    assert unleased.started_at is None and unleased.completed_at is None
+    assert leased.execution_status == "failed"
+    assert leased.error_message == REAPED_ERROR and leased.completed_at is not None
+    assert recent.execution_status == "running"
+    assert done.execution_status == "completed"
+
+def test_flight_outlasts_the_leaders_lease_and_job():
+    assert execution_flight.timeout >= settings.RUNNER_LEASE_TIMEOUT + settings.RUNNER_JOB_TIMEOUT
+
+def share_one_run(job):
+    """
+    Run `job` as a leader and an identical execution as its waiter.
+    """
+    key = uuid.uuid4()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def leader_job():
+        calls.append("leader")
+        started.set()
+        release.wait(5)
+        return job()
+
+    def waiter_job():
+        calls.append("waiter")
+        return job()
+
+    with ThreadPoolExecutor(max_workers=2) as threads:
+        leader = threads.submit(run_deduplicated, key, leader_job)
+        started.wait(5)
+        waiter = threads.submit(run_deduplicated, key, waiter_job)
+        # Let the waiter join the flight before the leader finishes
+        while execution_flight._calls[key].waiters == 0:
+            threading.Event().wait(0.001)
+        release.set()
+        return leader.result(), waiter.result(), calls
+
+def test_waiter_shares_the_leaders_result():
+    result = JobResult(ok=True, output={"n": 1})
+    leader, waiter, calls = share_one_run(lambda: result)
+    assert leader == (result, True)
+    assert waiter == (result, False)
+    assert calls == ["leader"]
+
+def test_waiter_that_gives_up_runs_itself(monkeypatch):
+    monkeypatch.setattr(execution_flight, "timeout", 0.05)
+    key = uuid.uuid4()
+    release = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as threads:
+        leader = threads.submit(run_deduplicated, key, lambda: release.wait(5) and JobResult(ok=True))
+        while key not in execution_flight._calls:
+            threading.Event().wait(0.001)
+        assert run_deduplicated(key, lambda: JobResult(ok=True, output="own")) == (JobResult(ok=True, output="own"), True)
+        release.set()
+        assert leader.result()[1] is True
+
+def test_unshared_job_always_runs():
+    assert run_deduplicated(None, lambda: JobResult(ok=True)) == (JobResult(ok=True), True)
+
+def test_record_result_marks_shared_successes_as_cache_hits():
+    shared = BotExecutionModel()
+    record_result(shared, JobResult(ok=True, output=1), ran=False, elapsed=2.4)
+    assert (shared.execution_status, shared.cache_hit, shared.execution_time) == ("completed", True, 2)
+
+    leader = BotExecutionModel()
+    record_result(leader, JobResult(ok=True, output=1), ran=True, elapsed=2.6)
+    assert (leader.execution_status, leader.cache_hit, leader.execution_time) == ("completed", False, 3)
+
+    failed = BotExecutionModel()
+    record_result(failed, JobResult(ok=False, error="boom"), ran=False, elapsed=0.1)
+    assert (failed.execution_status, failed.cache_hit, failed.error_message) == ("failed", False, "boom")
+    assert failed.completed_at is not None
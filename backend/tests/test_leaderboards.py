@@ -0,0 +1,105 @@
+# File: tests/test_leaderboards.py
+import time
+import uuid
+from decimal import Decimal
+import pytest
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.models import BotModel
+from app.services import leaderboards as leaderboards_module
+from app.services.leaderboards import (
+    LocalLeaderboards,
+    LocalSortedSet,
+    _collect_events,
+    rating_score,
+    track_leaderboard_events,
+)
+
+"""
+In-process leaderboard store and the ORM events that feed it.
+"""
+
+def test_sorted_set_orders_by_score_then_member():
+    scores = LocalSortedSet({"b": 2.0, "a": 2.0, "c": 5.0})
+    assert scores.top(3) == ["c", "a", "b"]
+    scores.incr("b", 4.0)
+    scores.set("c", 1.0)
+    scores.incr("d", 3.0)
+    assert scores.top(10) == ["b", "d", "a", "c"]
+    scores.remove("d")
+    scores.remove("missing")
+    assert scores.top(2) == ["b", "a"]
+    assert scores.scores == {"a": 2.0, "b": 6.0, "c": 1.0}
+
+def test_events_are_ignored_until_the_boards_are_built():
+    boards = LocalLeaderboards()
+    boards.apply([("downloads", "incr", "a", 1.0)])
+    assert boards.top("downloads", 10) == ([], None)
+
+def test_apply_incr_set_decay_and_remove():
+    boards = LocalLeaderboards()
+    landmark = time.time() - settings.LEADERBOARD_TRENDING_HALF_LIFE
+    boards.replace({"downloads": {"a": 5.0, "b": 3.0}, "rating": {"a": 4.0}}, landmark)
+
+    boards.apply([
+        ("downloads", "incr", "b", 4.0),
+        ("rating", "set", "b", 4.5),
+        ("trending", "decay", "a", 1.0),
+        ("trending", "decay", "b", 0.5),
+    ])
+    assert boards.top("downloads", 10)[0] == ["b", "a"]
+    assert boards.top("rating", 10)[0] == ["b", "a"]
+    # One half-life after the landmark an event is worth twice its weight
+    assert boards.boards["trending"].scores["a"] == pytest.approx(2.0, rel=1e-3)
+    assert boards.top("trending", 10)[0] == ["a", "b"]
+
+    boards.apply([("", "remove", "b", 0.0)])
+    assert all("b" not in boards.top(board, 10)[0] for board in ("downloads", "rating", "trending"))
+
+@pytest.fixture
+def tracked(db, monkeypatch):
+    """
+    Session factory with leaderboard tracking, and the events it records.
+    """
+    recorded = []
+    monkeypatch.setattr(leaderboards_module.leaderboards, "record", recorded.extend)
+    factory = sessionmaker(bind=db.connection(), join_transaction_mode="create_savepoint")
+    track_leaderboard_events(factory)
+    return factory, recorded
+
+def make_bot(session):
+    bot = BotModel(name=f"Bot {uuid.uuid4().hex[:12]}", price=Decimal("4.99"), download_count=10)
+    session.add(bot)
+    session.flush()
+    return bot
+
+def test_collect_events_from_a_flush(db):
+    bot = make_bot(db)
+    bot.download_count = 13
+    bot.rating_average = Decimal("4.00")
+    bot.rating_count = 2
+    assert set(_collect_events(db)) == {
+        ("downloads", "incr", str(bot.id), 3.0),
+        ("rating", "set", str(bot.id), rating_score(Decimal("4.00"), 2)),
+    }
+    bot.is_active = False
+    assert list(_collect_events(db)) == [("", "remove", str(bot.id), 0.0)]
+
+def test_committed_events_are_recorded(tracked):
+    factory, recorded = tracked
+    with factory() as session:
+        bot = make_bot(session)
+        bot_id = str(bot.id)
+        bot.download_count = 12
+        session.commit()
+    assert recorded == [("downloads", "incr", bot_id, 2.0)]
+
+def test_rolled_back_events_are_discarded(tracked):
+    factory, recorded = tracked
+    with factory() as session:
+        bot = make_bot(session)
+        bot.download_count = 12
+        session.flush()
+        session.rollback()
+        session.commit()
+    assert recorded == []
@@ -0,0 +1,35 @@
+# File: tests/test_pagination.py
+import uuid
+from datetime import datetime, timezone
+import pytest
+from fastapi import HTTPException
+from app.utils.pagination import decode_cursor, encode_cursor
+
+"""
+Opaque keyset pagination cursors.
+"""
+
+def test_round_trip_keeps_types_and_time_zone():
+    granted_at = datetime(2026, 10, 19, 18, 39, 51, 291471, tzinfo=timezone.utc)
+    access_id = uuid.uuid4()
+    cursor = encode_cursor(granted_at, access_id)
+    assert "=" not in cursor
+    assert decode_cursor(cursor, datetime, uuid.UUID) == [granted_at, access_id]
+
+def test_numbers_and_nulls_round_trip():
+    assert decode_cursor(encode_cursor(4.5, None, 7), float, str, int) == [4.5, None, 7]
+
+def test_missing_cursor_is_the_first_page():
+    assert decode_cursor(None, datetime, uuid.UUID) is None
+    assert decode_cursor("", datetime, uuid.UUID) is None
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor",
+    encode_cursor(datetime(2026, 1, 1, tzinfo=timezone.utc)),
+    encode_cursor("yesterday", str(uuid.uuid4())),
+    encode_cursor(datetime(2026, 1, 1, tzinfo=timezone.utc), "not-a-uuid"),
+])
+def test_malformed_cursor_is_a_bad_request(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor, datetime, uuid.UUID)
+    assert error.value.status_code == 400
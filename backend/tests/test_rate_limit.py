@@ -0,0 +1,69 @@
+# File: tests/test_rate_limit.py
+import time
+import fakeredis
+import pytest
+from app.core.redis import redis
+from app.services import rate_limit
+from app.services.rate_limit import RateLimit, RateLimiter
+
+"""
+Token buckets, in (fake) Redis through the Lua script and in process.
+"""
+
+@pytest.fixture(params=["local", "redis"])
+def limiter(request, monkeypatch):
+    client = fakeredis.FakeRedis() if request.param == "redis" else None
+    monkeypatch.setattr(rate_limit, "get_redis", lambda: client)
+    return RateLimiter()
+
+def test_parse():
+    assert RateLimit.parse("20/minute") == RateLimit(capacity=20, rate=20 / 60)
+    assert RateLimit.parse("5/seconds") == RateLimit(capacity=5, rate=5)
+    with pytest.raises(ValueError):
+        RateLimit.parse("20/fortnight")
+
+def test_burst_is_allowed_up_to_capacity(limiter):
+    buckets = {"login:ip:10.0.0.1": RateLimit(capacity=3, rate=3 / 60)}
+    assert [limiter.hit(buckets).allowed for _ in range(4)] == [True, True, True, False]
+    # Buckets are independent
+    assert limiter.hit({"login:ip:10.0.0.2": RateLimit(capacity=3, rate=3 / 60)}).allowed
+
+def test_retry_after_is_the_time_to_the_next_token(limiter):
+    buckets = {"login:ip:10.0.0.1": RateLimit(capacity=2, rate=1 / 60)}
+    limiter.hit(buckets)
+    limiter.hit(buckets)
+    denied = limiter.hit(buckets)
+    assert not denied.allowed
+    assert 59 < denied.retry_after <= 60
+
+def test_tokens_refill_over_time(limiter):
+    buckets = {"login:ip:10.0.0.1": RateLimit(capacity=1, rate=20)}
+    assert limiter.hit(buckets).allowed
+    assert not limiter.hit(buckets).allowed
+    time.sleep(0.1)
+    assert limiter.hit(buckets).allowed
+
+def test_denied_request_takes_no_tokens(limiter):
+    user = ("login:user:alice", RateLimit(capacity=5, rate=5 / 60))
+    ip = ("login:ip:10.0.0.1", RateLimit(capacity=1, rate=1 / 60))
+    assert limiter.hit(dict([user, ip])).allowed
+    for _ in range(3):
+        assert not limiter.hit(dict([user, ip])).allowed
+    # Only the allowed request was charged to the user's bucket
+    assert [limiter.hit(dict([user])).allowed for _ in range(5)] == [True] * 4 + [False]
+
+class BrokenRedis:
+    def register_script(self, script):
+        def run(keys, args):
+            raise redis.ConnectionError("connection reset")
+        return run
+
+def test_redis_errors_fall_back_to_in_process_buckets(monkeypatch):
+    failures = []
+    monkeypatch.setattr(rate_limit, "get_redis", lambda: BrokenRedis())
+    monkeypatch.setattr(rate_limit.redis_connection, "mark_failed", lambda: failures.append(1))
+    limiter = RateLimiter()
+    buckets = {"login:ip:10.0.0.1": RateLimit(capacity=1, rate=1 / 60)}
+    assert limiter.hit(buckets).allowed
+    assert not limiter.hit(buckets).allowed
+    assert len(failures) == 2
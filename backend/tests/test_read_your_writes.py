@@ -0,0 +1,72 @@
+# File: tests/test_read_your_writes.py
+import fakeredis
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+from app.db.session import routing
+from app.db.session.routing import RoutingSession, recent_writers, request_routing
+from app.middleware.routing import ReadYourWritesMiddleware
+from app.utils.security import create_access_token
+
+"""
+Read-your-writes pins for replica routing.
+"""
+
+@pytest.fixture(params=["local", "redis"])
+def writers(request, monkeypatch):
+    """
+    The shared pin store, emptied, in process or in (fake) Redis.
+    """
+    client = fakeredis.FakeRedis() if request.param == "redis" else None
+    monkeypatch.setattr(routing, "get_redis", lambda: client)
+    monkeypatch.setattr(recent_writers, "_local", {})
+    return recent_writers
+
+def test_pin_is_per_user(writers):
+    writers.pin("alice", 10)
+    assert writers.pinned("alice")
+    assert not writers.pinned("bob")
+
+def test_expired_pin_is_ignored(writers, monkeypatch):
+    writers.pin("alice", 10)
+    if writers._local:
+        monkeypatch.setattr(routing.time, "time", lambda: 2e10)
+    else:
+        client = routing.get_redis()
+        assert 0 < client.ttl(writers.prefix + "alice") <= 10
+        client.delete(writers.prefix + "alice")
+    assert not writers.pinned("alice")
+
+def read_or_write(request):
+    state = request_routing.get()
+    if request.method == "POST":
+        state.wrote = True
+    return JSONResponse({"sticky": state.sticky})
+
+@pytest.fixture
+def app(writers, monkeypatch):
+    monkeypatch.setattr(RoutingSession, "replicas", [object()])
+    app = Starlette(routes=[Route("/", read_or_write, methods=["GET", "POST"])])
+    app.add_middleware(ReadYourWritesMiddleware, window=10)
+    return app
+
+def test_bearer_client_reads_its_writes_without_cookies(app):
+    token = {"Authorization": f"Bearer {create_access_token('user-1')}"}
+    other = {"Authorization": f"Bearer {create_access_token('user-2')}"}
+    # A new client per request: API clients usually keep no cookies
+    assert TestClient(app).get("/", headers=token).json() == {"sticky": False}
+    TestClient(app).post("/", headers=token)
+    assert TestClient(app).get("/", headers=token).json() == {"sticky": True}
+    assert TestClient(app).get("/", headers=other).json() == {"sticky": False}
+
+def test_anonymous_client_is_pinned_by_cookie(app):
+    client = TestClient(app)
+    client.post("/")
+    assert client.get("/").json() == {"sticky": True}
+    assert TestClient(app).get("/").json() == {"sticky": False}
+
+def test_invalid_token_is_not_pinned(app):
+    TestClient(app).post("/", headers={"Authorization": "Bearer not-a-token"})
+    assert TestClient(app).get("/", headers={"Authorization": "Bearer not-a-token"}).json() == {"sticky": False}
@@ -0,0 +1,57 @@
+# File: tests/test_recommendations.py
+import json
+import uuid
+from decimal import Decimal
+import numpy as np
+import pytest
+from scipy import sparse
+from app.models import BotModel
+from app.services.catalog_cache import cached_details
+from app.services.recommendation_builder import top_neighbours
+
+"""
+"Also bought" lists: the similarity computation, and serving them.
+"""
+
+# Users x bots: bots 0 and 1 share two users, 0 and 2 one, 3 shares none
+GRANTS = sparse.csr_matrix(np.array([
+    [1, 1, 0, 0],
+    [1, 1, 1, 0],
+    [1, 0, 0, 0],
+    [0, 0, 0, 1],
+], dtype=np.float32))
+
+def neighbours(columns, *, top_k=10, min_cooccurrence=1):
+    return {
+        column: (others.tolist(), scores.tolist())
+        for column, others, scores in top_neighbours(GRANTS, np.array(columns, dtype=np.int32), top_k=top_k, min_cooccurrence=min_cooccurrence)
+    }
+
+def test_neighbours_are_ranked_by_cosine_similarity():
+    result = neighbours([0, 1, 3])
+    others, scores = result[0]
+    assert others == [1, 2]
+    # |users(0) & users(1)| / sqrt(|users(0)| * |users(1)|)
+    assert scores == pytest.approx([2 / np.sqrt(3 * 2), 1 / np.sqrt(3 * 1)])
+    assert result[1][0] == [0, 2]
+    assert result[3] == ([], [])
+
+def test_top_k_and_min_cooccurrence_cut_the_list():
+    assert neighbours([0], top_k=1)[0][0] == [1]
+    assert neighbours([0], min_cooccurrence=2)[0][0] == [1]
+
+def served(db, ids):
+    return [json.loads(body)["id"] for body in cached_details(db, ids)]
+
+def test_deactivated_bots_are_not_served(db):
+    bots = [BotModel(name=f"Bot {uuid.uuid4().hex[:12]}", price=Decimal("4.99")) for _ in range(3)]
+    db.add_all(bots)
+    db.flush()
+    ids = [str(bot.id) for bot in bots]
+    assert served(db, ids) == ids
+
+    bots[1].is_active = False
+    db.flush()
+    # Loaded from the database, then from the cache
+    assert served(db, ids) == [ids[0], ids[2]]
+    assert served(db, ids) == [ids[0], ids[2]]
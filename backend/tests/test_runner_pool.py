@@ -0,0 +1,118 @@
+# File: tests/test_runner_pool.py
+import time
+import pytest
+from app.core.config import settings
+from app.services.runner_pool import JobResult, PoolExhausted, Runner, RunnerPool, RuntimeKey, SubprocessRunner
+
+"""
+Warm runner pool, with an in-process backend, and the worker protocol
+through the subprocess backend.
+"""
+
+KEY = RuntimeKey("python:3.11-slim", "3.11")
+
+class FakeRunner(Runner):
+    def start(self, timeout):
+        self.running = True
+
+    def run(self, job, timeout):
+        return JobResult(ok=True, output=job)
+
+    def alive(self):
+        return self.running
+
+    def close(self):
+        self.running = False
+
+def make_pool(**kwargs):
+    options = dict(backend=FakeRunner, max_per_runtime=2, max_total=3, min_idle=0, max_uses=10, idle_timeout=60)
+    options.update(kwargs)
+    return RunnerPool(**options)
+
+def test_released_runner_is_reused_warm():
+    pool = make_pool()
+    with pool.lease(KEY) as first:
+        pass
+    with pool.lease(KEY) as second:
+        assert second is first
+    assert pool.stats()["started"] == 1
+    assert pool.warm_leases == 1
+
+def test_failed_job_discards_the_runner():
+    pool = make_pool()
+    with pytest.raises(RuntimeError):
+        with pool.lease(KEY) as first:
+            raise RuntimeError("job failed")
+    with pool.lease(KEY) as second:
+        assert second is not first
+
+def test_runner_is_recycled_after_max_uses():
+    pool = make_pool(max_uses=2)
+    runners = []
+    for _ in range(3):
+        with pool.lease(KEY) as runner:
+            runners.append(runner)
+    assert runners[0] is runners[1]
+    assert runners[2] is not runners[0]
+    assert pool.recycled == 1
+
+def test_set_demand_scales_up_to_the_caps():
+    pool = make_pool()
+    other = RuntimeKey(None, "3.12")
+    pool.set_demand({KEY: 5, other: 5})
+    # Two for the first runtime (max_per_runtime), one left of max_total
+    assert pool.maintain() == 3
+    runtimes = pool.stats()["runtimes"]
+    assert sorted(r["idle"] for r in runtimes.values()) == [1, 2]
+
+def test_unneeded_idle_runners_are_closed_after_idle_timeout():
+    pool = make_pool(idle_timeout=0.05)
+    pool.set_demand({KEY: 2})
+    pool.maintain()
+    pool.set_demand({})
+    pool.maintain()
+    assert pool.stats()["runners"] == 2
+    time.sleep(0.1)
+    pool.maintain()
+    assert pool.stats()["runners"] == 0
+
+def test_exhausted_pool_times_out():
+    pool = make_pool(max_per_runtime=1)
+    with pool.lease(KEY):
+        with pytest.raises(PoolExhausted):
+            with pool.lease(KEY, timeout=0.05):
+                pass
+
+@pytest.fixture
+def bots(tmp_path, monkeypatch):
+    bot = tmp_path / "bots" / "echo"
+    bot.mkdir(parents=True)
+    (bot / "main.py").write_text("def run(params):\n    print('bot output goes to stderr')\n    return {'echo': params}\n")
+    (tmp_path / "main.py").write_text("def run(params):\n    return 'outside the bots root'\n")
+    monkeypatch.setattr(settings, "RUNNER_BOT_PATH", str(tmp_path / "bots"))
+    return bot
+
+@pytest.fixture
+def worker(bots):
+    runner = SubprocessRunner(RuntimeKey(None, None))
+    runner.start(timeout=30)
+    yield runner
+    runner.close()
+
+def test_worker_runs_jobs_over_json_lines(worker):
+    assert worker.alive() and worker.pid
+    result = worker.run({"bot": "echo", "entry_point": "main:run", "input": {"n": 1}}, timeout=30)
+    assert result.ok and result.output == {"echo": {"n": 1}}
+    # Peak memory comes with every result, for recycling
+    assert worker.max_rss_kb > 0
+
+def test_worker_reports_job_errors_and_keeps_serving(worker):
+    result = worker.run({"bot": "echo", "entry_point": "main:missing", "input": None}, timeout=30)
+    assert not result.ok and "AttributeError" in result.error
+    assert worker.run({"bot": "echo", "entry_point": "main:run", "input": None}, timeout=30).ok
+
+@pytest.mark.parametrize("bot", ["..", "../bots/..", "echo/..", "/etc"])
+def test_worker_rejects_paths_outside_the_bots_root(worker, bot):
+    result = worker.run({"bot": bot, "entry_point": "main:run", "input": None}, timeout=30)
+    assert not result.ok
+    assert "Invalid bot directory" in result.error
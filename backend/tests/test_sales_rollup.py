@@ -0,0 +1,52 @@
+# File: tests/test_sales_rollup.py
+import uuid
+from decimal import Decimal
+from sqlalchemy import delete, select
+from app.models import BotModel, OrderItemModel, OrderModel, UserModel, sales_daily
+
+"""
+Trigger-maintained sales_daily rollup.
+"""
+
+def make_sale(db, *, price="9.99", payment_status="completed"):
+    suffix = uuid.uuid4().hex[:12]
+    user = UserModel(email=f"buyer-{suffix}@example.com", username=f"buyer-{suffix}", password_hash="x")
+    bot = BotModel(name=f"Bot {suffix}", price=Decimal(price))
+    db.add_all([user, bot])
+    db.flush()
+    order = OrderModel(user_id=user.id, total_amount=Decimal(price), payment_status=payment_status)
+    db.add(order)
+    db.flush()
+    db.add(OrderItemModel(order_id=order.id, bot_id=bot.id, quantity=1, price_at_purchase=Decimal(price)))
+    db.flush()
+    return bot, order
+
+def rollup(db, bot_id):
+    return db.execute(
+        select(sales_daily.c.units, sales_daily.c.revenue, sales_daily.c.order_count).where(sales_daily.c.bot_id == bot_id)
+    ).all()
+
+def test_paid_order_is_rolled_up(db):
+    bot, _ = make_sale(db)
+    assert rollup(db, bot.id) == [(1, Decimal("9.99"), 1)]
+
+def test_unpaid_order_is_not_rolled_up(db):
+    bot, _ = make_sale(db, payment_status="pending")
+    assert rollup(db, bot.id) == []
+
+def test_refund_subtracts_the_order(db):
+    bot, order = make_sale(db)
+    order.payment_status = "refunded"
+    db.flush()
+    assert rollup(db, bot.id) == [(0, Decimal("0.00"), 0)]
+
+def test_deleting_a_sold_bot_keeps_its_order(db):
+    bot, order = make_sale(db)
+    bot_id = bot.id
+    # In the database, as ON DELETE SET NULL runs after the rollup rows cascaded away
+    db.execute(delete(BotModel).where(BotModel.id == bot_id))
+    db.expire_all()
+
+    assert rollup(db, bot_id) == []
+    item = db.scalars(select(OrderItemModel).where(OrderItemModel.order_id == order.id)).one()
+    assert item.bot_id is None
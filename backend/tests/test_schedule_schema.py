@@ -0,0 +1,21 @@
+# File: tests/test_schedule_schema.py
+import pytest
+from pydantic import ValidationError
+from app.schemas.ScheduleSchema import ScheduleUpdate
+
+"""
+Schedule update payloads.
+"""
+
+@pytest.mark.parametrize("field", ["cron_expression", "timezone", "is_active"])
+def test_explicit_null_is_rejected(field):
+    with pytest.raises(ValidationError):
+        ScheduleUpdate.model_validate({field: None})
+
+def test_omitted_fields_are_left_unset():
+    update = ScheduleUpdate.model_validate({"timezone": "Europe/Berlin"})
+    assert update.model_dump(exclude_unset=True) == {"timezone": "Europe/Berlin"}
+
+def test_input_parameters_can_be_cleared():
+    update = ScheduleUpdate.model_validate({"input_parameters": None})
+    assert update.model_dump(exclude_unset=True) == {"input_parameters": None}
@@ -0,0 +1,70 @@
+# File: tests/test_scheduler.py
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+import pytest
+from sqlalchemy import select
+from app.models import BotExecutionModel, BotModel, BotScheduleModel, UserBotAccessModel, UserModel
+from app.services.scheduler import FIRE_STATEMENT, INPUT_TOO_LARGE_ERROR
+
+"""
+The scheduler's fire statement.
+"""
+
+DUE = datetime(2026, 1, 1, 9, tzinfo=timezone.utc)
+
+@pytest.fixture
+def user(db):
+    name = uuid.uuid4().hex[:12]
+    user = UserModel(email=f"{name}@example.com", username=name, password_hash="x")
+    db.add(user)
+    db.flush()
+    return user
+
+def make_schedule(db, user, *, is_free=True, bot_active=True, input_parameters=None):
+    bot = BotModel(name=f"Bot {uuid.uuid4().hex[:12]}", price=Decimal("4.99"), is_free=is_free, is_active=bot_active)
+    db.add(bot)
+    db.flush()
+    schedule = BotScheduleModel(
+        user_id=user.id, bot_id=bot.id, cron_expression="0 9 * * *",
+        input_parameters=input_parameters, is_active=True, next_run_at=DUE,
+    )
+    db.add(schedule)
+    db.flush()
+    return schedule
+
+def fire(db, *schedules, inline_max=64 * 1024):
+    rows = db.execute(FIRE_STATEMENT, {
+        "ids": [str(s.id) for s in schedules],
+        "expected": [DUE] * len(schedules),
+        "next": [DUE + timedelta(days=1)] * len(schedules),
+        "inline_max": inline_max,
+        "too_large": INPUT_TOO_LARGE_ERROR,
+    })
+    return dict(rows.all())
+
+def executions(db, schedule):
+    return db.scalars(select(BotExecutionModel).where(BotExecutionModel.schedule_id == schedule.id)).all()
+
+def test_runs_are_queued_only_for_bots_the_owner_may_run(db, user):
+    free = make_schedule(db, user)
+    paid = make_schedule(db, user, is_free=False)
+    granted = make_schedule(db, user, is_free=False)
+    db.add(UserBotAccessModel(user_id=user.id, bot_id=granted.bot_id))
+    inactive = make_schedule(db, user, bot_active=False)
+    db.flush()
+
+    assert fire(db, free, paid, granted, inactive) == {free.id: True, paid.id: False, granted.id: True, inactive.id: False}
+    assert [e.execution_status for e in executions(db, free)] == ["queued"]
+    assert executions(db, paid) == [] and executions(db, inactive) == []
+    # Denied runs still advance, so they are not retried every tick
+    db.expire_all()
+    assert paid.next_run_at == DUE + timedelta(days=1)
+
+def test_oversized_input_is_recorded_as_failed(db, user):
+    schedule = make_schedule(db, user, input_parameters={"text": "x" * 100})
+    assert fire(db, schedule, inline_max=50) == {schedule.id: True}
+    [execution] = executions(db, schedule)
+    assert execution.execution_status == "failed"
+    assert execution.error_message == INPUT_TOO_LARGE_ERROR
+    assert execution.input_size > 50
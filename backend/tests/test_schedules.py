@@ -0,0 +1,51 @@
+# File: tests/test_schedules.py
+import uuid
+from decimal import Decimal
+import pytest
+from fastapi import HTTPException
+from app.api.endpoints.schedules import create_schedule, update_schedule
+from app.models import BotModel, UserBotAccessModel, UserModel
+from app.schemas.ScheduleSchema import ScheduleCreate, ScheduleUpdate
+
+"""
+Who may schedule a bot.
+"""
+
+@pytest.fixture
+def user(db):
+    name = uuid.uuid4().hex[:12]
+    user = UserModel(email=f"{name}@example.com", username=name, password_hash="x")
+    db.add(user)
+    db.flush()
+    return user
+
+@pytest.fixture
+def paid_bot(db):
+    bot = BotModel(name=f"Bot {uuid.uuid4().hex[:12]}", price=Decimal("4.99"), is_free=False)
+    db.add(bot)
+    db.flush()
+    return bot
+
+def schedule(db, user, bot):
+    return create_schedule(db=db, schedule_in=ScheduleCreate(bot_id=bot.id, cron_expression="0 9 * * *"), current_user=user)
+
+def test_paid_bot_cannot_be_scheduled_without_access(db, user, paid_bot):
+    with pytest.raises(HTTPException) as exc_info:
+        schedule(db, user, paid_bot)
+    assert exc_info.value.status_code == 403
+
+def test_lapsed_access_allows_pausing_but_not_resuming(db, user, paid_bot):
+    access = UserBotAccessModel(user_id=user.id, bot_id=paid_bot.id)
+    db.add(access)
+    db.flush()
+    created = schedule(db, user, paid_bot)
+
+    access.is_active = False
+    db.flush()
+    with pytest.raises(HTTPException) as exc_info:
+        update_schedule(db=db, schedule_id=created.id, schedule_in=ScheduleUpdate(cron_expression="0 10 * * *"), current_user=user)
+    assert exc_info.value.status_code == 403
+    paused = update_schedule(db=db, schedule_id=created.id, schedule_in=ScheduleUpdate(is_active=False), current_user=user)
+    assert not paused.is_active
+    with pytest.raises(HTTPException):
+        update_schedule(db=db, schedule_id=created.id, schedule_in=ScheduleUpdate(is_active=True), current_user=user)
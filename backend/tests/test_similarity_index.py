@@ -0,0 +1,114 @@
+# File: tests/test_similarity_index.py
+import os
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+import numpy as np
+import pytest
+from app.services import similarity_index as module
+from app.services.similarity_index import (
+    Segment,
+    SimilarityIndex,
+    Vocabulary,
+    current_build,
+    locked,
+    save,
+)
+
+"""
+Similarity index builds on disk, shared between workers.
+"""
+
+BOTS = [
+    ("00000000-0000-0000-0000-000000000001", True, Counter({"csv": 2, "export": 1})),
+    ("00000000-0000-0000-0000-000000000002", True, Counter({"csv": 1, "database": 2})),
+    ("00000000-0000-0000-0000-000000000003", True, Counter({"email": 3})),
+]
+
+class FakeSession:
+    """
+    Just enough of a session for build(): the database clock.
+    """
+
+    def __init__(self, info=None):
+        self.info = info or {}
+
+    def execute(self, statement):
+        return self
+
+    def scalar(self):
+        return datetime.now(timezone.utc)
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def index_factory(tmp_path, monkeypatch):
+    monkeypatch.setattr(module, "read_bots", lambda db, since=None: [] if since else list(BOTS))
+    return lambda: SimilarityIndex(FakeSession, path=str(tmp_path), refresh_interval=60.0, max_delta=10)
+
+def write_build(path, build_id):
+    vocabulary = Vocabulary.fit([counts for _, _, counts in BOTS])
+    base = Segment.build(vocabulary, [(bot_id, counts) for bot_id, _, counts in BOTS])
+    save(path, build_id, vocabulary, base, datetime.now(timezone.utc))
+
+def test_save_never_prunes_the_current_build(tmp_path):
+    path = str(tmp_path)
+    write_build(path, "20260102T000000-bbbbbbbb")
+    write_build(path, "20260103T000000-cccccccc")
+    # Finished last but named earlier, as a slow concurrent build would be
+    write_build(path, "20260101T000000-aaaaaaaa")
+
+    assert current_build(path) == "20260101T000000-aaaaaaaa"
+    builds = sorted(entry for entry in os.listdir(path) if os.path.isdir(os.path.join(path, entry)))
+    assert builds == ["20260101T000000-aaaaaaaa", "20260103T000000-cccccccc"]
+
+def test_workers_share_one_build(index_factory):
+    first, second = index_factory(), index_factory()
+    first.refresh()
+    second.refresh()
+    assert (first.builds, second.builds) == (1, 0)
+    assert second.stats()["build"] == first.stats()["build"]
+    assert second.search("csv", 2)[0] == BOTS[0][0]
+
+def test_refresh_waits_for_a_build_in_progress(index_factory, tmp_path):
+    index = index_factory()
+    refreshed = threading.Event()
+
+    def refresh():
+        index.refresh()
+        refreshed.set()
+
+    with locked(str(tmp_path), exclusive=True):
+        thread = threading.Thread(target=refresh)
+        thread.start()
+        assert not refreshed.wait(0.2)
+        write_build(str(tmp_path), "20260101T000000-aaaaaaaa")
+    thread.join(5)
+
+    # It mapped the build made while it waited instead of making its own
+    assert refreshed.is_set()
+    assert index.builds == 0
+    assert index.stats()["build"] == "20260101T000000-aaaaaaaa"
+
+def test_rebuilds_keep_the_current_build_loadable(index_factory):
+    indexes = [index_factory() for _ in range(4)]
+    errors = []
+
+    def rebuild(index):
+        try:
+            for _ in range(5):
+                index.refresh(rebuild=True)
+                index_factory().refresh()
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=rebuild, args=(index,)) for index in indexes]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+    assert errors == []
+    assert np.array_equal(
+        np.asarray(indexes[0].refresh().base.bot_ids), np.array(sorted(bot_id for bot_id, _, _ in BOTS))
+    )
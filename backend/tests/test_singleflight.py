@@ -0,0 +1,63 @@
+# File: tests/test_singleflight.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from app.services.singleflight import SingleFlight
+
+"""
+Single-flight coalescing of concurrent identical calls.
+"""
+
+WAITERS = 4
+
+def run_concurrently(flight, fn):
+    """
+    One leader blocked in `fn` until WAITERS more callers have joined its flight.
+    """
+    release = threading.Event()
+    calls = []
+
+    def leader_fn():
+        calls.append(1)
+        release.wait(5)
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=WAITERS + 1) as pool:
+        futures = [pool.submit(flight.do, "key", leader_fn)]
+        while flight.in_flight() == 0 or not calls:
+            time.sleep(0.001)
+        futures += [pool.submit(flight.do, "key", leader_fn) for _ in range(WAITERS)]
+        while flight.shared < WAITERS:
+            time.sleep(0.001)
+        release.set()
+    return futures, calls
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight(timeout=5)
+    futures, calls = run_concurrently(flight, lambda: object())
+    results = [future.result() for future in futures]
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert (flight.executions, flight.shared, flight.in_flight()) == (1, WAITERS, 0)
+
+def test_waiters_receive_the_leaders_exception():
+    flight = SingleFlight(timeout=5)
+    error = LookupError("not found")
+
+    def fail():
+        raise error
+
+    futures, calls = run_concurrently(flight, fail)
+    for future in futures:
+        with pytest.raises(LookupError) as exc_info:
+            future.result()
+        assert exc_info.value is error
+    assert len(calls) == 1
+    # The failure is not remembered
+    assert flight.do("key", lambda: "ok") == "ok"
+
+def test_sequential_calls_each_run():
+    flight = SingleFlight()
+    assert [flight.do("key", lambda: n) for n in range(3)] == [0, 1, 2]
+    assert flight.executions == 3
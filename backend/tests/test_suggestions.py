@@ -0,0 +1,53 @@
+# File: tests/test_suggestions.py
+import heapq
+import random
+import pytest
+from app.services.suggestions import MAX_SUGGESTIONS, SCAN_LIMIT, Entry, PrefixIndex, normalize, word_starts
+
+"""
+The typeahead prefix index against a brute-force scan.
+"""
+
+WORDS = ["sales", "sync", "scraper", "csv", "export", "excel", "email", "report", "slack", "stock", "s3", "invoice"]
+
+def random_entry(rng, entry_id):
+    name = " ".join(rng.choice(WORDS).title() for _ in range(rng.randint(1, 3)))
+    return Entry(str(entry_id), name, rng.randint(0, 50))
+
+def brute_force(entries, prefix, n):
+    prefix = normalize(prefix)
+    matches = [e for e in entries.values() if any(start.startswith(prefix) for start in word_starts(e.name))]
+    return heapq.nlargest(n, matches, key=lambda e: (e.popularity, e.id))
+
+PREFIXES = ["s", "sa", "sales", "sales c", "c", "csv e", "ex", "exc", "r", "s3", "inv", "z", "stock stock"]
+
+@pytest.fixture
+def rng():
+    return random.Random(20240611)
+
+def test_search_matches_brute_force(rng):
+    entries = {str(i): random_entry(rng, i) for i in range(1500)}
+    index = PrefixIndex(entries.values())
+    # Short prefixes are precomputed, longer ones are scanned
+    assert "s" in index.hot and len(index.keys) > SCAN_LIMIT
+    for prefix in PREFIXES:
+        for n in (1, 5, MAX_SUGGESTIONS):
+            assert index.search(prefix, n) == brute_force(entries, prefix, n), (prefix, n)
+
+def test_incremental_changes_match_brute_force(rng):
+    entries = {str(i): random_entry(rng, i) for i in range(1500)}
+    index = PrefixIndex(entries.values())
+    for step in range(600):
+        entry_id = str(rng.randrange(1700))
+        if rng.random() < 0.3:
+            entries.pop(entry_id, None)
+            index.remove(entry_id)
+        else:
+            # New bots, renames, and downloads moving popularity both ways
+            entries[entry_id] = random_entry(rng, entry_id)
+            index.add(entries[entry_id])
+        if step % 100 == 0:
+            index.refresh_stale()
+            assert not index.stale
+    for prefix in PREFIXES:
+        assert index.search(prefix, MAX_SUGGESTIONS) == brute_force(entries, prefix, MAX_SUGGESTIONS), prefix
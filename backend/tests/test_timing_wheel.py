@@ -0,0 +1,44 @@
+# File: tests/test_timing_wheel.py
+from app.services.timing_wheel import TimingWheel
+
+"""
+TimingWheel scheduling and firing order.
+"""
+
+def test_fires_when_the_tick_is_reached():
+    wheel = TimingWheel(now=1000.0, slots=60)
+    wheel.schedule("a", 1005.5)
+    assert wheel.advance(1004.9) == []
+    assert wheel.advance(1005.0) == [("a", 1005.5)]
+    assert "a" not in wheel
+
+def test_overdue_timers_fire_on_an_advance_to_now():
+    wheel = TimingWheel(now=1000.0, slots=60)
+    wheel.schedule("late", 990.0)
+    wheel.schedule("now", 1000.0)
+    wheel.schedule("soon", 1000.5)
+    assert wheel.advance(1000.0) == [("late", 990.0), ("now", 1000.0)]
+    assert len(wheel) == 1
+    assert wheel.advance(1000.5) == [("soon", 1000.5)]
+
+def test_overdue_timer_does_not_fire_twice():
+    wheel = TimingWheel(now=1000.0, slots=60)
+    wheel.schedule("late", 990.0)
+    assert wheel.advance(1000.0) == [("late", 990.0)]
+    assert wheel.advance(1001.0) == []
+
+def test_timers_beyond_the_horizon_enter_the_wheel():
+    wheel = TimingWheel(now=0.0, slots=10)
+    wheel.schedule("far", 25.0)
+    wheel.schedule("near", 3.0)
+    assert wheel.advance(24.0) == [("near", 3.0)]
+    assert wheel.advance(25.0) == [("far", 25.0)]
+
+def test_reschedule_and_cancel():
+    wheel = TimingWheel(now=0.0, slots=10)
+    wheel.schedule("a", 5.0)
+    wheel.schedule("a", 7.0)
+    wheel.schedule("b", 6.0)
+    wheel.cancel("b")
+    assert wheel.fire_at("a") == 7.0
+    assert wheel.advance(10.0) == [("a", 7.0)]